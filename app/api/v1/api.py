@@ -11,6 +11,7 @@ from .endpoints import errors  # Added error_logs router -> Changed from error_l
 from .endpoints.webhooks import router as webhooks_router
 # Import the new dashboard router
 from .endpoints.dash import dashboard as dashboard_router
+from .endpoints.dash import live as live_router
 # Import the separate latency router
 from .endpoints import latency as latency_router
 # Import auth router - Correctly import 'router' and alias it
@@ -42,6 +43,8 @@ api_router_v1.include_router(
 # Include the dashboard router
 api_router_v1.include_router(
     dashboard_router.router, prefix="/dashboard", tags=["Dashboard"])
+api_router_v1.include_router(
+    live_router.router, prefix="/dashboard", tags=["Dashboard"])
 
 # Include the latency router separately
 api_router_v1.include_router(
@@ -12,7 +12,12 @@ from datetime import datetime
 # Import User models
 from app.models.user import Token, User, UserCreate, UserUpdate, UserInDB
 from app.models.common import GenericResponse  # Import GenericResponse
-from app.utils.image import ImageProcessor  # Import image processing helper
+from app.utils.image import (
+    DEFAULT_PICTURE_VARIANT,
+    PICTURE_SIZES,
+    USER_PICTURES_URL,
+    store_user_picture,
+)
 
 # Import the service class and its injector
 from app.services.auth.auth import AuthService, get_auth_service
@@ -33,7 +38,8 @@ def user_in_db_to_user(user_in_db: UserInDB) -> User:
       bio=getattr(user_in_db, 'bio', None),
       role=user_in_db.role,
       is_active=user_in_db.is_active,
-      picture=user_in_db.picture
+      picture=user_in_db.picture,
+      picture_variants=getattr(user_in_db, 'picture_variants', None)
   )
 
 
@@ -313,6 +319,29 @@ async def delete_user_endpoint(
     )
 
 
+def _picture_paths(user_doc: dict) -> set:
+  """Every stored picture URL of a user document (all variants)."""
+  paths = set((user_doc.get("picture_variants") or {}).values())
+  if user_doc.get("picture"):
+    paths.add(user_doc["picture"])
+  return paths
+
+
+async def _remove_unreferenced_pictures(collection, paths: set) -> None:
+  """Deletes picture files that no user document references any more."""
+  for picture_path in paths:
+    if not picture_path.startswith(f"{USER_PICTURES_URL}/"):
+      continue
+    # Pictures are content-addressed, so identical uploads share files
+    references = [{"picture": picture_path}] + [
+        {f"picture_variants.{name}": picture_path} for name in PICTURE_SIZES]
+    if await collection.count_documents({"$or": references}, limit=1):
+      continue
+    file_path = Path(f"app{picture_path}")
+    if file_path.exists():
+      file_path.unlink()
+
+
 @router.post("/users/{user_id}/picture", response_model=GenericResponse[User])
 async def upload_user_picture(
     user_id: uuid.UUID,
@@ -366,15 +395,15 @@ async def upload_user_picture(
           status_code=status.HTTP_400_BAD_REQUEST
       )
 
-    # Process the image using the ImageProcessor
+    # Check if user exists
+    collection = await auth_service.get_users_collection()
+    user_doc = await collection.find_one({"_id": user_id})
+    if not user_doc:
+      return GenericResponse.error(message="User not found", status_code=404)
+
+    # Decode, resize and store all variants on the image worker pool
     try:
-      timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-      processed_image_bytes, final_filename = ImageProcessor.process_user_picture(
-          file_content=file_content,
-          original_filename=file.filename,
-          user_id=str(user_id),
-          timestamp=timestamp
-      )
+      picture_urls = await store_user_picture(file_content)
     except ValueError as e:
       return GenericResponse.error(
           message="Invalid image file",
@@ -382,47 +411,26 @@ async def upload_user_picture(
           status_code=status.HTTP_400_BAD_REQUEST
       )
 
-    # Check if user exists
-    collection = await auth_service.get_users_collection()
-    user_doc = await collection.find_one({"_id": user_id})
-    if not user_doc:
-      return GenericResponse.error(message="User not found", status_code=404)
-
-    # Create static/users directory if it doesn't exist
-    static_users_dir = Path("app/static/users")
-    static_users_dir.mkdir(parents=True, exist_ok=True)
-
-    # Save the processed (thumbnail) image
-    file_path = static_users_dir / final_filename
-    with open(file_path, "wb") as buffer:
-      buffer.write(processed_image_bytes)
-
-    # Update user document with picture path
-    picture_url = f"/static/users/{final_filename}"
-
-    # Remove old picture file if it exists
-    if user_doc.get("picture"):
-      old_picture_path = user_doc["picture"]
-      if old_picture_path.startswith("/static/users/"):
-        old_file_path = Path(f"app{old_picture_path}")
-        if old_file_path.exists():
-          old_file_path.unlink()
-
-    # Update user in database
+    # Update user in database. Re-uploading the same image produces the same
+    # content-addressed URLs, so match rather than modification is checked.
     update_result = await collection.update_one(
         {"_id": user_id},
-        {"$set": {"picture": picture_url}}
+        {"$set": {
+            "picture": picture_urls[DEFAULT_PICTURE_VARIANT],
+            "picture_variants": picture_urls,
+        }}
     )
 
-    if update_result.modified_count == 0:
-      # Clean up uploaded file if database update failed
-      if file_path.exists():
-        file_path.unlink()
+    if update_result.matched_count == 0:
       return GenericResponse.error(
           message="Failed to update user picture",
           status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
       )
 
+    # Remove the previous picture's files once nothing references them
+    await _remove_unreferenced_pictures(
+        collection, _picture_paths(user_doc) - set(picture_urls.values()))
+
     # Return updated user
     updated_user_doc = await collection.find_one({"_id": user_id})
     if updated_user_doc:
@@ -492,17 +500,10 @@ async def delete_user_picture(
           status_code=status.HTTP_400_BAD_REQUEST
       )
 
-    # Delete picture file
-    picture_path = user_doc["picture"]
-    if picture_path.startswith("/static/users/"):
-      file_path = Path(f"app{picture_path}")
-      if file_path.exists():
-        file_path.unlink()
-
     # Update user document to remove picture
     update_result = await collection.update_one(
         {"_id": user_id},
-        {"$unset": {"picture": ""}}
+        {"$unset": {"picture": "", "picture_variants": ""}}
     )
 
     if update_result.modified_count == 0:
@@ -511,6 +512,9 @@ async def delete_user_picture(
           status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
       )
 
+    # Delete picture files unless another user shares the same image
+    await _remove_unreferenced_pictures(collection, _picture_paths(user_doc))
+
     # Return updated user
     updated_user_doc = await collection.find_one({"_id": user_id})
     if updated_user_doc:
@@ -1,13 +1,20 @@
 # app/api/v1/endpoints/classify.py
 
-from fastapi import APIRouter, Body
-from typing import Any
+from fastapi import APIRouter, Body, Depends, Query
+from typing import Any, List
 import logfire
 
 # Import classification service and models
 from app.services.classify.classification import classification_manager
 from app.models.classification import ClassificationInput, ClassificationResult
 from app.models.common import GenericResponse  # Import GenericResponse
+from app.core.security import get_current_user
+from app.services.classify.backfill import preview_reclassification
+from app.services.classify.table import call_flow_table
+from app.services.mongo import MongoService, get_mongo_service
+
+# Upper bound on leads accepted by one batch request
+MAX_BATCH_SIZE = 10000
 
 # Create an APIRouter instance for classification endpoints
 router = APIRouter()
@@ -47,3 +54,51 @@ async def classify_lead(lead_data: ClassificationInput = Body(...)):
     return GenericResponse.error(
         message="Classification failed", details=str(e), status_code=500
     )
+
+
+@router.post(
+    "/batch",
+    summary="Classify Leads in Batch (Rules)",
+    response_model=GenericResponse[List[dict]],
+    dependencies=[Depends(get_current_user)],
+)
+async def classify_lead_batch(leads: List[ClassificationInput] = Body(...)):
+  """
+  Evaluates many leads against the compiled call-flow rules table.
+  No AI, HubSpot or storage side effects; intended for backfills and checks.
+  """
+  if len(leads) > MAX_BATCH_SIZE:
+    return GenericResponse.error(
+        message=f"Batch too large (max {MAX_BATCH_SIZE} leads)", status_code=400)
+
+  decisions = call_flow_table.classify_batch(leads)
+  logfire.info("Batch classification completed.", leads=len(leads))
+  return GenericResponse(data=[
+      {"lead_type": d.lead_type, "reasoning": d.label, "owner_team": d.owner_team}
+      for d in decisions
+  ])
+
+
+@router.get(
+    "/reclassify/preview",
+    summary="Preview Re-classification of Stored Leads",
+    response_model=GenericResponse[dict],
+    dependencies=[Depends(get_current_user)],
+)
+async def preview_stored_reclassification(
+    limit: int = Query(5000, ge=1, le=50000,
+                       description="Maximum stored classifications to evaluate"),
+    mongo_service: MongoService = Depends(get_mongo_service),
+):
+  """
+  Re-evaluates stored classification inputs against the current rules and
+  reports which lead types would change. Nothing is written back.
+  """
+  try:
+    summary = await preview_reclassification(mongo_service, limit=limit)
+    return GenericResponse(data=summary)
+  except Exception as e:
+    logfire.error(f"Re-classification preview failed: {str(e)}", exc_info=True)
+    return GenericResponse.error(
+        message="Re-classification preview failed", details=str(e), status_code=500
+    )
@@ -28,7 +28,9 @@ from app.services.mongo import MongoService  # Import MongoService
 
 # Import the dependency injector from core
 # Add get_mongo_service
-from app.core.dependencies import get_dashboard_service_dep, get_mongo_service_dep
+from app.core.dependencies import get_dashboard_service_dep, get_mongo_service_dep, get_redis_service_dep
+from app.services.jobs import JobQueue
+from app.services.redis.service import RedisService
 from app.core.security import get_current_user  # Import JWT dependency
 from app.core.keys import PRICING_CATALOG_CACHE_KEY, GMAPS_API_CALLS_KEY, GMAPS_API_ERRORS_KEY
 
@@ -53,117 +55,15 @@ async def get_dashboard_overview_endpoint(
     dashboard_service: DashboardService = Depends(
         get_dashboard_service_dep
     ),  # Use core dependency
-    mongo_service: MongoService = Depends(
-        get_mongo_service_dep),  # Inject MongoService
 ):
-  """API endpoint to fetch dashboard overview data."""
+  """
+  API endpoint to fetch dashboard overview data.
+  Served from the materialized snapshot (see `as_of`); a snapshot older than
+  DASH_SNAPSHOT_MAX_AGE_SECONDS is rebuilt before it is returned.
+  """
   logger.info("Received request for dashboard overview.")
   try:
-    stats: Dict[str, Dict[str, int]] = await mongo_service.get_dashboard_stats()
-    # This should populate redis_counters among other things
-    base_overview = await dashboard_service.get_dashboard_overview()
-
-    # Get existing data as dict, includes base_overview.redis_counters
-    updated_data = base_overview.model_dump()
-
-    # Initialize aggregated report counters
-    agg_total_reports = 0
-    agg_successful_reports = 0
-    agg_failed_reports = 0
-
-    # 1. Quote Requests Stats (from MongoDB)
-    quote_requests_total = 0
-    quote_requests_successful = 0
-    quote_requests_failed = 0
-    if "quote_requests" in stats:
-      quote_requests_total = stats["quote_requests"].get("total", 0)
-      quote_requests_successful = stats["quote_requests"].get("successful", 0)
-      quote_requests_failed = stats["quote_requests"].get("failed", 0)
-      updated_data["quote_requests_total"] = quote_requests_total
-      updated_data["quote_requests_successful"] = quote_requests_successful
-      updated_data["quote_requests_failed"] = quote_requests_failed
-    else:
-      updated_data["quote_requests_total"] = 0
-      updated_data["quote_requests_successful"] = 0
-      updated_data["quote_requests_failed"] = 0
-      logger.warning(
-          "Quote request stats not found in mongo_service.get_dashboard_stats(). Defaulting to zeros for these.")
-
-    agg_total_reports += quote_requests_total
-    agg_successful_reports += quote_requests_successful
-    agg_failed_reports += quote_requests_failed
-
-    # 2. Location Lookups Stats
-    # These are for the top-level display fields in DashboardOverview, sourced from MongoDB
-    mongo_location_lookups_total = 0
-    mongo_location_lookups_successful = 0
-    mongo_location_lookups_failed = 0
-    if "location_lookups" in stats:
-      mongo_location_lookups_total = stats["location_lookups"].get("total", 0)
-      mongo_location_lookups_successful = stats["location_lookups"].get(
-          "successful", 0)
-      mongo_location_lookups_failed = stats["location_lookups"].get(
-          "failed", 0)
-      updated_data["location_lookups_total"] = mongo_location_lookups_total
-      updated_data["location_lookups_successful"] = mongo_location_lookups_successful
-      updated_data["location_lookups_failed"] = mongo_location_lookups_failed
-    else:
-      updated_data["location_lookups_total"] = 0
-      updated_data["location_lookups_successful"] = 0
-      updated_data["location_lookups_failed"] = 0
-      logger.warning(
-          "Location lookup stats (MongoDB) not found in mongo_service.get_dashboard_stats(). Defaulting to zeros for these.")
-
-    # For the aggregated report_summary, prioritize Redis total for location lookups if available
-    redis_location_lookups_total = 0
-    if base_overview.redis_counters and "location_lookups" in base_overview.redis_counters:
-      redis_location_stats = base_overview.redis_counters.get(
-          "location_lookups", {})
-      redis_location_lookups_total = int(redis_location_stats.get("total", 0))
-      logger.info(
-          f"Using Redis total for location lookups in report_summary: {redis_location_lookups_total}")
-    else:
-      logger.warning(
-          "Location lookup stats not found in base_overview.redis_counters for report_summary. Using MongoDB total for aggregation.")
-      # Fallback to Mongo total if not in Redis counters
-      redis_location_lookups_total = mongo_location_lookups_total
-
-    agg_total_reports += redis_location_lookups_total
-    # For successful/failed in aggregate, we use the breakdown from MongoDB stats as Redis only provides total for locations
-    agg_successful_reports += mongo_location_lookups_successful
-    agg_failed_reports += mongo_location_lookups_failed
-
-    # 3. GMaps API Calls Stats (from Redis, via base_overview.redis_counters)
-    gmaps_api_calls = 0
-    gmaps_api_errors = 0
-    if base_overview.redis_counters and "gmaps_api" in base_overview.redis_counters:
-      gmaps_stats = base_overview.redis_counters.get("gmaps_api", {})
-      gmaps_api_calls = int(gmaps_stats.get("calls", 0))
-      gmaps_api_errors = int(gmaps_stats.get("errors", 0))
-    else:
-      logger.warning(
-          "GMaps API stats not found in base_overview.redis_counters. Defaulting to zeros for these.")
-
-    gmaps_api_successful = max(0, gmaps_api_calls - gmaps_api_errors)
-
-    agg_total_reports += gmaps_api_calls
-    agg_successful_reports += gmaps_api_successful
-    agg_failed_reports += gmaps_api_errors
-
-    # Update the report_summary field with these aggregated counts
-    # This was the field previously populated by dashboard_service.get_report_summary()
-    updated_data["report_summary"] = {
-        # Corrected key to match original model if it was 'total_reports'
-        "total_reports": agg_total_reports,
-        "success_count": agg_successful_reports,  # Corrected key
-        "failure_count": agg_failed_reports  # Corrected key
-    }
-
-    # Ensure other fields from base_overview (like recent_errors, cache_stats etc.) are preserved
-    # The updated_data started with base_overview.model_dump(), so they are already there.
-
-    overview = DashboardOverview(**updated_data)
-
+    overview = await dashboard_service.get_dashboard_overview_snapshot()
     return GenericResponse[DashboardOverview](data=overview)
   except Exception as e:
     logger.error(f"Error fetching dashboard overview: {e}", exc_info=True)
@@ -173,6 +73,21 @@ async def get_dashboard_overview_endpoint(
     )
 
 
+@router.get(
+    "/counters/rates",
+    response_model=GenericResponse[Dict],
+    summary="Get Counter Rates",
+    description="Per-minute deltas of the request, API and cache counters over the last N minutes.",
+    dependencies=[Depends(get_current_user)],
+)
+async def get_counter_rates_endpoint(
+    minutes: int = Query(60, ge=1, le=1440, description="Number of minutes to return."),
+    dashboard_service: DashboardService = Depends(get_dashboard_service_dep),
+):
+  """API endpoint to fetch per-minute counter rates."""
+  return GenericResponse(data=await dashboard_service.get_counter_rates(minutes))
+
+
 @router.get(
     "/requests/recent",
     # Use GenericResponse
@@ -475,6 +390,41 @@ async def clear_maps_cache(
   )
 
 
+@router.post(
+    "/cache/clear/maps/unresolvable",
+    response_model=GenericResponse[MessageResponse],
+    summary="Clear Unresolvable Locations Cache",
+    description=(
+        "Clears negative cache entries for delivery locations Google Maps could not resolve, "
+        "so the next lookup for them calls the API again. Use '*' to clear every entry."
+    ),
+    dependencies=[Depends(get_current_user)],
+)
+async def clear_unresolvable_locations_cache(
+    location_pattern: str = Body(
+        ...,
+        embed=True,
+        description="Pattern to match in the normalized delivery location (e.g., '123mainst'), or '*' for all.",
+    ),
+    dashboard_service: DashboardService = Depends(get_dashboard_service_dep),
+):
+  """Endpoint to clear negative cache entries by location pattern."""
+  logger.warning(
+      f"Requested clearing unresolvable locations cache with pattern: {location_pattern}")
+  if not location_pattern:
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Location pattern must be provided.",
+    )
+  pattern = location_pattern if location_pattern == "*" else f"*{location_pattern}*"
+  deleted_count = await dashboard_service.clear_unresolvable_locations(pattern)
+  return GenericResponse[MessageResponse](
+      data=MessageResponse(
+          message=f"Cleared {deleted_count} unresolvable location keys matching pattern '{pattern}'."
+      )
+  )
+
+
 @router.get(
     "/errors",
     response_model=GenericResponse[
@@ -680,3 +630,24 @@ async def get_services_status_endpoint(
     raise HTTPException(
         status_code=500, detail="Failed to retrieve external services status."
     )
+
+
+@router.get(
+    "/jobs",
+    response_model=GenericResponse[Dict],
+    summary="Get Background Job Queue Status",
+    description="Retrieves depth, pending, retry and dead-letter counts and average wait/run latency for each background job queue.",
+    dependencies=[Depends(get_current_user)],
+)
+async def get_job_queue_status(
+    redis_service: RedisService = Depends(get_redis_service_dep),
+):
+  """API endpoint to fetch background job queue statistics."""
+  try:
+    stats = await JobQueue(redis_service).get_stats()
+    return GenericResponse(data=stats)
+  except Exception as e:
+    logger.error(f"Error fetching job queue status: {e}", exc_info=True)
+    raise HTTPException(
+        status_code=500, detail="Failed to retrieve job queue status."
+    )
@@ -1,10 +1,12 @@
 """Unified overview endpoint combining all latency metrics."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
 import logging
 
 from app.core.dependencies import get_dashboard_service_dep
 from app.services.dash import DashboardService
+from app.services.dash.snapshot import LATENCY_OVERVIEW_SNAPSHOT
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.latency.overview import LatencyOverview
@@ -14,6 +16,58 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Range served from the materialized snapshot; other ranges are computed per request
+SNAPSHOT_TIME_RANGE_MINUTES = 60
+
+
+async def build_latency_overview(
+    dashboard_service: DashboardService,
+    time_range_minutes: int = SNAPSHOT_TIME_RANGE_MINUTES,
+) -> LatencyOverview:
+  """Computes the latency overview; used by the endpoint and the snapshot aggregator."""
+  # Import the individual endpoints to reuse their logic
+  from .percentiles import get_all_services_percentiles
+  from .averages import get_all_services_averages
+  from .trends import get_all_services_trends
+
+  percentiles, averages, trends, spikes = await asyncio.gather(
+      get_all_services_percentiles(dashboard_service, None),
+      get_all_services_averages(dashboard_service, None),
+      get_all_services_trends(time_range_minutes, dashboard_service, None),
+      # Get spike summaries instead of detailed spike analysis for overview
+      dashboard_service.latency_service.get_spike_summaries(time_range_minutes),
+  )
+
+  # For alerts, create a simple mock since the full implementation needs more work
+  from app.models.latency.alerts.alerts import AllServicesAlerts, AlertSeverity
+  alerts = AllServicesAlerts(
+      active_alerts=[],
+      critical_count=0,
+      warning_count=0,
+      info_count=0,
+      total_alerts=0,
+      overall_severity=AlertSeverity.INFO,
+      services_with_alerts=[]
+  )
+
+  # Create comprehensive overview
+  from app.models.latency.metrics.percentiles import LatencyStatus
+  overview = LatencyOverview(
+      percentiles=percentiles,
+      averages=averages,
+      alerts=alerts,
+      trends=trends,
+      spikes=spikes,
+      overall_status=LatencyStatus.UNKNOWN,
+      system_health_score=None,
+      analysis_time_range_minutes=time_range_minutes
+  )
+
+  # Update calculated fields
+  overview.update_calculated_fields()
+  return overview
+
+
 @router.get("/data", response_model=LatencyOverview)
 async def get_latency_overview(
     time_range_minutes: int = Query(
@@ -34,49 +88,19 @@ async def get_latency_overview(
 
   This endpoint provides a complete picture of system latency health
   across all services: Quote, Location, Google Maps, and Redis APIs.
+  The default 60 minute range is served from the background snapshot
+  (see `as_of`).
   """
   try:
-    # Import the individual endpoints to reuse their logic
-    from .percentiles import get_all_services_percentiles
-    from .averages import get_all_services_averages
-    from .trends import get_all_services_trends
-    from .spikes import get_all_services_spikes
-
-    # Get all metrics in parallel would be ideal, but for simplicity doing sequentially
-    percentiles = await get_all_services_percentiles(dashboard_service, current_user)
-    averages = await get_all_services_averages(dashboard_service, current_user)
-    trends = await get_all_services_trends(time_range_minutes, dashboard_service, current_user)
-    # Get spike summaries instead of detailed spike analysis for overview
-    spikes = await dashboard_service.latency_service.get_spike_summaries(time_range_minutes)
-
-    # For alerts, create a simple mock since the full implementation needs more work
-    from app.models.latency.alerts.alerts import AllServicesAlerts, AlertSeverity
-    alerts = AllServicesAlerts(
-        active_alerts=[],
-        critical_count=0,
-        warning_count=0,
-        info_count=0,
-        total_alerts=0,
-        overall_severity=AlertSeverity.INFO,
-        services_with_alerts=[]
-    )
+    if time_range_minutes != SNAPSHOT_TIME_RANGE_MINUTES:
+      return await build_latency_overview(dashboard_service, time_range_minutes)
 
-    # Create comprehensive overview
-    from app.models.latency.metrics.percentiles import LatencyStatus
-    overview = LatencyOverview(
-        percentiles=percentiles,
-        averages=averages,
-        alerts=alerts,
-        trends=trends,
-        spikes=spikes,
-        overall_status=LatencyStatus.UNKNOWN,
-        system_health_score=None,
-        analysis_time_range_minutes=time_range_minutes
+    snapshot = await dashboard_service.snapshot_store.serve(
+        LATENCY_OVERVIEW_SNAPSHOT,
+        lambda: build_latency_overview(dashboard_service),
     )
-
-    # Update calculated fields
-    overview.update_calculated_fields()
-
+    overview = LatencyOverview.model_validate(snapshot.data)
+    overview.as_of = snapshot.as_of
     return overview
 
   except Exception as e:
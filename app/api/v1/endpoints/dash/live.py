@@ -0,0 +1,81 @@
+# app/api/v1/endpoints/dash/live.py
+
+"""Server-sent events stream of live dashboard metrics."""
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from app.core.security import get_current_user
+from app.models.common import GenericResponse
+from app.services.dash.live import TOPICS, LiveMetricsOverloaded, live_metrics_hub
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+# Comment frames keep proxies from closing an idle stream
+KEEPALIVE_SECONDS = 15.0
+
+
+def _split(value: Optional[str]):
+  return [item.strip() for item in value.split(",") if item.strip()] if value else None
+
+
+@router.get(
+    "/live",
+    summary="Live Dashboard Metrics Stream",
+    description=(
+        "Server-sent events for counter deltas (`counters`), latency histograms "
+        "(`latency`), recent errors (`errors`) and request log entries (`requests`)."
+    ),
+    dependencies=[Depends(get_current_user)],
+)
+async def stream_live_metrics(
+    request: Request,
+    topics: Optional[str] = Query(
+        None, description=f"Comma-separated topics to receive ({', '.join(sorted(TOPICS))}); all by default"),
+    services: Optional[str] = Query(
+        None, description="Comma-separated services for latency events (quote, location, gmaps, redis)"),
+):
+  """Streams dashboard events from the process-wide publisher."""
+  try:
+    subscription = live_metrics_hub.subscribe(_split(topics), _split(services))
+  except LiveMetricsOverloaded as e:
+    raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+  async def event_stream():
+    reported_drops = 0
+    try:
+      yield "retry: 5000\n\n"
+      while not await request.is_disconnected():
+        events = await subscription.drain(KEEPALIVE_SECONDS)
+        if subscription.dropped > reported_drops:
+          # Tell a slow client it missed events so it can refetch a snapshot
+          yield f"event: dropped\ndata: {subscription.dropped - reported_drops}\n\n"
+          reported_drops = subscription.dropped
+        if not events:
+          yield ": keepalive\n\n"
+          continue
+        for event in events:
+          yield event.frame
+    finally:
+      await live_metrics_hub.unsubscribe(subscription)
+
+  return StreamingResponse(
+      event_stream(),
+      media_type="text/event-stream",
+      headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+  )
+
+
+@router.get(
+    "/live/stats",
+    response_model=GenericResponse[dict],
+    summary="Live Stream Publisher Stats",
+    dependencies=[Depends(get_current_user)],
+)
+async def get_live_metrics_stats():
+  """Connected clients, published and dropped events for this process."""
+  return GenericResponse(data=live_metrics_hub.stats())
@@ -1,6 +1,6 @@
 # app/api/v1/endpoints/health.py
 
-from fastapi import APIRouter, Depends  # Updated import
+from fastapi import APIRouter, Depends, Request  # Updated import
 import httpx
 from datetime import datetime, timezone
 import time
@@ -20,7 +20,7 @@ from app.models.common import HealthCheckResponse, GenericResponse  # Updated im
 # Import unified dependencies
 from app.core.dependencies import get_mongo_service_dep, get_redis_service_dep
 from app.services.bland import get_bland_manager, BlandAIManager
-from app.services.mongo.dependency import MongoService
+from app.services.mongo import MongoService
 from app.services.redis.service import RedisService
 # Added import for Redis specific errors
 from redis.exceptions import RedisError
@@ -226,3 +226,15 @@ async def ping():
   Returns a 200 OK with "pong" message, useful for load balancers.
   """
   return {"ping": "pong"}
+
+
+@router.get("/startup", summary="Startup Timing Breakdown")
+async def startup_timings(request: Request):
+  """
+  Returns the per-phase startup timing breakdown recorded during the
+  application lifespan, including deferred phases that run after readiness.
+  """
+  startup = getattr(request.app.state, "startup", None)
+  if startup is None:
+    return GenericResponse.error("Startup report not available.", status_code=404)
+  return GenericResponse(success=True, data=startup.report(), status_code=200)
@@ -1,6 +1,6 @@
 # app/api/v1/endpoints/hubspot/sync.py
 
-from fastapi import APIRouter, Path as FastAPIPath, Depends
+from fastapi import APIRouter, Path as FastAPIPath, Depends, Query
 from typing import Literal, Optional
 import logfire
 
@@ -12,6 +12,9 @@ from app.services.hubspot.properties import PropertySyncManager
 
 router = APIRouter(prefix="/properties/sync", tags=["hubspot-sync"])
 
+DRY_RUN_QUERY = Query(
+    False, description="Report the properties that would be created or updated without changing HubSpot")
+
 
 @router.post(
     "/all",
@@ -19,14 +22,17 @@ router = APIRouter(prefix="/properties/sync", tags=["hubspot-sync"])
     summary="Sync all properties to HubSpot",
     description="Sync all contact and lead properties from JSON files to HubSpot"
 )
-async def sync_all_properties(current_user: User = Depends(get_current_user)):
+async def sync_all_properties(
+    dry_run: bool = DRY_RUN_QUERY,
+    current_user: User = Depends(get_current_user)
+):
   """
   Sync all properties from contact.json and lead.json to HubSpot.
 
   This endpoint will:
   - Load property definitions from both contact.json and lead.json
-  - Check which properties already exist in HubSpot
-  - Create any missing properties
+  - Diff them against one listing of the existing HubSpot properties
+  - Batch-create missing properties and update changed ones (unless dry_run)
   - Return a summary of the sync operation
   """
   try:
@@ -36,7 +42,7 @@ async def sync_all_properties(current_user: User = Depends(get_current_user)):
     property_sync = PropertySyncManager(hubspot_manager)
 
     # Perform sync
-    results = await property_sync.sync_all_properties()
+    results = await property_sync.sync_all_properties(dry_run=dry_run)
 
     if results.get("status") == "error":
       return GenericResponse.error(
@@ -67,14 +73,17 @@ async def sync_all_properties(current_user: User = Depends(get_current_user)):
     summary="Sync contact properties to HubSpot",
     description="Sync contact properties from contact.json to HubSpot"
 )
-async def sync_contact_properties(current_user: User = Depends(get_current_user)):
+async def sync_contact_properties(
+    dry_run: bool = DRY_RUN_QUERY,
+    current_user: User = Depends(get_current_user)
+):
   """
   Sync contact properties from contact.json to HubSpot.
 
   This endpoint will:
   - Load property definitions from contact.json
-  - Check which properties already exist in HubSpot
-  - Create any missing contact properties
+  - Diff them against one listing of the existing HubSpot properties
+  - Batch-create missing contact properties and update changed ones (unless dry_run)
   - Return a summary of the sync operation
   """
   try:
@@ -84,7 +93,7 @@ async def sync_contact_properties(current_user: User = Depends(get_current_user)
     property_sync = PropertySyncManager(hubspot_manager)
 
     # Perform contact sync
-    results = await property_sync.sync_contact_properties()
+    results = await property_sync.sync_contact_properties(dry_run=dry_run)
 
     if results.get("status") == "error":
       return GenericResponse.error(
@@ -95,6 +104,7 @@ async def sync_contact_properties(current_user: User = Depends(get_current_user)
     logfire.info(
         "Contact property sync completed successfully",
         created=len(results.get("created", [])),
+        updated=len(results.get("updated", [])),
         existing=len(results.get("existing", [])),
         failed=len(results.get("failed", []))
     )
@@ -117,14 +127,17 @@ async def sync_contact_properties(current_user: User = Depends(get_current_user)
     summary="Sync lead properties to HubSpot",
     description="Sync lead properties from lead.json to HubSpot"
 )
-async def sync_lead_properties(current_user: User = Depends(get_current_user)):
+async def sync_lead_properties(
+    dry_run: bool = DRY_RUN_QUERY,
+    current_user: User = Depends(get_current_user)
+):
   """
   Sync lead properties from lead.json to HubSpot.
 
   This endpoint will:
   - Load property definitions from lead.json
-  - Check which properties already exist in HubSpot
-  - Create any missing lead properties
+  - Diff them against one listing of the existing HubSpot properties
+  - Batch-create missing lead properties and update changed ones (unless dry_run)
   - Return a summary of the sync operation
   """
   try:
@@ -134,7 +147,7 @@ async def sync_lead_properties(current_user: User = Depends(get_current_user)):
     property_sync = PropertySyncManager(hubspot_manager)
 
     # Perform lead sync
-    results = await property_sync.sync_lead_properties()
+    results = await property_sync.sync_lead_properties(dry_run=dry_run)
 
     if results.get("status") == "error":
       return GenericResponse.error(
@@ -145,6 +158,7 @@ async def sync_lead_properties(current_user: User = Depends(get_current_user)):
     logfire.info(
         "Lead property sync completed successfully",
         created=len(results.get("created", [])),
+        updated=len(results.get("updated", [])),
         existing=len(results.get("existing", [])),
         failed=len(results.get("failed", []))
     )
@@ -1,9 +1,9 @@
 # app/api/v1/endpoints/webhooks/form/router.py
 
-from fastapi import APIRouter, BackgroundTasks, Body
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, Header, Response
 import logfire
 from pydantic import BaseModel
-from typing import Optional, Any
+from typing import Optional, Any, Dict
 
 # Import models
 from app.models.webhook import FormPayload
@@ -12,6 +12,7 @@ from app.models.common import GenericResponse
 
 # Import services
 from app.services.classify.classification import classification_manager
+from app.services.redis import RedisService, get_redis_service
 
 # Import local helpers
 from .service import (
@@ -22,6 +23,8 @@ from .service import (
 
 # Import shared helpers
 from ..util import prepare_classification_input
+from ..util.idempotency import IDEMPOTENCY_KEY_HEADER, WebhookIdempotency, derive_event_id
+
 
 router = APIRouter()
 
@@ -40,13 +43,44 @@ class FormWebhookResponseData(BaseModel):
 
 @router.post("/form", summary="Process Form Submissions", response_model=GenericResponse[FormWebhookResponseData])
 async def webhook_form(
+    response: Response,
     payload: FormPayload = Body(...),
-    background_tasks: BackgroundTasks = BackgroundTasks()
+    background_tasks: BackgroundTasks = BackgroundTasks(),
+    redis_service: RedisService = Depends(get_redis_service),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER)
 ) -> GenericResponse[FormWebhookResponseData]:
   """
   Receives form submission data, checks completeness, triggers classification,
   and updates HubSpot. If incomplete, triggers a Bland.ai call.
+  Re-deliveries (same Idempotency-Key header or, without one, an identical
+  body within the retry window) are acknowledged with the original outcome.
   """
+  event_id = derive_event_id(
+      payload.model_dump(mode="json"), delivery_id=idempotency_key)
+
+  async def _handler() -> Dict[str, Any]:
+    data = await _process_form_webhook(payload, background_tasks)
+    return data.model_dump(mode="json")
+
+  outcome = await WebhookIdempotency(redis_service).execute("form", event_id, _handler)
+
+  if outcome.duplicate:
+    response.headers["X-Idempotent-Replay"] = outcome.state
+  if outcome.result is None:
+    return GenericResponse(
+        data=FormWebhookResponseData(
+            status="received",
+            message="Duplicate submission; original is still being processed."
+        )
+    )
+  return GenericResponse(data=FormWebhookResponseData(**outcome.result))
+
+
+async def _process_form_webhook(
+    payload: FormPayload,
+    background_tasks: BackgroundTasks,
+) -> FormWebhookResponseData:
+  """Processes a single (first) delivery of a form submission."""
   logfire.info("Received form webhook payload.",
                form_data=payload.model_dump(exclude_none=True))
 
@@ -56,11 +90,9 @@ async def webhook_form(
     # Trigger Bland.ai call in the background
     background_tasks.add_task(trigger_bland_call, payload)
     # Return a response indicating the call is being made
-    return GenericResponse(
-        data=FormWebhookResponseData(
-            status="incomplete",
-            message="Form incomplete, initiating follow-up call."
-        )
+    return FormWebhookResponseData(
+        status="incomplete",
+        message="Form incomplete, initiating follow-up call."
     )
 
   logfire.info("Form data complete, proceeding to classification.")
@@ -127,12 +159,10 @@ async def webhook_form(
   # ------------------------- #
 
   # Return classification result (or a success message)
-  return GenericResponse(
-      data=FormWebhookResponseData(
-          status="success",
-          message="Form processed and classification initiated.",
-          classification_result=classification_result.model_dump(
-              exclude_none=True),
-          hubspot_update_status=hubspot_status
-      )
+  return FormWebhookResponseData(
+      status="success",
+      message="Form processed and classification initiated.",
+      classification_result=classification_result.model_dump(
+          mode="json", exclude_none=True),
+      hubspot_update_status=hubspot_status
   )
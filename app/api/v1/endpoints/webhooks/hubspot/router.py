@@ -1,8 +1,9 @@
 # app/api/v1/endpoints/webhooks/hubspot/router.py
 
-from fastapi import APIRouter, BackgroundTasks, Body, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, Header, HTTPException, Response
 import logfire
 from pydantic import BaseModel
+from typing import Any, Dict, Optional
 
 # Import models
 from app.models.webhook import HubSpotContactDataPayload
@@ -13,9 +14,12 @@ from .service import is_contact_complete, trigger_bland_call_for_contact, update
 
 # Import shared helpers
 from ..util import prepare_classification_input
+from ..util.idempotency import IDEMPOTENCY_KEY_HEADER, WebhookIdempotency, derive_event_id
 
 # Import services
 from app.services.classify.classification import classification_manager
+from app.services.redis import RedisService, get_redis_service
+
 
 router = APIRouter()
 
@@ -29,16 +33,47 @@ class HubSpotWebhookResponseData(BaseModel):
 
 @router.post("/hubspot", summary="Handle HubSpot Direct Contact Data Webhook", response_model=GenericResponse[HubSpotWebhookResponseData])
 async def webhook_hubspot(
+    response: Response,
     # Use the updated payload model
     payload: HubSpotContactDataPayload = Body(...),
-    background_tasks: BackgroundTasks = BackgroundTasks()
+    background_tasks: BackgroundTasks = BackgroundTasks(),
+    redis_service: RedisService = Depends(get_redis_service),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER)
 ) -> GenericResponse[HubSpotWebhookResponseData]:
   """
   Receives direct contact data payload from HubSpot (e.g., via Workflow).
   Processes the direct data from the webhook.
   If complete: Classifies data, creates/updates lead, notifies n8n.
   If incomplete: Creates a basic lead, triggers Bland.ai call.
+  Re-deliveries (same Idempotency-Key header or, without one, an identical
+  body within the retry window) are acknowledged with the original outcome.
   """
+  event_id = derive_event_id(
+      payload.model_dump(mode="json"), delivery_id=idempotency_key)
+
+  async def _handler() -> Dict[str, Any]:
+    data = await _process_hubspot_webhook(payload, background_tasks)
+    return data.model_dump(mode="json")
+
+  outcome = await WebhookIdempotency(redis_service).execute("hubspot", event_id, _handler)
+
+  if outcome.duplicate:
+    response.headers["X-Idempotent-Replay"] = outcome.state
+  if outcome.result is None:
+    return GenericResponse(
+        data=HubSpotWebhookResponseData(
+            status="received",
+            message="Duplicate delivery; original is still being processed."
+        )
+    )
+  return GenericResponse(data=HubSpotWebhookResponseData(**outcome.result))
+
+
+async def _process_hubspot_webhook(
+    payload: HubSpotContactDataPayload,
+    background_tasks: BackgroundTasks,
+) -> HubSpotWebhookResponseData:
+  """Processes a single (first) delivery of a HubSpot contact webhook."""
   logfire.info("Received HubSpot direct contact data payload.")
 
   # Convert the payload to a dict to process
@@ -110,9 +145,7 @@ async def webhook_hubspot(
         contact_properties
     )
 
-  return GenericResponse(
-      data=HubSpotWebhookResponseData(
-          status="received",
-          message="HubSpot direct contact data processed. Lead creation deferred."
-      )
+  return HubSpotWebhookResponseData(
+      status="received",
+      message="HubSpot direct contact data processed. Lead creation deferred."
   )
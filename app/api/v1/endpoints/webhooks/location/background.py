@@ -20,6 +20,7 @@ from app.core.security import get_api_key
 from app.services.background.util import attach_background_tasks
 from app.services.dash.background import increment_request_counter_bg
 from app.services.background.mongo.tasks import log_location_bg  # Added import
+from app.services.jobs import dispatch_job
 from app.core.keys import TOTAL_LOCATION_LOOKUPS_KEY
 
 logger = logging.getLogger(__name__)
@@ -40,7 +41,7 @@ async def location_lookup_webhook(
   Webhook endpoint to initiate background caching of location distance.
   - Validates API Key.
   - Receives `delivery_location`.
-  - Adds a background task to call `location_service.prefetch_distance`.
+  - Enqueues `location_service.prefetch_distance` (job queue or background task).
   - Returns `202 Accepted` immediately.
   """
   logger.info(
@@ -50,9 +51,14 @@ async def location_lookup_webhook(
   attach_background_tasks(location_service, background_tasks)
   attach_background_tasks(redis_service, background_tasks)
 
-  # Add background tasks
-  background_tasks.add_task(
-      location_service.prefetch_distance, payload.delivery_location
+  # Prefetch runs in the job worker when the queue is enabled
+  await dispatch_job(
+      redis_service,
+      background_tasks,
+      "location_prefetch",
+      {"delivery_location": payload.delivery_location},
+      location_service.prefetch_distance,
+      payload.delivery_location,
   )
   background_tasks.add_task(
       increment_request_counter_bg, redis_service, TOTAL_LOCATION_LOOKUPS_KEY
@@ -75,7 +81,11 @@ async def location_lookup_webhook(
       "cache_hit": False,
       "full_response_data": None  # Will be populated later by the prefetch task
   }
-  background_tasks.add_task(
+  await dispatch_job(
+      redis_service,
+      background_tasks,
+      "log_location",
+      {"location_data": location_data},
       log_location_bg,
       mongo_service=mongo_service,
       location_data=location_data
@@ -20,6 +20,7 @@ from .hubspot import (
     update_hubspot_lead_after_classification,
     is_hubspot_contact_complete
 )
+from .idempotency import WebhookIdempotency, IdempotentOutcome, derive_event_id, IDEMPOTENCY_KEY_HEADER
 
 __all__ = [
     # Service setup utilities
@@ -37,5 +38,11 @@ __all__ = [
     # HubSpot integration utilities
     "handle_hubspot_update",
     "update_hubspot_lead_after_classification",
-    "is_hubspot_contact_complete"
+    "is_hubspot_contact_complete",
+
+    # Webhook deduplication
+    "WebhookIdempotency",
+    "IdempotentOutcome",
+    "derive_event_id",
+    "IDEMPOTENCY_KEY_HEADER"
 ]
@@ -0,0 +1,180 @@
+# app/api/v1/endpoints/webhooks/util/idempotency.py
+
+"""
+Idempotency layer for inbound webhooks.
+Bland, form and HubSpot webhooks are re-delivered when the provider times out.
+Each delivery is claimed in Redis with SET NX; the first one runs the handler
+and stores its outcome, later ones replay that outcome instead of re-running
+classification, HubSpot writes and n8n handoff.
+
+A delivery is identified by the sender's Idempotency-Key header or a payload
+id when there is one. Otherwise it falls back to a hash of the body, which
+cannot tell a retry from a genuine resubmission of the same data; hash keys
+are therefore only kept for the short retry window of
+WEBHOOK_IDEMPOTENCY_HASH_TTL_SECONDS, after which an identical body is
+processed again.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+import logfire
+
+from app.core.config import settings
+from app.core.keys import WEBHOOK_IDEMPOTENCY_PREFIX
+from app.services.redis.service import RedisService
+
+# Request header carrying a sender-assigned delivery id, stable across retries
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+# Event ids derived from the body rather than sent by the provider
+PAYLOAD_HASH_PREFIX = "sha256:"
+
+STATE_IN_PROGRESS = "in_progress"
+STATE_COMPLETED = "completed"
+
+# Poll interval while a duplicate waits on an original running in another worker
+_POLL_INTERVAL_SECONDS = 0.25
+
+
+@dataclass
+class IdempotentOutcome:
+  """Result of running a webhook handler through the idempotency guard."""
+
+  result: Optional[Dict[str, Any]]
+  # True when this delivery was not the one that ran the handler
+  duplicate: bool = False
+  # "fresh", "completed" (replayed) or "in_progress" (original still running)
+  state: str = "fresh"
+
+
+def derive_event_id(
+    payload: Dict[str, Any],
+    id_fields: Iterable[str] = (),
+    delivery_id: Optional[str] = None,
+) -> str:
+  """
+  Returns the sender's `delivery_id` (the Idempotency-Key header), else the
+  first non-empty identifier among `id_fields`, else a SHA-256 of the
+  canonical payload. Re-deliveries carry an identical body, so the hash is
+  stable across retries.
+  """
+  if delivery_id and delivery_id.strip():
+    return delivery_id.strip()
+  for field_name in id_fields:
+    value = payload.get(field_name)
+    if value not in (None, ""):
+      return str(value)
+  canonical = json.dumps(payload, sort_keys=True, default=str)
+  return PAYLOAD_HASH_PREFIX + hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class WebhookIdempotency:
+  """
+  Deduplicates webhook deliveries by (source, event id).
+
+  Duplicates arriving while the original is still running in this process
+  await the same future; duplicates hitting another worker poll the stored
+  record for up to WEBHOOK_IDEMPOTENCY_WAIT_SECONDS. If Redis is unavailable
+  the guard fails open and the handler runs.
+  """
+
+  # In-flight originals in this process, keyed by Redis key
+  _inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+  def __init__(self, redis_service: RedisService):
+    self.redis_service = redis_service
+    self.result_ttl = settings.WEBHOOK_IDEMPOTENCY_TTL_SECONDS
+    self.hash_result_ttl = settings.WEBHOOK_IDEMPOTENCY_HASH_TTL_SECONDS
+    self.lock_ttl = settings.WEBHOOK_IDEMPOTENCY_LOCK_SECONDS
+    self.wait_seconds = settings.WEBHOOK_IDEMPOTENCY_WAIT_SECONDS
+
+  @staticmethod
+  def key_for(source: str, event_id: str) -> str:
+    return f"{WEBHOOK_IDEMPOTENCY_PREFIX}{source}:{event_id}"
+
+  def ttl_for(self, event_id: str) -> int:
+    """How long an outcome is replayed: payload hashes only cover the retry window."""
+    if event_id.startswith(PAYLOAD_HASH_PREFIX):
+      return self.hash_result_ttl
+    return self.result_ttl
+
+  async def execute(
+      self,
+      source: str,
+      event_id: Optional[str],
+      handler: Callable[[], Awaitable[Dict[str, Any]]],
+  ) -> IdempotentOutcome:
+    """
+    Runs `handler` once per (source, event_id) and returns its JSON-safe
+    result. Duplicates receive the stored result without running it again.
+    """
+    if not settings.WEBHOOK_IDEMPOTENCY_ENABLED or not event_id:
+      return IdempotentOutcome(result=await handler())
+
+    key = self.key_for(source, event_id)
+
+    local = self._inflight.get(key)
+    if local is not None:
+      logfire.info("Duplicate webhook coalesced onto in-flight original.",
+                   source=source, event_id=event_id)
+      return IdempotentOutcome(result=await asyncio.shield(local), duplicate=True, state=STATE_COMPLETED)
+
+    claim = json.dumps({
+        "state": STATE_IN_PROGRESS,
+        "claimed_at": datetime.now(timezone.utc).isoformat(),
+    })
+    acquired = await self.redis_service.set_if_not_exists(key, claim, ttl=self.lock_ttl)
+
+    if acquired is False:
+      return await self._replay(key, source, event_id)
+
+    if acquired is None:
+      logfire.warning("Idempotency store unavailable; processing webhook without deduplication.",
+                      source=source, event_id=event_id)
+
+    future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+    self._inflight[key] = future
+    try:
+      result = await handler()
+    except BaseException as e:
+      # Release the claim so the provider's next retry can be processed
+      if acquired:
+        await self.redis_service.delete(key)
+      if not future.done():
+        future.set_exception(e)
+        # Mark retrieved so an un-awaited future does not log a warning
+        future.exception()
+      raise
+    finally:
+      self._inflight.pop(key, None)
+
+    if acquired:
+      await self.redis_service.set_json(key, {
+          "state": STATE_COMPLETED,
+          "completed_at": datetime.now(timezone.utc).isoformat(),
+          "result": result,
+      }, ttl=self.ttl_for(event_id))
+    future.set_result(result)
+    return IdempotentOutcome(result=result)
+
+  async def _replay(self, key: str, source: str, event_id: str) -> IdempotentOutcome:
+    """Returns the stored outcome, waiting briefly if the original is still running."""
+    deadline = time.monotonic() + self.wait_seconds
+    while True:
+      record = await self.redis_service.get_json(key)
+      if record and record.get("state") == STATE_COMPLETED:
+        logfire.info("Duplicate webhook acknowledged with stored outcome.",
+                     source=source, event_id=event_id)
+        return IdempotentOutcome(result=record.get("result"), duplicate=True, state=STATE_COMPLETED)
+      if record is None or time.monotonic() >= deadline:
+        break
+      await asyncio.sleep(_POLL_INTERVAL_SECONDS)
+
+    logfire.info("Duplicate webhook acknowledged while original is in progress.",
+                 source=source, event_id=event_id)
+    return IdempotentOutcome(result=None, duplicate=True, state=STATE_IN_PROGRESS)
@@ -1,6 +1,6 @@
 # app/api/v1/endpoints/webhooks/voice/router.py
 
-from fastapi import APIRouter, BackgroundTasks, Body, HTTPException, status, Depends
+from fastapi import APIRouter, BackgroundTasks, Body, HTTPException, Response, status, Depends
 import logfire
 from typing import Optional, Dict, Any
 from pydantic import BaseModel
@@ -16,9 +16,11 @@ from app.services.bland import get_bland_manager
 from app.services.classify.classification import classification_manager
 from app.services.hubspot import hubspot_manager
 from app.services.mongo import MongoService, get_mongo_service
+from app.services.redis import RedisService, get_redis_service
 
 # Import background task for classification
 from app.services.background import process_voice_classification_bg
+from app.services.jobs import dispatch_job
 
 # Import local helpers
 from .service import (
@@ -29,6 +31,7 @@ from .service import (
 
 # Import shared helpers
 from ..util import prepare_classification_input
+from ..util.idempotency import WebhookIdempotency, derive_event_id
 
 router = APIRouter()
 
@@ -54,9 +57,11 @@ class VoiceWebhookResponseData(BaseModel):
     response_model=GenericResponse[VoiceWebhookResponseData]
 )
 async def webhook_voice(
+    response: Response,
     payload: BlandWebhookPayload = Body(...),
     background_tasks: BackgroundTasks = BackgroundTasks(),
     mongo_service: MongoService = Depends(get_mongo_service),
+    redis_service: RedisService = Depends(get_redis_service),
     use_ai_processing: bool = True  # New parameter to enable/disable AI processing
 ) -> GenericResponse[VoiceWebhookResponseData]:
   """
@@ -68,15 +73,52 @@ async def webhook_voice(
   - Stores results in MongoDB for later retrieval
   - Maintains backward compatibility with existing pipeline
 
+  Re-deliveries of the same call_id are acknowledged with the original
+  outcome and do not queue classification again.
+
   Args:
     payload: Bland webhook payload containing call data and transcript
     background_tasks: FastAPI background tasks for async operations
     mongo_service: MongoDB service dependency
+    redis_service: Redis service used for webhook deduplication
     use_ai_processing: Whether to use AI-enhanced processing (default: True)
 
   Returns:
     GenericResponse with immediate acknowledgment and background task ID
   """
+  event_id = payload.call_id or derive_event_id(
+      payload.model_dump(mode="json"), ())
+
+  async def _handler() -> Dict[str, Any]:
+    data = await _process_voice_webhook(
+        payload, background_tasks, redis_service, use_ai_processing)
+    return data.model_dump(mode="json")
+
+  outcome = await WebhookIdempotency(redis_service).execute("voice", event_id, _handler)
+
+  if outcome.duplicate:
+    response.headers["X-Idempotent-Replay"] = outcome.state
+  if outcome.result is None:
+    return GenericResponse(
+        data=VoiceWebhookResponseData(
+            status="received",
+            source="voice",
+            action="duplicate_in_progress",
+            call_id=payload.call_id or "unknown",
+            ai_processing_enabled=use_ai_processing,
+            processing_summary="Duplicate delivery; original is still being processed"
+        )
+    )
+  return GenericResponse(data=VoiceWebhookResponseData(**outcome.result))
+
+
+async def _process_voice_webhook(
+    payload: BlandWebhookPayload,
+    background_tasks: BackgroundTasks,
+    redis_service: RedisService,
+    use_ai_processing: bool,
+) -> VoiceWebhookResponseData:
+  """Processes a single (first) delivery of a Bland voice webhook."""
   call_id = payload.call_id or "unknown"
   processing_task_id = str(uuid.uuid4())
 
@@ -87,9 +129,18 @@ async def webhook_voice(
 
   try:
     if use_ai_processing:
-      # Add AI-enhanced background classification task
-      background_tasks.add_task(
+      # Hand AI-enhanced classification to the job queue (or a background task)
+      dispatched_to = await dispatch_job(
+          redis_service,
+          background_tasks,
+          "voice_classification",
+          {
+              "webhook_payload": payload.model_dump(mode="json", by_alias=True),
+              "use_ai_classification": True,
+              "background_task_id": processing_task_id,
+          },
           process_voice_classification_bg,
+          job_id=processing_task_id,
           webhook_payload=payload,
           use_ai_classification=True,
           background_task_id=processing_task_id
@@ -97,22 +148,21 @@ async def webhook_voice(
 
       logfire.info("AI-enhanced classification task queued",
                    call_id=call_id,
-                   processing_task_id=processing_task_id)
+                   processing_task_id=processing_task_id,
+                   dispatched_to=dispatched_to)
 
       # Return immediate acknowledgment
-      return GenericResponse(
-          data=VoiceWebhookResponseData(
-              status="received",
-              source="voice",
-              action="background_processing_started",
-              call_id=call_id,
-              processing_task_id=processing_task_id,
-              classification=None,
-              hubspot_contact_id=None,
-              hubspot_lead_id=None,
-              ai_processing_enabled=True,
-              processing_summary="AI-enhanced classification started in background"
-          )
+      return VoiceWebhookResponseData(
+          status="received",
+          source="voice",
+          action="background_processing_started",
+          call_id=call_id,
+          processing_task_id=processing_task_id,
+          classification=None,
+          hubspot_contact_id=None,
+          hubspot_lead_id=None,
+          ai_processing_enabled=True,
+          processing_summary="AI-enhanced classification started in background"
       )
 
     else:
@@ -189,19 +239,17 @@ async def webhook_voice(
       )
 
       # Return legacy response
-      return GenericResponse(
-          data=VoiceWebhookResponseData(
-              status="received",
-              source="voice",
-              action="classification_complete",
-              call_id=call_id,
-              processing_task_id=None,
-              classification=classification_result.classification,
-              hubspot_contact_id=final_contact_id,
-              hubspot_lead_id=final_lead_id,
-              ai_processing_enabled=False,
-              processing_summary="Processed using legacy classification"
-          )
+      return VoiceWebhookResponseData(
+          status="received",
+          source="voice",
+          action="classification_complete",
+          call_id=call_id,
+          processing_task_id=None,
+          classification=classification_result.classification,
+          hubspot_contact_id=final_contact_id,
+          hubspot_lead_id=final_lead_id,
+          ai_processing_enabled=False,
+          processing_summary="Processed using legacy classification"
       )
 
   except Exception as e:
@@ -82,6 +82,10 @@ class Settings(BaseSettings):
   CACHE_TTL_HUBSPOT_OWNERS: int = Field(
       default=3600, description="Cache TTL for HubSpot owners in seconds")  # Added
 
+  # HubSpot property sync: inputs per batch create request and concurrent requests
+  HUBSPOT_PROPERTY_BATCH_SIZE: int = 100
+  HUBSPOT_PROPERTY_SYNC_CONCURRENCY: int = 4
+
   # HUBSPOT_REVIEW_OWNER_ID: Optional[str] = None # Optional: Assign leads needing review to specific owner
 
   # Bland.ai Configuration
@@ -114,6 +118,22 @@ class Settings(BaseSettings):
   # Optionally specify a particular model
   MODEL_NAME: Optional[str] = None  # e.g., "gpt-4", "claude-3-opus-20240229"
 
+  # LLM execution limits (per provider, per process)
+  LLM_MAX_CONCURRENCY: int = 4
+  # Callers allowed to wait for a slot before new calls are rejected
+  LLM_MAX_QUEUED: int = 50
+  LLM_CALL_TIMEOUT_SECONDS: float = 60.0
+  LLM_QUEUE_TIMEOUT_SECONDS: float = 30.0
+
+  # Bland transcript extraction
+  # "single_pass": one merged LLM call for contact, lead and classification fields
+  # "concurrent": one call per schema, run concurrently
+  BLAND_EXTRACTION_MODE: Literal["single_pass", "concurrent"] = "single_pass"
+  # Fill fixed-shape fields from variables/patterns first; skip the LLM when nothing required is missing
+  BLAND_PREEXTRACTION_ENABLED: bool = True
+  # Upper bound on the trimmed transcript sent to the LLM
+  BLAND_PROMPT_MAX_CHARS: int = 6000
+
   # Marvin Logging Configuration
   MARVIN_LOG_LEVEL: str = "ERROR"  # Control Marvin's logging verbosity
   MARVIN_VERBOSE: str = "false"    # Disable Marvin's verbose console output
@@ -134,12 +154,94 @@ class Settings(BaseSettings):
   LOCAL_DISTANCE_THRESHOLD_MILES: int = Field(
       # Default 180 miles (approx 3 hours)
       default=180, validation_alias="LOCAL_DISTANCE_THRESHOLD_MILES")
+  # Locality index: drive-time cutoff and how many stored lookups seed it
+  LOCALITY_MAX_DRIVE_HOURS: float = 3.0
+  LOCALITY_INDEX_MAX_LOCATIONS: int = 50000
 
   # Redis Configuration
   REDIS_URL: str = "redis://localhost:6379/0"
+  # Encoding of JSON values written to Redis: "json" (plain text) or "orjson" (compact,
+  # version-prefixed). This release reads both; only switch to "orjson" once no worker
+  # older than it is left, since those read plain JSON only.
+  REDIS_SERIALIZER: str = "json"
+
+  # Webhook Idempotency (deduplication of provider re-deliveries)
+  WEBHOOK_IDEMPOTENCY_ENABLED: bool = True
+  # How long a completed webhook outcome is replayed to duplicates
+  WEBHOOK_IDEMPOTENCY_TTL_SECONDS: int = 86400
+  # Same, for deliveries without an Idempotency-Key or payload id, keyed by a hash
+  # of the body: only the provider's retry window, since a later identical body
+  # is a genuine resubmission and must be processed
+  WEBHOOK_IDEMPOTENCY_HASH_TTL_SECONDS: int = 600
+  # Lock lifetime for an in-flight webhook (covers crashed workers)
+  WEBHOOK_IDEMPOTENCY_LOCK_SECONDS: int = 300
+  # How long a duplicate waits for an in-flight original before acknowledging
+  WEBHOOK_IDEMPOTENCY_WAIT_SECONDS: float = 10.0
+
+  # Background Job Queue (Redis Streams, consumed by `python -m app.worker`)
+  # When disabled, web workers run heavy work as in-process BackgroundTasks
+  JOB_QUEUE_ENABLED: bool = False
+  JOB_QUEUE_MAX_STREAM_LENGTH: int = 100000
+  # Pending jobs idle longer than this are reclaimed from dead consumers
+  JOB_QUEUE_CLAIM_IDLE_SECONDS: int = 300
+
+  # Dashboard snapshots (computed in the background, served from Redis)
+  DASH_SNAPSHOT_INTERVAL_SECONDS: int = 30
+  # Older snapshots are rebuilt on read instead of served
+  DASH_SNAPSHOT_MAX_AGE_SECONDS: int = 120
+
+  # Live dashboard push (/dashboard/live): one publisher per process, bounded client buffers
+  LIVE_METRICS_INTERVAL_SECONDS: float = 2.0
+  LIVE_METRICS_CLIENT_BUFFER: int = 200
+  LIVE_METRICS_MAX_CLIENTS: int = 50
+
+  # Catalog / branch list cache loss: consecutive MongoDB rebuild failures before
+  # rebuilds pause for the cooldown, and the minimum gap between logged errors
+  CACHE_REBUILD_FAILURE_THRESHOLD: int = 3
+  CACHE_REBUILD_COOLDOWN_SECONDS: float = 30.0
+  CACHE_ERROR_REPORT_INTERVAL_SECONDS: float = 60.0
+  # Recurring errors are written to error_logs once per fingerprint per window, with a count
+  ERROR_ROLLUP_WINDOW_SECONDS: int = 60
+  # Per-minute dashboard counter buckets are kept this long
+  DASH_COUNTER_BUCKET_TTL_SECONDS: int = 24 * 60 * 60
+
+  # Profile picture processing runs on this many worker threads, off the event loop
+  IMAGE_PROCESSING_WORKERS: int = 2
 
   # Google Maps Configuration
   GOOGLE_MAPS_API_KEY: str = "YOUR_GOOGLE_MAPS_API_KEY_HERE"
+  # Fallback address variations sent together in one Distance Matrix request. The most
+  # specific variation always goes alone first: every destination is a billed element
+  GMAPS_VARIATIONS_PER_REQUEST: int = 4
+  # Upper bound on one branch -> delivery lookup; coordinates are skipped once it is spent
+  GMAPS_LOOKUP_BUDGET_SECONDS: float = 6.0
+  # How long a delivery location Google could not resolve is answered from the negative cache
+  UNRESOLVABLE_LOCATION_TTL_SECONDS: int = 3600
+  # Distance cache pre-warmer: refreshes popular addresses before their cached distances expire.
+  # Opt-in, as it is recurring paid Google load: each round sends up to
+  # DISTANCE_PREWARM_MAX_REQUESTS Distance Matrix requests of GMAPS_DESTINATIONS_PER_REQUEST
+  # billed elements (100 x 25 = 2,500 elements every 30 minutes at the defaults, about
+  # 120,000 a day), plus the warm-up of branches added by a branch sync
+  DISTANCE_PREWARM_ENABLED: bool = False
+  DISTANCE_PREWARM_INTERVAL_SECONDS: int = 1800
+  # Entries closer than this to expiry are refreshed
+  DISTANCE_PREWARM_REFRESH_BEFORE_SECONDS: int = 4 * 3600
+  DISTANCE_PREWARM_MAX_ADDRESSES: int = 500
+  # Rate limit: Distance Matrix requests per round and the pause between them
+  DISTANCE_PREWARM_MAX_REQUESTS: int = 100
+  DISTANCE_PREWARM_REQUEST_INTERVAL_SECONDS: float = 0.5
+  # Window for frequently looked-up and quoted addresses
+  DISTANCE_PREWARM_LOOKBACK_DAYS: int = 30
+  DISTANCE_PREWARM_LEAD_LIMIT: int = 200
+  # Addresses kept in the demand ranking between rounds
+  DISTANCE_DEMAND_SIZE: int = 5000
+  # Distance Matrix allows 25 destinations per request
+  GMAPS_DESTINATIONS_PER_REQUEST: int = 25
+  # Shared geocode store: bump the version to start a fresh namespace after a format change
+  GEOCODE_STORE_VERSION: int = 1
+  GEOCODE_STORE_TTL_SECONDS: int = 30 * 24 * 3600
+  # Historic lookups loaded into the geocode store at startup
+  GEOCODE_WARMUP_LIMIT: int = 5000
 
   # Pricing Agent Configuration
   PRICING_WEBHOOK_API_KEY: str = "YOUR_PRICING_WEBHOOK_API_KEY_HERE"
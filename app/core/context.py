@@ -0,0 +1,74 @@
+# app/core/context.py
+
+"""
+Request-scoped context carried in contextvars.
+Application-scoped services are shared by every request, so per-request
+state (the request id and FastAPI BackgroundTasks) lives here rather than
+on the service instances.
+"""
+
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional
+
+from fastapi import BackgroundTasks
+
+
+@dataclass
+class CounterBatch:
+  """Counter deltas collected during one request and written in one round trip."""
+
+  deltas: Dict[str, int] = field(default_factory=dict)
+  closed: bool = False
+
+  def add(self, key: str, amount: int = 1) -> bool:
+    """Returns False once the batch has been flushed; the caller writes directly."""
+    if self.closed:
+      return False
+    self.deltas[key] = self.deltas.get(key, 0) + amount
+    return True
+
+  def close(self) -> Dict[str, int]:
+    """Takes the collected deltas; later adds are refused."""
+    self.closed = True
+    deltas, self.deltas = self.deltas, {}
+    return deltas
+
+
+@dataclass(frozen=True)
+class RequestContext:
+  request_id: Optional[str] = None
+  background_tasks: Optional[BackgroundTasks] = None
+  counters: Optional[CounterBatch] = None
+
+
+_request_context: ContextVar[RequestContext] = ContextVar(
+    "request_context", default=RequestContext())
+
+
+def get_request_context() -> RequestContext:
+  return _request_context.get()
+
+
+def bind_request_context(**changes) -> Token:
+  """
+  Updates the context for the rest of the current task; tasks created
+  afterwards inherit a copy. Returns a token for reset_request_context.
+  """
+  return _request_context.set(replace(_request_context.get(), **changes))
+
+
+def reset_request_context(token: Token) -> None:
+  _request_context.reset(token)
+
+
+def current_request_id() -> Optional[str]:
+  return _request_context.get().request_id
+
+
+def current_background_tasks() -> Optional[BackgroundTasks]:
+  return _request_context.get().background_tasks
+
+
+def current_counter_batch() -> Optional[CounterBatch]:
+  return _request_context.get().counters
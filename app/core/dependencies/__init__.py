@@ -3,8 +3,11 @@ Unified dependency injection module for the application.
 
 This module re-exports all dependency injectors from their respective submodules.
 All dependencies use InstrumentedRedisService by default for automatic latency monitoring.
+Location, quote and dashboard services come from the application-scoped
+ServiceContainer built in the lifespan.
 """
 
+from .container import ServiceContainer, get_service_container
 from .redis import get_redis_service_dep
 from .mongo import get_mongo_service_dep
 from .location import get_location_service_dep
@@ -14,6 +17,8 @@ from .auth import get_auth_service_dep
 from .bland import get_bland_manager_dep
 
 __all__ = [
+    "ServiceContainer",
+    "get_service_container",
     "get_redis_service_dep",
     "get_mongo_service_dep",
     "get_location_service_dep",
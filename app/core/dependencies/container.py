@@ -0,0 +1,55 @@
+"""
+Application-scoped service graph.
+
+Built once in the lifespan and stored on app.state.services, so requests
+reuse the same RedisService, LocationService (and its Google Maps client),
+QuoteService and DashboardService instead of constructing them per request.
+Request-specific state is passed through app.core.context.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from fastapi import Request
+
+from app.services.mongo import MongoService
+from app.services.redis.service import RedisService
+from app.services.location import LocationService
+
+
+@dataclass
+class ServiceContainer:
+  redis: RedisService
+  mongo: MongoService
+  location: LocationService
+  quote: Any
+  dashboard: Any
+
+  @classmethod
+  def create(
+      cls,
+      mongo_service: MongoService,
+      redis_service: Optional[RedisService] = None,
+  ) -> "ServiceContainer":
+    # Import here to avoid circular dependency
+    from app.services.quote import QuoteService
+    from app.services.dash import DashboardService
+
+    redis_service = redis_service or RedisService()
+    location_service = LocationService(redis_service, mongo_service)
+    return cls(
+        redis=redis_service,
+        mongo=mongo_service,
+        location=location_service,
+        quote=QuoteService(
+            redis_service=redis_service,
+            location_service=location_service,
+            mongo_service=mongo_service,
+        ),
+        dashboard=DashboardService(redis_service=redis_service, mongo_service=mongo_service),
+    )
+
+
+def get_service_container(request: Request) -> Optional[ServiceContainer]:
+  """The container built at startup, or None when running without the lifespan."""
+  return getattr(request.app.state, "services", None)
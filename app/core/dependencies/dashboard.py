@@ -2,20 +2,23 @@
 Core dependency injection module for dashboard services.
 """
 
-from fastapi import Depends
-from app.services.mongo.dependency import MongoService, get_mongo_service
+from fastapi import Request
+from app.services.mongo import get_mongo_service
+from app.core.dependencies.container import get_service_container
 from app.core.dependencies.redis import get_redis_service_dep
 
 
-async def get_dashboard_service_dep(
-    mongo_service: MongoService = Depends(get_mongo_service),
-):
+async def get_dashboard_service_dep(request: Request):
   """
-  Get DashboardService with instrumented Redis for automatic latency monitoring.
+  Get the application-scoped DashboardService.
   Note: BackgroundTasks should be injected directly in endpoints that need them.
   """
+  services = get_service_container(request)
+  if services is not None:
+    return services.dashboard
+
   # Import here to avoid circular dependency
   from app.services.dash import DashboardService
 
   redis_service = await get_redis_service_dep()
-  return DashboardService(redis_service=redis_service, mongo_service=mongo_service)
+  return DashboardService(redis_service=redis_service, mongo_service=await get_mongo_service())
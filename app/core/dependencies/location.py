@@ -2,18 +2,21 @@
 Core dependency injection module for location services.
 """
 
-from fastapi import Depends
-from app.services.mongo.dependency import MongoService, get_mongo_service
+from fastapi import Request
+from app.services.mongo import get_mongo_service
 from app.services.location import LocationService
+from app.core.dependencies.container import get_service_container
 from app.core.dependencies.redis import get_redis_service_dep
 
 
-async def get_location_service_dep(
-    mongo_service: MongoService = Depends(get_mongo_service),
-) -> LocationService:
+async def get_location_service_dep(request: Request) -> LocationService:
   """
-  Get LocationService with instrumented Redis for automatic latency monitoring.
+  Get the application-scoped LocationService.
   Note: BackgroundTasks should be injected directly in endpoints that need them.
   """
+  services = get_service_container(request)
+  if services is not None:
+    return services.location
+  # Without the lifespan (e.g. scripts), build one for this request
   redis_service = await get_redis_service_dep()
-  return LocationService(redis_service, mongo_service)
+  return LocationService(redis_service, await get_mongo_service())
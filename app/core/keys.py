@@ -7,6 +7,8 @@ Centralized location to avoid circular imports.
 # Pricing and catalog data
 PRICING_CATALOG_CACHE_KEY = "stahla:pricing_catalog"
 BRANCH_LIST_CACHE_KEY = "stahla:branches"
+# Branch-set manifest written by the branch sync: set version plus per-branch versions
+BRANCH_SET_VERSION_KEY = "stahla:branches:version"
 STATES_LIST_CACHE_KEY = "stahla:states"
 
 # ===== LOCATION SERVICE CACHE KEYS =====
@@ -15,6 +17,27 @@ COORDINATES_CACHE_KEY = f"{LOCATION_CACHE_PREFIX}coordinates"
 DISTANCE_CACHE_KEY = f"{LOCATION_CACHE_PREFIX}distance"
 ADDRESS_CACHE_KEY = f"{LOCATION_CACHE_PREFIX}address"
 VALIDATION_CACHE_KEY = f"{LOCATION_CACHE_PREFIX}validation"
+# Branch -> delivery distance cache (maps:distance:{branch version}:{delivery}) and
+# its expiry-scored index, used to count and clear it without SCAN
+DISTANCE_CACHE_PREFIX = "maps:distance:"
+DISTANCE_CACHE_INDEX_KEY = "maps:index:distance"
+# Delivery locations Google could not resolve from any branch
+# (maps:unresolvable:{delivery}), kept briefly so repeats skip the API fan-out
+UNRESOLVABLE_LOCATION_PREFIX = "maps:unresolvable:"
+UNRESOLVABLE_LOCATION_INDEX_KEY = "maps:index:unresolvable"
+# Delivery location -> number of distance requests, used to rank pre-warming
+DISTANCE_DEMAND_KEY = "maps:demand"
+# Held by the worker running the current distance pre-warm round
+DISTANCE_PREWARM_LOCK_KEY = "maps:prewarm:lock"
+# Claimed by the one instance that warms the branches added by a branch-set
+# version (maps:prewarm:branches:{version}), so concurrent syncs warm them once
+DISTANCE_PREWARM_BRANCHES_PREFIX = "maps:prewarm:branches:"
+# Shared geocodes: canonical address -> coordinates, components and the variation
+# Google accepted (location:address:v{version}:{digest}), with an expiry-scored index
+GEOCODE_STORE_PREFIX = f"{ADDRESS_CACHE_KEY}:"
+GEOCODE_STORE_INDEX_KEY = f"{LOCATION_CACHE_PREFIX}index:geocode"
+# Precomputed ZIP / ZIP3 / city drive times to the nearest branch
+LOCALITY_INDEX_KEY = f"{LOCATION_CACHE_PREFIX}locality_index"
 
 # ===== QUOTE SERVICE CACHE KEYS =====
 QUOTE_CACHE_PREFIX = "quote:"
@@ -22,6 +45,19 @@ PRICING_CACHE_KEY = f"{QUOTE_CACHE_PREFIX}pricing"
 CATALOG_CACHE_KEY = f"{QUOTE_CACHE_PREFIX}catalog"
 DELIVERY_CACHE_KEY = f"{QUOTE_CACHE_PREFIX}delivery"
 
+# ===== WEBHOOK IDEMPOTENCY KEYS =====
+# One key per delivered event: webhook:idempotency:{source}:{event_id}
+WEBHOOK_IDEMPOTENCY_PREFIX = "webhook:idempotency:"
+
+# ===== BACKGROUND JOB QUEUE KEYS =====
+# Redis Streams per queue, plus retry schedule, dead letters and counters
+JOBS_PREFIX = "jobs:"
+JOBS_STREAM_PREFIX = f"{JOBS_PREFIX}stream:"        # jobs:stream:{queue}
+JOBS_DEAD_LETTER_PREFIX = f"{JOBS_PREFIX}dead:"     # jobs:dead:{queue}
+JOBS_METRICS_PREFIX = f"{JOBS_PREFIX}metrics:"      # jobs:metrics:{queue} (hash)
+JOBS_DELAYED_KEY = f"{JOBS_PREFIX}delayed"          # sorted set, score = run-at epoch seconds
+JOBS_CONSUMER_GROUP = "stahla-workers"
+
 # ===== DASHBOARD SERVICE CACHE KEYS =====
 # Request counters
 RECENT_REQUESTS_KEY = "dash:recent_requests"
@@ -42,10 +78,21 @@ PRICING_CACHE_HITS_KEY = "dash:cache:pricing:hits"
 PRICING_CACHE_MISSES_KEY = "dash:cache:pricing:misses"
 MAPS_CACHE_HITS_KEY = "dash:cache:maps:hits"
 MAPS_CACHE_MISSES_KEY = "dash:cache:maps:misses"
+MAPS_NEGATIVE_CACHE_HITS_KEY = "dash:cache:maps:negative_hits"
+
+# Per-minute counter buckets: dash:counters:minute:{epoch_minute} -> {counter key: delta}
+DASH_COUNTER_BUCKET_PREFIX = "dash:counters:minute:"
 
 # Dashboard recent requests (different from background)
 RECENT_REQUESTS_DASHBOARD_KEY = "dash:requests:recent"
 
+# Materialized dashboard snapshots: dash:snapshot:{name}, refreshed by one aggregator at a time
+DASH_SNAPSHOT_PREFIX = "dash:snapshot:"
+DASH_SNAPSHOT_LOCK_KEY = "dash:snapshot:lock"
+
+# Pub/sub channel for live dashboard events (request log entries, errors)
+DASH_LIVE_CHANNEL = "dash:live"
+
 # ===== LATENCY TRACKING CACHE KEYS =====
 # Latency tracking using Redis Sorted Sets (for percentiles) and Streams (for time series)
 LATENCY_PREFIX = "latency:"
@@ -12,13 +12,15 @@ import logfire
 
 # Import background task functions and Redis service dependency
 from app.services.redis.factory import get_redis_service
-from app.services.background.request import log_request_response_bg
+from app.services.background.request import flush_request_counters_bg, log_request_response_bg
 
 # Import GenericResponse for error formatting
 from app.models.common import GenericResponse
 
 # Import templating
 from app.core.templating import templates
+from app.core.telemetry import begin_request
+from app.core.context import CounterBatch, bind_request_context
 
 logger = logging.getLogger(__name__)
 
@@ -148,6 +150,11 @@ class LoggingMiddleware(BaseHTTPMiddleware):
   async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
     start_time = time.monotonic()
     request_id = str(uuid.uuid4())  # Generate unique ID for this request
+    # Dashboard counters incremented during the request are written together at the end
+    counters = CounterBatch()
+    bind_request_context(request_id=request_id, counters=counters)
+    # Head-based sampling decision for detail logs on hot paths
+    begin_request(request.url.path)
 
     # Check if the path should be logged
     should_log = any(request.url.path.startswith(p) for p in PATHS_TO_LOG)
@@ -322,5 +329,23 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         except Exception as e:
           logger.error(
               f"Failed to get RedisService or add logging task in middleware (request_id: {request_id}): {e}")
+
+      if not counters.deltas:
+        # Nothing to flush; increments from later background work are written directly
+        counters.close()
+      else:
+        try:
+          redis_service = await get_redis_service()
+          if response is not None:
+            if response.background is None:
+              response.background = BackgroundTasks()
+            # Written once the response is sent; increments after the flush go directly to Redis
+            response.background.add_task(  # type: ignore
+                flush_request_counters_bg, redis_service, counters)
+          else:
+            await flush_request_counters_bg(redis_service, counters)
+        except Exception as e:
+          logger.error(
+              f"Failed to flush request counters in middleware (request_id: {request_id}): {e}")
     return response  # type: ignore
 # --- End LoggingMiddleware ---
@@ -0,0 +1,9 @@
+# app/core/startup/__init__.py
+
+"""
+Startup orchestration for the application lifespan.
+"""
+
+from .orchestrator import StartupOrchestrator
+
+__all__ = ["StartupOrchestrator"]
@@ -0,0 +1,156 @@
+# app/core/startup/orchestrator.py
+
+"""
+Startup orchestrator for the application lifespan.
+Runs independent initializers concurrently, defers non-critical work until
+after the application reports ready, and records a per-phase timing breakdown.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import logfire
+
+PhaseFactory = Callable[[], Awaitable[Any]]
+
+
+class StartupOrchestrator:
+  """
+  Coordinates application startup phases.
+
+  Phases are awaited (alone or as a concurrent group) before the application
+  yields from its lifespan. Deferred phases are scheduled as background tasks
+  right before readiness, so they never delay the first request.
+  """
+
+  def __init__(self):
+    self.started_at = datetime.now(timezone.utc)
+    self._start = time.perf_counter()
+    self._ready_ms: Optional[float] = None
+    self.phases: Dict[str, Dict[str, Any]] = {}
+    self.deferred: Dict[str, Dict[str, Any]] = {}
+    self._deferred_factories: List[tuple] = []
+    self._deferred_tasks: List[asyncio.Task] = []
+
+  async def _timed(self, name: str, factory: PhaseFactory, registry: Dict[str, Dict[str, Any]]) -> Any:
+    """Runs a single phase and records its duration and outcome."""
+    phase_start = time.perf_counter()
+    registry[name] = {"status": "running"}
+    try:
+      result = await factory()
+      registry[name] = {
+          "status": "ok",
+          "duration_ms": round((time.perf_counter() - phase_start) * 1000, 2),
+      }
+      return result
+    except Exception as e:
+      registry[name] = {
+          "status": "error",
+          "duration_ms": round((time.perf_counter() - phase_start) * 1000, 2),
+          "error": f"{type(e).__name__}: {e}",
+      }
+      raise
+
+  async def run_phase(self, name: str, factory: PhaseFactory, required: bool = True) -> Any:
+    """
+    Runs one startup phase.
+    Errors from required phases are re-raised; optional phases return None.
+    """
+    try:
+      return await self._timed(name, factory, self.phases)
+    except Exception as e:
+      if required:
+        raise
+      logfire.warning(f"Optional startup phase '{name}' failed: {e}")
+      return None
+
+  async def run_concurrently(
+      self,
+      factories: Dict[str, PhaseFactory],
+      required: Optional[List[str]] = None,
+  ) -> Dict[str, Any]:
+    """
+    Runs independent phases concurrently and returns their results by name.
+    The first failure among the `required` phases is re-raised once all
+    phases in the group have finished.
+    """
+    required = required or []
+    names = list(factories.keys())
+    results = await asyncio.gather(
+        *(self._timed(name, factories[name], self.phases) for name in names),
+        return_exceptions=True,
+    )
+
+    outcome: Dict[str, Any] = {}
+    first_required_error: Optional[BaseException] = None
+    for name, result in zip(names, results):
+      if isinstance(result, BaseException):
+        outcome[name] = None
+        if name in required and first_required_error is None:
+          first_required_error = result
+        elif name not in required:
+          logfire.warning(f"Optional startup phase '{name}' failed: {result}")
+      else:
+        outcome[name] = result
+
+    if first_required_error is not None:
+      raise first_required_error
+    return outcome
+
+  def defer(self, name: str, factory: PhaseFactory, delay_seconds: float = 0.0):
+    """Registers a phase to run in the background once startup is complete."""
+    self._deferred_factories.append((name, factory, delay_seconds))
+    self.deferred[name] = {"status": "pending", "delay_seconds": delay_seconds}
+
+  async def _run_deferred(self, name: str, factory: PhaseFactory, delay_seconds: float):
+    """Waits for the configured delay, then runs a deferred phase."""
+    if delay_seconds > 0:
+      await asyncio.sleep(delay_seconds)
+    try:
+      await self._timed(name, factory, self.deferred)
+      logfire.info(
+          f"Deferred startup phase '{name}' completed.",
+          duration_ms=self.deferred[name].get("duration_ms"),
+      )
+    except asyncio.CancelledError:
+      self.deferred[name] = {"status": "cancelled"}
+      raise
+    except Exception as e:
+      logfire.error(
+          f"Deferred startup phase '{name}' failed: {e}", exc_info=True)
+
+  def mark_ready(self):
+    """Marks the application ready and schedules all deferred phases."""
+    self._ready_ms = round((time.perf_counter() - self._start) * 1000, 2)
+    for name, factory, delay_seconds in self._deferred_factories:
+      task = asyncio.create_task(
+          self._run_deferred(name, factory, delay_seconds),
+          name=f"startup-deferred:{name}",
+      )
+      self._deferred_tasks.append(task)
+    self._deferred_factories = []
+    logfire.info(
+        f"Application ready in {self._ready_ms}ms.",
+        phases=self.phases,
+        deferred=list(self.deferred.keys()),
+    )
+
+  async def cancel_deferred(self):
+    """Cancels deferred phases that are still running (used at shutdown)."""
+    pending = [task for task in self._deferred_tasks if not task.done()]
+    for task in pending:
+      task.cancel()
+    if pending:
+      await asyncio.gather(*pending, return_exceptions=True)
+    self._deferred_tasks = []
+
+  def report(self) -> Dict[str, Any]:
+    """Returns the startup timing breakdown."""
+    return {
+        "started_at": self.started_at.isoformat(),
+        "ready_ms": self._ready_ms,
+        "phases": self.phases,
+        "deferred": self.deferred,
+    }
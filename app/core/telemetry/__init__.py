@@ -0,0 +1,28 @@
+# app/core/telemetry/__init__.py
+
+"""
+Logfire instrumentation policy, request-scoped sampling and configuration.
+"""
+
+from .policy import (
+    TelemetryPolicy,
+    get_telemetry_policy,
+    pydantic_plugin_settings,
+    HOT_PATH_MODELS,
+    HOT_PATH_ROUTES,
+)
+from .sampling import begin_request, is_detail_sampled, detail, timing_span
+from .setup import configure_logfire
+
+__all__ = [
+    "TelemetryPolicy",
+    "get_telemetry_policy",
+    "pydantic_plugin_settings",
+    "HOT_PATH_MODELS",
+    "HOT_PATH_ROUTES",
+    "begin_request",
+    "is_detail_sampled",
+    "detail",
+    "timing_span",
+    "configure_logfire",
+]
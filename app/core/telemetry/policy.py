@@ -0,0 +1,140 @@
+# app/core/telemetry/policy.py
+
+"""
+Instrumentation policy for Logfire.
+
+The policy is read from environment variables (not `Settings`) because Logfire
+is configured before the application settings are loaded. `.env` is loaded
+first, since models read the policy as soon as they are imported:
+
+- LOGFIRE_PYDANTIC_RECORD: default record mode for Pydantic models
+  ("all", "failure", "metrics" or "off").
+- LOGFIRE_PYDANTIC_MODELS: optional comma-separated allowlist of model names.
+  When set, only these models are instrumented, with the default record mode
+  (or "all" if that is "off").
+- LOGFIRE_HEAD_SAMPLE_RATE: fraction of traces kept (head-based sampling).
+- LOGFIRE_HOT_PATH_MODE: when true, hot-path models only record metrics and
+  hot-path routes only keep timing spans (detail logs are dropped).
+- LOGFIRE_HOT_PATH_SAMPLE_RATE: fraction of hot-path requests that still emit
+  detail logs while hot-path mode is on.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Tuple
+
+from dotenv import find_dotenv, load_dotenv
+
+RECORD_MODES = ("all", "failure", "metrics", "off")
+
+# Models validated on every quote / location request
+HOT_PATH_MODELS: FrozenSet[str] = frozenset({
+    "QuoteRequest",
+    "QuoteResponse",
+    "QuoteDocument",
+    "DistanceResult",
+    "BranchLocation",
+    "RequestLogEntry",
+})
+
+# Route prefixes treated as the latency-sensitive quote path
+HOT_PATH_ROUTES: Tuple[str, ...] = (
+    "/api/v1/webhook/quote",
+    "/api/v1/webhook/location",
+)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+  value = os.getenv(name)
+  if value is None:
+    return default
+  return value.lower() in ("true", "1", "yes", "t")
+
+
+def _env_rate(name: str, default: float) -> float:
+  try:
+    rate = float(os.getenv(name, default))
+  except ValueError:
+    return default
+  return min(max(rate, 0.0), 1.0)
+
+
+@dataclass(frozen=True)
+class TelemetryPolicy:
+  """Per-route / per-model instrumentation policy."""
+
+  pydantic_record: str = "all"
+  pydantic_allowlist: FrozenSet[str] = field(default_factory=frozenset)
+  head_sample_rate: float = 1.0
+  hot_path_mode: bool = False
+  hot_path_sample_rate: float = 1.0
+  hot_path_routes: Tuple[str, ...] = HOT_PATH_ROUTES
+  hot_path_models: FrozenSet[str] = HOT_PATH_MODELS
+
+  @classmethod
+  def from_env(cls) -> "TelemetryPolicy":
+    # Same .env as Settings (relative to the working directory); existing variables win
+    load_dotenv(find_dotenv(usecwd=True))
+    record = os.getenv("LOGFIRE_PYDANTIC_RECORD", "all").lower()
+    if record not in RECORD_MODES:
+      record = "all"
+    allowlist = frozenset(
+        name.strip()
+        for name in os.getenv("LOGFIRE_PYDANTIC_MODELS", "").split(",")
+        if name.strip()
+    )
+    return cls(
+        pydantic_record=record,
+        pydantic_allowlist=allowlist,
+        head_sample_rate=_env_rate("LOGFIRE_HEAD_SAMPLE_RATE", 1.0),
+        hot_path_mode=_env_bool("LOGFIRE_HOT_PATH_MODE", False),
+        hot_path_sample_rate=_env_rate("LOGFIRE_HOT_PATH_SAMPLE_RATE", 1.0),
+    )
+
+  @property
+  def plugin_record(self) -> str:
+    """Record mode of the Logfire Pydantic plugin; an allowlist opts its models in."""
+    if self.pydantic_allowlist and self.pydantic_record == "off":
+      return "all"
+    return self.pydantic_record
+
+  def plugin_options(self) -> Dict[str, Any]:
+    """
+    Arguments for `logfire.instrument_pydantic`. The allowlist becomes the
+    plugin's `include` patterns, so models without plugin_settings of their
+    own are filtered as well.
+    """
+    options: Dict[str, Any] = {"record": self.plugin_record}
+    if self.pydantic_allowlist:
+      options["include"] = {f".*::{re.escape(name)}" for name in sorted(self.pydantic_allowlist)}
+    return options
+
+  def record_for_model(self, model_name: str) -> str:
+    """Returns the Logfire record mode for a Pydantic model."""
+    if self.pydantic_allowlist and model_name not in self.pydantic_allowlist:
+      return "off"
+    record = self.plugin_record
+    if self.hot_path_mode and model_name in self.hot_path_models:
+      # Keep validation counts/durations, drop per-validation spans
+      return "metrics" if record != "off" else "off"
+    return record
+
+  def is_hot_route(self, path: str) -> bool:
+    """Whether a request path belongs to the latency-sensitive quote path."""
+    return any(path.startswith(prefix) for prefix in self.hot_path_routes)
+
+
+@lru_cache()
+def get_telemetry_policy() -> TelemetryPolicy:
+  """Returns the cached policy loaded from the environment."""
+  return TelemetryPolicy.from_env()
+
+
+def pydantic_plugin_settings(model_name: str) -> Dict[str, Any]:
+  """
+  Pydantic `plugin_settings` for a model, applying the instrumentation policy.
+  Use in a model's config: `plugin_settings = pydantic_plugin_settings("Name")`.
+  """
+  return {"logfire": {"record": get_telemetry_policy().record_for_model(model_name)}}
@@ -0,0 +1,60 @@
+# app/core/telemetry/sampling.py
+
+"""
+Request-scoped sampling for detail logs on hot paths.
+
+The sampling decision is made once per request (head-based) in the logging
+middleware and stored in a context variable, so every log call in the same
+request agrees on whether details are kept.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+import logfire
+
+from .policy import get_telemetry_policy
+
+_hot_path: ContextVar[bool] = ContextVar("telemetry_hot_path", default=False)
+_detail_sampled: ContextVar[bool] = ContextVar(
+    "telemetry_detail_sampled", default=True)
+
+
+def begin_request(path: str) -> bool:
+  """
+  Makes the per-request sampling decision for `path`.
+  Returns True if detail logs are kept for this request.
+  """
+  policy = get_telemetry_policy()
+  hot = policy.hot_path_mode and policy.is_hot_route(path)
+  sampled = True
+  if hot:
+    sampled = random.random() < policy.hot_path_sample_rate
+  _hot_path.set(hot)
+  _detail_sampled.set(sampled)
+  return sampled
+
+
+def is_detail_sampled() -> bool:
+  """Whether detail logs are kept for the current request."""
+  return _detail_sampled.get()
+
+
+def detail(message: str, **attributes: Any) -> None:
+  """Info-level log that is dropped for unsampled hot-path requests."""
+  if _detail_sampled.get():
+    logfire.info(message, **attributes)
+
+
+@contextmanager
+def timing_span(name: str, **attributes: Any) -> Iterator[Any]:
+  """
+  Span used to time a hot-path step.
+  For unsampled hot-path requests only the span name and duration are kept.
+  """
+  if _hot_path.get() and not _detail_sampled.get():
+    attributes = {}
+  with logfire.span(name, **attributes) as span:
+    yield span
@@ -0,0 +1,58 @@
+# app/core/telemetry/setup.py
+
+"""
+Logfire configuration applying the instrumentation policy.
+"""
+
+import os
+from typing import Any, Dict
+
+import logfire
+
+from .policy import TelemetryPolicy, get_telemetry_policy
+
+
+def _sampling_options(policy: TelemetryPolicy) -> Dict[str, Any]:
+  """Builds the head-sampling kwargs supported by the installed Logfire version."""
+  if policy.head_sample_rate >= 1.0:
+    return {}
+  sampling_options = getattr(logfire, "SamplingOptions", None)
+  if sampling_options is not None:
+    return {"sampling": sampling_options(head=policy.head_sample_rate)}
+  # Older Logfire releases only support a trace sample rate
+  return {"trace_sample_rate": policy.head_sample_rate}
+
+
+def configure_logfire() -> TelemetryPolicy:
+  """
+  Configures Logfire from environment variables directly.
+  This runs before config.py loads the application settings.
+  """
+  policy = get_telemetry_policy()
+
+  project_name = os.getenv(
+      "PROJECT_NAME", "Stahla AI SDR"
+  )  # Default from config.py
+  dev_mode = os.getenv("DEV", "False").lower() in ("true", "1", "yes", "t")
+
+  config: Dict[str, Any] = {
+      "send_to_logfire": True,  # Consistent with previous direct configuration
+      "service_name": project_name,
+  }
+
+  # If not in DEV mode, disable console logging for Logfire.
+  # Otherwise, Logfire's default (console=True) will apply.
+  if not dev_mode:
+    config["console"] = False
+
+  config.update(_sampling_options(policy))
+
+  # Note: LOGFIRE_TOKEN is typically picked up by Logfire automatically from the environment.
+  logfire.configure(**config)
+
+  # Models listed in the policy override this default via plugin_settings;
+  # the allowlist limits which models the plugin instruments at all
+  if policy.plugin_record != "off":
+    logfire.instrument_pydantic(**policy.plugin_options())
+
+  return policy
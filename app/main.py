@@ -1,12 +1,31 @@
 # app/main.py
 
+# Environment and Logfire come before every other application import: the
+# Pydantic plugin and the instrumentation policy apply to models when they
+# are defined, i.e. when their modules are imported.
+from dotenv import load_dotenv
+load_dotenv()
+
+from app.core.telemetry import configure_logfire  # noqa: E402
+# Head sampling and the Pydantic instrumentation policy are read from the
+# environment (see app/core/telemetry/policy.py).
+configure_logfire()
+
 from app.core.middleware import http_exception_handler, generic_exception_handler, not_found_exception_handler, server_error_exception_handler
 from app.core.middleware import LoggingMiddleware
 from app.services.dash.health.checker import (
     initialize_service_monitor,
     shutdown_service_monitor,
 )
+from app.services.dash.snapshot import (
+    LATENCY_OVERVIEW_SNAPSHOT,
+    LATENCY_SUMMARY_SNAPSHOT,
+    OVERVIEW_SNAPSHOT,
+    initialize_snapshot_aggregator,
+    shutdown_snapshot_aggregator,
+)
 from app.services.n8n import close_n8n_client
+from app.utils.image import shutdown_image_executor
 from app.services.redis.factory import get_redis_service
 from app.services.auth.auth import startup_auth_service
 from app.services.mongo import (
@@ -17,9 +36,15 @@ from app.services.mongo import (
 from app.services.quote.sync import lifespan_shutdown as sheet_sync_shutdown
 from app.services.quote.sync import lifespan_startup as sheet_sync_startup
 from app.services.hubspot import HubSpotManager
+from app.services.location.locality import ensure_locality_index
+from app.services.location.cache import distance_cache_keyspace
+from app.services.location.geocode import prepare_geocode_store
+from app.services.location.prewarm import initialize_distance_prewarmer, shutdown_distance_prewarmer
 from app.api.v1.api import api_router_v1
 from app.api.v1.endpoints import home  # Import home router
 from app.core.config import settings
+from app.core.startup import StartupOrchestrator
+from app.core.dependencies.container import ServiceContainer
 import logfire
 import os
 from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
@@ -28,40 +53,65 @@ from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
 import asyncio
-from dotenv import load_dotenv
 
-# Load environment variables first
-load_dotenv()
+# --- Lifespan Management ---
+
+
+async def _init_redis_service():
+  """Creates the Redis service; the application continues without Redis on failure."""
+  try:
+    redis_service = await get_redis_service()
+    logfire.info("Redis service factory ready and tested.")
+    return redis_service
+  except Exception as redis_err:
+    logfire.warning(f"Redis service not available: {redis_err}")
+    return None  # Continue without Redis
 
-# --- Logfire Configuration ---
 
-# Configure Logfire using environment variables directly or defaults
-# This ensures Logfire is configured before any other module (like config.py) might use it.
-_logfire_project_name = os.getenv(
-    "PROJECT_NAME", "Stahla AI SDR"
-)  # Default from config.py
-_logfire_dev_mode_str = os.getenv("DEV", "False")  # Default from config.py
-_logfire_dev_mode = _logfire_dev_mode_str.lower() in ("true", "1", "yes", "t")
+async def _init_bland_manager(app: FastAPI, mongo_service_instance):
+  """Initializes the Bland AI manager; the pathway sync is deferred until after readiness."""
+  # Bland AI service requires MongoService for call logging
+  try:
+    from app.services.bland.manager import initialize_bland_manager, set_bland_manager
+
+    # Initialize with proper background tasks context
+    background_tasks = BackgroundTasks()
+    bland_manager_instance = await initialize_bland_manager(
+        mongo_service=mongo_service_instance,
+        background_tasks=background_tasks,
+        sync_definitions=False,
+    )
 
-_logfire_config = {
-    "send_to_logfire": True,  # Consistent with previous direct configuration
-    "service_name": _logfire_project_name,
-}
+    # Set the instance in application state for direct access
+    app.state.bland_manager = bland_manager_instance
 
-# If not in DEV mode, disable console logging for Logfire.
-# Otherwise, Logfire's default (console=True) will apply.
-if not _logfire_dev_mode:
-  _logfire_config["console"] = False
+    # Also register it with the singleton pattern for dependency injection
+    set_bland_manager(bland_manager_instance)
 
-# Note: LOGFIRE_TOKEN is typically picked up by Logfire automatically from the environment.
-# If it needed to be explicitly passed, you would get it from os.getenv("LOGFIRE_TOKEN")
-# and add it to _logfire_config if present.
+    logfire.info("Bland AI service initialized and registered successfully.")
+    return bland_manager_instance
+  except Exception as bland_init_error:
+    logfire.error(
+        f"Failed to initialize Bland AI service: {bland_init_error}", exc_info=True)
+    raise RuntimeError(
+        f"Bland AI service initialization failed: {bland_init_error}. Application cannot start.")
 
-logfire.configure(**_logfire_config)
-logfire.instrument_pydantic()
-# --- End Logfire Configuration ---
 
-# --- Lifespan Management ---
+async def _init_hubspot_manager(app: FastAPI):
+  """Initializes the HubSpot manager and stores it in application state."""
+  app.state.hubspot_manager = HubSpotManager(settings.HUBSPOT_API_KEY)
+  logfire.info("HubSpotManager initialized.")
+
+
+async def _start_dashboard_snapshots(redis_service, dashboard_service):
+  """Starts the background aggregator that materializes dashboard snapshots."""
+  from app.api.v1.endpoints.dash.latency.overview import build_latency_overview
+
+  await initialize_snapshot_aggregator(redis_service, {
+      OVERVIEW_SNAPSHOT: dashboard_service.build_dashboard_overview,
+      LATENCY_OVERVIEW_SNAPSHOT: lambda: build_latency_overview(dashboard_service),
+      LATENCY_SUMMARY_SNAPSHOT: dashboard_service.latency_service.get_dashboard_overview,
+  })
 
 
 @asynccontextmanager
@@ -69,19 +119,23 @@ async def lifespan(app: FastAPI):
   # Startup: Initialize connections, load models, etc.
   logfire.info("Application startup: Initializing resources.")
 
+  startup = StartupOrchestrator()
+  app.state.startup = startup
+
   mongo_service_instance = None  # Initialize to None
   redis_service = None  # Initialize Redis service variable
   try:
-    # Test Redis connectivity using the new factory
-    try:
-      redis_service = await get_redis_service()
-      logfire.info("Redis service factory ready and tested.")
-    except Exception as redis_err:
-      logfire.warning(f"Redis service not available: {redis_err}")
-      redis_service = None  # Continue without Redis
-
-    # Initialize MongoDB (connects, creates indexes)
-    await startup_mongo_service()
+    # Connect to Redis and MongoDB concurrently.
+    # Index creation is deferred until after the application is ready.
+    connections = await startup.run_concurrently(
+        {
+            "redis": _init_redis_service,
+            "mongo": lambda: startup_mongo_service(create_indexes=False),
+        },
+        required=["mongo"],
+    )
+    redis_service = connections["redis"]
+
     # Get MongoService instance for other services that need it during startup
     mongo_service_instance = await get_mongo_service()
 
@@ -93,48 +147,23 @@ async def lifespan(app: FastAPI):
 
     logfire.info("MongoDB service initialized successfully.")
 
-    # Initialize Auth Service (creates initial user if needed)
-    # startup_auth_service will get the mongo_service instance itself
-    await startup_auth_service()  # Removed mongo_service argument
-
-    # Initialize Sheet Sync Service
-    # sheet_sync_startup will get the mongo_service instance itself
-    await sheet_sync_startup()  # Removed mongo_service argument
+    # Application-scoped service graph shared by every request
+    app.state.services = ServiceContainer.create(mongo_service_instance, redis_service)
+
+    # Auth bootstrap, sheet sync, Bland AI and HubSpot only depend on MongoDB,
+    # so they are initialized concurrently.
+    # startup_auth_service and sheet_sync_startup get the mongo_service instance themselves
+    await startup.run_concurrently(
+        {
+            "auth": startup_auth_service,
+            "sheet_sync": sheet_sync_startup,
+            "bland": lambda: _init_bland_manager(app, mongo_service_instance),
+            "hubspot": lambda: _init_hubspot_manager(app),
+        },
+        required=["auth", "sheet_sync", "bland", "hubspot"],
+    )
     logfire.info("Sheet Sync service startup initiated.")
 
-    # Initialize Bland AI Manager with MongoService (REQUIRED)
-    # Bland AI service requires MongoService for call logging
-    try:
-      from app.services.bland.manager import initialize_bland_manager, set_bland_manager
-
-      # Initialize with proper background tasks context
-      background_tasks = BackgroundTasks()
-      bland_manager_instance = await initialize_bland_manager(
-          mongo_service=mongo_service_instance,
-          background_tasks=background_tasks
-      )
-
-      # Set the instance in application state for direct access
-      app.state.bland_manager = bland_manager_instance
-
-      # Also register it with the singleton pattern for dependency injection
-      set_bland_manager(bland_manager_instance)
-
-      logfire.info("Bland AI service initialized and registered successfully.")
-    except Exception as bland_init_error:
-      logfire.error(
-          f"Failed to initialize Bland AI service: {bland_init_error}", exc_info=True)
-      raise RuntimeError(
-          f"Bland AI service initialization failed: {bland_init_error}. Application cannot start.")
-
-    # Initialize other managers/services if needed
-    # BlandAI manager is already initialized above and set in app.state
-    app.state.hubspot_manager = HubSpotManager(settings.HUBSPOT_API_KEY)
-    logfire.info("HubSpotManager initialized.")
-
-    # Bland pathway sync was already completed during initialization above
-    logfire.info("Bland pathway sync completed during initialization.")
-
     # Initialize Service Status Monitor
     # redis_service is already available from above
     if redis_service and app.state.bland_manager:
@@ -143,11 +172,14 @@ async def lifespan(app: FastAPI):
 
       logfire.info("Initializing service status monitor...")
       try:
-        await initialize_service_monitor(
-            mongo_service=mongo_service_instance,
-            redis_service=redis_service,
-            bland_ai_manager=app.state.bland_manager,
-            sheet_sync_service=_sheet_sync_service_instance,
+        await startup.run_phase(
+            "service_monitor",
+            lambda: initialize_service_monitor(
+                mongo_service=mongo_service_instance,
+                redis_service=redis_service,
+                bland_ai_manager=app.state.bland_manager,
+                sheet_sync_service=_sheet_sync_service_instance,
+            ),
         )
         logfire.info("Service status monitor initialized successfully.")
       except Exception as monitor_err:
@@ -160,6 +192,22 @@ async def lifespan(app: FastAPI):
           "Missing required services for status monitoring. Monitor will not be initialized."
       )
 
+    # Work that is not needed to serve the first request runs after readiness
+    startup.defer("mongo_indexes", mongo_service_instance.ensure_indexes)
+    startup.defer("bland_sync", app.state.bland_manager.sync_bland)
+    if redis_service:
+      startup.defer("locality_index", lambda: ensure_locality_index(
+          redis_service, mongo_service_instance))
+      # One-time indexing of distance cache keys written before the index existed
+      startup.defer("distance_cache_index",
+                    distance_cache_keyspace(redis_service).backfill)
+      startup.defer("geocode_store", lambda: prepare_geocode_store(mongo_service_instance))
+      if settings.DISTANCE_PREWARM_ENABLED:
+        startup.defer("distance_prewarm", lambda: initialize_distance_prewarmer(
+            redis_service, mongo_service_instance, getattr(app.state, "hubspot_manager", None)))
+      startup.defer("dashboard_snapshots", lambda: _start_dashboard_snapshots(
+          redis_service, app.state.services.dashboard))
+
   except Exception as e:
     logfire.error(
         f"Critical error during application startup sequence: {e}", exc_info=True
@@ -171,7 +219,11 @@ async def lifespan(app: FastAPI):
             service_name="ApplicationStartup",
             error_type="CriticalStartupError",
             message=f"Critical error during application startup: {str(e)}",
-            details={"exception_type": type(e).__name__, "args": e.args},
+            details={
+                "exception_type": type(e).__name__,
+                "args": e.args,
+                "startup_phases": startup.phases,
+            },
         )
       except Exception as log_e:
         logfire.error(
@@ -180,6 +232,7 @@ async def lifespan(app: FastAPI):
         )
     raise e
 
+  startup.mark_ready()
   logfire.info("Application startup sequence complete.")
   yield
   # Shutdown: Clean up connections, etc.
@@ -187,9 +240,21 @@ async def lifespan(app: FastAPI):
 
   # Consolidate shutdown calls into a single try block
   try:
+    logfire.debug("Cancelling deferred startup phases...")
+    await startup.cancel_deferred()
+
+    logfire.debug("Attempting dashboard snapshot aggregator shutdown...")
+    await shutdown_snapshot_aggregator()
+
+    logfire.debug("Attempting distance pre-warmer shutdown...")
+    await shutdown_distance_prewarmer()
+
     logfire.debug("Attempting sheet_sync_shutdown...")
     await sheet_sync_shutdown()
 
+    logfire.debug("Attempting image worker pool shutdown...")
+    shutdown_image_executor()
+
     logfire.debug("Attempting close_n8n_client...")
     await close_n8n_client()
 
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field, validator  # Add validator
+from pydantic import BaseModel, ConfigDict, Field, validator  # Add validator
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime, timezone
 
+from app.core.telemetry.policy import pydantic_plugin_settings
+
 # --- Request Models ---
 
 
@@ -47,6 +49,9 @@ class CacheStats(BaseModel):
   pricing_cache_last_updated: Optional[str] = None  # Kept as string for now
   pricing_catalog_size_bytes: Optional[int] = None
   maps_cache_key_count: int = 0
+  # Delivery locations currently answered from the negative cache, and its lifetime hits
+  unresolvable_location_count: int = 0
+  unresolvable_location_hits: int = 0
   hit_miss_ratio_pricing: Optional[CacheHitMissRatio] = None
   hit_miss_ratio_maps: Optional[CacheHitMissRatio] = None
 
@@ -72,6 +77,9 @@ class ExternalServiceStatus(BaseModel):
 
 
 class RequestLogEntry(BaseModel):
+  model_config = ConfigDict(
+      plugin_settings=pydantic_plugin_settings("RequestLogEntry"))
+
   timestamp: datetime
   request_id: str
   endpoint: str  # e.g., /webhook/quote
@@ -115,6 +123,10 @@ class DashboardOverview(BaseModel):
   location_lookups_failed: int = Field(
       0, description="Number of failed location lookups.")
 
+  # Snapshot metadata (set when served from a materialized snapshot)
+  as_of: Optional[datetime] = Field(
+      None, description="When the served data was computed.")
+
 
 class CacheClearResult(BaseModel):
   key: str = Field(..., description="The cache key targeted for clearing.")
@@ -18,6 +18,12 @@ class ErrorLog(BaseModel):
       default=None, description="Contextual information about the request that led to the error (e.g., request ID, user ID, input payload snippet)")
   additional_data: Optional[Dict[str, Any]] = Field(
       default=None, description="Any other relevant data for debugging")
+  fingerprint: Optional[str] = Field(
+      default=None, description="Hash of service, error type and normalized message")
+  count: int = Field(
+      default=1, description="Occurrences rolled up into this document")
+  first_seen: Optional[datetime] = None
+  last_seen: Optional[datetime] = None
 
   class Config:
     populate_by_name = True  # Allows using alias _id for id field
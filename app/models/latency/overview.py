@@ -37,6 +37,8 @@ class LatencyOverview(BaseModel):
       default_factory=datetime.now, description="When this overview was generated")
   analysis_time_range_minutes: int = Field(
       60, description="Time range used for analysis")
+  as_of: Optional[datetime] = Field(
+      None, description="When the served snapshot was computed (None if computed for this request)")
 
   class Config:
     json_encoders = {
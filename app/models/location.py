@@ -1,7 +1,9 @@
 # filepath: /home/femar/AO3/Stahla/app/models/location.py
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
+from app.core.telemetry.policy import pydantic_plugin_settings
+
 
 # Define the missing request model
 class LocationLookupRequest(BaseModel):
@@ -14,6 +16,9 @@ class LocationLookupRequest(BaseModel):
 class BranchLocation(BaseModel):
   """Represents a Stahla branch location."""
 
+  model_config = ConfigDict(
+      plugin_settings=pydantic_plugin_settings("BranchLocation"))
+
   name: str = Field(..., description="Name of the Stahla branch.")
   address: str = Field(..., description="Full address of the Stahla branch.")
 
@@ -21,6 +26,9 @@ class BranchLocation(BaseModel):
 class DistanceResult(BaseModel):
   """Represents the result of a distance calculation."""
 
+  model_config = ConfigDict(
+      plugin_settings=pydantic_plugin_settings("DistanceResult"))
+
   nearest_branch: BranchLocation
   delivery_location: str
   distance_miles: float = Field(..., description="Driving distance in miles")
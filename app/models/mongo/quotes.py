@@ -4,6 +4,8 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
 
+from app.core.telemetry.policy import pydantic_plugin_settings
+
 
 class QuoteStatus(str, Enum):
   """Status of quote generation."""
@@ -74,6 +76,7 @@ class QuoteDocument(BaseModel):
       default_factory=datetime.utcnow, description="Last update timestamp")
 
   class Config:
+    plugin_settings = pydantic_plugin_settings("QuoteDocument")
     json_schema_extra = {
         "example": {
             "id": "QT-uuid-123",
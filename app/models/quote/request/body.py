@@ -7,6 +7,8 @@ import uuid
 from datetime import date
 from typing import List, Literal
 
+from app.core.telemetry.policy import pydantic_plugin_settings
+
 from .extras.input import ExtraInput
 
 
@@ -47,6 +49,7 @@ class QuoteRequest(BaseModel):
     return value
 
   class Config:
+    plugin_settings = pydantic_plugin_settings("QuoteRequest")
     json_schema_extra = {
         "example": {
             "request_id": "req_abc123",
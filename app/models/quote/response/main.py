@@ -6,6 +6,8 @@ import uuid
 from pydantic import BaseModel, Field
 from typing import Optional
 
+from app.core.telemetry.policy import pydantic_plugin_settings
+
 from .body import QuoteBody
 from .meta.data import QuoteMetadata
 from .details.location import LocationDetails
@@ -26,6 +28,7 @@ class QuoteResponse(BaseModel):
                                   description="Metadata about the quote generation process.")
 
   class Config:
+    plugin_settings = pydantic_plugin_settings("QuoteResponse")
     json_schema_extra = {
         "example": {
             "request_id": "req_abc123",
@@ -1,7 +1,7 @@
 \
 # filepath: app/models/user.py
 from pydantic import BaseModel, EmailStr, Field
-from typing import Literal, Optional
+from typing import Dict, Literal, Optional
 import uuid
 
 
@@ -14,6 +14,8 @@ class UserBase(BaseModel):
   is_active: bool = Field(default=True, description="Whether user is active")
   picture: Optional[str] = Field(
       default=None, description="User profile picture path")
+  picture_variants: Optional[Dict[str, str]] = Field(
+      default=None, description="Profile picture paths by variant size (sm, md, lg)")
 
 
 class UserCreate(UserBase):
@@ -4,25 +4,20 @@ Used for consistent background task handling across the application.
 """
 
 from fastapi import BackgroundTasks
-from app.services.redis.service import RedisService
 from typing import Any
 
+from app.core.context import bind_request_context
+
 
 def attach_background_tasks(service: Any, background_tasks: BackgroundTasks) -> None:
     """
-    Attach background tasks to a service instance.
-    This function detects service types and attaches background tasks accordingly.
+    Attach background tasks to a service for the current request.
+    Services are shared between requests, so the tasks are bound to the
+    request context rather than stored on the instance.
 
     Args:
         service: The service instance to attach background tasks to
         background_tasks: The BackgroundTasks instance from FastAPI
     """
-    # Handle RedisService directly
-    if isinstance(service, RedisService):
-        service.background_tasks = background_tasks
-        return
-
-    # If service has a redis_service attribute, attach background tasks to it
-    redis_service = getattr(service, "redis_service", None)
-    if redis_service is not None and isinstance(redis_service, RedisService):
-        redis_service.background_tasks = background_tasks
+    # Shared service instances read the tasks from the request context
+    bind_request_context(background_tasks=background_tasks)
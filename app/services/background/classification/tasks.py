@@ -20,7 +20,8 @@ logger = logging.getLogger(__name__)
 async def process_voice_classification_bg(
     webhook_payload: BlandWebhookPayload,
     use_ai_classification: bool = True,
-    background_task_id: Optional[str] = None
+    background_task_id: Optional[str] = None,
+    raise_errors: bool = False
 ) -> None:
   """
   Background task to process voice webhook with AI-powered classification.
@@ -29,6 +30,8 @@ async def process_voice_classification_bg(
       webhook_payload: Bland webhook payload containing call data
       use_ai_classification: Whether to use AI classification (default: True)
       background_task_id: Optional background task ID for tracking
+      raise_errors: Raise when processing fails, after the error result is
+          stored, so a job worker can retry the call (default: False)
   """
   call_id = webhook_payload.call_id
   task_id = background_task_id or str(uuid.uuid4())
@@ -69,6 +72,13 @@ async def process_voice_classification_bg(
 
     # Store error result
     await _store_error_result(webhook_payload, str(e), task_id)
+    if raise_errors:
+      raise
+    return
+
+  # The AI service reports its own failures as an error result, not an exception
+  if raise_errors and processing_result.status == "error":
+    raise RuntimeError(processing_result.message)
 
 
 async def _store_classification_results(
@@ -8,6 +8,7 @@ import json
 import logfire
 
 from app.core.keys import (
+    DASH_LIVE_CHANNEL,
     RECENT_ERRORS_KEY,
 )
 
@@ -55,6 +56,9 @@ async def log_error_bg(
         pipe.lpush(RECENT_ERRORS_KEY, entry_json)
         # Keep list capped to recent entries
         pipe.ltrim(RECENT_ERRORS_KEY, 0, MAX_ERROR_ENTRIES - 1)
+        # Push to live dashboards (no-op when nobody is subscribed)
+        pipe.publish(DASH_LIVE_CHANNEL, json.dumps(
+            {"topic": "errors", "data": error_entry}))
         # Increment counter for this specific error type
         pipe.incr(f"error:{error_key}")
         await pipe.execute()
@@ -71,8 +71,11 @@ async def log_classify_bg(mongo_service, classify_data: Dict[str, Any], backgrou
         f"Error logging classification in background: {e}", exc_info=True)
 
 
-async def log_location_bg(mongo_service, location_data: Dict[str, Any], background_task_id: Optional[str] = None):
-  """Background task to log a location lookup to MongoDB."""
+async def log_location_bg(mongo_service, location_data: Dict[str, Any], background_task_id: Optional[str] = None, raise_errors: bool = False):
+  """
+  Background task to log a location lookup to MongoDB.
+  With `raise_errors` a failed write raises instead of only being logged.
+  """
   try:
     if not location_data.get("id"):
       location_data["id"] = str(uuid.uuid4())
@@ -85,8 +88,12 @@ async def log_location_bg(mongo_service, location_data: Dict[str, Any], backgrou
       logger.info(f"Location logged successfully in background: {result}")
     else:
       logger.error("Failed to log location in background")
+      if raise_errors:
+        raise RuntimeError("MongoDB did not store the location record")
   except Exception as e:
     logger.error(f"Error logging location in background: {e}", exc_info=True)
+    if raise_errors:
+      raise
 
 
 async def log_email_bg(mongo_service, email_data: Dict[str, Any], background_task_id: Optional[str] = None):
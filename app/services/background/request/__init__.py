@@ -5,8 +5,11 @@ from typing import Any, Optional
 from datetime import datetime
 import json
 
+from app.core.context import CounterBatch, current_counter_batch
 from app.models.dash.dashboard import RequestLogEntry
+from app.services.redis.counters import flush_counters
 from app.core.keys import (
+    DASH_LIVE_CHANNEL,
     RECENT_REQUESTS_KEY,
     TOTAL_QUOTE_REQUESTS_KEY,
     SUCCESS_QUOTE_REQUESTS_KEY,
@@ -49,6 +52,9 @@ async def log_request_response_bg(redis, endpoint: str, request_id: str, request
         pipe.lpush(RECENT_REQUESTS_KEY, entry_json)
         # Keep list size capped
         pipe.ltrim(RECENT_REQUESTS_KEY, 0, MAX_LOG_ENTRIES - 1)
+        # Push to live dashboards (no-op when nobody is subscribed)
+        pipe.publish(DASH_LIVE_CHANNEL, json.dumps(
+            {"topic": "requests", "data": entry_dict}))
         await pipe.execute()
     finally:
       await redis_client.close()
@@ -61,11 +67,25 @@ async def log_request_response_bg(redis, endpoint: str, request_id: str, request
         f"Failed to log request/response: {str(e)}", exc_info=True)
 
 
-async def increment_request_counter_bg(redis, key: str):
-  """Background task to increment a Redis counter."""
+async def increment_request_counter_bg(redis, key: str, amount: int = 1):
+  """
+  Increments a dashboard counter. Inside a request the delta joins the
+  request's counter batch, flushed once at the end by LoggingMiddleware;
+  otherwise it is written at once.
+  """
+  counters = current_counter_batch()
+  if counters is not None and counters.add(key, amount):
+    return
   try:
-    await redis.increment(key)
+    await flush_counters(redis, {key: amount})
     logger.debug(f"Incremented Redis counter: {key}")
   except Exception as e:
     logger.error(
         f"Failed to increment Redis counter '{key}': {e}", exc_info=True)
+
+
+async def flush_request_counters_bg(redis, counters: CounterBatch):
+  """Background task writing a request's counter batch in one pipeline."""
+  deltas = counters.close()
+  if deltas:
+    await flush_counters(redis, deltas)
@@ -7,6 +7,7 @@ that require access to background task queues.
 
 from typing import Any, Optional, Callable
 from fastapi.background import BackgroundTasks
+from app.core.context import bind_request_context
 from .safe import get_background_tasks, add_task_safely
 
 __all__ = ["attach_background_tasks",
@@ -15,11 +16,10 @@ __all__ = ["attach_background_tasks",
 
 def attach_background_tasks(service_instance: Any, background_tasks: BackgroundTasks) -> None:
   """
-  Attach background tasks to a service instance that supports them.
+  Make background tasks available to a service for the current request.
 
-  This utility function checks if a service instance has a set_background_tasks method,
-  and if so, attaches the provided background tasks object. It also handles 
-  nested services that may have background task support.
+  The tasks are bound to the request context (app.core.context), which every
+  service reads from, so shared service instances are never mutated.
 
   Args:
       service_instance: Any service instance that might support background tasks
@@ -43,21 +43,7 @@ def attach_background_tasks(service_instance: Any, background_tasks: BackgroundT
           return {"result": result}
       ```
   """
-  # Direct attachment if service has set_background_tasks method
-  if hasattr(service_instance, 'set_background_tasks') and callable(getattr(service_instance, 'set_background_tasks')):
-    service_instance.set_background_tasks(background_tasks)
-
-  # For RedisService with background_tasks attribute
-  if hasattr(service_instance, 'background_tasks') and service_instance.background_tasks is None:
-    service_instance.background_tasks = background_tasks
-
-  # Handle nested services with redis_service attribute
-  if hasattr(service_instance, 'redis_service') and service_instance.redis_service is not None:
-    attach_background_tasks(service_instance.redis_service, background_tasks)
-
-  # Handle nested services like distance_calc, etc.
-  for attr_name in ['distance_calc', 'cache_ops', 'google_ops', 'area_checker']:
-    if hasattr(service_instance, attr_name):
-      nested_service = getattr(service_instance, attr_name)
-      if nested_service is not None:
-        attach_background_tasks(nested_service, background_tasks)
+  # Services are application-scoped and shared between requests, so the
+  # tasks are bound to the current request's context instead of the instance
+  # (and every nested service sees them without being walked).
+  bind_request_context(background_tasks=background_tasks)
@@ -6,6 +6,8 @@ These utilities can be imported from anywhere in the application.
 from typing import Any, Optional, Callable
 from fastapi import BackgroundTasks
 
+from app.core.context import current_background_tasks
+
 
 def get_background_tasks(service_instance: Any) -> Optional[BackgroundTasks]:
   """
@@ -18,15 +20,16 @@ def get_background_tasks(service_instance: Any) -> Optional[BackgroundTasks]:
   Returns:
       BackgroundTasks object if available, None otherwise
   """
-  if hasattr(service_instance, 'background_tasks'):
+  if getattr(service_instance, 'background_tasks', None) is not None:
     return getattr(service_instance, 'background_tasks')
 
   # Also check redis_service if available
-  if hasattr(service_instance, 'redis_service') and service_instance.redis_service is not None:
-    if hasattr(service_instance.redis_service, 'background_tasks'):
-      return getattr(service_instance.redis_service, 'background_tasks')
+  redis_service = getattr(service_instance, 'redis_service', None)
+  if getattr(redis_service, 'background_tasks', None) is not None:
+    return redis_service.background_tasks
 
-  return None
+  # Shared services get the current request's tasks from the request context
+  return current_background_tasks()
 
 
 def add_task_safely(service_instance: Any, task_func: Callable, *args: Any, **kwargs: Any) -> bool:
@@ -293,8 +293,16 @@ class BlandAIManager:
 _bland_manager: Optional[BlandAIManager] = None
 
 
-async def initialize_bland_manager(mongo_service: MongoService, background_tasks: BackgroundTasks) -> BlandAIManager:
-  """Initialize and sync the Bland AI manager with required dependencies."""
+async def initialize_bland_manager(
+    mongo_service: MongoService,
+    background_tasks: BackgroundTasks,
+    sync_definitions: bool = True,
+) -> BlandAIManager:
+  """
+  Initialize and sync the Bland AI manager with required dependencies.
+  Pass sync_definitions=False to skip the pathway/tool sync so it can be run
+  later (e.g. after the application is ready) via `sync_bland()`.
+  """
   global _bland_manager
 
   if _bland_manager is not None:
@@ -302,7 +310,7 @@ async def initialize_bland_manager(mongo_service: MongoService, background_tasks
         "BlandAIManager already initialized, returning existing instance.")
     return _bland_manager
 
-  logfire.info("Initializing BlandAIManager and syncing Bland definitions...")
+  logfire.info("Initializing BlandAIManager...")
 
   _bland_manager = BlandAIManager(
       api_key=settings.BLAND_API_KEY,
@@ -312,8 +320,11 @@ async def initialize_bland_manager(mongo_service: MongoService, background_tasks
       pathway_id_setting=settings.BLAND_PATHWAY_ID,
   )
 
-  await _bland_manager.sync_bland()
-  logfire.info("BlandAIManager initialized and synced successfully.")
+  if sync_definitions:
+    await _bland_manager.sync_bland()
+    logfire.info("BlandAIManager initialized and synced successfully.")
+  else:
+    logfire.info("BlandAIManager initialized; definition sync deferred.")
   return _bland_manager
 
 
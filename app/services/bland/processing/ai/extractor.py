@@ -6,10 +6,15 @@ This module uses natural language processing to extract specific field values
 from voice call transcripts and maps them to HubSpot contact and lead properties.
 """
 
+import asyncio
 import marvin
 from typing import Dict, Any, Optional, List
+from app.core.config import settings
 from app.models.hubspot import HubSpotContactProperties, HubSpotLeadProperties
 from app.models.classification import ClassificationInput
+from app.services.bland.processing.ai.transcript.prefill import PreExtraction, transcript_pre_extractor
+from app.services.llm import llm_executor
+from pydantic import BaseModel, ValidationError
 import logfire
 from datetime import datetime
 import re
@@ -133,6 +138,46 @@ def extract_structured_call_data(
   return {"result": {}}  # Marvin will implement this and return the actual data
 
 
+@marvin.fn
+def extract_all_call_data(
+    transcript: str
+) -> Dict[str, Any]:
+  """
+  Extract contact, lead and classification data from a voice call transcript
+  in a single pass.
+
+  **Instructions:**
+  - Return a dictionary with exactly three keys: 'contact', 'lead' and 'result'
+  - If information is not mentioned or unclear, leave the field as None
+  - **IMPORTANT: All date strings MUST be formatted as 'YYYY-MM-DD'**
+
+  **'contact' (HubSpot contact properties):**
+  - firstname, lastname, email, phone (clean string)
+  - city, state, zip, address when mentioned
+  - company and industry when mentioned
+
+  **'lead' (HubSpot lead/project properties):**
+  - project_category: Construction, Event, Emergency/Disaster Relief, Facility Management or Other
+  - service type: Portable Restrooms, Restroom Trailers, Shower Trailers, Handwashing Stations, Waste Management or Other
+  - units_needed, expected_attendance (integer), ada_required, power/water availability (True/False)
+  - rental start/end dates and other project details
+
+  **'result' (classification data):**
+  - product_interest: List of products/services mentioned
+  - service_needed, event_type
+  - location, city, state (2 letters), postal_code
+  - start_date, end_date, duration_days
+  - guest_count, required_stalls
+  - ada_required, power_available, water_available (True/False)
+  - budget_mentioned (e.g., '$2500', '$10k') or 'none'
+  - comments: Additional important details or requirements
+
+  **Input:** Voice call transcript text
+  **Output:** Dictionary with 'contact', 'lead' and 'result' fields
+  """
+  return {"contact": {}, "lead": {}, "result": {}}  # Marvin will implement this
+
+
 class AIFieldExtractor:
   """
   AI-powered field extraction service for Bland voice call processing.
@@ -142,6 +187,10 @@ class AIFieldExtractor:
   def __init__(self):
     self.logger = logfire
 
+  async def _run_llm(self, call_type: str, func, transcript: str):
+    """Runs a Marvin function through the shared LLM executor (off-loop, rate limited)."""
+    return await llm_executor.run(f"extraction.{call_type}", func, transcript)
+
   async def extract_contact_data(self, transcript: str) -> Optional[HubSpotContactProperties]:
     """
     Extract contact information from transcript using AI.
@@ -155,9 +204,8 @@ class AIFieldExtractor:
     try:
       self.logger.info("Extracting contact data from transcript using AI")
 
-      # Run the Marvin function in a thread to avoid coroutine reuse issues
-      import asyncio
-      contact_dict = await asyncio.to_thread(extract_contact_properties_from_transcript, transcript)
+      # Run the Marvin function off the event loop via the LLM executor
+      contact_dict = await self._run_llm("contact", extract_contact_properties_from_transcript, transcript)
 
       # Convert dictionary to HubSpotContactProperties object
       contact_data = HubSpotContactProperties(**contact_dict)
@@ -184,9 +232,8 @@ class AIFieldExtractor:
     try:
       self.logger.info("Extracting lead data from transcript using AI")
 
-      # Run the Marvin function in a thread to avoid coroutine reuse issues
-      import asyncio
-      lead_dict = await asyncio.to_thread(extract_lead_properties_from_transcript, transcript)
+      # Run the Marvin function off the event loop via the LLM executor
+      lead_dict = await self._run_llm("lead", extract_lead_properties_from_transcript, transcript)
 
       # Convert dictionary to HubSpotLeadProperties object
       lead_data = HubSpotLeadProperties(**lead_dict)
@@ -214,19 +261,9 @@ class AIFieldExtractor:
       self.logger.info(
           "Extracting classification data from transcript using AI")
 
-      # Run the Marvin function in a thread to avoid coroutine reuse issues
-      import asyncio
-      classification_response = await asyncio.to_thread(extract_structured_call_data, transcript)
-
-      # Extract the result field from the response
-      if isinstance(classification_response, dict) and 'result' in classification_response:
-        classification_data = classification_response['result']
-      else:
-        # Fallback for backwards compatibility
-        classification_data = classification_response
-
-      # Validate and clean the extracted data
-      cleaned_data = self._validate_and_clean_data(classification_data)
+      # Run the Marvin function off the event loop via the LLM executor
+      classification_response = await self._run_llm("classification", extract_structured_call_data, transcript)
+      cleaned_data = self._clean_classification_response(classification_response)
 
       self.logger.info("Classification data extraction successful",
                        extracted_fields=len([k for k, v in cleaned_data.items() if v is not None]))
@@ -238,6 +275,66 @@ class AIFieldExtractor:
           f"Error extracting classification data: {e}", exc_info=True)
       return None
 
+  def _clean_classification_response(self, classification_response: Any) -> Dict[str, Any]:
+    """Unwraps the 'result' field of a classification response and cleans it."""
+    if isinstance(classification_response, dict) and 'result' in classification_response:
+      classification_data = classification_response['result']
+    else:
+      # Fallback for backwards compatibility
+      classification_data = classification_response
+    return self._validate_and_clean_data(classification_data or {})
+
+  async def extract_single_pass(self, transcript: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract contact, lead and classification data with one LLM call.
+
+    Args:
+        transcript: Voice call transcript text
+
+    Returns:
+        Dictionary with 'contact', 'lead' and 'classification' entries,
+        or None if the merged extraction fails
+    """
+    try:
+      self.logger.info("Extracting all call data from transcript in a single pass")
+      response = await self._run_llm("single_pass", extract_all_call_data, transcript)
+      if not isinstance(response, dict):
+        raise ValueError(
+            f"Single-pass extraction returned {type(response).__name__}, expected dict")
+
+      contact_data = HubSpotContactProperties(**(response.get('contact') or {}))
+      lead_data = HubSpotLeadProperties(**(response.get('lead') or {}))
+      classification_data = self._clean_classification_response(
+          {'result': response.get('result') or {}})
+
+      self.logger.info("Single-pass extraction successful",
+                       contact_fields=len([k for k, v in contact_data.model_dump().items() if v is not None]),
+                       lead_fields=len([k for k, v in lead_data.model_dump().items() if v is not None]),
+                       classification_fields=len(classification_data))
+      return {
+          'contact': contact_data,
+          'lead': lead_data,
+          'classification': classification_data,
+      }
+
+    except Exception as e:
+      self.logger.warning(
+          f"Single-pass extraction failed, falling back to concurrent extraction: {e}")
+      return None
+
+  async def extract_hubspot_properties(self, transcript: str):
+    """
+    Extract contact and lead properties concurrently.
+
+    Returns:
+        Tuple of (contact_data, lead_data)
+    """
+    contact_data, lead_data = await asyncio.gather(
+        self.extract_contact_data(transcript),
+        self.extract_lead_data(transcript),
+    )
+    return contact_data, lead_data
+
   def _validate_and_clean_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate and clean extracted data.
@@ -311,12 +408,79 @@ class AIFieldExtractor:
     except ValueError:
       return False
 
-  async def extract_comprehensive_data(self, transcript: str) -> Dict[str, Any]:
+  def _build_properties(self, model: type, data: Dict[str, Any]) -> BaseModel:
+    """Builds a properties model, dropping values that fail validation."""
+    try:
+      return model(**data)
+    except ValidationError as e:
+      invalid = {str(error['loc'][0]) for error in e.errors() if error.get('loc')}
+      self.logger.warning("Dropping invalid pre-extracted fields", fields=sorted(invalid))
+      return model(**{k: v for k, v in data.items() if k not in invalid})
+
+  def _merge_pre_extraction(
+      self,
+      pre: PreExtraction,
+      contact_data: Optional[HubSpotContactProperties],
+      lead_data: Optional[HubSpotLeadProperties],
+      classification_data: Optional[Dict[str, Any]],
+  ):
+    """
+    Overlays pre-extracted fields on the LLM output. Variables come from the
+    form or CRM and override the LLM; pattern matches only fill its gaps.
+    """
+    contact = contact_data.model_dump() if contact_data else {}
+    lead = lead_data.model_dump() if lead_data else {}
+    classification = dict(classification_data or {})
+
+    for source in ("pattern", "variables"):
+      part = pre.subset(source)
+      for target, values in ((contact, part.contact_properties()),
+                             (lead, part.lead_properties()),
+                             (classification, part.classification_data())):
+        for key, value in values.items():
+          if source == "variables" or target.get(key) in (None, "", []):
+            target[key] = value
+
+    return (self._build_properties(HubSpotContactProperties, contact),
+            self._build_properties(HubSpotLeadProperties, lead),
+            self._validate_and_clean_data(classification))
+
+  async def _extract_with_llm(self, transcript: str):
+    """Runs single-pass or per-schema LLM extraction. Returns (contact, lead, classification, mode)."""
+    single_pass = None
+    if settings.BLAND_EXTRACTION_MODE == "single_pass":
+      single_pass = await self.extract_single_pass(transcript)
+
+    if single_pass is not None:
+      return (single_pass['contact'], single_pass['lead'],
+              single_pass['classification'], "single_pass")
+
+    # One call per schema, run concurrently within the LLM executor's limits
+    contact_data, lead_data, classification_data = await asyncio.gather(
+        self.extract_contact_data(transcript),
+        self.extract_lead_data(transcript),
+        self.extract_classification_data(transcript),
+    )
+    return contact_data, lead_data, classification_data, "concurrent"
+
+  async def extract_comprehensive_data(
+      self,
+      transcript: str,
+      variables: Optional[Dict[str, Any]] = None
+  ) -> Dict[str, Any]:
     """
     Extract all available data from transcript using AI.
 
+    With BLAND_PREEXTRACTION_ENABLED, fixed-shape fields are first taken from
+    the call variables and compiled patterns; the LLM then sees only the
+    relevant transcript turns, or is skipped when every required field is
+    already known. In "single_pass" mode (BLAND_EXTRACTION_MODE) one merged
+    LLM call returns all three schemas; otherwise, or if that call fails, the
+    three per-schema calls run concurrently.
+
     Args:
         transcript: Voice call transcript text
+        variables: Bland call variables/metadata (see extract_variables_data)
 
     Returns:
         Dictionary containing contact data, lead data, and classification data
@@ -325,25 +489,39 @@ class AIFieldExtractor:
       self.logger.info(
           "Starting comprehensive data extraction from transcript")
 
-      # Extract all data types in parallel
-      contact_task = self.extract_contact_data(transcript)
-      lead_task = self.extract_lead_data(transcript)
-      classification_task = self.extract_classification_data(transcript)
+      pre = None
+      if settings.BLAND_PREEXTRACTION_ENABLED:
+        pre = transcript_pre_extractor.run(transcript, variables)
 
-      # Wait for all extractions to complete
-      contact_data = await contact_task
-      lead_data = await lead_task
-      classification_data = await classification_task
+      if pre is not None and not pre.llm_required:
+        contact_data, lead_data, classification_data = self._merge_pre_extraction(
+            pre, None, None, None)
+        extraction_mode = "deterministic"
+      else:
+        contact_data, lead_data, classification_data, extraction_mode = \
+            await self._extract_with_llm(pre.prompt if pre and pre.prompt else transcript)
+        if pre is not None and pre.fields:
+          contact_data, lead_data, classification_data = self._merge_pre_extraction(
+              pre, contact_data, lead_data, classification_data)
 
       result = {
           'contact_properties': contact_data.model_dump() if contact_data else None,
           'lead_properties': lead_data.model_dump() if lead_data else None,
           'classification_data': classification_data,
           'extraction_timestamp': datetime.utcnow().isoformat(),
+          'extraction_mode': extraction_mode,
           'transcript_length': len(transcript) if transcript else 0
       }
-
-      self.logger.info("Comprehensive data extraction completed successfully")
+      if pre is not None:
+        result['pre_extraction'] = {
+            'fields_prefilled': len(pre.fields),
+            'sources': pre.sources,
+            'llm_skipped': not pre.llm_required,
+            'prompt_length': len(pre.prompt),
+        }
+
+      self.logger.info("Comprehensive data extraction completed successfully",
+                       extraction_mode=extraction_mode)
 
       return result
 
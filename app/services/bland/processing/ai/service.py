@@ -12,12 +12,14 @@ from datetime import datetime
 
 from app.models.bland import BlandWebhookPayload, BlandProcessingResult
 from app.services.bland.processing.ai.transcript.processor import transcript_processor
+from app.services.bland.processing.ai.transcript.prefill import transcript_pre_extractor
 from app.services.bland.processing.ai.extractor import ai_field_extractor
 from app.services.bland.processing.ai.location.handler import create_location_handler
 from app.services.bland.processing.ai.classification.coordinator import create_classification_coordinator
 from app.services.bland.processing.ai.results.builder import result_builder
 from app.services.classify.classification import classification_manager
 from app.services.classify.marvin import marvin_classification_manager
+from app.services.llm import llm_executor
 
 
 class EnhancedVoiceWebhookService:
@@ -289,8 +291,10 @@ class EnhancedVoiceWebhookService:
             "No transcript available for processing", webhook_payload
         )
 
-      # Step 2: Extract all fields using AI
-      extraction_result = await self.field_extractor.extract_comprehensive_data(transcript)
+      # Step 2: Extract all fields (variables and patterns first, then AI)
+      variables = self.transcript_processor.extract_variables_data(webhook_payload)
+      extraction_result = await self.field_extractor.extract_comprehensive_data(
+          transcript, variables)
 
       # Step 3: Process location data
       await self._ensure_location_handler()
@@ -334,13 +338,8 @@ class EnhancedVoiceWebhookService:
         Tuple of (contact_data, lead_data)
     """
     try:
-      # Extract contact properties
-      contact_data = await self.field_extractor.extract_contact_data(transcript)
-
-      # Extract lead properties
-      lead_data = await self.field_extractor.extract_lead_data(transcript)
-
-      return contact_data, lead_data
+      # Extract contact and lead properties concurrently
+      return await self.field_extractor.extract_hubspot_properties(transcript)
 
     except Exception as e:
       self.logger.error("Error extracting HubSpot properties",
@@ -360,6 +359,8 @@ class EnhancedVoiceWebhookService:
           'ai_orchestrator': 'available',
           'field_extractor': 'available',
           'marvin_classifier': 'available',
+          'llm_executor': llm_executor.get_stats(),
+          'pre_extraction': transcript_pre_extractor.get_stats(),
           'timestamp': datetime.utcnow().isoformat(),
           'version': '2.0'
       }
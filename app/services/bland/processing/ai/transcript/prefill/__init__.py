@@ -0,0 +1,33 @@
+# app/services/bland/processing/ai/transcript/prefill/__init__.py
+
+"""
+Deterministic pre-extraction for Bland voice call transcripts.
+Fields with a fixed shape (email, phone, ZIP, state, dates, stall counts,
+durations, guest counts, budgets) are taken from the call variables first and
+then from compiled patterns over the transcript. The LLM only sees the turns
+relevant to the fields still missing, and is skipped entirely when nothing
+required is left to extract.
+
+- patterns: compiled regular expressions and lookup tables
+- fields: variable aliases, required field groups and turn keywords
+- parsing: value normalizers, date finding and turn splitting
+- models: PreExtraction results and savings counters
+- extractor: TranscriptPreExtractor and the shared instance
+"""
+
+from .extractor import TranscriptPreExtractor, transcript_pre_extractor
+from .fields import FIELD_KEYWORDS, REQUIRED_FIELD_GROUPS, VARIABLE_ALIASES
+from .models import PreExtraction, PreExtractionStats
+from .parsing import find_dates, split_turns
+
+__all__ = [
+    "TranscriptPreExtractor",
+    "transcript_pre_extractor",
+    "FIELD_KEYWORDS",
+    "REQUIRED_FIELD_GROUPS",
+    "VARIABLE_ALIASES",
+    "PreExtraction",
+    "PreExtractionStats",
+    "find_dates",
+    "split_turns",
+]
@@ -0,0 +1,232 @@
+# app/services/bland/processing/ai/transcript/prefill/extractor.py
+
+"""
+Runs pre-extraction: call variables first, then compiled patterns over the
+caller's turns, then the LLM-or-skip decision and the trimmed prompt.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+import logfire
+
+from app.core.config import settings
+
+from .fields import FIELD_KEYWORDS, REQUIRED_FIELD_GROUPS, VARIABLE_ALIASES, keyword_pattern
+from .models import PreExtraction, PreExtractionStats
+from .parsing import clean_phone, find_dates, split_turns, to_bool, to_int, to_iso_date
+from .patterns import (
+    BUDGET_RE,
+    CITY_STATE_ZIP_RE,
+    DURATION_DAYS,
+    DURATION_RE,
+    EMAIL_RE,
+    GUESTS_RE,
+    PHONE_RE,
+    SPOKEN_EMAIL_RE,
+    STALLS_RE,
+    US_STATE_CODES,
+    ZIP_RE,
+)
+
+
+class TranscriptPreExtractor:
+  """
+  Fills fixed-shape fields from Bland variables and compiled patterns, and
+  builds a compact LLM prompt for whatever is left.
+  """
+
+  def __init__(self):
+    self.stats = PreExtractionStats()
+
+  def from_variables(self, variables: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Maps Bland variables (and nested form/metadata dicts) onto field names."""
+    if not variables:
+      return {}
+    flat: Dict[str, Any] = {}
+    for key, value in variables.items():
+      if isinstance(value, dict):
+        # metadata / form_submission_data nest the form fields one or two levels down
+        for inner_key, inner_value in value.items():
+          if isinstance(inner_value, dict):
+            for deep_key, deep_value in inner_value.items():
+              flat.setdefault(str(deep_key).lower(), deep_value)
+          else:
+            flat.setdefault(str(inner_key).lower(), inner_value)
+      else:
+        flat[str(key).lower()] = value
+
+    fields: Dict[str, Any] = {}
+    for field_name, aliases in VARIABLE_ALIASES.items():
+      for alias in aliases:
+        value = flat.get(alias)
+        if value is None or (isinstance(value, str) and value.strip().lower() in ("", "none", "null", "n/a")):
+          continue
+        normalized = self._normalize(field_name, value)
+        if normalized is not None:
+          fields[field_name] = normalized
+          break
+    return fields
+
+  def _normalize(self, field_name: str, value: Any) -> Any:
+    if field_name in ("duration_days", "guest_count", "required_stalls"):
+      return to_int(value)
+    if field_name in ("ada_required", "power_available", "water_available"):
+      return to_bool(value)
+    if field_name in ("start_date", "end_date"):
+      return to_iso_date(value)
+    if field_name == "phone":
+      return clean_phone(value)
+    if field_name == "state":
+      code = str(value).strip().upper()
+      return code if code in US_STATE_CODES else None
+    if field_name == "zip":
+      match = re.search(r"\d{5}", str(value))
+      return match.group(0) if match else None
+    if isinstance(value, list):
+      return ", ".join(str(item) for item in value if item) or None
+    return str(value).strip()
+
+  def from_transcript(self, transcript: str) -> Dict[str, Any]:
+    """Pulls fixed-shape fields out of the transcript with compiled patterns."""
+    fields: Dict[str, Any] = {}
+    turns = split_turns(transcript)
+    # Only the caller's words: the agent reads out Stahla's own number and address
+    user_turns = [text for speaker, text in turns if speaker == "user"]
+    user_text = " ".join(user_turns or [text for speaker, text in turns
+                                         if speaker != "agent-action"])
+
+    email = EMAIL_RE.search(user_text)
+    if email:
+      fields["email"] = email.group(0).lower()
+    else:
+      spoken = SPOKEN_EMAIL_RE.search(user_text)
+      if spoken:
+        domain = re.sub(r"\s+dot\s+", ".", spoken.group(2), flags=re.IGNORECASE)
+        fields["email"] = f"{spoken.group(1)}@{domain}".lower()
+
+    phone = PHONE_RE.search(user_text)
+    if phone:
+      fields["phone"] = "".join(phone.groups())
+
+    location = CITY_STATE_ZIP_RE.search(user_text)
+    if location and location.group(2) in US_STATE_CODES:
+      fields["city"] = location.group(1).strip()
+      fields["state"] = location.group(2)
+      fields["zip"] = location.group(3)
+    else:
+      zip_match = ZIP_RE.search(user_text)
+      if zip_match:
+        fields["zip"] = zip_match.group(1)
+
+    dates = find_dates(user_text)
+    if dates:
+      fields["start_date"] = dates[0]
+      if len(dates) > 1:
+        fields["end_date"] = dates[1]
+
+    stalls = STALLS_RE.search(user_text)
+    if stalls:
+      count = to_int(stalls.group(1))
+      if count:
+        fields["required_stalls"] = count
+
+    duration = DURATION_RE.search(user_text)
+    if duration:
+      amount = to_int(duration.group(1))
+      unit = duration.group(2).lower().rstrip("s")
+      if amount:
+        fields["duration_days"] = amount * DURATION_DAYS[unit]
+
+    guests = GUESTS_RE.search(user_text)
+    if guests:
+      fields["guest_count"] = to_int(guests.group(1))
+
+    budget = BUDGET_RE.search(user_text)
+    if budget:
+      fields["budget_mentioned"] = budget.group(0).replace(" ", "")
+
+    return {key: value for key, value in fields.items() if value is not None}
+
+  def trim(self, transcript: str, missing: List[str], max_chars: Optional[int] = None) -> str:
+    """
+    Keeps the user turns relevant to the missing fields, each with the agent
+    turn that prompted it. Falls back to the head of the transcript when no
+    turn matches.
+    """
+    max_chars = max_chars or settings.BLAND_PROMPT_MAX_CHARS
+    turns = [turn for turn in split_turns(transcript) if turn[0] != "agent-action"]
+    pattern = keyword_pattern(missing)
+
+    keep = set()
+    for index, (speaker, text) in enumerate(turns):
+      if pattern is None or not pattern.search(text):
+        continue
+      keep.add(index)
+      # Keep the question with its answer and the answer with its question
+      if speaker == "user" and index > 0:
+        keep.add(index - 1)
+      elif speaker != "user" and index + 1 < len(turns):
+        keep.add(index + 1)
+
+    selected = [turns[index] for index in sorted(keep)] or turns
+    lines: List[str] = []
+    used = 0
+    for speaker, text in selected:
+      line = f"{speaker}: {text}"
+      if used + len(line) > max_chars:
+        break
+      lines.append(line)
+      used += len(line) + 1
+    return "\n".join(lines) if lines else transcript[:max_chars]
+
+  def run(self, transcript: str, variables: Optional[Dict[str, Any]] = None) -> PreExtraction:
+    """Pre-extracts fields and decides whether, and with what prompt, to call the LLM."""
+    variable_fields = self.from_variables(variables)
+    pattern_fields = self.from_transcript(transcript) if transcript else {}
+
+    # Variables come from the form or CRM and win over transcript patterns
+    fields = {**pattern_fields, **variable_fields}
+    sources = {key: "pattern" for key in pattern_fields}
+    sources.update({key: "variables" for key in variable_fields})
+
+    missing = [name for name in FIELD_KEYWORDS if name not in fields]
+    llm_required = not all(any(name in fields for name in group) for group in REQUIRED_FIELD_GROUPS)
+
+    prompt = ""
+    if llm_required and transcript:
+      known = "\n".join(f"- {key}: {value}" for key, value in fields.items())
+      excerpt = self.trim(transcript, missing)
+      prompt = (f"Already known (do not re-derive):\n{known}\n\nTranscript excerpts:\n{excerpt}"
+                if known else excerpt)
+
+    result = PreExtraction(
+        fields=fields,
+        sources=sources,
+        missing=missing,
+        llm_required=llm_required,
+        prompt=prompt,
+        original_chars=len(transcript or ""),
+    )
+
+    self.stats.transcripts += 1
+    self.stats.fields_prefilled += len(fields)
+    self.stats.original_chars += result.original_chars
+    self.stats.prompt_chars += len(prompt)
+    if not llm_required:
+      self.stats.llm_skipped += 1
+
+    logfire.info("Transcript pre-extraction completed",
+                 fields_prefilled=len(fields),
+                 from_variables=len(variable_fields),
+                 llm_required=llm_required,
+                 original_chars=result.original_chars,
+                 prompt_chars=len(prompt))
+    return result
+
+  def get_stats(self) -> Dict[str, Any]:
+    return self.stats.to_dict()
+
+
+# Global instance
+transcript_pre_extractor = TranscriptPreExtractor()
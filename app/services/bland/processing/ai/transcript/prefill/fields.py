@@ -0,0 +1,79 @@
+# app/services/bland/processing/ai/transcript/prefill/fields.py
+
+"""Field names: where they come from, which are required and what they sound like."""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Bland variables / form metadata keys that carry a field, in order of preference
+VARIABLE_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "firstname": ("firstname", "first_name"),
+    "lastname": ("lastname", "last_name"),
+    "email": ("email", "email_address"),
+    "phone": ("phone", "phone_number", "mobilephone"),
+    "address": ("event_or_job_address", "address", "event_address", "location"),
+    "city": ("city", "event_city"),
+    "state": ("state", "event_state"),
+    "zip": ("zip", "postal_code", "event_postal_code"),
+    "service_needed": ("what_service_do_you_need_", "service_needed", "product_interest"),
+    "event_type": ("event_type", "project_category"),
+    "start_date": ("event_start_date", "start_date", "rental_start_date"),
+    "end_date": ("event_end_date", "end_date", "rental_end_date"),
+    "duration_days": ("duration_days", "event_duration_days"),
+    "guest_count": ("guest_count", "expected_attendance", "guest_count_estimate"),
+    "required_stalls": ("required_stalls", "how_many_portable_toilet_stalls_",
+                        "how_many_restroom_stalls_", "number_of_stalls", "units_needed"),
+    "ada_required": ("ada", "ada_required"),
+    "power_available": ("do_you_have_power_access_onsite_", "power_available"),
+    "water_available": ("do_you_have_water_access_onsite_", "water_available"),
+}
+
+# The LLM is skipped when every group has at least one field filled. Comments
+# are never pre-extracted, so a skipped call records none.
+REQUIRED_FIELD_GROUPS: Tuple[Tuple[str, ...], ...] = (
+    ("firstname", "lastname"),
+    ("email", "phone"),
+    ("service_needed",),
+    ("event_type",),
+    ("address", "zip"),
+    ("start_date",),
+    ("end_date", "duration_days"),
+    ("required_stalls", "guest_count"),
+    ("ada_required",),
+    ("power_available",),
+    ("water_available",),
+)
+
+# Word prefixes (regex fragments) that make a turn relevant to a missing field
+FIELD_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "firstname": ("name", "speaking"),
+    "lastname": ("name", "last name", "surname"),
+    "email": ("e-?mail", "@"),
+    "phone": ("phone", "number", "call you", "reach you"),
+    "address": ("address", "street", "located", "location", "site", "where", "road", "avenue"),
+    "city": ("city", "town", "where", "located"),
+    "state": ("state", "where", "located"),
+    "zip": ("zip", "postal", "address"),
+    "service_needed": ("restroom", "toilet", "trailer", "shower", "porta", "handwash",
+                       "sink", "need", "looking for", "rent"),
+    "event_type": ("event", "wedding", "festival", "party", "construction", "project",
+                   "job ?site", "concert", "fair", "disaster", "emergency"),
+    "start_date": ("date", "when", "start", "begin", "deliver", "drop off", "month",
+                   "week", r"days?\b", "tomorrow"),
+    "end_date": ("date", "end", "until", "through", "pick ?up", "last"),
+    "duration_days": (r"days?\b", "week", "month", "how long", "duration"),
+    "guest_count": ("guest", "people", "attend", "crowd", "workers", "employees", "how many"),
+    "required_stalls": ("stall", r"units?\b", "how many", "restroom", "toilet"),
+    "ada_required": (r"ada\b", "wheelchair", "accessib", "handicap", "disab"),
+    "power_available": ("power", "electric", "outlet", "generator"),
+    "water_available": ("water", "hose", "spigot", "hook ?up"),
+    "budget_mentioned": ("budget", r"\$", "dollar", "price", "cost", "spend"),
+}
+
+
+def keyword_pattern(fields: List[str]) -> Optional["re.Pattern[str]"]:
+  fragments = sorted({keyword for name in fields for keyword in FIELD_KEYWORDS.get(name, ())})
+  if not fragments:
+    return None
+  # Anchored at word starts so "day" does not match "today"
+  return re.compile(r"(?<!\w)(?:" + "|".join(fragments) + ")", re.IGNORECASE)
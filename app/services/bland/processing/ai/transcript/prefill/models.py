@@ -0,0 +1,74 @@
+# app/services/bland/processing/ai/transcript/prefill/models.py
+
+"""Pre-extraction results and process-wide savings counters."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass
+class PreExtraction:
+  """Fields resolved before the LLM, and the prompt to send for the rest."""
+
+  fields: Dict[str, Any] = field(default_factory=dict)
+  # Field name -> "variables" or "pattern"
+  sources: Dict[str, str] = field(default_factory=dict)
+  missing: List[str] = field(default_factory=list)
+  llm_required: bool = True
+  prompt: str = ""
+  original_chars: int = 0
+
+  def subset(self, source: str) -> "PreExtraction":
+    """Returns only the fields that came from `source`."""
+    return PreExtraction(
+        fields={key: value for key, value in self.fields.items() if self.sources.get(key) == source},
+        sources={key: value for key, value in self.sources.items() if value == source},
+    )
+
+  def contact_properties(self) -> Dict[str, Any]:
+    keys = ("firstname", "lastname", "email", "phone", "address", "city", "state", "zip")
+    return {key: self.fields[key] for key in keys if key in self.fields}
+
+  def lead_properties(self) -> Dict[str, Any]:
+    mapping = {
+        "rental_start_date": "start_date",
+        "rental_end_date": "end_date",
+        "expected_attendance": "guest_count",
+        "number_of_stalls": "required_stalls",
+        "event_duration_days": "duration_days",
+        "ada_required": "ada_required",
+    }
+    return {lead_key: self.fields[key] for lead_key, key in mapping.items() if key in self.fields}
+
+  def classification_data(self) -> Dict[str, Any]:
+    data = {key: value for key, value in self.fields.items()
+            if key not in ("firstname", "lastname", "email", "phone", "address", "zip")}
+    if "address" in self.fields:
+      data["location"] = self.fields["address"]
+    if "zip" in self.fields:
+      data["postal_code"] = self.fields["zip"]
+    if "service_needed" in self.fields:
+      data.setdefault("product_interest", [self.fields["service_needed"]])
+    return data
+
+
+@dataclass
+class PreExtractionStats:
+  """Process-wide counters for how much work pre-extraction saves."""
+
+  transcripts: int = 0
+  llm_skipped: int = 0
+  fields_prefilled: int = 0
+  original_chars: int = 0
+  prompt_chars: int = 0
+
+  def to_dict(self) -> Dict[str, Any]:
+    return {
+        "transcripts": self.transcripts,
+        "llm_skipped": self.llm_skipped,
+        "llm_skip_rate": round(self.llm_skipped / self.transcripts, 4) if self.transcripts else None,
+        "avg_fields_prefilled": round(self.fields_prefilled / self.transcripts, 2) if self.transcripts else None,
+        "original_chars": self.original_chars,
+        "prompt_chars": self.prompt_chars,
+        "prompt_reduction": round(1 - self.prompt_chars / self.original_chars, 4) if self.original_chars else None,
+    }
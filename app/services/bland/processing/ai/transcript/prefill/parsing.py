@@ -0,0 +1,108 @@
+# app/services/bland/processing/ai/transcript/prefill/parsing.py
+
+"""Value normalizers, date finding and turn splitting."""
+
+import re
+from datetime import date, datetime
+from typing import Any, List, Optional, Tuple
+
+from .patterns import (
+    ISO_DATE_RE,
+    MONTH_DATE_RE,
+    MONTHS,
+    PHONE_RE,
+    TURN_RE,
+    US_DATE_RE,
+    WORD_NUMBERS,
+)
+
+
+def to_int(value: Any) -> Optional[int]:
+  if isinstance(value, bool):
+    return None
+  if isinstance(value, (int, float)):
+    return int(value)
+  text = str(value).strip().lower().replace(",", "")
+  if text in WORD_NUMBERS:
+    return WORD_NUMBERS[text]
+  match = re.match(r"^\d+", text)
+  return int(match.group(0)) if match else None
+
+
+def to_bool(value: Any) -> Optional[bool]:
+  if isinstance(value, bool):
+    return value
+  text = str(value).strip().lower()
+  if text in ("true", "yes", "y", "1", "required", "available"):
+    return True
+  if text in ("false", "no", "n", "0", "not required", "unavailable"):
+    return False
+  return None
+
+
+def to_iso_date(value: Any) -> Optional[str]:
+  text = str(value).strip()
+  for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
+    try:
+      return datetime.strptime(text[:10], fmt).date().isoformat()
+    except ValueError:
+      continue
+  dates = find_dates(text)
+  return dates[0] if dates else None
+
+
+def clean_phone(value: Any) -> Optional[str]:
+  match = PHONE_RE.search(str(value))
+  return "".join(match.groups()) if match else None
+
+
+def find_dates(text: str, today: Optional[date] = None) -> List[str]:
+  """Returns ISO dates mentioned in `text`, in order of appearance."""
+  today = today or date.today()
+  found: List[Tuple[int, str]] = []
+
+  def add(position: int, year: int, month: int, day: int):
+    try:
+      found.append((position, date(year, month, day).isoformat()))
+    except ValueError:
+      pass
+
+  for match in ISO_DATE_RE.finditer(text):
+    add(match.start(), int(match.group(1)), int(match.group(2)), int(match.group(3)))
+  for match in US_DATE_RE.finditer(text):
+    year = int(match.group(3))
+    add(match.start(), year + 2000 if year < 100 else year, int(match.group(1)), int(match.group(2)))
+  for match in MONTH_DATE_RE.finditer(text):
+    month = MONTHS[match.group(1)[:3].lower()]
+    day = int(match.group(2))
+    if match.group(3):
+      year = int(match.group(3))
+    else:
+      # A month without a year is the next one to come
+      year = today.year + 1 if (month, day) < (today.month, today.day) else today.year
+    add(match.start(), year, month, day)
+
+  seen = set()
+  ordered = []
+  for _, iso in sorted(found):
+    if iso not in seen:
+      seen.add(iso)
+      ordered.append(iso)
+  return ordered
+
+
+def split_turns(transcript: str) -> List[Tuple[str, str]]:
+  """Splits a concatenated transcript into (speaker, text) turns."""
+  turns: List[Tuple[str, str]] = []
+  for line in transcript.splitlines():
+    if not line.strip():
+      continue
+    match = TURN_RE.match(line)
+    if match:
+      turns.append((match.group(1).lower(), line[match.end():].strip()))
+    elif turns:
+      speaker, text = turns[-1]
+      turns[-1] = (speaker, f"{text} {line.strip()}")
+    else:
+      turns.append(("speaker", line.strip()))
+  return turns
@@ -0,0 +1,43 @@
+# app/services/bland/processing/ai/transcript/prefill/patterns.py
+
+"""Compiled patterns and lookup tables for transcript pre-extraction."""
+
+import re
+
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+# Speech-to-text also renders addresses as "john at example dot com"
+SPOKEN_EMAIL_RE = re.compile(
+    r"\b([a-z0-9._-]+)\s+at\s+([a-z0-9-]+(?:\s+dot\s+[a-z0-9-]+)+)\b", re.IGNORECASE)
+PHONE_RE = re.compile(r"(?<!\d)(?:\+?1[\s.-]?)?\(?(\d{3})\)?[\s.-]?(\d{3})[\s.-]?(\d{4})(?!\d)")
+CITY_STATE_ZIP_RE = re.compile(
+    r"\b([A-Z][a-zA-Z.]+(?:\s[A-Z][a-zA-Z.]+){0,2}),?\s+([A-Z]{2})\s+(\d{5})(?:-\d{4})?\b")
+ZIP_RE = re.compile(r"\b(?:zip(?:\s*code)?|postal\s*code)\D{0,15}(\d{5})(?:-\d{4})?\b", re.IGNORECASE)
+ISO_DATE_RE = re.compile(r"\b(20\d{2})-(\d{1,2})-(\d{1,2})\b")
+US_DATE_RE = re.compile(r"\b(\d{1,2})/(\d{1,2})/(20\d{2}|\d{2})\b")
+MONTH_DATE_RE = re.compile(
+    r"\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|"
+    r"sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?\s+"
+    r"(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(20\d{2}))?\b", re.IGNORECASE)
+_NUMBER = r"(\d{1,5}|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|" \
+          r"fifteen|twenty|thirty|forty|fifty|hundred)"
+STALLS_RE = re.compile(
+    _NUMBER + r"\s+(?:\w+\s+){0,2}?(?:stalls?|units?|restrooms?|toilets?|porta[\s-]?(?:potties|johns?))\b",
+    re.IGNORECASE)
+DURATION_RE = re.compile(_NUMBER + r"[\s-]+(days?|weeks?|months?)\b", re.IGNORECASE)
+GUESTS_RE = re.compile(
+    r"(\d{1,3}(?:,\d{3})*|\d+)\s+(?:guests|people|attendees|persons|workers|employees)\b", re.IGNORECASE)
+BUDGET_RE = re.compile(r"\$\s?\d[\d,]*(?:\.\d{2})?\s?[kK]?\b")
+TURN_RE = re.compile(r"^\s*(user|assistant|agent|agent-action|speaker)\s*:\s*", re.IGNORECASE)
+
+WORD_NUMBERS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "fifteen": 15,
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50, "hundred": 100,
+}
+MONTHS = {name: index for index, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+DURATION_DAYS = {"day": 1, "week": 7, "month": 30}
+
+US_STATE_CODES = frozenset(
+    "AL AK AZ AR CA CO CT DE DC FL GA HI ID IL IN IA KS KY LA ME MD MA MI MN MS MO MT NE NV NH NJ "
+    "NM NY NC ND OH OK OR PA RI SC SD TN TX UT VT VA WA WV WI WY".split())
@@ -0,0 +1,94 @@
+# app/services/classify/backfill.py
+
+"""
+Batch re-classification of stored leads.
+Loads past classification inputs from MongoDB page by page and evaluates
+them against a compiled decision table, for backfills after a rule change
+and for what-if comparisons before one.
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import logfire
+from pydantic import ValidationError
+
+from app.models.classification import ClassificationInput
+from app.services.classify.table import DecisionTable, call_flow_table
+from app.services.mongo import MongoService
+
+_FLAT_FIELDS = ("intended_use", "product_interest", "is_local", "duration_days", "stall_count")
+
+
+def input_from_document(doc: Dict[str, Any]) -> Optional[ClassificationInput]:
+  """Rebuilds a ClassificationInput from a classify document, or None if unusable."""
+  data = dict(doc.get("classification_input") or {})
+  for name in _FLAT_FIELDS:
+    if data.get(name) is None and doc.get(name) is not None:
+      data[name] = doc[name]
+  data.setdefault("source", doc.get("source") or "webform")
+  data.setdefault("raw_data", {})
+  try:
+    return ClassificationInput.model_validate(data)
+  except ValidationError:
+    return None
+
+
+async def load_stored_inputs(
+    mongo_service: MongoService,
+    limit: int = 5000,
+    page_size: int = 1000,
+) -> Tuple[List[Tuple[str, Optional[str], ClassificationInput]], int]:
+  """Returns ([(id, stored lead type, input)], skipped count) for up to `limit` documents."""
+  loaded: List[Tuple[str, Optional[str], ClassificationInput]] = []
+  skipped = 0
+  offset = 0
+  while offset < limit:
+    docs = await mongo_service.get_classification_inputs(
+        limit=min(page_size, limit - offset), offset=offset)
+    if not docs:
+      break
+    for doc in docs:
+      input_data = input_from_document(doc)
+      if input_data is None:
+        skipped += 1
+        continue
+      loaded.append((doc["id"], doc.get("lead_type"), input_data))
+    offset += len(docs)
+  return loaded, skipped
+
+
+async def preview_reclassification(
+    mongo_service: MongoService,
+    table: DecisionTable = call_flow_table,
+    limit: int = 5000,
+    sample_limit: int = 50,
+) -> Dict[str, Any]:
+  """
+  Evaluates stored leads against `table` and reports how the result differs
+  from the stored lead type. Nothing is written back.
+  """
+  loaded, skipped = await load_stored_inputs(mongo_service, limit=limit)
+  decisions = table.classify_batch(input_data for _, _, input_data in loaded)
+
+  transitions: Counter = Counter()
+  samples = []
+  for (doc_id, stored_type, _), decision in zip(loaded, decisions):
+    if stored_type != decision.lead_type:
+      transitions[f"{stored_type} -> {decision.lead_type}"] += 1
+      if len(samples) < sample_limit:
+        samples.append({"id": doc_id, "stored": stored_type,
+                        "lead_type": decision.lead_type, "rule": decision.label})
+
+  summary = {
+      "table": table.name,
+      "evaluated": len(loaded),
+      "skipped": skipped,
+      "changed": sum(transitions.values()),
+      "transitions": dict(transitions),
+      "counts": dict(Counter(decision.lead_type for decision in decisions)),
+      "samples": samples,
+  }
+  logfire.info("Re-classification preview completed", table=table.name,
+               evaluated=summary["evaluated"], changed=summary["changed"])
+  return summary
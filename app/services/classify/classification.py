@@ -15,8 +15,7 @@ from app.models.classification import (
 )
 from app.core.config import settings  # Import settings for threshold
 from app.services.classify.rules import classify_lead
-from app.services.classify.marvin import marvin_classification_manager
-from app.utils.location import determine_locality_from_description
+from app.utils.location import determine_locality
 
 # --- Add a date normalization utility ---
 
@@ -70,7 +69,7 @@ class ClassificationManager:
   Applies rules defined in the PRD and call script.
   """
 
-  def _determine_locality(self,
+  async def _determine_locality(self,
                           location_description: Optional[str] = None,
                           state_code: Optional[str] = None,
                           city: Optional[str] = None,
@@ -85,9 +84,7 @@ class ClassificationManager:
         city: City name if available
         postal_code: Postal/ZIP code if available
     """
-    # Import enhanced location utils that support all location fields
-    from app.utils.location import determine_locality_from_description
-    return determine_locality_from_description(
+    return await determine_locality(
         location_description=location_description,
         state_code=state_code,
         city=city,
@@ -187,7 +184,7 @@ class ClassificationManager:
 
     # Determine locality if not already set
     if getattr(input_data, 'is_local', None) is None:  # Check is_local first
-      input_data.is_local = self._determine_locality(
+      input_data.is_local = await self._determine_locality(
           location_description=getattr(input_data, 'service_address', getattr(
               input_data, 'event_location_description', None)),
           state_code=getattr(input_data, 'state', getattr(
@@ -201,6 +198,8 @@ class ClassificationManager:
     try:
       # Use Marvin for classification if enabled in settings
       if settings.LLM_PROVIDER.lower() == "marvin" and settings.MARVIN_API_KEY:
+        # Imported here so Marvin is only loaded when AI classification is used
+        from app.services.classify.marvin import marvin_classification_manager
         # --- Update call to handle ClassificationOutput ---
         classification_output: ClassificationOutput = await marvin_classification_manager.get_lead_classification(input_data)
         classification = classification_output.lead_type
@@ -22,6 +22,15 @@ from typing import Tuple, Optional, Dict, Any, List
 import logfire
 import marvin
 
+from app.services.classify.table import (
+    OWNER_TEAMS,
+    PORTA_POTTY_TYPE,
+    SPECIALTY_TRAILER,
+    categories_for,
+    enhancement_table,
+)
+from app.services.llm import llm_executor
+
 # Configure Marvin logging using settings values directly
 _log_level = getattr(logging, settings.MARVIN_LOG_LEVEL.upper(), logging.ERROR)
 
@@ -324,14 +333,11 @@ class MarvinClassificationManager:
 
   def _is_specialty_trailer(self, product_types: List[str]) -> bool:
     """Check if any product is a specialty trailer."""
-    specialty_trailers = ["Restroom Trailer", "Shower Trailer", "ADA Trailer"]
-    return any(trailer.lower() in product.lower() for product in product_types for trailer in specialty_trailers)
+    return SPECIALTY_TRAILER in categories_for(product_types)
 
   def _is_porta_potty(self, product_types: List[str]) -> bool:
     """Check if any product is a porta potty type."""
-    porta_potty_types = [
-        "Portable Toilet", "Handicap Accessible (ADA) Portable Toilet", "Handwashing Station"]
-    return any(potty.lower() in product.lower() for product in product_types for potty in porta_potty_types)
+    return PORTA_POTTY_TYPE in categories_for(product_types)
 
   def _enhance_classification_with_rules(
       self,
@@ -341,118 +347,35 @@ class MarvinClassificationManager:
   ) -> Tuple[LeadClassificationType, str, Optional[str]]:
     """
     Enhance the AI classification with explicit rule checking.
-    This adds a layer of rule-based validation on top of the AI decision.
+    This adds a layer of rule-based validation on top of the AI decision,
+    using the compiled ENHANCEMENT_RULES table.
 
     Returns:
         Tuple of (final_classification, final_reasoning, owner_team)
     """
-    intended_use = input_data.intended_use
-    product_interest = input_data.product_interest or []
-    stalls = input_data.required_stalls or 0
-    duration_days = input_data.duration_days or 0
-    is_local = input_data.is_local or False
-
-    # Determine if products include specialty trailers or porta potties
-    has_specialty_trailer = self._is_specialty_trailer(product_interest)
-    has_porta_potty = self._is_porta_potty(product_interest)
-
-    # Default values
-    rule_classification = ai_classification
-    rule_reasoning = f"AI decided {ai_classification}: {ai_reasoning}"
-    owner_team = None
-
-    # Apply explicit rules to validate or override AI classification
-    # Event / Porta Potty
-    if intended_use == "Small Event" and has_porta_potty and stalls < 20 and duration_days < 5:
-      rule_classification = "Services"
-      rule_reasoning = f"Rule: Event / Porta Potty - {ai_reasoning}"
-      owner_team = "Stahla Services Sales Team"
-
-    # Construction / Porta Potty
-    elif intended_use and intended_use not in ["Small Event", "Large Event"] and has_porta_potty and stalls < 20 and duration_days >= 5:
-      if is_local:
-        rule_classification = "Services"
-        owner_team = "Stahla Services Sales Team"
-      else:
-        rule_classification = "Logistics"
-        owner_team = "Stahla Logistics Sales Team"
-      rule_reasoning = f"Rule: Construction / Porta Potty - {ai_reasoning}"
-
-    # Small Event / Trailer / Local
-    elif intended_use == "Small Event" and has_specialty_trailer and stalls < 8 and duration_days > 5 and is_local:
-      rule_classification = "Services"
-      rule_reasoning = f"Rule: Small Event / Trailer / Local - {ai_reasoning}"
-      owner_team = "Stahla Services Sales Team"
-
-    # Small Event / Trailer / Not Local
-    elif intended_use == "Small Event" and has_specialty_trailer and stalls < 8 and duration_days > 5 and not is_local:
-      rule_classification = "Leads"
-      rule_reasoning = f"Rule: Small Event / Trailer / Not Local - {ai_reasoning}"
-      owner_team = "Stahla Leads Team"
-
-    # Large Event / Trailer / Local
-    elif intended_use == "Large Event" and has_specialty_trailer and stalls >= 7 and duration_days > 5 and is_local:
-      rule_classification = "Services"
-      rule_reasoning = f"Rule: Large Event / Trailer / Local - {ai_reasoning}"
-      owner_team = "Stahla Services Sales Team"
-
-    # Large Event / Trailer / Not Local
-    elif intended_use == "Large Event" and has_specialty_trailer and stalls >= 7 and duration_days > 5 and not is_local:
-      rule_classification = "Logistics"
-      rule_reasoning = f"Rule: Large Event / Trailer / Not Local - {ai_reasoning}"
-      owner_team = "Stahla Logistics Sales Team"
-
-    # Disaster Relief / Trailer / Local
-    elif intended_use == "Disaster Relief" and has_specialty_trailer and duration_days < 180 and is_local:
-      rule_classification = "Services"
-      rule_reasoning = f"Rule: Disaster Relief / Trailer / Local - {ai_reasoning}"
-      owner_team = "Stahla Services Sales Team"
-
-    # Disaster Relief / Trailer / Not Local
-    elif intended_use == "Disaster Relief" and has_specialty_trailer and duration_days < 180 and not is_local:
-      rule_classification = "Logistics"
-      rule_reasoning = f"Rule: Disaster Relief / Trailer / Not Local - {ai_reasoning}"
-      owner_team = "Stahla Logistics Sales Team"
-
-    # Construction / Company Trailer / Local
-    elif intended_use == "Construction" and has_specialty_trailer and is_local:
-      rule_classification = "Services"
-      rule_reasoning = f"Rule: Construction / Company Trailer / Local - {ai_reasoning}"
-      owner_team = "Stahla Services Sales Team"
-
-    # Construction / Company Trailer / Not Local
-    elif intended_use == "Construction" and has_specialty_trailer and not is_local:
-      rule_classification = "Logistics"
-      rule_reasoning = f"Rule: Construction / Company Trailer / Not Local - {ai_reasoning}"
-      owner_team = "Stahla Logistics Sales Team"
-
-    # Facility / Trailer / Local
-    elif intended_use == "Facility" and has_specialty_trailer and is_local:
-      rule_classification = "Services"
-      rule_reasoning = f"Rule: Facility / Trailer / Local - {ai_reasoning}"
-      owner_team = "Stahla Services Sales Team"
-
-    # Facility / Trailer / Not Local
-    elif intended_use == "Facility" and has_specialty_trailer and not is_local:
-      rule_classification = "Logistics"
-      rule_reasoning = f"Rule: Facility / Trailer / Not Local - {ai_reasoning}"
-      owner_team = "Stahla Logistics Sales Team"
-
-    # Add fallback cases
+    features = enhancement_table.features(input_data)
+    intended_use = features.intended_use
+    stalls = features.stalls
+    duration_days = features.duration_days
+    is_local = features.is_local
+    has_specialty_trailer = SPECIALTY_TRAILER in features.categories
+    has_porta_potty = PORTA_POTTY_TYPE in features.categories
+
+    decision = enhancement_table.evaluate_features(features)
+    if decision.matched:
+      rule_classification = decision.lead_type
+      rule_reasoning = f"Rule: {decision.label} - {ai_reasoning}"
+      owner_team = decision.owner_team
+    elif ai_classification == "Disqualify":
+      # Recommend human review if disqualified
+      rule_classification = ai_classification
+      rule_reasoning = f"Disqualified, but needs review: {ai_reasoning}"
+      owner_team = "Stahla Leads Team"  # Default to leads team for manual review
     else:
-      # If AI classification doesn't match rules or has low confidence
-      if rule_classification == "Disqualify":
-        # Recommend human review if disqualified
-        rule_reasoning = f"Disqualified, but needs review: {ai_reasoning}"
-        owner_team = "Stahla Leads Team"  # Default to leads team for manual review
-      else:
-        # Assign teams based on classification
-        if rule_classification == "Services":
-          owner_team = "Stahla Services Sales Team"
-        elif rule_classification == "Logistics":
-          owner_team = "Stahla Logistics Sales Team"
-        elif rule_classification == "Leads":
-          owner_team = "Stahla Leads Team"
+      # Keep the AI decision and assign its team
+      rule_classification = ai_classification
+      rule_reasoning = f"AI decided {ai_classification}: {ai_reasoning}"
+      owner_team = OWNER_TEAMS.get(ai_classification)
 
     # Log the classification decision for transparency
     logfire.info(f"Classification enhanced with rules: {rule_classification}",
@@ -505,7 +428,9 @@ class MarvinClassificationManager:
 
     try:
       logfire.info("Calling Marvin for classification with call text.")
-      extracted_details: ExtractedCallDetails = classify_lead_with_ai(
+      # Blocking Marvin call runs off the event loop, within provider limits
+      extracted_details: ExtractedCallDetails = await llm_executor.run(
+          "classification.lead", classify_lead_with_ai,
           call_summary_or_transcript=call_text)
 
       classification = extracted_details.classification
@@ -0,0 +1,331 @@
+# app/services/classify/table.py
+
+"""
+Declarative decision tables for lead classification.
+The call.md rules (rules.py) and the rule checks layered on Marvin's answer
+(marvin.py) are written as ordered rows. Each table is compiled once into a
+lookup keyed by (intended use, locality), so evaluating a lead only walks the
+few rows that can apply. Product interest is reduced to a frozenset of
+categories, memoized per product string.
+"""
+
+import operator
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from app.models.classification import ClassificationInput, LeadClassificationType
+
+# --- Product categories ---
+
+TRAILER = "trailer"
+SPECIALTY_TRAILER = "specialty_trailer"
+PORTA_POTTY = "porta_potty"
+PORTA_POTTY_TYPE = "porta_potty_type"
+HANDWASHING = "handwashing"
+
+SPECIALTY_TRAILERS: FrozenSet[str] = frozenset({"restroom trailer", "shower trailer", "ada trailer"})
+PORTA_POTTY_TYPES: FrozenSet[str] = frozenset({
+    "portable toilet", "handicap accessible (ada) portable toilet", "handwashing station"})
+
+# Substrings that put a product into a category
+_CATEGORY_MARKERS: Dict[str, FrozenSet[str]] = {
+    TRAILER: frozenset({"trailer"}),
+    SPECIALTY_TRAILER: SPECIALTY_TRAILERS,
+    PORTA_POTTY: frozenset({"portable toilet", "porta potty"}),
+    PORTA_POTTY_TYPE: PORTA_POTTY_TYPES,
+    HANDWASHING: frozenset({"handwashing", "hand wash"}),
+}
+
+OWNER_TEAMS: Dict[str, Optional[str]] = {
+    "Services": "Stahla Services Sales Team",
+    "Logistics": "Stahla Logistics Sales Team",
+    "Leads": "Stahla Leads Team",
+    "Disqualify": None,
+}
+
+
+@lru_cache(maxsize=1024)
+def product_categories(product: str) -> FrozenSet[str]:
+  """Categories of one product name (case-insensitive, substring match)."""
+  lowered = product.lower()
+  return frozenset(category for category, markers in _CATEGORY_MARKERS.items()
+                   if any(marker in lowered for marker in markers))
+
+
+def categories_for(products: Optional[Iterable[str]]) -> FrozenSet[str]:
+  """Union of the categories of all products of interest."""
+  if not products:
+    return frozenset()
+  result: FrozenSet[str] = frozenset()
+  for product in products:
+    if isinstance(product, str):
+      result |= product_categories(product)
+  return result
+
+
+def _to_count(value: Any) -> int:
+  """Stall and day counts go through int(), as the call-flow rules always did: "3.5" counts as 0."""
+  if value is None:
+    return 0
+  try:
+    return int(value)
+  except (TypeError, ValueError):
+    return 0
+
+
+def _to_number(value: Any) -> float:
+  if value is None or isinstance(value, bool):
+    return 0
+  try:
+    return float(value)
+  except (TypeError, ValueError):
+    return 0
+
+
+# --- Features and rows ---
+
+@dataclass(frozen=True)
+class LeadFeatures:
+  """The inputs every rule is evaluated against, derived once per lead."""
+
+  intended_use: Optional[str]
+  categories: FrozenSet[str]
+  stalls: int
+  duration_days: int
+  budget: float
+  is_local: bool
+
+  @classmethod
+  def from_input(cls, input_data: ClassificationInput, stall_field: str = "required_stalls") -> "LeadFeatures":
+    return cls(
+        intended_use=input_data.intended_use,
+        categories=categories_for(input_data.product_interest),
+        stalls=_to_count(getattr(input_data, stall_field, None)),
+        duration_days=_to_count(input_data.duration_days),
+        budget=_to_number(getattr(input_data, "budget", None)),
+        is_local=bool(input_data.is_local),
+    )
+
+
+Comparison = Tuple[Callable[[float, float], bool], float]
+
+LT = operator.lt
+LE = operator.le
+GT = operator.gt
+GE = operator.ge
+
+
+@dataclass(frozen=True)
+class Rule:
+  """
+  One row of a decision table. `intended_uses` and `local` of None match
+  anything; numeric conditions are (operator, threshold) pairs.
+  """
+
+  label: str
+  lead_type: LeadClassificationType
+  intended_uses: Optional[FrozenSet[str]] = None
+  local: Optional[bool] = None
+  requires: FrozenSet[str] = frozenset()
+  excludes: FrozenSet[str] = frozenset()
+  stalls: Tuple[Comparison, ...] = ()
+  duration_days: Tuple[Comparison, ...] = ()
+  budget: Tuple[Comparison, ...] = ()
+  owner_team: Optional[str] = field(default=None)
+
+  @property
+  def team(self) -> Optional[str]:
+    return self.owner_team if self.owner_team is not None else OWNER_TEAMS.get(self.lead_type)
+
+  def matches(self, features: LeadFeatures) -> bool:
+    if not self.requires <= features.categories or self.excludes & features.categories:
+      return False
+    for conditions, value in ((self.stalls, features.stalls),
+                              (self.duration_days, features.duration_days),
+                              (self.budget, features.budget)):
+      for compare, threshold in conditions:
+        if not compare(value, threshold):
+          return False
+    return True
+
+
+@dataclass(frozen=True)
+class RuleDecision:
+  """Outcome of evaluating one lead against a table."""
+
+  lead_type: Optional[LeadClassificationType]
+  label: Optional[str]
+  owner_team: Optional[str]
+
+  @property
+  def matched(self) -> bool:
+    return self.label is not None
+
+
+NO_MATCH = RuleDecision(lead_type=None, label=None, owner_team=None)
+
+
+class DecisionTable:
+  """
+  Ordered rows compiled into a (intended use, locality) lookup.
+  The first matching row wins, as in the if/elif chains it replaces.
+  """
+
+  def __init__(self, name: str, rules: Sequence[Rule], stall_field: str = "required_stalls"):
+    self.name = name
+    self.rules: Tuple[Rule, ...] = tuple(rules)
+    self.stall_field = stall_field
+    self._index: Dict[Tuple[Optional[str], bool], Tuple[Rule, ...]] = {}
+    self._compile()
+
+  def _compile(self) -> None:
+    uses = {use for rule in self.rules for use in (rule.intended_uses or ())}
+    for use in list(uses) + [None]:
+      for local in (True, False):
+        self._index[(use, local)] = tuple(
+            rule for rule in self.rules
+            if (rule.intended_uses is None or use in rule.intended_uses)
+            and (rule.local is None or rule.local == local)
+        )
+
+  def candidates(self, intended_use: Optional[str], is_local: bool) -> Tuple[Rule, ...]:
+    rows = self._index.get((intended_use, is_local))
+    # Unknown intended uses only see the wildcard rows
+    return rows if rows is not None else self._index[(None, is_local)]
+
+  def features(self, input_data: ClassificationInput) -> LeadFeatures:
+    return LeadFeatures.from_input(input_data, self.stall_field)
+
+  def evaluate_features(self, features: LeadFeatures) -> RuleDecision:
+    for rule in self.candidates(features.intended_use, features.is_local):
+      if rule.matches(features):
+        return RuleDecision(lead_type=rule.lead_type, label=rule.label, owner_team=rule.team)
+    return NO_MATCH
+
+  def evaluate(self, input_data: ClassificationInput) -> RuleDecision:
+    return self.evaluate_features(self.features(input_data))
+
+  def classify_batch(self, inputs: Iterable[ClassificationInput]) -> List[RuleDecision]:
+    """Evaluates many leads; identical feature sets are evaluated once."""
+    cache: Dict[LeadFeatures, RuleDecision] = {}
+    decisions = []
+    for input_data in inputs:
+      features = self.features(input_data)
+      decision = cache.get(features)
+      if decision is None:
+        decision = self.evaluate_features(features)
+        cache[features] = decision
+      decisions.append(decision)
+    return decisions
+
+
+def compare_tables(
+    inputs: Sequence[ClassificationInput],
+    baseline: DecisionTable,
+    candidate: DecisionTable,
+    sample_limit: int = 50,
+) -> Dict[str, Any]:
+  """
+  What-if analysis: evaluates the same leads against two tables and reports
+  how many would change lead type, and between which types.
+  """
+  before = baseline.classify_batch(inputs)
+  after = candidate.classify_batch(inputs)
+  transitions: Counter = Counter()
+  samples = []
+  for index, (old, new) in enumerate(zip(before, after)):
+    if old.lead_type != new.lead_type:
+      transitions[f"{old.lead_type} -> {new.lead_type}"] += 1
+      if len(samples) < sample_limit:
+        samples.append({"index": index, "before": old.label, "after": new.label})
+  return {
+      "total": len(inputs),
+      "changed": sum(transitions.values()),
+      "transitions": dict(transitions),
+      "baseline_counts": dict(Counter(d.lead_type for d in before)),
+      "candidate_counts": dict(Counter(d.lead_type for d in after)),
+      "samples": samples,
+  }
+
+
+# --- Tables ---
+
+def _uses(*names: str) -> FrozenSet[str]:
+  return frozenset(names)
+
+
+_SERVICES = OWNER_TEAMS["Services"]
+_LOGISTICS = OWNER_TEAMS["Logistics"]
+_LEADS = OWNER_TEAMS["Leads"]
+
+# Path A of call.md. Porta potty rows exclude trailers; trailer rows gate on budget.
+CALL_FLOW_RULES: Tuple[Rule, ...] = (
+    Rule("Event | Porta Potty: Subflow SA, Process PA", "Services",
+         _uses("Event"), requires=frozenset({PORTA_POTTY}), excludes=frozenset({TRAILER})),
+    Rule("Construction | Porta Potty: Subflow SB, Process PA", "Services",
+         _uses("Construction"), local=True, requires=frozenset({PORTA_POTTY}), excludes=frozenset({TRAILER})),
+    Rule("Construction | Porta Potty: Subflow SB, Process PB", "Logistics",
+         _uses("Construction"), local=False, requires=frozenset({PORTA_POTTY}), excludes=frozenset({TRAILER})),
+    Rule("Small Event | Trailer | Local: Subflow SA, Process PC", "Leads",
+         _uses("Small Event"), local=True, requires=frozenset({TRAILER}), budget=((LT, 10000),)),
+    Rule("Small Event | Trailer | Not Local: Subflow SA, Process PA", "Services",
+         _uses("Small Event"), local=False, requires=frozenset({TRAILER}), budget=((LT, 10000),)),
+    Rule("Large Event | Trailer | Local: Subflow SA, Process PA", "Services",
+         _uses("Large Event"), local=True, requires=frozenset({TRAILER}), budget=((GE, 10000),)),
+    Rule("Large Event | Trailer | Not Local: Subflow SA, Process PB", "Logistics",
+         _uses("Large Event"), local=False, requires=frozenset({TRAILER}), budget=((GT, 10000),)),
+    Rule("Disaster Relief | Trailer | Local: Subflow SB, Process PA", "Services",
+         _uses("Disaster Relief"), local=True, requires=frozenset({TRAILER}), budget=((GT, 10000),)),
+    Rule("Disaster Relief | Trailer | Not Local: Subflow SB, Process PB", "Logistics",
+         _uses("Disaster Relief"), local=False, requires=frozenset({TRAILER}), budget=((GT, 10000),)),
+    Rule("Construction Company | Trailer | Local: Subflow SB, Process PA", "Services",
+         _uses("Construction"), local=True, requires=frozenset({TRAILER}), budget=((GT, 5000),)),
+    Rule("Construction Company | Trailer | Not Local: Subflow SB, Process PB", "Logistics",
+         _uses("Construction"), local=False, requires=frozenset({TRAILER}), budget=((GT, 5000),)),
+    Rule("Facility | Trailer | Local: Subflow SB, Process PA", "Services",
+         _uses("Facility"), local=True, requires=frozenset({TRAILER}), budget=((GT, 10000),)),
+    Rule("Facility | Trailer | Not Local: Subflow SB, Process PB", "Logistics",
+         _uses("Facility"), local=False, requires=frozenset({TRAILER}), budget=((GT, 10000),)),
+    # Fallbacks and disqualification
+    Rule("Outside service area: Process PC", "Leads", local=False),
+    Rule("Insufficient information or very small scale (stalls < 1, no trailer).", "Disqualify",
+         excludes=frozenset({TRAILER}), stalls=((LT, 1),), owner_team="None"),
+    Rule("Lead does not fit standard Services/Logistics criteria based on rules. Forwarding to Leads.",
+         "Leads"),
+)
+
+# Checks applied on top of Marvin's classification; no match keeps the AI's answer.
+ENHANCEMENT_RULES: Tuple[Rule, ...] = (
+    Rule("Event / Porta Potty", "Services", _uses("Small Event"),
+         requires=frozenset({PORTA_POTTY_TYPE}), stalls=((LT, 20),), duration_days=((LT, 5),)),
+    Rule("Construction / Porta Potty", "Services", _uses("Construction", "Disaster Relief", "Facility"),
+         local=True, requires=frozenset({PORTA_POTTY_TYPE}), stalls=((LT, 20),), duration_days=((GE, 5),)),
+    Rule("Construction / Porta Potty", "Logistics", _uses("Construction", "Disaster Relief", "Facility"),
+         local=False, requires=frozenset({PORTA_POTTY_TYPE}), stalls=((LT, 20),), duration_days=((GE, 5),)),
+    Rule("Small Event / Trailer / Local", "Services", _uses("Small Event"), local=True,
+         requires=frozenset({SPECIALTY_TRAILER}), stalls=((LT, 8),), duration_days=((GT, 5),)),
+    Rule("Small Event / Trailer / Not Local", "Leads", _uses("Small Event"), local=False,
+         requires=frozenset({SPECIALTY_TRAILER}), stalls=((LT, 8),), duration_days=((GT, 5),)),
+    Rule("Large Event / Trailer / Local", "Services", _uses("Large Event"), local=True,
+         requires=frozenset({SPECIALTY_TRAILER}), stalls=((GE, 7),), duration_days=((GT, 5),)),
+    Rule("Large Event / Trailer / Not Local", "Logistics", _uses("Large Event"), local=False,
+         requires=frozenset({SPECIALTY_TRAILER}), stalls=((GE, 7),), duration_days=((GT, 5),)),
+    Rule("Disaster Relief / Trailer / Local", "Services", _uses("Disaster Relief"), local=True,
+         requires=frozenset({SPECIALTY_TRAILER}), duration_days=((LT, 180),)),
+    Rule("Disaster Relief / Trailer / Not Local", "Logistics", _uses("Disaster Relief"), local=False,
+         requires=frozenset({SPECIALTY_TRAILER}), duration_days=((LT, 180),)),
+    Rule("Construction / Company Trailer / Local", "Services", _uses("Construction"), local=True,
+         requires=frozenset({SPECIALTY_TRAILER})),
+    Rule("Construction / Company Trailer / Not Local", "Logistics", _uses("Construction"), local=False,
+         requires=frozenset({SPECIALTY_TRAILER})),
+    Rule("Facility / Trailer / Local", "Services", _uses("Facility"), local=True,
+         requires=frozenset({SPECIALTY_TRAILER})),
+    Rule("Facility / Trailer / Not Local", "Logistics", _uses("Facility"), local=False,
+         requires=frozenset({SPECIALTY_TRAILER})),
+)
+
+# rules.py reads the stall count prepared by the webhook/preparation layer
+call_flow_table = DecisionTable("call_flow", CALL_FLOW_RULES, stall_field="stall_count")
+enhancement_table = DecisionTable("marvin_enhancement", ENHANCEMENT_RULES, stall_field="required_stalls")
@@ -1,10 +1,14 @@
 # filepath: app/services/dash/cache/manager.py
-import json
 import logging
 from typing import List, Optional
 from app.services.redis.service import RedisService
 from app.models.dash.dashboard import CacheItem, CacheSearchResult
-from app.core.keys import PRICING_CATALOG_CACHE_KEY
+from app.services.location.cache import distance_cache_keyspace, unresolvable_location_keyspace
+from app.core.keys import (
+    DISTANCE_CACHE_PREFIX,
+    PRICING_CATALOG_CACHE_KEY,
+    UNRESOLVABLE_LOCATION_PREFIX,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -105,9 +109,9 @@ class CacheManager:
         if value:
           try:
             # Attempt to parse as JSON
-            json_val = json.loads(value)
+            json_val = self.redis.decode(value)
             return str(json_val)
-          except json.JSONDecodeError:
+          except ValueError:
             # If not JSON, return the full string value
             return str(value)
         return "Empty string"
@@ -163,16 +167,16 @@ class CacheManager:
 
     parsed_value = None
     try:
-      # Ensure value is string before json.loads
+      # Ensure value is string before decoding
       if isinstance(value_from_pipe, bytes):
         value_from_pipe = value_from_pipe.decode("utf-8")
 
       if isinstance(value_from_pipe, str):
-        parsed_value = json.loads(value_from_pipe)
+        parsed_value = self.redis.decode(value_from_pipe)
       else:
         parsed_value = value_from_pipe
 
-    except (json.JSONDecodeError, TypeError):
+    except (ValueError, TypeError):
       parsed_value = value_from_pipe
     return CacheItem(key=key, value=parsed_value, ttl=ttl_from_pipe)
 
@@ -194,15 +198,23 @@ class CacheManager:
 
   async def clear_maps_location_cache(self, location_pattern: str) -> int:
     """Clears Google Maps cache keys matching a location pattern."""
-    pattern = f"maps:distance:*:{location_pattern}"
+    pattern = f"{DISTANCE_CACHE_PREFIX}*:{location_pattern}"
     logger.warning(
         f"Clearing Google Maps cache keys matching pattern: {pattern}")
-    keys_to_delete = await self.redis.scan_keys(match=pattern)
-    if not keys_to_delete:
+    # Walks the distance cache index in batches rather than SCANning every key
+    deleted_count = await distance_cache_keyspace(self.redis).clear(match=pattern)
+    if not deleted_count:
       logger.info("No matching maps cache keys found to clear.")
-      return 0
-    deleted_count = await self.redis.delete(*keys_to_delete)
-    logger.info(f"Cleared {deleted_count} maps cache keys matching pattern.")
+    return deleted_count
+
+  async def clear_unresolvable_locations(self, location_pattern: str) -> int:
+    """Clears negative cache entries for delivery locations matching a pattern."""
+    pattern = f"{UNRESOLVABLE_LOCATION_PREFIX}{location_pattern}"
+    logger.warning(
+        f"Clearing unresolvable location cache keys matching pattern: {pattern}")
+    deleted_count = await unresolvable_location_keyspace(self.redis).clear(match=pattern)
+    if not deleted_count:
+      logger.info("No matching unresolvable location keys found to clear.")
     return deleted_count
 
   async def clear_cache_key(self, cache_key: str) -> bool:
@@ -1,6 +1,7 @@
 # filepath: app/services/dash/errors/manager.py
+import asyncio
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from app.services.mongo import MongoService
 from app.models.dash.dashboard import ErrorLogEntry
 
@@ -16,47 +17,75 @@ class ErrorManager:
   async def get_error_logs(
       self, report_type: Optional[str] = None, limit: int = 50
   ) -> List[ErrorLogEntry]:
-    """Retrieves recent error logs from MongoDB, optionally filtered by type."""
+    """
+    Retrieves recent errors from MongoDB, optionally filtered by type: failed
+    reports and rolled-up error logs, newest first. Both are filtered and
+    sorted by indexed queries.
+    """
     logger.info(
         f"Fetching error logs from MongoDB. Type: {report_type}, Limit: {limit}"
     )
     try:
-      raw_reports = await self.mongo.get_recent_reports(
-          report_type=report_type, limit=limit
+      failed_reports, rollups = await asyncio.gather(
+          self.mongo.get_recent_reports(
+              report_type=report_type, limit=limit, success=False),
+          self.mongo.get_recent_error_rollups(
+              error_type=report_type, limit=limit),
       )
 
-      # Log the raw data received from MongoDB before filtering
-      logger.debug(
-          f"Raw reports received from MongoDB for get_error_logs: {raw_reports}"
-      )
-
-      # Filter for errors (success=False) and parse into ErrorLogEntry model
       error_logs = []
-      for report in raw_reports:
-        # Check if 'success' field exists and is explicitly False
-        if "success" in report and report["success"] is False:
-          try:
-            # Transform MongoDB report to ErrorLogEntry format
-            error_entry_data = {
-                "timestamp": report.get("timestamp"),
-                "error_type": report.get("report_type", "Unknown"),
-                "message": report.get("error_message", "No message provided"),
-                "details": {
-                    "_id": str(report.get("_id")),
-                    "data": report.get("data", {}),
-                    "success": report.get("success")
-                }
-            }
-            error_logs.append(ErrorLogEntry(**error_entry_data))
-          except Exception as parse_error:
-            logger.warning(
-                f"Failed to parse MongoDB report into ErrorLogEntry: {report}. Error: {parse_error}"
-            )
-
-      logger.info(f"Retrieved {len(error_logs)} error logs after filtering.")
-      return error_logs
+      for report in failed_reports:
+        entry = self._parse(report, self._report_entry)
+        if entry:
+          error_logs.append(entry)
+      for rollup in rollups:
+        entry = self._parse(rollup, self._rollup_entry)
+        if entry:
+          error_logs.append(entry)
+
+      error_logs.sort(key=lambda entry: entry.timestamp, reverse=True)
+      logger.info(f"Retrieved {len(error_logs[:limit])} error logs.")
+      return error_logs[:limit]
     except Exception as e:
       logger.error(
           f"Failed to retrieve error logs from MongoDB: {e}", exc_info=True
       )
       return []
+
+  def _parse(self, document: Dict[str, Any], to_entry) -> Optional[ErrorLogEntry]:
+    try:
+      return ErrorLogEntry(**to_entry(document))
+    except Exception as parse_error:
+      logger.warning(
+          f"Failed to parse MongoDB document into ErrorLogEntry: {document}. Error: {parse_error}"
+      )
+      return None
+
+  @staticmethod
+  def _report_entry(report: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "timestamp": report.get("timestamp"),
+        "error_type": report.get("report_type", "Unknown"),
+        "message": report.get("error_message", "No message provided"),
+        "details": {
+            "_id": str(report.get("_id")),
+            "data": report.get("data", {}),
+            "success": report.get("success")
+        }
+    }
+
+  @staticmethod
+  def _rollup_entry(rollup: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "timestamp": rollup.get("last_seen") or rollup.get("timestamp"),
+        "error_type": rollup.get("error_type", "Unknown"),
+        "message": rollup.get("error_message", "No message provided"),
+        "details": {
+            "_id": str(rollup.get("_id")),
+            "service_name": rollup.get("service_name"),
+            "fingerprint": rollup.get("fingerprint"),
+            "first_seen": rollup.get("first_seen"),
+            "data": rollup.get("additional_data") or {},
+        },
+        "count": rollup.get("count", 1),
+    }
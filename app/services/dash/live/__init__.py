@@ -0,0 +1,25 @@
+# app/services/dash/live/__init__.py
+
+"""
+Server-push channel for the operational dashboard.
+"""
+
+from .hub import (
+    TOPICS,
+    LiveEvent,
+    LiveMetricsHub,
+    LiveMetricsOverloaded,
+    Subscription,
+    latency_histogram,
+    live_metrics_hub,
+)
+
+__all__ = [
+    "TOPICS",
+    "LiveEvent",
+    "LiveMetricsHub",
+    "LiveMetricsOverloaded",
+    "Subscription",
+    "latency_histogram",
+    "live_metrics_hub",
+]
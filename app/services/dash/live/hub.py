@@ -0,0 +1,282 @@
+# app/services/dash/live/hub.py
+
+"""
+In-process publisher for the live dashboard channel.
+One set of feed tasks per process reads Redis (counters, latency streams and
+the dash:live pub/sub channel) and fans events out to every connected
+client, so N open dashboards cost one poll instead of N.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+from app.core.config import settings
+from app.core.keys import (
+    DASH_LIVE_CHANNEL,
+    ERROR_QUOTE_REQUESTS_KEY,
+    GMAPS_API_CALLS_KEY,
+    GMAPS_API_ERRORS_KEY,
+    GMAPS_LATENCY_STREAM,
+    LOCATION_LATENCY_STREAM,
+    MAPS_CACHE_HITS_KEY,
+    MAPS_CACHE_MISSES_KEY,
+    MAPS_NEGATIVE_CACHE_HITS_KEY,
+    PRICING_CACHE_HITS_KEY,
+    PRICING_CACHE_MISSES_KEY,
+    QUOTE_LATENCY_STREAM,
+    REDIS_LATENCY_STREAM,
+    SUCCESS_QUOTE_REQUESTS_KEY,
+    TOTAL_LOCATION_LOOKUPS_KEY,
+    TOTAL_QUOTE_REQUESTS_KEY,
+)
+from app.services.redis.service import RedisService
+
+logger = logging.getLogger(__name__)
+
+TOPICS = frozenset({"counters", "latency", "errors", "requests"})
+SERVICES = frozenset({"quote", "location", "gmaps", "redis"})
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+COUNTER_KEYS = {
+    TOTAL_QUOTE_REQUESTS_KEY: "quote_requests.total",
+    SUCCESS_QUOTE_REQUESTS_KEY: "quote_requests.success",
+    ERROR_QUOTE_REQUESTS_KEY: "quote_requests.error",
+    TOTAL_LOCATION_LOOKUPS_KEY: "location_lookups.total",
+    GMAPS_API_CALLS_KEY: "gmaps_api.calls",
+    GMAPS_API_ERRORS_KEY: "gmaps_api.errors",
+    PRICING_CACHE_HITS_KEY: "cache.pricing.hits",
+    PRICING_CACHE_MISSES_KEY: "cache.pricing.misses",
+    MAPS_CACHE_HITS_KEY: "cache.maps.hits",
+    MAPS_CACHE_MISSES_KEY: "cache.maps.misses",
+    MAPS_NEGATIVE_CACHE_HITS_KEY: "cache.maps.negative_hits",
+}
+
+LATENCY_STREAMS = {
+    "quote": QUOTE_LATENCY_STREAM,
+    "location": LOCATION_LATENCY_STREAM,
+    "gmaps": GMAPS_LATENCY_STREAM,
+    "redis": REDIS_LATENCY_STREAM,
+}
+
+Feed = Callable[["LiveMetricsHub"], Awaitable[None]]
+
+
+class LiveMetricsOverloaded(Exception):
+  """Raised when the process already serves LIVE_METRICS_MAX_CLIENTS clients."""
+
+
+@dataclass(frozen=True)
+class LiveEvent:
+  """An event and its server-sent-events frame, encoded once for all clients."""
+
+  topic: str
+  data: Dict[str, Any]
+  service: Optional[str] = None
+  frame: str = ""
+
+  @classmethod
+  def create(cls, topic: str, data: Dict[str, Any], service: Optional[str] = None) -> "LiveEvent":
+    frame = f"event: {topic}\ndata: {json.dumps(data, default=str)}\n\n"
+    return cls(topic=topic, data=data, service=service, frame=frame)
+
+
+@dataclass
+class Subscription:
+  """One client's filters and bounded buffer; the oldest events are dropped on overflow."""
+
+  topics: FrozenSet[str]
+  services: Optional[FrozenSet[str]] = None
+  buffer_size: int = 200
+  dropped: int = 0
+  buffer: Deque[LiveEvent] = field(init=False)
+  _ready: asyncio.Event = field(init=False)
+
+  def __post_init__(self):
+    self.buffer = deque(maxlen=self.buffer_size)
+    self._ready = asyncio.Event()
+
+  def accepts(self, event: LiveEvent) -> bool:
+    if event.topic not in self.topics:
+      return False
+    return self.services is None or event.service is None or event.service in self.services
+
+  def push(self, event: LiveEvent) -> None:
+    if len(self.buffer) == self.buffer.maxlen:
+      self.dropped += 1
+    self.buffer.append(event)
+    self._ready.set()
+
+  async def drain(self, timeout: float) -> List[LiveEvent]:
+    """Waits up to `timeout` seconds for events and returns everything buffered."""
+    if not self.buffer:
+      try:
+        await asyncio.wait_for(self._ready.wait(), timeout)
+      except asyncio.TimeoutError:
+        return []
+    events = list(self.buffer)
+    self.buffer.clear()
+    self._ready.clear()
+    return events
+
+
+def latency_histogram(latencies: Sequence[float]) -> Dict[str, Any]:
+  """Bucket counts plus count/avg/max for one batch of latency samples."""
+  buckets = {f"le_{bound}": 0 for bound in LATENCY_BUCKETS_MS}
+  buckets["gt_max"] = 0
+  for value in latencies:
+    for bound in LATENCY_BUCKETS_MS:
+      if value <= bound:
+        buckets[f"le_{bound}"] += 1
+        break
+    else:
+      buckets["gt_max"] += 1
+  return {
+      "count": len(latencies),
+      "avg_ms": round(sum(latencies) / len(latencies), 2) if latencies else None,
+      "max_ms": max(latencies) if latencies else None,
+      "buckets": buckets,
+  }
+
+
+class LiveMetricsHub:
+  """Fans Redis-sourced dashboard events out to subscribed clients."""
+
+  def __init__(self, feeds: Optional[Iterable[Feed]] = None):
+    self.feeds: List[Feed] = list(feeds) if feeds is not None else [poll_feed, pubsub_feed]
+    self.subscriptions: List[Subscription] = []
+    self.tasks: List[asyncio.Task] = []
+    self.counter_totals: Dict[str, int] = {}
+    self.published = 0
+
+  def subscribe(
+      self,
+      topics: Optional[Iterable[str]] = None,
+      services: Optional[Iterable[str]] = None,
+      buffer_size: Optional[int] = None,
+  ) -> Subscription:
+    if len(self.subscriptions) >= settings.LIVE_METRICS_MAX_CLIENTS:
+      raise LiveMetricsOverloaded(
+          f"Live metrics limit of {settings.LIVE_METRICS_MAX_CLIENTS} clients reached")
+    subscription = Subscription(
+        topics=frozenset(topics or TOPICS) & TOPICS,
+        services=frozenset(services) & SERVICES if services else None,
+        buffer_size=buffer_size or settings.LIVE_METRICS_CLIENT_BUFFER,
+    )
+    self.subscriptions.append(subscription)
+    # Late joiners start from the current totals rather than waiting for the next delta
+    if self.counter_totals and "counters" in subscription.topics:
+      subscription.push(LiveEvent.create(
+          "counters", {"totals": dict(self.counter_totals), "deltas": {}}))
+    if not self.tasks:
+      self.tasks = [asyncio.create_task(feed(self)) for feed in self.feeds]
+      logger.info("Live metrics feeds started")
+    return subscription
+
+  async def unsubscribe(self, subscription: Subscription) -> None:
+    if subscription in self.subscriptions:
+      self.subscriptions.remove(subscription)
+    # Feeds only run while someone is watching
+    if not self.subscriptions and self.tasks:
+      tasks, self.tasks = self.tasks, []
+      for task in tasks:
+        task.cancel()
+      await asyncio.gather(*tasks, return_exceptions=True)
+      self.counter_totals = {}
+      logger.info("Live metrics feeds stopped")
+
+  def publish(self, event: LiveEvent) -> None:
+    self.published += 1
+    for subscription in self.subscriptions:
+      if subscription.accepts(event):
+        subscription.push(event)
+
+  def update_counters(self, totals: Dict[str, int]) -> None:
+    """Publishes the counters that changed since the previous poll."""
+    deltas = {name: value - self.counter_totals.get(name, 0)
+              for name, value in totals.items() if value != self.counter_totals.get(name)}
+    first_poll = not self.counter_totals
+    self.counter_totals = totals
+    if deltas or first_poll:
+      self.publish(LiveEvent.create("counters", {"totals": totals, "deltas": {} if first_poll else deltas}))
+
+  def stats(self) -> Dict[str, Any]:
+    return {
+        "clients": len(self.subscriptions),
+        "feeds_running": bool(self.tasks),
+        "published": self.published,
+        "dropped": sum(subscription.dropped for subscription in self.subscriptions),
+    }
+
+
+async def poll_feed(hub: LiveMetricsHub) -> None:
+  """Reads counters and new latency stream entries once per interval."""
+  start_id = f"{int(time.time() * 1000)}-0"
+  last_ids = {stream: start_id for stream in LATENCY_STREAMS.values()}
+  services_by_stream = {stream: service for service, stream in LATENCY_STREAMS.items()}
+  keys = list(COUNTER_KEYS)
+  while True:
+    try:
+      client = await RedisService.get_client()
+      try:
+        values = await client.mget(keys)
+        hub.update_counters({COUNTER_KEYS[key]: int(float(value or 0))
+                             for key, value in zip(keys, values)})
+
+        for stream, entries in await client.xread(last_ids, count=1000) or []:
+          if not entries:
+            continue
+          last_ids[stream] = entries[-1][0]
+          latencies = [float(fields.get("latency_ms", 0)) for _, fields in entries]
+          service = services_by_stream.get(stream)
+          hub.publish(LiveEvent.create(
+              "latency", {"service": service, **latency_histogram(latencies)}, service=service))
+      finally:
+        await client.close()
+    except asyncio.CancelledError:
+      raise
+    except Exception as e:
+      logger.warning(f"Live metrics poll failed: {e}")
+    await asyncio.sleep(settings.LIVE_METRICS_INTERVAL_SECONDS)
+
+
+async def pubsub_feed(hub: LiveMetricsHub) -> None:
+  """Relays request log entries and errors published on the dash:live channel."""
+  while True:
+    client = None
+    pubsub = None
+    try:
+      client = await RedisService.get_client()
+      pubsub = client.pubsub()
+      await pubsub.subscribe(DASH_LIVE_CHANNEL)
+      while True:
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+        if not message:
+          continue
+        try:
+          payload = json.loads(message["data"])
+        except (TypeError, ValueError):
+          continue
+        topic = payload.get("topic")
+        if topic in TOPICS:
+          hub.publish(LiveEvent.create(topic, payload.get("data") or {}))
+    except asyncio.CancelledError:
+      raise
+    except Exception as e:
+      logger.warning(f"Live metrics pub/sub feed failed, reconnecting: {e}")
+      await asyncio.sleep(settings.LIVE_METRICS_INTERVAL_SECONDS)
+    finally:
+      if pubsub is not None:
+        await pubsub.close()
+      if client is not None:
+        await client.close()
+
+
+# Process-wide hub used by the /dashboard/live endpoint
+live_metrics_hub = LiveMetricsHub()
@@ -4,6 +4,7 @@ from datetime import datetime
 from fastapi import Depends
 
 from app.services.redis.service import RedisService
+from app.services.location.cache import distance_cache_keyspace, unresolvable_location_keyspace
 from app.services.mongo import MongoService
 from app.models.dash.dashboard import (
     DashboardOverview,
@@ -25,6 +26,7 @@ from app.core.keys import (
     PRICING_CACHE_MISSES_KEY,
     MAPS_CACHE_HITS_KEY,
     MAPS_CACHE_MISSES_KEY,
+    MAPS_NEGATIVE_CACHE_HITS_KEY,
 )
 
 logger = logging.getLogger(__name__)
@@ -156,6 +158,8 @@ class OverviewGenerator:
     redis_memory_used_human = "N/A"
     pricing_catalog_size_bytes = None
     maps_cache_key_count = 0
+    unresolvable_location_count = 0
+    unresolvable_location_hits = 0
     pricing_ratio_obj: Optional[CacheHitMissRatio] = None
     maps_ratio_obj: Optional[CacheHitMissRatio] = None
 
@@ -169,8 +173,10 @@ class OverviewGenerator:
           PRICING_CATALOG_CACHE_KEY
       )
 
-      maps_keys = await self.redis.scan_keys(match="maps:distance:*")
-      maps_cache_key_count = len(maps_keys)
+      maps_cache_key_count = await distance_cache_keyspace(self.redis).count()
+      unresolvable_location_count = await unresolvable_location_keyspace(self.redis).count()
+      negative_hits_raw = await self.redis.get(MAPS_NEGATIVE_CACHE_HITS_KEY)
+      unresolvable_location_hits = int(negative_hits_raw) if negative_hits_raw is not None else 0
 
       # Calculate cache hit/miss ratios
       pricing_ratio_obj = await self._calculate_cache_ratio(
@@ -197,6 +203,8 @@ class OverviewGenerator:
         redis_memory_used_human=redis_memory_used_human,
         pricing_catalog_size_bytes=pricing_catalog_size_bytes,
         maps_cache_key_count=maps_cache_key_count,
+        unresolvable_location_count=unresolvable_location_count,
+        unresolvable_location_hits=unresolvable_location_hits,
         hit_miss_ratio_pricing=pricing_ratio_obj,
         hit_miss_ratio_maps=maps_ratio_obj,
     )
@@ -26,6 +26,11 @@ from app.services.dash.sync.trigger import SyncTrigger
 from app.services.dash.sheets.fetcher import DataFetcher
 from app.services.dash.services.status import StatusFetcher
 from app.services.dash.latency.service import LatencyService
+from app.services.dash.snapshot import (
+    LATENCY_SUMMARY_SNAPSHOT,
+    OVERVIEW_SNAPSHOT,
+    SnapshotStore,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +52,7 @@ class DashboardService:
     self.data_fetcher = DataFetcher(mongo_service)
     self.status_fetcher = StatusFetcher(mongo_service)
     self.latency_service = LatencyService(redis_service)
+    self.snapshot_store = SnapshotStore(redis_service)
 
   # --- Monitoring Features ---
 
@@ -54,6 +60,74 @@ class DashboardService:
     """Gathers data for the main dashboard overview from Redis and MongoDB."""
     return await self.overview_generator.generate_overview()
 
+  async def build_dashboard_overview(self) -> DashboardOverview:
+    """
+    Computes the full dashboard overview: the generated overview merged with
+    MongoDB request stats and an aggregated report summary.
+    """
+    stats: Dict[str, Dict[str, int]] = await self.mongo.get_dashboard_stats()
+    base_overview = await self.get_dashboard_overview()
+    updated_data = base_overview.model_dump()
+
+    # 1. Quote Requests Stats (from MongoDB)
+    quote_stats = stats.get("quote_requests")
+    if quote_stats is None:
+      logger.warning(
+          "Quote request stats not found in mongo_service.get_dashboard_stats(). Defaulting to zeros for these.")
+      quote_stats = {}
+    quote_total = quote_stats.get("total", 0)
+    quote_successful = quote_stats.get("successful", 0)
+    quote_failed = quote_stats.get("failed", 0)
+    updated_data["quote_requests_total"] = quote_total
+    updated_data["quote_requests_successful"] = quote_successful
+    updated_data["quote_requests_failed"] = quote_failed
+
+    # 2. Location Lookups Stats (top-level fields from MongoDB)
+    location_stats = stats.get("location_lookups")
+    if location_stats is None:
+      logger.warning(
+          "Location lookup stats (MongoDB) not found in mongo_service.get_dashboard_stats(). Defaulting to zeros for these.")
+      location_stats = {}
+    location_total = location_stats.get("total", 0)
+    location_successful = location_stats.get("successful", 0)
+    location_failed = location_stats.get("failed", 0)
+    updated_data["location_lookups_total"] = location_total
+    updated_data["location_lookups_successful"] = location_successful
+    updated_data["location_lookups_failed"] = location_failed
+
+    # The report summary prefers the Redis total for location lookups
+    redis_counters = base_overview.redis_counters or {}
+    if "location_lookups" in redis_counters:
+      location_total_for_summary = int(
+          redis_counters["location_lookups"].get("total", 0))
+    else:
+      location_total_for_summary = location_total
+
+    # 3. GMaps API Calls Stats (from Redis counters)
+    gmaps_stats = redis_counters.get("gmaps_api", {})
+    gmaps_api_calls = int(gmaps_stats.get("calls", 0))
+    gmaps_api_errors = int(gmaps_stats.get("errors", 0))
+    gmaps_api_successful = max(0, gmaps_api_calls - gmaps_api_errors)
+
+    updated_data["report_summary"] = {
+        "total_reports": quote_total + location_total_for_summary + gmaps_api_calls,
+        "success_count": quote_successful + location_successful + gmaps_api_successful,
+        "failure_count": quote_failed + location_failed + gmaps_api_errors,
+    }
+    return DashboardOverview(**updated_data)
+
+  async def get_dashboard_overview_snapshot(self) -> DashboardOverview:
+    """Serves the dashboard overview from its snapshot, rebuilding it if stale."""
+    snapshot = await self.snapshot_store.serve(
+        OVERVIEW_SNAPSHOT, self.build_dashboard_overview)
+    overview = DashboardOverview.model_validate(snapshot.data)
+    overview.as_of = snapshot.as_of
+    return overview
+
+  async def get_counter_rates(self, minutes: int = 60) -> Dict[str, Any]:
+    """Per-minute request and cache counters for the last `minutes` minutes."""
+    return await self.stats_collector.get_counter_rates(minutes)
+
   # --- Management Features ---
 
   async def search_cache_keys(self, pattern: str) -> List[CacheSearchResult]:
@@ -76,6 +150,10 @@ class DashboardService:
     """Clears Google Maps cache keys matching a location pattern."""
     return await self.cache_manager.clear_maps_location_cache(location_pattern)
 
+  async def clear_unresolvable_locations(self, location_pattern: str) -> int:
+    """Clears negative cache entries for delivery locations matching a pattern."""
+    return await self.cache_manager.clear_unresolvable_locations(location_pattern)
+
   async def clear_cache_key(self, cache_key: str) -> bool:
     """Clears a specific key in Redis."""
     return await self.cache_manager.clear_cache_key(cache_key)
@@ -119,8 +197,10 @@ class DashboardService:
   # --- Latency Tracking Methods ---
 
   async def get_latency_overview(self) -> Dict[str, Any]:
-    """Get comprehensive latency overview for dashboard."""
-    return await self.latency_service.get_dashboard_overview()
+    """Get comprehensive latency overview for dashboard (served from its snapshot)."""
+    snapshot = await self.snapshot_store.serve(
+        LATENCY_SUMMARY_SNAPSHOT, self.latency_service.get_dashboard_overview)
+    return {**snapshot.data, "as_of": snapshot.as_of.isoformat()}
 
   async def get_latency_summary(self, service_type: str) -> Dict[str, Any]:
     """Get latency summary for a specific service."""
@@ -0,0 +1,29 @@
+# app/services/dash/snapshot/__init__.py
+
+"""
+Materialized dashboard snapshots and the background aggregator that refreshes them.
+"""
+
+from .store import (
+    LATENCY_OVERVIEW_SNAPSHOT,
+    LATENCY_SUMMARY_SNAPSHOT,
+    OVERVIEW_SNAPSHOT,
+    Snapshot,
+    SnapshotStore,
+)
+from .aggregator import (
+    SnapshotAggregator,
+    initialize_snapshot_aggregator,
+    shutdown_snapshot_aggregator,
+)
+
+__all__ = [
+    "LATENCY_OVERVIEW_SNAPSHOT",
+    "LATENCY_SUMMARY_SNAPSHOT",
+    "OVERVIEW_SNAPSHOT",
+    "Snapshot",
+    "SnapshotStore",
+    "SnapshotAggregator",
+    "initialize_snapshot_aggregator",
+    "shutdown_snapshot_aggregator",
+]
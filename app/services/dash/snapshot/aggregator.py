@@ -0,0 +1,119 @@
+# app/services/dash/snapshot/aggregator.py
+
+"""
+Background aggregator that refreshes dashboard snapshots on a fixed cadence.
+Every worker runs the loop, but a short Redis lock lets only one of them
+compute each round, so the cost no longer scales with open dashboards.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.keys import DASH_SNAPSHOT_LOCK_KEY
+from app.services.redis.service import RedisService
+
+from .store import SnapshotBuilder, SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotAggregator:
+  """Periodically rebuilds the registered snapshots."""
+
+  def __init__(
+      self,
+      redis_service: RedisService,
+      builders: Dict[str, SnapshotBuilder],
+      interval_seconds: Optional[int] = None,
+  ):
+    self.redis = redis_service
+    self.store = SnapshotStore(redis_service)
+    self.builders = builders
+    self.interval_seconds = interval_seconds or settings.DASH_SNAPSHOT_INTERVAL_SECONDS
+    self.owner = f"{socket.gethostname()}:{os.getpid()}"
+    self.running = False
+    self.task: Optional[asyncio.Task] = None
+    self.last_run: Dict[str, Any] = {}
+
+  async def start(self):
+    """Start the periodic refresh task."""
+    if self.running:
+      logger.warning("Snapshot aggregator is already running.")
+      return
+    self.running = True
+    self.task = asyncio.create_task(self._loop())
+    logger.info(
+        f"Started dashboard snapshot aggregator ({len(self.builders)} snapshots every {self.interval_seconds}s).")
+
+  async def stop(self):
+    """Stop the periodic refresh task."""
+    self.running = False
+    if self.task:
+      self.task.cancel()
+      try:
+        await self.task
+      except asyncio.CancelledError:
+        pass
+      self.task = None
+    logger.info("Stopped dashboard snapshot aggregator.")
+
+  async def refresh_all(self) -> Dict[str, Any]:
+    """Rebuilds every snapshot if this worker wins the round; returns per-snapshot timings."""
+    # Lock expires just before the next round so a crashed owner does not stall refreshes
+    acquired = await self.redis.set_if_not_exists(
+        DASH_SNAPSHOT_LOCK_KEY, self.owner, ttl=max(1, self.interval_seconds - 1))
+    if not acquired:
+      return {}
+
+    results: Dict[str, Any] = {}
+    for name, builder in self.builders.items():
+      try:
+        snapshot = await self.store.build(name, builder)
+        results[name] = {"as_of": snapshot.as_of.isoformat(), "duration_ms": snapshot.duration_ms}
+      except Exception as e:
+        logger.error(f"Failed to build dashboard snapshot '{name}': {e}", exc_info=True)
+        results[name] = {"error": str(e)}
+    self.last_run = results
+    return results
+
+  async def _loop(self):
+    try:
+      while self.running:
+        try:
+          await self.refresh_all()
+        except Exception as e:
+          logger.error(f"Error during snapshot refresh: {e}", exc_info=True)
+        await asyncio.sleep(self.interval_seconds)
+    except asyncio.CancelledError:
+      logger.info("Snapshot aggregator loop cancelled.")
+      raise
+
+
+snapshot_aggregator: Optional[SnapshotAggregator] = None
+
+
+async def initialize_snapshot_aggregator(
+    redis_service: RedisService,
+    builders: Dict[str, SnapshotBuilder],
+):
+  """Initialize and start the snapshot aggregator."""
+  global snapshot_aggregator
+
+  if snapshot_aggregator is None:
+    snapshot_aggregator = SnapshotAggregator(redis_service, builders)
+    await snapshot_aggregator.start()
+  else:
+    logger.warning("Snapshot aggregator already initialized.")
+
+
+async def shutdown_snapshot_aggregator():
+  """Stop the snapshot aggregator."""
+  global snapshot_aggregator
+
+  if snapshot_aggregator:
+    await snapshot_aggregator.stop()
+    snapshot_aggregator = None
@@ -0,0 +1,118 @@
+# app/services/dash/snapshot/store.py
+
+"""
+Redis storage for materialized dashboard snapshots.
+A snapshot is the JSON form of an expensive dashboard payload plus the time
+it was computed; readers serve it while it is within the freshness budget.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.keys import DASH_SNAPSHOT_PREFIX
+from app.services.redis.service import RedisService
+
+logger = logging.getLogger(__name__)
+
+SnapshotBuilder = Callable[[], Awaitable[Any]]
+
+# Snapshot names
+OVERVIEW_SNAPSHOT = "overview"
+LATENCY_OVERVIEW_SNAPSHOT = "latency_overview"
+LATENCY_SUMMARY_SNAPSHOT = "latency_summary"
+
+# One in-process rebuild per snapshot when it is missing or stale
+_rebuild_locks: Dict[str, asyncio.Lock] = {}
+
+
+@dataclass
+class Snapshot:
+  """A stored snapshot and when it was computed."""
+
+  name: str
+  data: Any
+  as_of: datetime
+  duration_ms: float
+
+  @property
+  def age_seconds(self) -> float:
+    return (datetime.now(timezone.utc) - self.as_of).total_seconds()
+
+  def is_fresh(self, max_age_seconds: float) -> bool:
+    return self.age_seconds <= max_age_seconds
+
+
+def _to_json(data: Any) -> Any:
+  if hasattr(data, "model_dump"):
+    return data.model_dump(mode="json")
+  return data
+
+
+class SnapshotStore:
+  """Reads and writes snapshot documents."""
+
+  def __init__(self, redis_service: RedisService):
+    self.redis = redis_service
+
+  @staticmethod
+  def key(name: str) -> str:
+    return f"{DASH_SNAPSHOT_PREFIX}{name}"
+
+  async def read(self, name: str) -> Optional[Snapshot]:
+    document = await self.redis.get_json(self.key(name))
+    if not document or "as_of" not in document:
+      return None
+    try:
+      as_of = datetime.fromisoformat(document["as_of"])
+    except (TypeError, ValueError):
+      return None
+    return Snapshot(name=name, data=document.get("data"), as_of=as_of,
+                    duration_ms=document.get("duration_ms", 0.0))
+
+  async def build(self, name: str, builder: SnapshotBuilder) -> Snapshot:
+    """Runs `builder` and stores the result as the latest snapshot."""
+    start = time.perf_counter()
+    data = _to_json(await builder())
+    snapshot = Snapshot(
+        name=name,
+        data=data,
+        as_of=datetime.now(timezone.utc),
+        duration_ms=round((time.perf_counter() - start) * 1000, 2),
+    )
+    # Abandoned snapshots expire instead of being served forever
+    await self.redis.set_json(
+        self.key(name),
+        {"as_of": snapshot.as_of.isoformat(), "duration_ms": snapshot.duration_ms, "data": data},
+        ttl=settings.DASH_SNAPSHOT_MAX_AGE_SECONDS * 10,
+    )
+    logger.debug(f"Snapshot '{name}' built in {snapshot.duration_ms}ms")
+    return snapshot
+
+  async def serve(
+      self,
+      name: str,
+      builder: SnapshotBuilder,
+      max_age_seconds: Optional[float] = None,
+  ) -> Snapshot:
+    """
+    Returns the stored snapshot if it is within `max_age_seconds`, otherwise
+    rebuilds it once (concurrent readers wait for that rebuild).
+    """
+    max_age = settings.DASH_SNAPSHOT_MAX_AGE_SECONDS if max_age_seconds is None else max_age_seconds
+    snapshot = await self.read(name)
+    if snapshot and snapshot.is_fresh(max_age):
+      return snapshot
+
+    lock = _rebuild_locks.setdefault(name, asyncio.Lock())
+    async with lock:
+      # Another request may have rebuilt it while this one waited
+      snapshot = await self.read(name)
+      if snapshot and snapshot.is_fresh(max_age):
+        return snapshot
+      logger.info(f"Snapshot '{name}' missing or stale; rebuilding on read")
+      return await self.build(name, builder)
@@ -1,7 +1,12 @@
 # filepath: app/services/dash/stats/collector.py
 import logging
+import time
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from app.services.redis.service import RedisService
+from app.services.redis.counters import recent_bucket_keys
+from app.services.dash.live.hub import COUNTER_KEYS
+from app.services.location.cache import distance_cache_keyspace, unresolvable_location_keyspace
 from app.services.mongo import MongoService
 from app.models.dash.dashboard import CacheStats, CacheHitMissRatio
 from app.core.keys import (
@@ -16,6 +21,7 @@ from app.core.keys import (
     PRICING_CACHE_MISSES_KEY,
     MAPS_CACHE_HITS_KEY,
     MAPS_CACHE_MISSES_KEY,
+    MAPS_NEGATIVE_CACHE_HITS_KEY,
 )
 
 logger = logging.getLogger(__name__)
@@ -68,12 +74,48 @@ class StatsCollector:
       logger.error(f"Failed to fetch counters from Redis: {e}", exc_info=True)
       return {}
 
+  async def get_counter_rates(self, minutes: int = 60) -> Dict[str, Any]:
+    """Per-minute counter deltas for the last `minutes` minutes, oldest first."""
+    buckets = recent_bucket_keys(minutes, time.time())
+    client = None
+    try:
+      client = await self.redis.get_client()
+      async with client.pipeline(transaction=False) as pipe:
+        for _, key in buckets:
+          pipe.hgetall(key)
+        values = await pipe.execute()
+    except Exception as e:
+      logger.error(f"Failed to fetch counter buckets from Redis: {e}", exc_info=True)
+      values = [{} for _ in buckets]
+    finally:
+      if client:
+        await client.close()
+
+    series = []
+    totals: Dict[str, int] = {}
+    for (minute, _), counts in zip(buckets, values):
+      named = {COUNTER_KEYS.get(key, key): int(value) for key, value in (counts or {}).items()}
+      for name, value in named.items():
+        totals[name] = totals.get(name, 0) + value
+      series.append({
+          "minute": datetime.fromtimestamp(minute * 60, tz=timezone.utc).isoformat(),
+          "counters": named,
+      })
+    return {
+        "minutes": minutes,
+        "buckets": series,
+        "totals": totals,
+        "per_minute": {name: round(value / minutes, 2) for name, value in totals.items()},
+    }
+
   async def get_cache_stats(self) -> CacheStats:
     """Collects cache statistics from Redis."""
     total_redis_keys = -1
     redis_memory_used_human = "N/A"
     pricing_catalog_size_bytes = None
     maps_cache_key_count = 0
+    unresolvable_location_count = 0
+    unresolvable_location_hits = 0
     pricing_ratio_obj: Optional[CacheHitMissRatio] = None
     maps_ratio_obj: Optional[CacheHitMissRatio] = None
 
@@ -87,8 +129,10 @@ class StatsCollector:
           PRICING_CATALOG_CACHE_KEY
       )
 
-      maps_keys = await self.redis.scan_keys(match="maps:distance:*")
-      maps_cache_key_count = len(maps_keys)
+      maps_cache_key_count = await distance_cache_keyspace(self.redis).count()
+      unresolvable_location_count = await unresolvable_location_keyspace(self.redis).count()
+      negative_hits_raw = await self.redis.get(MAPS_NEGATIVE_CACHE_HITS_KEY)
+      unresolvable_location_hits = int(negative_hits_raw) if negative_hits_raw is not None else 0
 
       # Calculate Pricing Cache Hit/Miss Ratio
       pricing_hits_raw = await self.redis.get(PRICING_CACHE_HITS_KEY)
@@ -168,6 +212,8 @@ class StatsCollector:
         redis_memory_used_human=redis_memory_used_human,
         pricing_catalog_size_bytes=pricing_catalog_size_bytes,
         maps_cache_key_count=maps_cache_key_count,
+        unresolvable_location_count=unresolvable_location_count,
+        unresolvable_location_hits=unresolvable_location_hits,
         hit_miss_ratio_pricing=pricing_ratio_obj,
         hit_miss_ratio_maps=maps_ratio_obj,
     )
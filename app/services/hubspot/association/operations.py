@@ -8,7 +8,9 @@ from hubspot.crm.associations.v4.models import (
     AssociationSpec,
     PublicObjectId,
     BatchInputPublicAssociationMultiPost,
+    BatchInputPublicFetchAssociationsBatchRequest,
     PublicAssociationMultiPost,
+    PublicFetchAssociationsBatchRequest,
 )
 
 from app.services.hubspot.utils.helpers import _handle_api_error
@@ -162,6 +164,39 @@ class AssociationOperations:
       logger.error(f"Error {context}: {e}", exc_info=True)
       return False
 
+  async def get_associated_ids(
+      self,
+      from_object_type: str,
+      from_object_ids: List[str],
+      to_object_type: str,
+  ) -> Dict[str, List[str]]:
+    """
+    Reads the associations of many objects with the v4 batch API.
+    Returns from_object_id -> associated `to_object_type` IDs; objects
+    without associations are left out.
+    """
+    sdk_from_object_type = self._normalize_object_type(from_object_type)
+    sdk_to_object_type = self._normalize_object_type(to_object_type)
+    associated: Dict[str, List[str]] = {}
+    # The batch endpoint accepts at most 1000 inputs per call
+    for start in range(0, len(from_object_ids), 1000):
+      batch = from_object_ids[start:start + 1000]
+      try:
+        response = await asyncio.to_thread(
+            self.manager.client.crm.associations.v4.batch_api.get_page,
+            from_object_type=sdk_from_object_type,
+            to_object_type=sdk_to_object_type,
+            batch_input_public_fetch_associations_batch_request=BatchInputPublicFetchAssociationsBatchRequest(
+                inputs=[PublicFetchAssociationsBatchRequest(id=object_id) for object_id in batch]),
+        )
+      except Exception as e:
+        logger.error(
+            f"Error reading {from_object_type} -> {to_object_type} associations: {e}", exc_info=True)
+        continue
+      for result in response.results or []:
+        associated[str(result._from.id)] = [str(target.to_object_id) for target in result.to or []]
+    return associated
+
   def _normalize_object_type(self, object_type: str) -> str:
     """Convert plural object types to singular lowercase for API calls."""
     sdk_object_type = object_type.lower()
@@ -7,6 +7,8 @@ import json
 from datetime import datetime, timezone
 
 from hubspot.crm.contacts import (
+    BatchReadInputSimplePublicObjectId,
+    SimplePublicObjectId,
     SimplePublicObjectInput as ContactSimplePublicObjectInput,
     ApiException as ContactApiException
 )
@@ -397,6 +399,25 @@ class ContactOperations:
           details=error_details_dict
       )
 
+  async def batch_read(self, contact_ids: List[str], properties: List[str]) -> List[HubSpotObject]:
+    """Reads many contacts by ID, 100 per request. Contacts that fail to load are left out."""
+    contacts: List[HubSpotObject] = []
+    for start in range(0, len(contact_ids), 100):
+      batch = contact_ids[start:start + 100]
+      try:
+        api_response = await asyncio.to_thread(
+            self.manager.client.crm.contacts.batch_api.read,
+            batch_read_input_simple_public_object_id=BatchReadInputSimplePublicObjectId(
+                properties=properties,
+                inputs=[SimplePublicObjectId(id=contact_id) for contact_id in batch],
+            ),
+        )
+      except Exception as e:
+        logger.error(f"Error batch reading {len(batch)} contacts: {e}", exc_info=True)
+        continue
+      contacts.extend(HubSpotObject(**result.to_dict()) for result in api_response.results or [])
+    return contacts
+
   async def search(self, search_request: HubSpotSearchRequest) -> HubSpotSearchResponse:
     """Search for contacts."""
     try:
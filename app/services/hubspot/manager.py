@@ -210,6 +210,9 @@ class HubSpotManager:
   async def get_contact_by_id(self, contact_id: str, properties: Optional[List[str]] = None) -> HubSpotApiResult:
     return await self.contact.get_by_id(contact_id, properties)
 
+  async def batch_read_contacts(self, contact_ids: List[str], properties: List[str]) -> List[HubSpotObject]:
+    return await self.contact.batch_read(contact_ids, properties)
+
   # Company methods
   async def create_company(self, company_input: HubSpotCompanyInput) -> HubSpotApiResult:
     return await self.company.create(company_input)
@@ -251,6 +254,9 @@ class HubSpotManager:
   async def associate_objects(self, from_object_type: str, from_object_id: str, to_object_type: str, to_object_id: str, association_type_id: int) -> bool:
     return await self.association.associate_objects(from_object_type, from_object_id, to_object_type, to_object_id, association_type_id)
 
+  async def get_associated_ids(self, from_object_type: str, from_object_ids: List[str], to_object_type: str) -> Dict[str, List[str]]:
+    return await self.association.get_associated_ids(from_object_type, from_object_ids, to_object_type)
+
   # Pipeline methods
   async def get_pipelines(self, object_type: str, archived: bool = False) -> List[HubSpotPipeline]:
     return await self.pipeline.get_pipelines(object_type, archived)
@@ -1,5 +1,6 @@
 # app/services/hubspot/properties/sync.py
 
+import asyncio
 import json
 import logging
 from pathlib import Path
@@ -7,11 +8,36 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 import logfire
 
+from app.core.config import settings
 from app.models.hubspot import HubSpotApiResult
-from app.services.hubspot.property.operations import PropertyOperations
+from app.services.hubspot.property.operations import PropertyOperations, property_groups
 
 logger = logging.getLogger(__name__)
 
+# Fields compared against HubSpot to decide whether a property needs an update
+SYNCED_FIELDS = ("label", "type", "fieldType")
+
+
+def _summary(prop: Dict[str, Any]) -> Dict[str, Any]:
+  return {"name": prop["name"], "label": prop["label"], "type": prop["type"]}
+
+
+def _options_key(options: Optional[List[Dict[str, Any]]]) -> List[Tuple[str, str]]:
+  return [(str(option.get("value")), str(option.get("label"))) for option in options or []]
+
+
+def _property_changes(desired: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+  """Fields of `desired` that differ from the HubSpot property `current`."""
+  # HubSpot's own properties cannot be modified
+  if current.get("hubspotDefined"):
+    return {}
+  changes = {field: desired[field] for field in SYNCED_FIELDS
+             if desired.get(field) != current.get(field)}
+  if desired["type"] == "enumeration" and (
+      _options_key(desired.get("options")) != _options_key(current.get("options"))):
+    changes["options"] = desired["options"]
+  return changes
+
 
 class PropertySyncManager:
   """Manages synchronization of properties from JSON files to HubSpot."""
@@ -23,25 +49,30 @@ class PropertySyncManager:
     self.properties_path = Path(
         __file__).parent.parent.parent.parent / "properties"
 
-  async def sync_all_properties(self) -> Dict[str, Any]:
+  async def sync_all_properties(self, dry_run: bool = False) -> Dict[str, Any]:
     """
     Sync all properties from contact.json and lead.json to HubSpot.
 
+    Args:
+        dry_run: Report the planned creates and updates without applying them
+
     Returns:
         Dict containing sync results for each object type
     """
     try:
-      logfire.info("Starting property sync for all object types")
+      logfire.info("Starting property sync for all object types", dry_run=dry_run)
 
-      results = {
-          "contacts": await self._sync_properties_for_object("contacts", "contact.json"),
-          "leads": await self._sync_properties_for_object("leads", "lead.json"),
-          "summary": {}
-      }
+      contacts, leads = await asyncio.gather(
+          self._sync_properties_for_object("contacts", "contact.json", dry_run),
+          self._sync_properties_for_object("leads", "lead.json", dry_run),
+      )
+      results = {"contacts": contacts, "leads": leads, "summary": {}}
 
       # Generate summary
       total_created = sum(len(r.get("created", []))
                           for r in results.values() if isinstance(r, dict))
+      total_updated = sum(len(r.get("updated", []))
+                          for r in results.values() if isinstance(r, dict))
       total_existing = sum(len(r.get("existing", []))
                            for r in results.values() if isinstance(r, dict))
       total_failed = sum(len(r.get("failed", []))
@@ -49,16 +80,20 @@ class PropertySyncManager:
 
       results["summary"] = {
           "total_created": total_created,
+          "total_updated": total_updated,
           "total_existing": total_existing,
           "total_failed": total_failed,
+          "dry_run": dry_run,
           "status": "completed"
       }
 
       logfire.info(
           "Property sync completed",
           created=total_created,
+          updated=total_updated,
           existing=total_existing,
-          failed=total_failed
+          failed=total_failed,
+          dry_run=dry_run
       )
 
       return results
@@ -71,35 +106,39 @@ class PropertySyncManager:
           "status": "error"
       }
 
-  async def sync_contact_properties(self) -> Dict[str, Any]:
+  async def sync_contact_properties(self, dry_run: bool = False) -> Dict[str, Any]:
     """
     Sync properties from contact.json to HubSpot contacts.
 
     Returns:
         Dict containing sync results
     """
-    return await self._sync_properties_for_object("contacts", "contact.json")
+    return await self._sync_properties_for_object("contacts", "contact.json", dry_run)
 
-  async def sync_lead_properties(self) -> Dict[str, Any]:
+  async def sync_lead_properties(self, dry_run: bool = False) -> Dict[str, Any]:
     """
     Sync properties from lead.json to HubSpot leads.
 
     Returns:
         Dict containing sync results
     """
-    return await self._sync_properties_for_object("leads", "lead.json")
+    return await self._sync_properties_for_object("leads", "lead.json", dry_run)
 
   async def _sync_properties_for_object(
       self,
       object_type: str,
-      filename: str
+      filename: str,
+      dry_run: bool = False
   ) -> Dict[str, Any]:
     """
-    Sync properties for a specific HubSpot object type.
+    Sync properties for a specific HubSpot object type. The definitions are
+    diffed against one listing of the existing properties; missing ones are
+    created through batch requests and changed ones are updated.
 
     Args:
         object_type: HubSpot object type (e.g., 'contacts', 'leads')
         filename: JSON file containing property definitions
+        dry_run: Report the diff without applying it
 
     Returns:
         Dict containing sync results
@@ -115,75 +154,76 @@ class PropertySyncManager:
             "status": "error"
         }
 
-      # Get existing properties from HubSpot
+      # Get existing properties from HubSpot, once for the whole sync
       existing_properties = await self._get_existing_properties(object_type)
-      existing_property_names = {prop["name"] for prop in existing_properties}
-
-      # Filter properties that don't exist yet
-      properties_to_create = []
-      existing_props = []
-
-      for prop in properties_data:
-        if prop["name"] in existing_property_names:
-          existing_props.append({
-              "name": prop["name"],
-              "label": prop["label"],
-              "type": prop["type"]
-          })
-        else:
-          properties_to_create.append(prop)
+      to_create, to_update, existing_props, failed_props = self._diff_properties(
+          object_type, properties_data, existing_properties)
 
       logfire.info(
           f"Properties analysis for {object_type}",
           total_properties=len(properties_data),
           existing_properties=len(existing_props),
-          properties_to_create=len(properties_to_create)
+          properties_to_create=len(to_create),
+          properties_to_update=len(to_update)
+      )
+
+      planned_updates = [
+          {"name": name, "label": changes.get("label", label), "changes": sorted(changes)}
+          for name, label, changes in to_update
+      ]
+      if dry_run:
+        return {
+            "object_type": object_type,
+            "created": [_summary(prop) for prop in to_create],
+            "updated": planned_updates,
+            "existing": existing_props,
+            "failed": failed_props,
+            "dry_run": True,
+            "status": "completed"
+        }
+
+      semaphore = asyncio.Semaphore(
+          max(1, settings.HUBSPOT_PROPERTY_SYNC_CONCURRENCY))
+      batch_size = max(1, settings.HUBSPOT_PROPERTY_BATCH_SIZE)
+
+      async def create_chunk(chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+        async with semaphore:
+          return await self.property_ops.batch_create_properties(object_type, chunk)
+
+      async def update_one(name: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+          return await self.property_ops.update_property(object_type, name, changes)
+
+      chunks = [to_create[i:i + batch_size] for i in range(0, len(to_create), batch_size)]
+      chunk_results, update_results = await asyncio.gather(
+          asyncio.gather(*(create_chunk(chunk) for chunk in chunks)),
+          asyncio.gather(*(update_one(name, changes) for name, _, changes in to_update)),
       )
 
-      # Create missing properties
       created_props = []
-      failed_props = []
-
-      if properties_to_create:
-        for prop in properties_to_create:
-          try:
-            # Preprocess property before creation
-            processed_prop = self._preprocess_property(prop)
-
-            # Add detailed logging for debugging
-            logfire.info(
-                f"Creating property '{processed_prop['name']}' for {object_type}",
-                property_type=processed_prop["type"],
-                field_type=processed_prop["fieldType"],
-                group_name=processed_prop.get("groupName"),
-                has_options=bool(processed_prop.get("options"))
-            )
-
-            result = await self.property_ops.create_property_full(object_type, processed_prop)
-            if result:
-              created_props.append({
-                  "name": prop["name"],
-                  "label": prop["label"],
-                  "type": prop["type"]
-              })
-            else:
-              failed_props.append({
-                  "name": prop["name"],
-                  "label": prop["label"],
-                  "error": "Creation failed"
-              })
-          except Exception as e:
-            failed_props.append({
-                "name": prop["name"],
-                "label": prop["label"],
-                "error": str(e)
-            })
+      for chunk_result in chunk_results:
+        created_props.extend(chunk_result["created"])
+        existing_props.extend(chunk_result["existing"])
+        failed_props.extend(chunk_result["failed"])
+
+      updated_props = []
+      for planned, result in zip(planned_updates, update_results):
+        if result:
+          updated_props.append(planned)
+        else:
+          failed_props.append({
+              "name": planned["name"],
+              "label": planned["label"],
+              "error": "Update failed"
+          })
 
       return {
           "object_type": object_type,
           "created": created_props,
+          "updated": updated_props,
           "existing": existing_props,
           "failed": failed_props,
+          "dry_run": False,
           "status": "completed"
       }
 
@@ -196,6 +236,48 @@ class PropertySyncManager:
           "status": "error"
       }
 
+  def _diff_properties(
+      self,
+      object_type: str,
+      properties_data: List[Dict[str, Any]],
+      existing_properties: List[Dict[str, Any]],
+  ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str, Dict[str, Any]]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Splits the definitions into HubSpot payloads to create, (name, label,
+    changed fields) to update, unchanged properties and invalid definitions.
+    """
+    existing_by_name = {prop["name"]: prop for prop in existing_properties}
+    valid_groups = property_groups(existing_properties) if object_type == "leads" else None
+
+    to_create: List[Dict[str, Any]] = []
+    to_update: List[Tuple[str, str, Dict[str, Any]]] = []
+    unchanged: List[Dict[str, Any]] = []
+    invalid: List[Dict[str, Any]] = []
+
+    for prop in properties_data:
+      desired = self.property_ops.to_hubspot_property(
+          object_type, self._preprocess_property(prop), valid_groups)
+      if desired is None:
+        invalid.append({
+            "name": prop["name"],
+            "label": prop["label"],
+            "error": "Invalid property definition"
+        })
+        continue
+
+      current = existing_by_name.get(prop["name"])
+      if current is None:
+        to_create.append(desired)
+        continue
+
+      changes = _property_changes(desired, current)
+      if changes:
+        to_update.append((prop["name"], current.get("label", prop["label"]), changes))
+      else:
+        unchanged.append(_summary(prop))
+
+    return to_create, to_update, unchanged, invalid
+
   async def _load_properties_from_file(self, filename: str) -> List[Dict[str, Any]]:
     """
     Load property definitions from JSON file.
@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import httpx
 import logfire
@@ -60,88 +60,105 @@ class PropertyOperations:
   ) -> Optional[Dict[str, Any]]:
     """Create a custom property with full property data."""
     try:
+      valid_groups = None
       # For leads, we need to discover valid property groups first
       if object_type == "leads":
-        # Get existing properties to see what groups are available
-        existing_props = await self.get_all_properties(object_type)
-        if existing_props:
-          # Extract unique group names from existing properties
-          valid_groups = set()
-          for prop in existing_props:
-            if prop.get("groupName"):
-              valid_groups.add(prop["groupName"])
-
-          logfire.info(
-              f"Found valid property groups for leads: {list(valid_groups)}")
-
-          # Use the first available group or a common one
-          if valid_groups:
-            group_name = list(valid_groups)[0]  # Use first available group
-            logfire.info(
-                f"Using property group '{group_name}' for leads property '{property_data['name']}'")
-          else:
-            # If no existing properties have groups, omit groupName entirely
-            group_name = None
-            logfire.info(
-                f"No property groups found for leads, creating property '{property_data['name']}' without group")
-        else:
-          # If we can't get existing properties, try without group
-          group_name = None
-          logfire.info(
-              f"Cannot determine valid groups for leads, creating property '{property_data['name']}' without group")
-      else:
-        # For other object types, use the provided group name with mapping
-        group_name = property_data.get("groupName")
-        if object_type == "contacts" and group_name == "leadinformation":
-          group_name = "contactinformation"
-
-      # Handle field type mappings
-      field_type = property_data["fieldType"]
-      property_type = property_data["type"]
-
-      # Skip properties with empty options for enumeration types
-      if property_type == "enumeration":
-        options = property_data.get("options", [])
-        if not options:
-          logfire.warning(
-              f"Skipping property '{property_data['name']}' - enumeration type requires at least one option"
-          )
-          return None
-
-      # Field type validations and mappings
-      if property_type == "bool":
-        if field_type not in ["booleancheckbox", "checkbox"]:
-          field_type = "booleancheckbox"
-      elif property_type == "string":
-        if field_type not in ["text", "textarea", "email", "phonenumber"]:
-          field_type = "text"
-      elif property_type == "enumeration":
-        # Handle multi-select/multi-choice enumeration fields
-        if field_type == "checkbox":
-          # For multi-select checkboxes, ensure proper handling
-          field_type = "checkbox"
-        elif field_type not in ["select", "radio", "checkbox"]:
-          # Default to select for single choice
-          field_type = "select"
-
-      # Map to HubSpot format
-      hubspot_property = {
-          "name": property_data["name"],
-          "label": property_data["label"],
-          "type": property_type,
-          "fieldType": field_type,
-          "description": property_data.get("description", ""),
-      }
+        valid_groups = property_groups(await self.get_all_properties(object_type))
+        logfire.info(
+            f"Found valid property groups for leads: {sorted(valid_groups)}")
 
-      # Only include groupName if we have a valid one
-      if group_name is not None:
-        hubspot_property["groupName"] = group_name
+      hubspot_property = self.to_hubspot_property(
+          object_type, property_data, valid_groups)
+      if hubspot_property is None:
+        return None
+      return await self._post_property(object_type, hubspot_property)
+    except Exception as e:
+      logfire.error(
+          "Failed to create property",
+          object_type=object_type,
+          property_name=property_data["name"],
+          error=str(e)
+      )
+      return None
 
-      # Add options for enumeration properties
-      if property_type == "enumeration" and "options" in property_data:
-        hubspot_property["options"] = property_data["options"]
+  def to_hubspot_property(
+      self,
+      object_type: str,
+      property_data: Dict[str, Any],
+      valid_groups: Optional[Set[str]] = None,
+  ) -> Optional[Dict[str, Any]]:
+    """
+    Maps a property definition to the payload HubSpot expects. For leads,
+    `valid_groups` are the groups seen on the existing lead properties.
+    Returns None for definitions HubSpot would reject.
+    """
+    if object_type == "leads":
+      group_name = property_data.get("groupName")
+      if valid_groups and group_name not in valid_groups:
+        # Use a group the leads object already has
+        group_name = sorted(valid_groups)[0]
+      elif not valid_groups:
+        # If no existing properties have groups, omit groupName entirely
+        group_name = None
+    else:
+      # For other object types, use the provided group name with mapping
+      group_name = property_data.get("groupName")
+      if object_type == "contacts" and group_name == "leadinformation":
+        group_name = "contactinformation"
+
+    # Handle field type mappings
+    field_type = property_data["fieldType"]
+    property_type = property_data["type"]
+
+    # Skip properties with empty options for enumeration types
+    if property_type == "enumeration":
+      options = property_data.get("options", [])
+      if not options:
+        logfire.warning(
+            f"Skipping property '{property_data['name']}' - enumeration type requires at least one option"
+        )
+        return None
+
+    # Field type validations and mappings
+    if property_type == "bool":
+      if field_type not in ["booleancheckbox", "checkbox"]:
+        field_type = "booleancheckbox"
+    elif property_type == "string":
+      if field_type not in ["text", "textarea", "email", "phonenumber"]:
+        field_type = "text"
+    elif property_type == "enumeration":
+      # Checkbox stays multi-select; anything unknown defaults to single choice
+      if field_type not in ["select", "radio", "checkbox"]:
+        field_type = "select"
+
+    # Map to HubSpot format
+    hubspot_property = {
+        "name": property_data["name"],
+        "label": property_data["label"],
+        "type": property_type,
+        "fieldType": field_type,
+        "description": property_data.get("description", ""),
+    }
+
+    # Only include groupName if we have a valid one
+    if group_name is not None:
+      hubspot_property["groupName"] = group_name
+
+    # Add options for enumeration properties
+    if property_type == "enumeration" and "options" in property_data:
+      hubspot_property["options"] = property_data["options"]
+
+    return hubspot_property
+
+  async def _post_property(
+      self, object_type: str, hubspot_property: Dict[str, Any]
+  ) -> Optional[Dict[str, Any]]:
+    """Creates one property from a HubSpot payload."""
+    name = hubspot_property["name"]
+    try:
+      if hubspot_property["type"] == "enumeration":
         logfire.info(
-            f"Creating enumeration property '{property_data['name']}' with {len(property_data['options'])} options and fieldType '{field_type}'"
+            f"Creating enumeration property '{name}' with {len(hubspot_property.get('options', []))} options and fieldType '{hubspot_property['fieldType']}'"
         )
 
       # Make API request
@@ -152,14 +169,14 @@ class PropertyOperations:
       response.raise_for_status()
 
       logfire.info(
-          f"Successfully created property '{property_data['name']}' for {object_type}")
+          f"Successfully created property '{name}' for {object_type}")
       return response.json()
 
     except httpx.HTTPStatusError as e:
       if e.response.status_code == 409:  # Property already exists
         logfire.info(
-            f"Property '{property_data['name']}' already exists for {object_type}")
-        return await self.get_property(object_type, property_data["name"])
+            f"Property '{name}' already exists for {object_type}")
+        return await self.get_property(object_type, name)
 
       try:
         error_response = e.response.json()
@@ -168,7 +185,7 @@ class PropertyOperations:
         error_message = e.response.text
 
       logger.error(
-          f"Failed to create property '{property_data['name']}' for {object_type}: "
+          f"Failed to create property '{name}' for {object_type}: "
           f"Status {e.response.status_code} - {error_message}"
       )
       return None
@@ -176,7 +193,39 @@ class PropertyOperations:
       logfire.error(
           "Failed to create property",
           object_type=object_type,
-          property_name=property_data["name"],
+          property_name=name,
+          error=str(e)
+      )
+      return None
+
+  async def update_property(
+      self, object_type: str, property_name: str, changes: Dict[str, Any]
+  ) -> Optional[Dict[str, Any]]:
+    """Updates the given fields of an existing property."""
+    try:
+      response = await self.manager._http_client.patch(
+          f"/crm/v3/properties/{object_type}/{property_name}",
+          json=changes
+      )
+      response.raise_for_status()
+      logfire.info(
+          f"Updated property '{property_name}' for {object_type}",
+          fields=sorted(changes))
+      return response.json()
+    except httpx.HTTPStatusError as e:
+      logfire.error(
+          "Failed to update property",
+          object_type=object_type,
+          property_name=property_name,
+          status_code=e.response.status_code,
+          error=e.response.text
+      )
+      return None
+    except Exception as e:
+      logfire.error(
+          "Failed to update property",
+          object_type=object_type,
+          property_name=property_name,
           error=str(e)
       )
       return None
@@ -239,7 +288,11 @@ class PropertyOperations:
   async def batch_create_properties(
       self, object_type: str, properties_data: List[Dict[str, Any]]
   ) -> Dict[str, Any]:
-    """Batch create multiple properties."""
+    """
+    Batch create multiple properties from HubSpot payloads (see
+    to_hubspot_property). Falls back to one request per property if the
+    batch is rejected as a whole.
+    """
     results = {"created": [], "existing": [], "failed": []}
 
     try:
@@ -251,10 +304,12 @@ class PropertyOperations:
             "label": prop_data["label"],
             "type": prop_data["type"],
             "fieldType": prop_data["fieldType"],
-            "groupName": prop_data["groupName"],
             "description": prop_data.get("description", ""),
         }
 
+        if prop_data.get("groupName"):
+          hubspot_property["groupName"] = prop_data["groupName"]
+
         if prop_data["type"] == "enumeration" and "options" in prop_data:
           hubspot_property["options"] = prop_data["options"]
 
@@ -268,12 +323,23 @@ class PropertyOperations:
       response.raise_for_status()
 
       response_data = response.json()
-      if "results" in response_data:
-        for result in response_data["results"]:
-          results["created"].append({
-              "name": result["name"],
-              "label": result["label"],
-              "type": result["type"]
+      created_names = set()
+      for result in response_data.get("results", []):
+        created_names.add(result["name"])
+        results["created"].append({
+            "name": result["name"],
+            "label": result["label"],
+            "type": result["type"]
+        })
+
+      # A multi-status response lists per-input errors next to the results
+      errors = response_data.get("errors", [])
+      for prop_data in properties_data:
+        if prop_data["name"] not in created_names and errors:
+          results["failed"].append({
+              "name": prop_data["name"],
+              "label": prop_data["label"],
+              "error": "; ".join(str(error.get("message", error)) for error in errors)
           })
 
       logfire.info(
@@ -283,9 +349,10 @@ class PropertyOperations:
       # Fall back to individual creation
       logfire.warning(
           f"Batch create failed, falling back to individual creation: {str(e)}")
+      results = {"created": [], "existing": [], "failed": []}
 
       for prop_data in properties_data:
-        result = await self.create_property_full(object_type, prop_data)
+        result = await self._post_property(object_type, prop_data)
         if result:
           results["created"].append({
               "name": prop_data["name"],
@@ -300,3 +367,8 @@ class PropertyOperations:
           })
 
     return results
+
+
+def property_groups(properties: List[Dict[str, Any]]) -> Set[str]:
+  """Unique group names used by a property listing."""
+  return {prop["groupName"] for prop in properties if prop.get("groupName")}
@@ -0,0 +1,26 @@
+# app/services/jobs/__init__.py
+
+"""
+Durable background job queue backed by Redis Streams.
+
+- registry: queue policies (concurrency, retries, backoff) and job registration
+- queue: enqueue, retry scheduling, dead-lettering and statistics
+- worker: consumer-group worker run by `python -m app.worker`
+- dispatch: enqueue-or-fallback helper for web endpoints
+- handlers: the registered jobs
+"""
+
+from .registry import QUEUES, QueueConfig, job, get_job, get_queue_config
+from .queue import JobQueue
+from .dispatch import dispatch_job
+from . import handlers  # noqa: F401  (registers jobs)
+
+__all__ = [
+    "QUEUES",
+    "QueueConfig",
+    "job",
+    "get_job",
+    "get_queue_config",
+    "JobQueue",
+    "dispatch_job",
+]
@@ -0,0 +1,43 @@
+# app/services/jobs/dispatch.py
+
+"""
+Dispatch helper used by web endpoints.
+With JOB_QUEUE_ENABLED the work is enqueued for the worker process; otherwise
+(or if enqueueing fails) it runs as an in-process FastAPI background task.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import BackgroundTasks
+
+from app.core.config import settings
+from app.services.redis.service import RedisService
+
+from .queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+
+async def dispatch_job(
+    redis_service: RedisService,
+    background_tasks: BackgroundTasks,
+    name: str,
+    payload: Dict[str, Any],
+    fallback: Callable[..., Any],
+    *fallback_args: Any,
+    job_id: Optional[str] = None,
+    **fallback_kwargs: Any,
+) -> str:
+  """
+  Enqueues job `name`, or schedules `fallback(*fallback_args, **fallback_kwargs)`
+  as a background task. Returns "queued" or "background".
+  """
+  if settings.JOB_QUEUE_ENABLED:
+    queued_id = await JobQueue(redis_service).enqueue(name, payload, job_id=job_id)
+    if queued_id:
+      return "queued"
+    logger.warning(
+        f"Enqueue of job '{name}' failed; running it as an in-process background task.")
+  background_tasks.add_task(fallback, *fallback_args, **fallback_kwargs)
+  return "background"
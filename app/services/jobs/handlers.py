@@ -0,0 +1,65 @@
+# app/services/jobs/handlers.py
+
+"""
+Job handlers run by the worker process.
+Payloads are plain JSON dicts; each handler rebuilds the models and services
+it needs, so jobs can be retried or reclaimed by any worker. Handlers call the
+background functions with `raise_errors=True`: a job that fails must raise,
+or the worker acks it as done and never retries it.
+"""
+
+from typing import Any, Dict
+
+from .registry import job
+
+
+@job("voice_classification", queue="classification")
+async def voice_classification_job(payload: Dict[str, Any]) -> None:
+  """AI classification, result storage and HubSpot sync for a Bland call."""
+  from app.models.bland import BlandWebhookPayload
+  from app.services.background.classification import process_voice_classification_bg
+
+  await process_voice_classification_bg(
+      webhook_payload=BlandWebhookPayload.model_validate(
+          payload["webhook_payload"]),
+      use_ai_classification=payload.get("use_ai_classification", True),
+      background_task_id=payload.get("background_task_id"),
+      raise_errors=True,
+  )
+
+
+@job("location_prefetch", queue="location")
+async def location_prefetch_job(payload: Dict[str, Any]) -> None:
+  """Computes and caches the distance to the nearest branch."""
+  from app.services.location import LocationService
+  from app.services.mongo import get_mongo_service
+  from app.services.redis.factory import get_redis_service
+
+  location_service = LocationService(await get_redis_service(), await get_mongo_service())
+  await location_service.prefetch_distance(payload["delivery_location"], raise_errors=True)
+
+
+@job("log_location", queue="logging")
+async def log_location_job(payload: Dict[str, Any]) -> None:
+  """Writes a location lookup record to MongoDB."""
+  from app.services.background.mongo.tasks import log_location_bg
+  from app.services.mongo import get_mongo_service
+
+  await log_location_bg(
+      mongo_service=await get_mongo_service(),
+      location_data=payload["location_data"],
+      background_task_id=payload.get("background_task_id"),
+      raise_errors=True,
+  )
+
+
+@job("n8n_handoff", queue="integrations")
+async def n8n_handoff_job(payload: Dict[str, Any]) -> None:
+  """Posts a lead handoff to the n8n webhook; a failed post is retried."""
+  from app.core.config import settings
+  from app.services.n8n import send_to_n8n_webhook
+
+  if not settings.N8N_WEBHOOK_URL:
+    return
+  if not await send_to_n8n_webhook(payload=payload["payload"]):
+    raise RuntimeError("n8n webhook did not accept the handoff")
@@ -0,0 +1,225 @@
+# app/services/jobs/queue.py
+
+"""
+Redis Streams-backed job queue.
+Web workers enqueue; `python -m app.worker` consumes through a consumer group.
+Each queue is one stream. Retries wait in a shared sorted set until due, and
+jobs that exhaust their retries are moved to a per-queue dead-letter stream.
+"""
+
+import json
+import logging
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from redis.exceptions import RedisError, ResponseError
+
+from app.core.config import settings
+from app.core.keys import (
+    JOBS_CONSUMER_GROUP,
+    JOBS_DEAD_LETTER_PREFIX,
+    JOBS_DELAYED_KEY,
+    JOBS_METRICS_PREFIX,
+    JOBS_STREAM_PREFIX,
+)
+from app.services.redis.service import RedisService
+
+from .registry import QUEUES, get_job
+
+logger = logging.getLogger(__name__)
+
+# Dead-letter streams keep the most recent failures only
+DEAD_LETTER_MAX_LENGTH = 10000
+
+
+def stream_key(queue: str) -> str:
+  return f"{JOBS_STREAM_PREFIX}{queue}"
+
+
+def dead_letter_key(queue: str) -> str:
+  return f"{JOBS_DEAD_LETTER_PREFIX}{queue}"
+
+
+def metrics_key(queue: str) -> str:
+  return f"{JOBS_METRICS_PREFIX}{queue}"
+
+
+class JobQueue:
+  """Enqueue, retry scheduling, dead-lettering and queue statistics."""
+
+  def __init__(self, redis_service: RedisService):
+    self.redis_service = redis_service
+
+  async def enqueue(
+      self,
+      name: str,
+      payload: Dict[str, Any],
+      job_id: Optional[str] = None,
+      attempt: int = 0,
+      enqueued_at_ms: Optional[int] = None,
+  ) -> Optional[str]:
+    """
+    Adds a job to its queue's stream. Returns the job id, or None when the
+    job is unknown or Redis is unavailable (callers fall back to in-process).
+    """
+    definition = get_job(name)
+    if definition is None:
+      logger.error(f"Cannot enqueue unknown job '{name}'")
+      return None
+
+    job_id = job_id or str(uuid.uuid4())
+    fields = {
+        "job_id": job_id,
+        "name": name,
+        "payload": json.dumps(payload, default=str),
+        "attempt": str(attempt),
+        "enqueued_at": str(enqueued_at_ms or int(time.time() * 1000)),
+    }
+    try:
+      client = await self.redis_service.get_client()
+      async with client.pipeline(transaction=False) as pipe:
+        pipe.xadd(stream_key(definition.queue), fields,  # type: ignore
+                  maxlen=settings.JOB_QUEUE_MAX_STREAM_LENGTH, approximate=True)
+        if attempt == 0:
+          pipe.hincrby(metrics_key(definition.queue), "enqueued", 1)
+        await pipe.execute()
+      await client.close()
+      logger.debug(
+          f"Enqueued job {name} ({job_id}) on '{definition.queue}', attempt {attempt}")
+      return job_id
+    except RedisError as e:
+      logger.error(f"Failed to enqueue job {name}: {e}", exc_info=True)
+      return None
+
+  async def ensure_group(self, queue: str) -> None:
+    """Creates the consumer group (and stream) if it does not exist yet."""
+    client = await self.redis_service.get_client()
+    try:
+      await client.xgroup_create(stream_key(queue), JOBS_CONSUMER_GROUP, id="0", mkstream=True)
+      logger.info(f"Created consumer group for job queue '{queue}'")
+    except ResponseError as e:
+      if "BUSYGROUP" not in str(e):
+        raise
+    finally:
+      await client.close()
+
+  async def ack(self, queue: str, message_id: str) -> None:
+    """Acknowledges a processed entry and removes it from the stream."""
+    client = await self.redis_service.get_client()
+    try:
+      async with client.pipeline(transaction=False) as pipe:
+        pipe.xack(stream_key(queue), JOBS_CONSUMER_GROUP, message_id)
+        pipe.xdel(stream_key(queue), message_id)
+        await pipe.execute()
+    finally:
+      await client.close()
+
+  async def schedule_retry(self, queue: str, fields: Dict[str, str], delay_seconds: float) -> None:
+    """Parks a failed job until its backoff has elapsed."""
+    entry = json.dumps({**fields, "queue": queue,
+                       "attempt": str(int(fields.get("attempt", "0")) + 1)})
+    client = await self.redis_service.get_client()
+    try:
+      async with client.pipeline(transaction=False) as pipe:
+        pipe.zadd(JOBS_DELAYED_KEY, {entry: time.time() + delay_seconds})
+        pipe.hincrby(metrics_key(queue), "retried", 1)
+        await pipe.execute()
+    finally:
+      await client.close()
+
+  async def promote_due(self, limit: int = 100) -> int:
+    """Moves retries whose backoff has elapsed back onto their streams."""
+    client = await self.redis_service.get_client()
+    promoted = 0
+    try:
+      due: List[str] = await client.zrangebyscore(
+          JOBS_DELAYED_KEY, "-inf", time.time(), start=0, num=limit)
+      for entry in due:
+        # ZREM decides which worker owns the promotion when several race
+        if not await client.zrem(JOBS_DELAYED_KEY, entry):
+          continue
+        fields = json.loads(entry)
+        queue = fields.pop("queue")
+        await client.xadd(stream_key(queue), fields,  # type: ignore
+                          maxlen=settings.JOB_QUEUE_MAX_STREAM_LENGTH, approximate=True)
+        promoted += 1
+    finally:
+      await client.close()
+    return promoted
+
+  async def dead_letter(self, queue: str, fields: Dict[str, str], error: str) -> None:
+    """Records a job that exhausted its retries."""
+    client = await self.redis_service.get_client()
+    try:
+      async with client.pipeline(transaction=False) as pipe:
+        pipe.xadd(dead_letter_key(queue), {**fields, "error": error[:2000],  # type: ignore
+                                           "failed_at": str(int(time.time() * 1000))},
+                  maxlen=DEAD_LETTER_MAX_LENGTH, approximate=True)
+        pipe.hincrby(metrics_key(queue), "dead_lettered", 1)
+        await pipe.execute()
+    finally:
+      await client.close()
+
+  async def record_result(self, queue: str, success: bool, wait_ms: float, run_ms: float) -> None:
+    """Accumulates per-queue outcome counters and latency sums."""
+    client = await self.redis_service.get_client()
+    try:
+      async with client.pipeline(transaction=False) as pipe:
+        key = metrics_key(queue)
+        pipe.hincrby(key, "completed" if success else "failed", 1)
+        pipe.hincrbyfloat(key, "wait_ms_sum", wait_ms)
+        pipe.hincrbyfloat(key, "run_ms_sum", run_ms)
+        pipe.hincrby(key, "runs", 1)
+        await pipe.execute()
+    finally:
+      await client.close()
+
+  async def get_stats(self) -> Dict[str, Any]:
+    """Queue depth, pending, retry and dead-letter counts and job latency per queue."""
+    client = await self.redis_service.get_client()
+    queues: Dict[str, Any] = {}
+    try:
+      delayed_entries = await client.zrange(JOBS_DELAYED_KEY, 0, -1)
+      delayed_by_queue: Dict[str, int] = {}
+      for entry in delayed_entries:
+        try:
+          queue_name = json.loads(entry).get("queue", "unknown")
+        except json.JSONDecodeError:
+          queue_name = "unknown"
+        delayed_by_queue[queue_name] = delayed_by_queue.get(queue_name, 0) + 1
+
+      for queue, config in QUEUES.items():
+        length = await client.xlen(stream_key(queue))
+        pending = 0
+        lag = None
+        try:
+          groups = await client.xinfo_groups(stream_key(queue))
+          for group in groups:
+            if group.get("name") == JOBS_CONSUMER_GROUP:
+              pending = group.get("pending", 0)
+              lag = group.get("lag")
+        except ResponseError:
+          pass  # Stream not created yet
+
+        metrics = await client.hgetall(metrics_key(queue))
+        runs = int(metrics.get("runs", 0))
+        queues[queue] = {
+            "concurrency": config.concurrency,
+            "max_retries": config.max_retries,
+            # Workers delete acknowledged entries, so the stream holds waiting + running jobs
+            "depth": length,
+            "pending": pending,
+            "lag": lag,
+            "delayed_retries": delayed_by_queue.get(queue, 0),
+            "dead_lettered": await client.xlen(dead_letter_key(queue)),
+            "enqueued_total": int(metrics.get("enqueued", 0)),
+            "completed_total": int(metrics.get("completed", 0)),
+            "failed_attempts_total": int(metrics.get("failed", 0)),
+            "retried_total": int(metrics.get("retried", 0)),
+            "avg_wait_ms": round(float(metrics.get("wait_ms_sum", 0)) / runs, 2) if runs else None,
+            "avg_run_ms": round(float(metrics.get("run_ms_sum", 0)) / runs, 2) if runs else None,
+        }
+    finally:
+      await client.close()
+    return {"enabled": settings.JOB_QUEUE_ENABLED, "queues": queues}
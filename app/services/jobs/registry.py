@@ -0,0 +1,68 @@
+# app/services/jobs/registry.py
+
+"""
+Job and queue registry for the background job queue.
+Handlers register by name with the queue they run on; queues carry their
+own concurrency limit and retry policy.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class QueueConfig:
+  """Consumption policy for one queue."""
+
+  name: str
+  # Jobs from this queue running at once in one worker process
+  concurrency: int = 4
+  # Attempts after the first before a job is dead-lettered
+  max_retries: int = 3
+  # Retry delay = backoff_base_seconds * 2 ** (attempt - 1), capped
+  backoff_base_seconds: float = 5.0
+  backoff_max_seconds: float = 300.0
+
+  def backoff_for(self, attempt: int) -> float:
+    return min(self.backoff_base_seconds * (2 ** max(attempt - 1, 0)), self.backoff_max_seconds)
+
+
+# LLM + HubSpot work is slow and rate limited; logging and prefetch are cheap.
+QUEUES: Dict[str, QueueConfig] = {
+    "classification": QueueConfig("classification", concurrency=2, max_retries=3, backoff_base_seconds=10.0),
+    "location": QueueConfig("location", concurrency=8, max_retries=2, backoff_base_seconds=5.0),
+    "logging": QueueConfig("logging", concurrency=8, max_retries=5, backoff_base_seconds=2.0),
+    "integrations": QueueConfig("integrations", concurrency=4, max_retries=5, backoff_base_seconds=10.0),
+}
+
+
+@dataclass(frozen=True)
+class JobDefinition:
+  name: str
+  queue: str
+  handler: JobHandler
+
+
+_JOBS: Dict[str, JobDefinition] = {}
+
+
+def job(name: str, queue: str) -> Callable[[JobHandler], JobHandler]:
+  """Registers an async handler taking the job payload dict."""
+  if queue not in QUEUES:
+    raise ValueError(f"Unknown job queue '{queue}'")
+
+  def decorator(func: JobHandler) -> JobHandler:
+    _JOBS[name] = JobDefinition(name=name, queue=queue, handler=func)
+    return func
+
+  return decorator
+
+
+def get_job(name: str) -> Optional[JobDefinition]:
+  return _JOBS.get(name)
+
+
+def get_queue_config(queue: str) -> QueueConfig:
+  return QUEUES.get(queue) or QueueConfig(queue)
@@ -0,0 +1,199 @@
+# app/services/jobs/worker.py
+
+"""
+Job worker consuming the Redis Streams job queues.
+One consume loop per queue reads through the shared consumer group, bounded
+by that queue's concurrency; a scheduler loop promotes due retries and a
+reclaim loop takes over jobs left pending by crashed workers.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from typing import Dict, List, Optional, Set
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.keys import JOBS_CONSUMER_GROUP
+from app.services.redis.service import RedisService
+
+from .queue import JobQueue, stream_key
+from .registry import QUEUES, get_job, get_queue_config
+
+logger = logging.getLogger(__name__)
+
+READ_BLOCK_MS = 5000
+SCHEDULER_INTERVAL_SECONDS = 1.0
+RECLAIM_INTERVAL_SECONDS = 60.0
+
+
+class JobWorker:
+  """Consumes jobs for the given queues until `stop()` is called."""
+
+  def __init__(
+      self,
+      redis_service: RedisService,
+      queues: Optional[List[str]] = None,
+      consumer_name: Optional[str] = None,
+  ):
+    self.redis_service = redis_service
+    self.queue = JobQueue(redis_service)
+    self.queues = queues or list(QUEUES.keys())
+    self.consumer_name = consumer_name or f"{socket.gethostname()}-{os.getpid()}"
+    self._stopping = asyncio.Event()
+    self._semaphores: Dict[str, asyncio.Semaphore] = {
+        name: asyncio.Semaphore(get_queue_config(name).concurrency) for name in self.queues
+    }
+    self._active: Dict[str, int] = {name: 0 for name in self.queues}
+    self._running: Set[asyncio.Task] = set()
+
+  def stop(self):
+    self._stopping.set()
+
+  async def run(self):
+    for name in self.queues:
+      await self.queue.ensure_group(name)
+    logger.info(
+        f"Job worker '{self.consumer_name}' consuming queues: {', '.join(self.queues)}")
+
+    loops = [asyncio.create_task(self._consume(name), name=f"jobs-consume:{name}")
+             for name in self.queues]
+    loops.append(asyncio.create_task(self._schedule(), name="jobs-scheduler"))
+    loops.append(asyncio.create_task(self._reclaim(), name="jobs-reclaim"))
+
+    await self._stopping.wait()
+    for task in loops:
+      task.cancel()
+    await asyncio.gather(*loops, return_exceptions=True)
+
+    # Let in-flight jobs finish; anything cut short stays pending and is reclaimed later
+    if self._running:
+      logger.info(f"Waiting for {len(self._running)} running jobs to finish")
+      await asyncio.wait(self._running, timeout=30)
+    logger.info(f"Job worker '{self.consumer_name}' stopped")
+
+  async def _consume(self, queue_name: str):
+    """Reads new entries for one queue, never holding more than its concurrency."""
+    semaphore = self._semaphores[queue_name]
+    # Dedicated connection: blocking reads must not starve the shared pool
+    client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    try:
+      while not self._stopping.is_set():
+        # Wait for a free slot, then read at most as many entries as there are free slots
+        await semaphore.acquire()
+        semaphore.release()
+        concurrency = get_queue_config(queue_name).concurrency
+        free_slots = max(concurrency - self._active[queue_name], 1)
+        try:
+          response = await client.xreadgroup(
+              JOBS_CONSUMER_GROUP, self.consumer_name,
+              {stream_key(queue_name): ">"},
+              count=free_slots, block=READ_BLOCK_MS,
+          )
+        except redis.RedisError as e:
+          logger.error(f"Error reading job queue '{queue_name}': {e}")
+          await asyncio.sleep(1)
+          continue
+        for _stream, messages in response or []:
+          for message_id, fields in messages:
+            await self._start(queue_name, message_id, fields)
+    finally:
+      await client.close()
+
+  async def _start(self, queue_name: str, message_id: str, fields: Dict[str, str]):
+    await self._semaphores[queue_name].acquire()
+    self._active[queue_name] += 1
+    task = asyncio.create_task(self._process(queue_name, message_id, fields))
+    self._running.add(task)
+    task.add_done_callback(self._running.discard)
+
+  async def _process(self, queue_name: str, message_id: str, fields: Dict[str, str]):
+    config = get_queue_config(queue_name)
+    name = fields.get("name", "")
+    attempt = int(fields.get("attempt", "0"))
+    enqueued_at_ms = int(fields.get("enqueued_at", "0") or 0)
+    started = time.perf_counter()
+    wait_ms = max(time.time() * 1000 - enqueued_at_ms, 0) if enqueued_at_ms else 0.0
+    success = False
+    # Only settled entries are acknowledged: the job ran, or its retry or
+    # dead letter was written. Anything else stays pending for `_reclaim`.
+    settled = False
+    try:
+      definition = get_job(name)
+      if definition is None:
+        await self.queue.dead_letter(queue_name, fields, f"Unknown job '{name}'")
+        settled = True
+        return
+      try:
+        await definition.handler(json.loads(fields.get("payload", "{}")))
+        success = True
+        settled = True
+      except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        if attempt < config.max_retries:
+          delay = config.backoff_for(attempt + 1)
+          logger.warning(
+              f"Job {name} ({fields.get('job_id')}) failed on attempt {attempt + 1}; retrying in {delay}s: {error}")
+          await self.queue.schedule_retry(queue_name, fields, delay)
+        else:
+          logger.error(
+              f"Job {name} ({fields.get('job_id')}) failed after {attempt + 1} attempts; dead-lettering: {error}",
+              exc_info=True)
+          await self.queue.dead_letter(queue_name, fields, error)
+        settled = True
+    except Exception as e:
+      logger.error(
+          f"Could not record the outcome of job {name} ({message_id}) on '{queue_name}'; "
+          f"leaving it pending for reclaim: {e}")
+    finally:
+      run_ms = (time.perf_counter() - started) * 1000
+      try:
+        await self.queue.record_result(queue_name, success, wait_ms, run_ms)
+      except Exception as e:
+        logger.error(f"Failed to record the result of job {message_id} on '{queue_name}': {e}")
+      if settled:
+        try:
+          await self.queue.ack(queue_name, message_id)
+        except Exception as e:
+          logger.error(f"Failed to acknowledge job {message_id} on '{queue_name}': {e}")
+      self._active[queue_name] -= 1
+      self._semaphores[queue_name].release()
+
+  async def _schedule(self):
+    while not self._stopping.is_set():
+      try:
+        promoted = await self.queue.promote_due()
+        if promoted:
+          logger.debug(f"Promoted {promoted} retried jobs")
+      except Exception as e:
+        logger.error(f"Job retry scheduler error: {e}")
+      await asyncio.sleep(SCHEDULER_INTERVAL_SECONDS)
+
+  async def _reclaim(self):
+    """Claims entries left pending too long by consumers that went away."""
+    min_idle_ms = settings.JOB_QUEUE_CLAIM_IDLE_SECONDS * 1000
+    while not self._stopping.is_set():
+      await asyncio.sleep(RECLAIM_INTERVAL_SECONDS)
+      for queue_name in self.queues:
+        try:
+          client = await self.redis_service.get_client()
+          try:
+            result = await client.xautoclaim(
+                stream_key(queue_name), JOBS_CONSUMER_GROUP, self.consumer_name,
+                min_idle_time=min_idle_ms, start_id="0-0",
+                count=get_queue_config(queue_name).concurrency,
+            )
+          finally:
+            await client.close()
+          claimed = result[1] if result else []
+          for message_id, fields in claimed:
+            if fields:
+              logger.warning(
+                  f"Reclaimed stalled job {fields.get('name')} ({message_id}) on '{queue_name}'")
+              await self._start(queue_name, message_id, fields)
+        except Exception as e:
+          logger.error(f"Error reclaiming stalled jobs on '{queue_name}': {e}")
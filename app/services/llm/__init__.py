@@ -0,0 +1,23 @@
+# app/services/llm/__init__.py
+
+"""
+LLM execution layer.
+Runs blocking LLM (Marvin) calls off the event loop with per-provider
+concurrency limits, timeouts and per-call-type metrics.
+"""
+
+from .executor import (
+    LLMExecutor,
+    LLMOverloadedError,
+    LLMTimeoutError,
+    estimate_tokens,
+    llm_executor,
+)
+
+__all__ = [
+    "LLMExecutor",
+    "LLMOverloadedError",
+    "LLMTimeoutError",
+    "estimate_tokens",
+    "llm_executor",
+]
@@ -0,0 +1,218 @@
+# app/services/llm/executor.py
+
+"""
+Async-safe execution layer for blocking LLM calls.
+Marvin functions are synchronous network calls; this runs them on a dedicated
+thread pool so the event loop keeps serving requests, and enforces per-provider
+concurrency, a bounded wait queue and call timeouts. Latency, queue wait and
+estimated token counts are recorded per call type.
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+import logfire
+
+from app.core.config import settings
+
+# Rough characters-per-token ratio used when the provider does not report usage
+CHARS_PER_TOKEN = 4
+
+
+class LLMOverloadedError(RuntimeError):
+  """Raised when a provider's wait queue is full."""
+
+
+class LLMTimeoutError(asyncio.TimeoutError):
+  """Raised when an LLM call (or its wait for a slot) exceeds its timeout."""
+
+
+def estimate_tokens(value: Any) -> int:
+  """Estimates tokens for a prompt argument or result from its text length."""
+  if value is None:
+    return 0
+  if hasattr(value, "model_dump_json"):
+    text = value.model_dump_json()
+  elif isinstance(value, str):
+    text = value
+  else:
+    try:
+      text = json.dumps(value, default=str)
+    except (TypeError, ValueError):
+      text = str(value)
+  return max(len(text) // CHARS_PER_TOKEN, 1)
+
+
+@dataclass
+class CallTypeStats:
+  """Counters for one call type (e.g. 'classification.lead')."""
+
+  calls: int = 0
+  errors: int = 0
+  timeouts: int = 0
+  rejected: int = 0
+  latency_ms_sum: float = 0.0
+  latency_ms_max: float = 0.0
+  queue_wait_ms_sum: float = 0.0
+  input_tokens_estimated: int = 0
+  output_tokens_estimated: int = 0
+  last_error: Optional[str] = None
+
+  def to_dict(self) -> Dict[str, Any]:
+    completed = self.calls - self.errors - self.timeouts
+    return {
+        "calls": self.calls,
+        "errors": self.errors,
+        "timeouts": self.timeouts,
+        "rejected": self.rejected,
+        "avg_latency_ms": round(self.latency_ms_sum / self.calls, 2) if self.calls else None,
+        "max_latency_ms": round(self.latency_ms_max, 2),
+        "avg_queue_wait_ms": round(self.queue_wait_ms_sum / self.calls, 2) if self.calls else None,
+        "input_tokens_estimated": self.input_tokens_estimated,
+        "output_tokens_estimated": self.output_tokens_estimated,
+        "completed": completed,
+        "last_error": self.last_error,
+    }
+
+
+@dataclass
+class _ProviderLimiter:
+  slots: asyncio.Semaphore
+  max_queued: int
+  waiting: int = 0
+  in_flight: int = 0
+
+
+class LLMExecutor:
+  """
+  Runs blocking LLM functions off the event loop with per-provider limits.
+
+  Calls beyond a provider's concurrency wait in a bounded queue; once
+  LLM_MAX_QUEUED callers are waiting, new calls fail fast with
+  LLMOverloadedError. A timed-out call releases its slot and returns to the
+  caller; the worker thread finishes in the background.
+  """
+
+  def __init__(
+      self,
+      max_concurrency: Optional[int] = None,
+      max_queued: Optional[int] = None,
+      call_timeout: Optional[float] = None,
+      queue_timeout: Optional[float] = None,
+  ):
+    self.max_concurrency = max(max_concurrency or settings.LLM_MAX_CONCURRENCY, 1)
+    self.max_queued = max_queued if max_queued is not None else settings.LLM_MAX_QUEUED
+    self.call_timeout = call_timeout or settings.LLM_CALL_TIMEOUT_SECONDS
+    self.queue_timeout = queue_timeout or settings.LLM_QUEUE_TIMEOUT_SECONDS
+    self._limiters: Dict[str, _ProviderLimiter] = {}
+    self._stats: Dict[str, CallTypeStats] = {}
+    self._pool: Optional[ThreadPoolExecutor] = None
+
+  @property
+  def pool(self) -> ThreadPoolExecutor:
+    """Dedicated threads so LLM calls never starve the loop's default executor."""
+    if self._pool is None:
+      self._pool = ThreadPoolExecutor(
+          max_workers=self.max_concurrency * 2, thread_name_prefix="llm")
+    return self._pool
+
+  def _limiter(self, provider: str) -> _ProviderLimiter:
+    limiter = self._limiters.get(provider)
+    if limiter is None:
+      limiter = _ProviderLimiter(asyncio.Semaphore(self.max_concurrency), self.max_queued)
+      self._limiters[provider] = limiter
+    return limiter
+
+  def _stats_for(self, call_type: str) -> CallTypeStats:
+    return self._stats.setdefault(call_type, CallTypeStats())
+
+  async def run(
+      self,
+      call_type: str,
+      func: Callable[..., Any],
+      *args: Any,
+      provider: Optional[str] = None,
+      timeout: Optional[float] = None,
+      **kwargs: Any,
+  ) -> Any:
+    """
+    Runs `func(*args, **kwargs)` on the LLM thread pool and returns its result.
+
+    Raises LLMOverloadedError when the provider queue is full and
+    LLMTimeoutError when waiting for a slot or the call itself times out.
+    """
+    provider = (provider or settings.LLM_PROVIDER or "default").lower()
+    limiter = self._limiter(provider)
+    stats = self._stats_for(call_type)
+
+    if limiter.slots.locked() and limiter.waiting >= limiter.max_queued:
+      stats.rejected += 1
+      logfire.warning(f"LLM queue full for provider '{provider}'; rejecting {call_type}",
+                      waiting=limiter.waiting, in_flight=limiter.in_flight)
+      raise LLMOverloadedError(
+          f"LLM provider '{provider}' is overloaded ({limiter.waiting} calls waiting)")
+
+    queued_at = time.perf_counter()
+    limiter.waiting += 1
+    try:
+      await asyncio.wait_for(limiter.slots.acquire(), timeout=self.queue_timeout)
+    except asyncio.TimeoutError as e:
+      stats.rejected += 1
+      raise LLMTimeoutError(
+          f"Timed out after {self.queue_timeout}s waiting for an LLM slot ({call_type})") from e
+    finally:
+      limiter.waiting -= 1
+
+    queue_wait_ms = (time.perf_counter() - queued_at) * 1000
+    limiter.in_flight += 1
+    started = time.perf_counter()
+    stats.calls += 1
+    stats.queue_wait_ms_sum += queue_wait_ms
+    stats.input_tokens_estimated += sum(estimate_tokens(a) for a in args) + \
+        sum(estimate_tokens(v) for v in kwargs.values())
+    try:
+      loop = asyncio.get_running_loop()
+      future = loop.run_in_executor(self.pool, lambda: func(*args, **kwargs))
+      result = await asyncio.wait_for(future, timeout=timeout or self.call_timeout)
+      stats.output_tokens_estimated += estimate_tokens(result)
+      return result
+    except asyncio.TimeoutError as e:
+      stats.timeouts += 1
+      stats.last_error = "timeout"
+      raise LLMTimeoutError(
+          f"LLM call {call_type} timed out after {timeout or self.call_timeout}s") from e
+    except Exception as e:
+      stats.errors += 1
+      stats.last_error = f"{type(e).__name__}: {e}"[:300]
+      raise
+    finally:
+      latency_ms = (time.perf_counter() - started) * 1000
+      stats.latency_ms_sum += latency_ms
+      stats.latency_ms_max = max(stats.latency_ms_max, latency_ms)
+      limiter.in_flight -= 1
+      limiter.slots.release()
+      logfire.debug(f"LLM call {call_type} finished",
+                    provider=provider,
+                    latency_ms=round(latency_ms, 2),
+                    queue_wait_ms=round(queue_wait_ms, 2))
+
+  def get_stats(self) -> Dict[str, Any]:
+    """Per-provider load and per-call-type metrics."""
+    return {
+        "max_concurrency_per_provider": self.max_concurrency,
+        "max_queued_per_provider": self.max_queued,
+        "call_timeout_seconds": self.call_timeout,
+        "providers": {
+            name: {"in_flight": limiter.in_flight, "waiting": limiter.waiting}
+            for name, limiter in self._limiters.items()
+        },
+        "call_types": {name: stats.to_dict() for name, stats in self._stats.items()},
+    }
+
+
+# Process-wide executor shared by classification and transcript extraction
+llm_executor = LLMExecutor()
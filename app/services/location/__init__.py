@@ -5,9 +5,11 @@ Location service module - reorganized for better maintainability.
 This module provides location operations organized into focused submodules:
 - parsing: Address parsing and normalization utilities
 - cache: Redis caching operations for branches and states
+- geocode: Redis-backed geocodes shared across instances
 - google: Google Maps API operations
 - areas: Service area validation
 - distance: Distance calculation logic
+- prewarm: Background refresh of cached distances for popular addresses
 - service: Main LocationService class
 """
 
@@ -1,2 +1,10 @@
 # filepath: app/services/location/cache/__init__.py
-from .operations import LocationCacheOperations
+from .operations import (
+    BranchSetChange,
+    LocationCacheOperations,
+    branch_set_version,
+    branch_version,
+    distance_cache_keyspace,
+    unresolvable_location_keyspace,
+)
+from .codec import pack_distance_result, unpack_distance_result
@@ -0,0 +1,67 @@
+# filepath: app/services/location/cache/codec.py
+"""
+Compact encoding of cached DistanceResults.
+Entries are stored as a flat list instead of a model dump: no field names,
+no nested branch object, coordinates as a [latitude, longitude] pair. The
+first element is the layout version. Entries are still validated on load:
+pydantic-core validation is cheaper than model_construct, which runs in
+Python. Dicts written before the compact layout are still accepted.
+
+The layout is only written once REDIS_SERIALIZER selects a versioned format:
+processes from before this change cannot read it, so under the "json"
+default entries keep the plain model dump.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+from app.models.location import DistanceResult
+from app.services.redis.serializer import get_serializer
+
+DISTANCE_LAYOUT_VERSION = 1
+
+
+def pack_distance_result(
+    result: DistanceResult, compact: Optional[bool] = None
+) -> Union[List[Any], Dict[str, Any]]:
+  """The cache entry for `result`; `compact` defaults to whether the serializer is versioned."""
+  if compact is None:
+    compact = bool(get_serializer().version)
+  if not compact:
+    return result.model_dump()
+  coordinates = result.geocoded_coordinates
+  if coordinates is not None and set(coordinates) == {"latitude", "longitude"}:
+    coordinates = [coordinates["latitude"], coordinates["longitude"]]
+  return [
+      DISTANCE_LAYOUT_VERSION,
+      result.nearest_branch.name,
+      result.nearest_branch.address,
+      result.delivery_location,
+      result.distance_miles,
+      result.distance_meters,
+      result.duration_seconds,
+      result.within_service_area,
+      coordinates,
+      result.is_distance_estimated,
+  ]
+
+
+def unpack_distance_result(payload: Any) -> DistanceResult:
+  """Rebuilds a cached DistanceResult; raises ValueError for unknown layouts."""
+  if isinstance(payload, dict):
+    return DistanceResult(**payload)
+  if not isinstance(payload, list) or not payload or payload[0] != DISTANCE_LAYOUT_VERSION:
+    raise ValueError(f"Unknown cached distance layout: {str(payload)[:80]}")
+  (_, branch_name, branch_address, delivery_location, distance_miles, distance_meters,
+   duration_seconds, within_service_area, coordinates, is_distance_estimated) = payload
+  if isinstance(coordinates, list):
+    coordinates = {"latitude": coordinates[0], "longitude": coordinates[1]}
+  return DistanceResult(
+      nearest_branch={"name": branch_name, "address": branch_address},
+      delivery_location=delivery_location,
+      distance_miles=distance_miles,
+      distance_meters=distance_meters,
+      duration_seconds=duration_seconds,
+      within_service_area=within_service_area,
+      geocoded_coordinates=coordinates,
+      is_distance_estimated=is_distance_estimated,
+  )
@@ -1,10 +1,72 @@
 # filepath: app/services/location/cache/operations.py
+import hashlib
+import time
 import logfire
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 from app.models.location import BranchLocation
 from app.services.redis.service import RedisService
-from app.services.mongo import MongoService, SHEET_STATES_COLLECTION
-from app.core.keys import BRANCH_LIST_CACHE_KEY, STATES_LIST_CACHE_KEY
+from app.services.redis.index import IndexedKeyspace
+from app.services.redis.revalidate import RevalidatingCache
+from app.services.mongo import MongoService, SHEET_BRANCHES_COLLECTION, SHEET_STATES_COLLECTION
+from app.core.keys import (
+    BRANCH_LIST_CACHE_KEY,
+    BRANCH_SET_VERSION_KEY,
+    DISTANCE_CACHE_INDEX_KEY,
+    DISTANCE_DEMAND_KEY,
+    DISTANCE_CACHE_PREFIX,
+    STATES_LIST_CACHE_KEY,
+    UNRESOLVABLE_LOCATION_INDEX_KEY,
+    UNRESOLVABLE_LOCATION_PREFIX,
+)
+from app.core.telemetry import detail
+
+
+def distance_cache_keyspace(redis_service: RedisService) -> IndexedKeyspace:
+  """The indexed namespace holding cached branch -> delivery distances."""
+  return IndexedKeyspace(redis_service, DISTANCE_CACHE_INDEX_KEY, DISTANCE_CACHE_PREFIX)
+
+
+def unresolvable_location_keyspace(redis_service: RedisService) -> IndexedKeyspace:
+  """The indexed namespace holding delivery locations Google could not resolve."""
+  return IndexedKeyspace(redis_service, UNRESOLVABLE_LOCATION_INDEX_KEY, UNRESOLVABLE_LOCATION_PREFIX)
+
+
+def _normalize_location(location: str) -> str:
+  return "".join(filter(str.isalnum, location)).lower()
+
+
+def branch_version(branch_address: str) -> str:
+  """
+  Namespace of a branch's cached distances. It depends only on the address,
+  so renaming a branch keeps its entries and moving it starts a new namespace.
+  """
+  return hashlib.sha1(_normalize_location(branch_address).encode("utf-8")).hexdigest()[:12]
+
+
+def branch_set_version(branches: List[BranchLocation]) -> str:
+  """Version of the whole branch list; changes with any add, move or rename."""
+  lines = sorted(f"{branch.name}|{_normalize_location(branch.address)}" for branch in branches)
+  return hashlib.sha1("\n".join(lines).encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass
+class BranchSetChange:
+  """Difference between the stored branch set and a newly synced one."""
+
+  version: str
+  previous_version: Optional[str] = None
+  added: List[BranchLocation] = field(default_factory=list)
+  removed: List[BranchLocation] = field(default_factory=list)
+  renamed: List[BranchLocation] = field(default_factory=list)
+
+  @property
+  def changed(self) -> bool:
+    return self.version != self.previous_version
+
+
+# Process-wide, so the last known good list outlives per-request instances
+branch_list_cache: RevalidatingCache = RevalidatingCache(BRANCH_LIST_CACHE_KEY)
 
 
 class LocationCacheOperations:
@@ -13,39 +75,25 @@ class LocationCacheOperations:
   def __init__(self, redis_service: RedisService, mongo_service: MongoService):
     self.redis_service = redis_service
     self.mongo_service = mongo_service
+    self.distance_cache = distance_cache_keyspace(redis_service)
+    self.unresolvable_cache = unresolvable_location_keyspace(redis_service)
 
   async def get_branches_from_cache(self) -> List[BranchLocation]:
-    """Loads the list of branches from Redis cache. Logs errors to MongoDB."""
+    """
+    Loads the list of branches from Redis cache. If the key is lost, the last
+    known good list is served while one rebuild from MongoDB refreshes it.
+    Errors are logged to MongoDB at a limited rate.
+    """
     try:
-      branches_data = await self.redis_service.get_json(BRANCH_LIST_CACHE_KEY)
-      if branches_data is None:
-        msg = f"Branch list key '{BRANCH_LIST_CACHE_KEY}' not found in Redis cache. Run sheet sync."
-        logfire.error(msg)
-        await self.mongo_service.log_error_to_db(
-            service_name="LocationCacheOperations.get_branches_from_cache",
-            error_type="CacheMiss",
-            message=msg,
-            details={"cache_key": BRANCH_LIST_CACHE_KEY},
-        )
-        return []
-
-      if not isinstance(branches_data, list):
-        msg = f"Branch list data in Redis cache key '{BRANCH_LIST_CACHE_KEY}' is not a list."
-        logfire.error(msg)
-        await self.mongo_service.log_error_to_db(
-            service_name="LocationCacheOperations.get_branches_from_cache",
-            error_type="CacheFormatError",
-            message=msg,
-            details={
-                "cache_key": BRANCH_LIST_CACHE_KEY,
-                "data_type": str(type(branches_data)),
-            },
-        )
-        return []
-
+      branches_data = await branch_list_cache.get(
+          self._read_branch_list,
+          self._load_branch_list_from_mongo,
+          write=lambda data: self.redis_service.set_json(BRANCH_LIST_CACHE_KEY, data),
+          report=self._report_branch_cache_error,
+      )
       if not branches_data:
         logfire.warning(
-            f"Branch list loaded from Redis cache key '{BRANCH_LIST_CACHE_KEY}' is empty."
+            f"No branches available from Redis cache key '{BRANCH_LIST_CACHE_KEY}' or MongoDB. Run sheet sync."
         )
         return []
 
@@ -67,7 +115,8 @@ class LocationCacheOperations:
               },
           )
 
-      logfire.info(f"Loaded {len(branches)} branches from Redis cache.")
+      detail("Loaded {branch_count} branches from Redis cache.",
+             branch_count=len(branches))
       return branches
     except Exception as e:
       msg = f"Unexpected error parsing branch data from Redis cache key '{BRANCH_LIST_CACHE_KEY}'"
@@ -84,6 +133,32 @@ class LocationCacheOperations:
       )
       return []
 
+  async def _read_branch_list(self) -> Optional[List[Dict[str, Any]]]:
+    branches_data = await self.redis_service.get_json(BRANCH_LIST_CACHE_KEY)
+    if branches_data is not None and not isinstance(branches_data, list):
+      await branch_list_cache.report(
+          self._report_branch_cache_error,
+          "CacheFormatError",
+          f"Branch list data in Redis cache key '{BRANCH_LIST_CACHE_KEY}' is not a list.",
+          {"data_type": str(type(branches_data))},
+      )
+      return None
+    return branches_data
+
+  async def _load_branch_list_from_mongo(self) -> List[Dict[str, Any]]:
+    db = await self.mongo_service.get_db()
+    return await db[SHEET_BRANCHES_COLLECTION].find({}, {"_id": 0}).to_list(length=None)
+
+  async def _report_branch_cache_error(
+      self, error_type: str, message: str, details: Dict[str, Any]
+  ) -> None:
+    await self.mongo_service.log_error_to_db(
+        service_name="LocationCacheOperations.get_branches_from_cache",
+        error_type=error_type,
+        message=message,
+        details=details,
+    )
+
   async def get_states_from_cache_or_mongo(self) -> List[Dict[str, Any]]:
     """Gets states data from Redis cache, falls back to MongoDB if cache miss."""
     try:
@@ -121,7 +196,94 @@ class LocationCacheOperations:
       return []
 
   def get_cache_key(self, branch_address: str, delivery_location: str) -> str:
-    """Generate cache key for distance calculations."""
-    norm_branch = "".join(filter(str.isalnum, branch_address)).lower()
-    norm_delivery = "".join(filter(str.isalnum, delivery_location)).lower()
-    return f"maps:distance:{norm_branch}:{norm_delivery}"
+    """Generate cache key for distance calculations, namespaced by the branch version."""
+    norm_delivery = _normalize_location(delivery_location)
+    return f"{DISTANCE_CACHE_PREFIX}{branch_version(branch_address)}:{norm_delivery}"
+
+  async def record_branch_set(self, branches: List[BranchLocation]) -> BranchSetChange:
+    """
+    Stores the manifest of a freshly synced branch list and returns what
+    changed. Distances of removed or moved branches are cleared by namespace;
+    every other branch keeps its cached distances. The first manifest only
+    records the set, since there is nothing to compare it with.
+    """
+    manifest = await self.redis_service.get_json(BRANCH_SET_VERSION_KEY) or {}
+    previous: Dict[str, Dict[str, str]] = manifest.get("branches") or {}
+    current = {branch_version(branch.address): branch for branch in branches}
+    change = BranchSetChange(
+        version=branch_set_version(branches),
+        previous_version=manifest.get("version"),
+    )
+    if not change.changed:
+      return change
+
+    if previous:
+      change.added = [branch for version, branch in current.items() if version not in previous]
+      change.removed = [BranchLocation(**previous[version])
+                        for version in previous if version not in current]
+      change.renamed = [branch for version, branch in current.items()
+                        if version in previous and previous[version].get("name") != branch.name]
+
+    await self.redis_service.set_json(BRANCH_SET_VERSION_KEY, {
+        "version": change.version,
+        "branches": {version: branch.model_dump() for version, branch in current.items()},
+        "synced_at": time.time(),
+    })
+
+    for branch in change.removed:
+      cleared = await self.distance_cache.clear(f"{DISTANCE_CACHE_PREFIX}{branch_version(branch.address)}:*")
+      logfire.info(f"Cleared {cleared} cached distances of removed branch '{branch.name}'")
+    if change.added:
+      # Addresses with no route from the old branches may have one from a new branch
+      await self.unresolvable_cache.clear()
+
+    logfire.info(
+        "Branch set changed",
+        version=change.version,
+        previous_version=change.previous_version,
+        added=[branch.name for branch in change.added],
+        removed=[branch.name for branch in change.removed],
+        renamed=[branch.name for branch in change.renamed],
+    )
+    return change
+
+  def get_unresolvable_key(self, delivery_location: str) -> str:
+    """Generate the negative cache key for a delivery location."""
+    return f"{UNRESOLVABLE_LOCATION_PREFIX}{_normalize_location(delivery_location)}"
+
+  async def record_demand(self, delivery_location: str) -> None:
+    """Counts a distance request for the location; the pre-warmer refreshes the busiest first."""
+    client = None
+    try:
+      client = await self.redis_service.get_client()
+      await client.zincrby(DISTANCE_DEMAND_KEY, 1, delivery_location.strip())
+    except Exception as e:
+      logfire.warning(f"Failed to record distance demand for '{delivery_location}': {e}")
+    finally:
+      if client:
+        await client.close()
+
+  async def get_top_demand(self, limit: int) -> List[Tuple[str, float]]:
+    """(delivery location, request count) pairs, busiest first."""
+    client = None
+    try:
+      client = await self.redis_service.get_client()
+      return await client.zrevrange(DISTANCE_DEMAND_KEY, 0, limit - 1, withscores=True)
+    except Exception as e:
+      logfire.warning(f"Failed to read distance demand: {e}")
+      return []
+    finally:
+      if client:
+        await client.close()
+
+  async def trim_demand(self, keep: int) -> None:
+    """Drops all but the `keep` busiest locations from the demand ranking."""
+    client = None
+    try:
+      client = await self.redis_service.get_client()
+      await client.zremrangebyrank(DISTANCE_DEMAND_KEY, 0, -(keep + 1))
+    except Exception as e:
+      logfire.warning(f"Failed to trim distance demand: {e}")
+    finally:
+      if client:
+        await client.close()
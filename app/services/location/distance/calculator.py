@@ -1,12 +1,20 @@
 # filepath: app/services/location/distance/calculator.py
 import asyncio
+import time
 import logfire
 from typing import Optional, List
 from app.models.location import BranchLocation, DistanceResult
-from app.services.location.cache import LocationCacheOperations
+from app.services.location.cache import (
+    LocationCacheOperations,
+    branch_version,
+    pack_distance_result,
+    unpack_distance_result,
+)
 from app.services.location.google import GoogleMapsOperations
 from app.services.location.areas import ServiceAreaChecker
-from app.core.keys import MAPS_CACHE_HITS_KEY, MAPS_CACHE_MISSES_KEY
+from app.core.config import settings
+from app.core.keys import MAPS_CACHE_HITS_KEY, MAPS_CACHE_MISSES_KEY, MAPS_NEGATIVE_CACHE_HITS_KEY
+from app.core.telemetry import detail
 from app.services.background import increment_request_counter_bg
 from app.services.background.util import add_task_safely
 
@@ -40,7 +48,12 @@ class DistanceCalculator:
       app.services.background.util.attach_background_tasks(calculator, background_tasks)
     """
     success = False  # Initialize success flag for stat tracking
+    # Demand ranks the addresses the pre-warmer keeps fresh
+    if not add_task_safely(self, self.cache_ops.record_demand, delivery_location):
+      await self.cache_ops.record_demand(delivery_location)
     try:
+      unresolvable_key = self.cache_ops.get_unresolvable_key(delivery_location)
+
       # Check service area first
       within_service_area = await self.area_checker.check_service_area(delivery_location)
 
@@ -59,34 +72,51 @@ class DistanceCalculator:
         # success remains False
         return None
 
+      # One round trip for every branch's cached distance and the negative cache entry
+      cache_keys = [self.cache_ops.get_cache_key(branch.address, delivery_location)
+                    for branch in branches]
+      *cached_values, unresolvable = await self.cache_ops.redis_service.mget(
+          [*cache_keys, unresolvable_key])
+      # Addresses Google recently could not resolve are answered without any API work
+      if unresolvable and not any(cached_values):
+        detail(
+            "Negative cache hit: '{delivery_location}' was recently unresolvable",
+            delivery_location=delivery_location,
+        )
+        await increment_request_counter_bg(
+            self.cache_ops.redis_service, MAPS_NEGATIVE_CACHE_HITS_KEY
+        )
+        return None
+
       min_distance_meters = float("inf")
       nearest_branch: Optional[BranchLocation] = None
       best_duration_seconds: Optional[int] = None
       potential_results = []
+      # One flag per branch that needed the API: did Google definitively reject the address?
+      unresolvable_lookups: List[bool] = []
 
-      async def check_branch(branch: BranchLocation):
+      async def check_branch(branch: BranchLocation, cache_key: str, cached_value: Optional[str]):
         nonlocal min_distance_meters, nearest_branch, best_duration_seconds, potential_results
-        cache_key = self.cache_ops.get_cache_key(
-            branch.address, delivery_location)
-        cached_data = await self.cache_ops.redis_service.get_json(cache_key)
-
         api_call_needed = True
 
-        if cached_data:
-          logfire.info(
-              f"Cache hit for distance: '{branch.address}' -> '{delivery_location}'"
+        if cached_value:
+          detail(
+              "Cache hit for distance: '{branch_address}' -> '{delivery_location}'",
+              branch_address=branch.address,
+              delivery_location=delivery_location,
           )
           try:
+            cached_data = self.cache_ops.redis_service.decode(cached_value)
             # Handle legacy cached data that might not have within_service_area field
-            if 'within_service_area' not in cached_data:
+            if isinstance(cached_data, dict) and 'within_service_area' not in cached_data:
               cached_data['within_service_area'] = within_service_area
 
-            distance_result = DistanceResult(**cached_data)
-            if (
-                distance_result.nearest_branch
-                and distance_result.nearest_branch.name == branch.name
-                and distance_result.nearest_branch.address == branch.address
-            ):
+            distance_result = unpack_distance_result(cached_data)
+            cached_branch = distance_result.nearest_branch
+            if cached_branch and branch_version(cached_branch.address) == branch_version(branch.address):
+              # Same namespace means the same branch address; a renamed branch keeps its distance
+              if cached_branch.name != branch.name or cached_branch.address != branch.address:
+                distance_result.nearest_branch = branch
               potential_results.append(distance_result)
               await increment_request_counter_bg(
                   self.cache_ops.redis_service, MAPS_CACHE_HITS_KEY
@@ -96,12 +126,12 @@ class DistanceCalculator:
               logfire.warning(
                   f"Cached data for key {cache_key} has mismatched branch info ({distance_result.nearest_branch}) vs current ({branch}). Will refetch."
               )
-              await self.cache_ops.redis_service.delete(cache_key)
+              await self.cache_ops.distance_cache.delete(cache_key)
           except Exception as e:
             logfire.warning(
                 f"Error parsing cached data for key {cache_key}: {e}. Will refetch."
             )
-            await self.cache_ops.redis_service.delete(cache_key)
+            await self.cache_ops.distance_cache.delete(cache_key)
             # Log this specific cache parsing error to MongoDB
             await self.cache_ops.mongo_service.log_error_to_db(
                 service_name="DistanceCalculator.get_distance_to_nearest_branch.check_branch",
@@ -119,9 +149,11 @@ class DistanceCalculator:
           await increment_request_counter_bg(
               self.cache_ops.redis_service, MAPS_CACHE_MISSES_KEY
           )
-          distance_info = await self.google_ops.get_distance_from_google(
+          lookup = await self.google_ops.lookup_distance(
               branch.address, delivery_location
           )
+          unresolvable_lookups.append(lookup.unresolvable)
+          distance_info = lookup.result
           if distance_info:
             distance_meters = distance_info["distance_meters"]
             duration_seconds = distance_info["duration_seconds"]
@@ -138,14 +170,26 @@ class DistanceCalculator:
                 is_distance_estimated=False,
             )
             potential_results.append(result)
-            await self.cache_ops.redis_service.set_json(
-                cache_key, result.model_dump(), ttl=CACHE_TTL_SECONDS
+            await self.cache_ops.distance_cache.set_json(
+                cache_key, pack_distance_result(result), ttl=CACHE_TTL_SECONDS
             )
-          # else: get_distance_from_google already logged the error to DB
+          # else: lookup_distance already logged the error to DB
 
-      await asyncio.gather(*(check_branch(branch) for branch in branches))
+      await asyncio.gather(*(check_branch(branch, cache_key, cached_value)
+                             for branch, cache_key, cached_value
+                             in zip(branches, cache_keys, cached_values)))
 
       if not potential_results:
+        if unresolvable_lookups and all(unresolvable_lookups):
+          await self.cache_ops.unresolvable_cache.set_json(
+              unresolvable_key,
+              {
+                  "delivery_location": delivery_location,
+                  "branches_checked": len(branches),
+                  "cached_at": time.time(),
+              },
+              ttl=settings.UNRESOLVABLE_LOCATION_TTL_SECONDS,
+          )
         msg = f"Could not determine distance to any branch for location: {delivery_location}. All Google Maps API calls may have failed or returned no valid data."
         logfire.error(msg)
         await self.cache_ops.mongo_service.log_error_to_db(
@@ -161,15 +205,15 @@ class DistanceCalculator:
         return None
 
       final_result = min(potential_results, key=lambda r: r.distance_meters)
-      logfire.info(
-          f"Nearest branch to '{delivery_location}' is '{final_result.nearest_branch.name}' ({final_result.distance_miles:.2f} miles)"
+      detail(
+          "Nearest branch to '{delivery_location}' is '{branch_name}' ({distance_miles} miles)",
+          delivery_location=delivery_location,
+          branch_name=final_result.nearest_branch.name,
+          distance_miles=final_result.distance_miles,
       )
       success = True  # Set success to True as we have a result
       return final_result
     finally:
-      # Use our utility function to safely add a background task
-      from app.services.background.util import add_task_safely
-
       # Increment location lookup stats in a background task if available
       add_task_safely(
           self,
@@ -177,10 +221,12 @@ class DistanceCalculator:
           LOCATION_LOOKUP_STAT_NAME,
           success)
 
-  async def prefetch_distance(self, delivery_location: str):
+  async def prefetch_distance(self, delivery_location: str, raise_errors: bool = False):
     """
     Triggers the distance calculation and caching in the background.
-    Used by the early location lookup webhook. Logs errors to MongoDB.
+    Used by the early location lookup webhook. Logs errors to MongoDB. With
+    `raise_errors` (job worker) an error, or a lookup that found no distance
+    for an address not known to be unresolvable, raises so the job is retried.
     The stat incrementation is handled by get_distance_to_nearest_branch.
 
     Note: 
@@ -190,7 +236,7 @@ class DistanceCalculator:
     logfire.info(f"Prefetching distance for location: {delivery_location}")
     try:
       # The success/failure of this operation will be recorded by get_distance_to_nearest_branch's finally block.
-      await self.get_distance_to_nearest_branch(delivery_location)
+      result = await self.get_distance_to_nearest_branch(delivery_location)
     except Exception as e:
       msg = (
           f"Error prefetching distance for location {delivery_location}: {str(e)}"
@@ -207,3 +253,12 @@ class DistanceCalculator:
               "args": e.args,
           },
       )
+      if raise_errors:
+        raise
+      return
+
+    # A failed lookup was already logged; only a transient one is worth retrying
+    if result is None and raise_errors:
+      unresolvable_key = self.cache_ops.get_unresolvable_key(delivery_location)
+      if not await self.cache_ops.redis_service.exists(unresolvable_key):
+        raise RuntimeError(f"No distance calculated for '{delivery_location}'")
@@ -0,0 +1,16 @@
+# filepath: app/services/location/geocode/__init__.py
+from .store import (
+    GeocodeRecord,
+    GeocodeStore,
+    canonical_address,
+    get_geocode_store,
+    prepare_geocode_store,
+)
+
+__all__ = [
+    "GeocodeRecord",
+    "GeocodeStore",
+    "canonical_address",
+    "get_geocode_store",
+    "prepare_geocode_store",
+]
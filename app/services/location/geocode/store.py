@@ -0,0 +1,211 @@
+# filepath: app/services/location/geocode/store.py
+"""
+Geocodes shared by every instance and every consumer.
+Each canonical address has one Redis record holding its coordinates, parsed
+components and the address variation Google's Distance Matrix accepted.
+Records live under a versioned prefix, so bumping GEOCODE_STORE_VERSION
+starts a fresh namespace; the old one is cleared at startup or ages out with
+its TTL. A small per-process LRU sits in front so hot addresses skip the
+round trip.
+"""
+
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
+
+import logfire
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.keys import GEOCODE_STORE_INDEX_KEY, GEOCODE_STORE_PREFIX
+from app.services.location.parsing import extract_location_components
+from app.services.mongo import MongoService
+from app.services.redis.index import IndexedKeyspace
+from app.services.redis.service import RedisService
+
+LOCAL_CACHE_SIZE = 2048
+# One worker warms each store version per interval; the rest skip it
+WARMUP_INTERVAL_SECONDS = 24 * 3600
+# Held while one worker loads; expires so a killed warm-up can be retried
+WARMUP_LOCK_SECONDS = 600
+
+_PUNCTUATION = re.compile(r"[^\w\s#-]")
+
+# Process-wide so per-request service instances share it
+_recent_records: "OrderedDict[str, GeocodeRecord]" = OrderedDict()
+
+
+def canonical_address(address: str, state_code: Optional[str] = None) -> str:
+  """Lower-cased, punctuation-free form so spellings of one address share a record."""
+  canonical = " ".join(_PUNCTUATION.sub(" ", address.lower()).split())
+  if state_code and state_code.strip():
+    canonical = f"{canonical} | {state_code.strip().lower()}"
+  return canonical
+
+
+@dataclass
+class GeocodeRecord:
+  """What is known about one canonical address."""
+
+  latitude: float
+  longitude: float
+  address: str = ""
+  components: Dict[str, Optional[str]] = field(default_factory=dict)
+  # Address variation Google's Distance Matrix accepted, probed first next time
+  variation: Optional[str] = None
+  formatted_address: Optional[str] = None
+  # google, nominatim or history (warmed from MongoDB)
+  source: str = "google"
+  version: int = 0
+  stored_at: float = 0.0
+
+  @property
+  def coordinates(self) -> Dict[str, float]:
+    return {"latitude": self.latitude, "longitude": self.longitude}
+
+  def to_payload(self) -> Dict[str, Any]:
+    return asdict(self)
+
+  @classmethod
+  def from_payload(cls, payload: Any, version: int) -> Optional["GeocodeRecord"]:
+    """None for malformed records or ones written by another store version."""
+    if not isinstance(payload, dict) or payload.get("version") != version:
+      return None
+    try:
+      return cls(**{**payload,
+                    "latitude": float(payload["latitude"]),
+                    "longitude": float(payload["longitude"])})
+    except (KeyError, TypeError, ValueError):
+      return None
+
+
+class GeocodeStore:
+  """Redis-backed canonical address -> GeocodeRecord store."""
+
+  def __init__(
+      self,
+      redis_service: RedisService,
+      version: Optional[int] = None,
+      ttl: Optional[int] = None,
+      local_cache: Optional["OrderedDict[str, GeocodeRecord]"] = None,
+  ):
+    self.redis_service = redis_service
+    self.version = version or settings.GEOCODE_STORE_VERSION
+    self.ttl = ttl or settings.GEOCODE_STORE_TTL_SECONDS
+    self.keyspace = IndexedKeyspace(redis_service, GEOCODE_STORE_INDEX_KEY, GEOCODE_STORE_PREFIX)
+    self.local = _recent_records if local_cache is None else local_cache
+
+  def key(self, address: str, state_code: Optional[str] = None) -> str:
+    digest = hashlib.sha1(canonical_address(address, state_code).encode("utf-8")).hexdigest()
+    return f"{GEOCODE_STORE_PREFIX}v{self.version}:{digest}"
+
+  def _remember(self, key: str, record: GeocodeRecord) -> None:
+    self.local[key] = record
+    self.local.move_to_end(key)
+    if len(self.local) > LOCAL_CACHE_SIZE:
+      self.local.popitem(last=False)
+
+  async def get(self, address: Optional[str], state_code: Optional[str] = None) -> Optional[GeocodeRecord]:
+    if not address or not address.strip():
+      return None
+    key = self.key(address, state_code)
+    record = self.local.get(key)
+    if record is not None:
+      self.local.move_to_end(key)
+      return record
+    record = GeocodeRecord.from_payload(await self.redis_service.get_json(key), self.version)
+    if record is not None:
+      self._remember(key, record)
+    return record
+
+  async def put(self, address: str, record: GeocodeRecord, state_code: Optional[str] = None) -> bool:
+    key = self.key(address, state_code)
+    record.address = canonical_address(address, state_code)
+    record.version = self.version
+    record.stored_at = time.time()
+    self._remember(key, record)
+    return await self.keyspace.set_json(key, record.to_payload(), ttl=self.ttl)
+
+  async def warm_up(self, mongo_service: MongoService, limit: Optional[int] = None) -> int:
+    """
+    Loads coordinates of historic location lookups without overwriting
+    records that are already stored. Returns the number of records written.
+    """
+    marker = f"{GEOCODE_STORE_INDEX_KEY}:warmed:v{self.version}"
+    lock = f"{GEOCODE_STORE_INDEX_KEY}:warming:v{self.version}"
+    if await self.redis_service.exists(marker):
+      return 0
+    if not await self.redis_service.set_if_not_exists(lock, "1", ttl=WARMUP_LOCK_SECONDS):
+      return 0
+
+    try:
+      written = await self._load_history(mongo_service, limit)
+    except RedisError as e:
+      logfire.warning(f"Geocode store warm-up failed; retrying on the next start: {e}")
+      return 0
+    finally:
+      await self.redis_service.delete(lock)
+    # Marked only once the records are written, so a failed warm-up is retried
+    await self.redis_service.set(marker, "1", ttl=WARMUP_INTERVAL_SECONDS)
+    return written
+
+  async def _load_history(self, mongo_service: MongoService, limit: Optional[int]) -> int:
+    docs = await mongo_service.get_geocoded_locations(limit or settings.GEOCODE_WARMUP_LIMIT)
+    now = time.time()
+    items: Dict[str, Dict[str, Any]] = {}
+    # Newest first, so the latest coordinates of an address win
+    for doc in docs:
+      address = doc.get("delivery_location")
+      coordinates = doc.get("geocoded_coordinates") or {}
+      if not address or coordinates.get("latitude") is None or coordinates.get("longitude") is None:
+        continue
+      key = self.key(address)
+      if key in items:
+        continue
+      items[key] = GeocodeRecord(
+          latitude=coordinates["latitude"],
+          longitude=coordinates["longitude"],
+          address=canonical_address(address),
+          components=extract_location_components(address),
+          source="history",
+          version=self.version,
+          stored_at=now,
+      ).to_payload()
+
+    written = await self.keyspace.set_many_json(items, ttl=self.ttl, only_new=True, strict=True)
+    logfire.info("Geocode store warmed from location history",
+                 candidates=len(items), written=written, version=self.version)
+    return written
+
+  async def clear_stale_versions(self) -> int:
+    """Unlinks records written by earlier store versions."""
+    cleared = 0
+    for version in range(1, self.version):
+      cleared += await self.keyspace.clear(f"{GEOCODE_STORE_PREFIX}v{version}:*")
+    return cleared
+
+  async def count(self) -> int:
+    return await self.keyspace.count()
+
+
+_shared_store: Optional[GeocodeStore] = None
+
+
+def get_geocode_store() -> GeocodeStore:
+  """Process-wide store for callers outside the service container, such as app.utils.location."""
+  global _shared_store
+  if _shared_store is None:
+    _shared_store = GeocodeStore(RedisService())
+  return _shared_store
+
+
+async def prepare_geocode_store(mongo_service: MongoService) -> int:
+  """Startup hook: drops records of earlier versions, then warms the current one."""
+  store = get_geocode_store()
+  cleared = await store.clear_stale_versions()
+  if cleared:
+    logfire.info("Cleared stale geocode store records", cleared=cleared, version=store.version)
+  return await store.warm_up(mongo_service)
@@ -1,2 +1,2 @@
 # filepath: app/services/location/google/__init__.py
-from .operations import GoogleMapsOperations
+from .operations import DistanceLookup, GoogleMapsOperations
@@ -1,16 +1,16 @@
 # filepath: app/services/location/google/operations.py
 import asyncio
 import functools
+from dataclasses import replace
 import logfire
 import time
-from typing import Dict, Any, Optional
-import googlemaps
-from googlemaps.exceptions import ApiError, HTTPError, Timeout, TransportError
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from fastapi import BackgroundTasks
 from app.core.config import settings
 from app.services.redis.service import RedisService
 from app.services.mongo import MongoService
-from app.services.location.parsing import parse_and_normalize_address
+from app.services.location.geocode import GeocodeRecord, GeocodeStore
+from app.services.location.parsing import extract_location_components, parse_and_normalize_address
 from app.core.keys import GMAPS_API_CALLS_KEY, GMAPS_API_ERRORS_KEY
 from app.services.background import increment_request_counter_bg, record_external_api_latency_bg
 from app.services.background.util import add_task_safely
@@ -18,6 +18,18 @@ from app.utils.latency import LatencyTracker
 
 MILES_PER_METER = 0.000621371
 
+# Element statuses meaning Google understood the request but the address has no route;
+# anything else (quota, transport errors, timeouts) is treated as transient
+UNRESOLVABLE_ELEMENT_STATUSES = frozenset({"NOT_FOUND", "ZERO_RESULTS"})
+
+
+class DistanceLookup(NamedTuple):
+  """Outcome of one origin -> destination lookup."""
+
+  result: Optional[Dict[str, Any]]
+  # True only when every variation was definitively rejected by Google
+  unresolvable: bool = False
+
 
 class GoogleMapsOperations:
   """Handles Google Maps API operations for location service."""
@@ -25,9 +37,18 @@ class GoogleMapsOperations:
   def __init__(self, redis_service: RedisService, mongo_service: MongoService):
     self.redis_service = redis_service
     self.mongo_service = mongo_service
-    self.gmaps = googlemaps.Client(key=settings.GOOGLE_MAPS_API_KEY)
+    self.geocode_store = GeocodeStore(redis_service)
+    self._gmaps = None
+
+  @property
+  def gmaps(self):
+    """Google Maps client, created on first use so the SDK is not imported at startup."""
+    if self._gmaps is None:
+      import googlemaps
+      self._gmaps = googlemaps.Client(key=settings.GOOGLE_MAPS_API_KEY)
+    return self._gmaps
 
-  async def _get_geocoded_coordinates(self, address: str) -> Optional[Dict[str, float]]:
+  async def geocode_coordinates(self, address: str) -> Optional[Dict[str, float]]:
     """Get geocoded coordinates for an address using Google Geocoding API."""
     if not self.gmaps:
       return None
@@ -55,10 +76,123 @@ class GoogleMapsOperations:
 
     return None
 
+  async def _distance_matrix(self, origin: str, destinations: List[str]) -> Dict[str, Any]:
+    """One Distance Matrix request from `origin` to every destination."""
+    from app.services.background.util import get_background_tasks
+
+    await increment_request_counter_bg(self.redis_service, GMAPS_API_CALLS_KEY)
+    loop = asyncio.get_running_loop()
+    func_call = functools.partial(
+        self.gmaps.distance_matrix,  # type: ignore
+        origins=[origin],
+        destinations=destinations,
+        mode="driving",
+    )
+    bg_tasks = get_background_tasks(self)
+    if bg_tasks:
+      with LatencyTracker(
+          service_type="gmaps",
+          redis_service=self.redis_service,
+          background_tasks=bg_tasks,
+          operation_name="distance_matrix",
+          request_id=f"{origin}:{destinations[0]}"
+      ):
+        return await loop.run_in_executor(None, func_call)
+    return await loop.run_in_executor(None, func_call)
+
+  async def distance_matrix_elements(
+      self, origin: str, destinations: List[str]
+  ) -> Dict[str, Dict[str, Any]]:
+    """
+    One Distance Matrix request from `origin` to several destinations, sent as
+    given (no variations). Returns every element keyed by destination, OK or
+    not, so callers can tell unresolvable destinations apart; a failed request
+    is logged and returns no elements.
+    """
+    if not self.gmaps or not destinations:
+      return {}
+    try:
+      result = await self._distance_matrix(origin, destinations)
+    except Exception as e:
+      logfire.warning(
+          f"Bulk Distance Matrix request from '{origin}' failed: {type(e).__name__} - {str(e)}")
+      await increment_request_counter_bg(self.redis_service, GMAPS_API_ERRORS_KEY)
+      return {}
+
+    rows = result.get("rows") or []
+    if result.get("status") != "OK" or not rows:
+      logfire.warning(
+          f"Bulk Distance Matrix request from '{origin}' returned status {result.get('status')}")
+      await increment_request_counter_bg(self.redis_service, GMAPS_API_ERRORS_KEY)
+      return {}
+    elements = rows[0].get("elements", [])
+    return dict(zip(destinations, elements))
+
+  async def _probe_variations(
+      self, origin: str, variations: List[str], attempted: List[str], statuses: List[str]
+  ) -> Optional[Tuple[str, Dict[str, Any], str]]:
+    """
+    Sends the primary (most specific) variation on its own, then the fallbacks
+    in batches of GMAPS_VARIATIONS_PER_REQUEST destinations, and returns the
+    best-ranked variation with an OK element, its element and the address
+    Google resolved it to. Distance Matrix bills every element, so batching
+    the primary with its fallbacks would pay for variations that are usually
+    not needed. The status of every failed attempt is appended to `statuses`.
+    """
+    from googlemaps.exceptions import ApiError, HTTPError, Timeout, TransportError
+
+    batch_size = max(1, settings.GMAPS_VARIATIONS_PER_REQUEST)
+    starts = [0, *range(1, len(variations), batch_size)] if variations else []
+    for start in starts:
+      batch = variations[:1] if start == 0 else variations[start:start + batch_size]
+      attempted.extend(batch)
+      logfire.info(
+          f"Attempting Google Maps API call for origin: '{origin}', destinations: {batch} (variations {start + 1}-{start + len(batch)}/{len(variations)})")
+      try:
+        result = await self._distance_matrix(origin, batch)
+      except (ApiError, HTTPError, Timeout, TransportError) as e:
+        logfire.warning(
+            f"Google Maps API client error for variations {batch}: {type(e).__name__} - {str(e)}")
+        statuses.append(type(e).__name__)
+        continue
+      except Exception as e:
+        logfire.warning(
+            f"Unexpected error during Google Maps API call for variations {batch}: {str(e)}")
+        statuses.append(type(e).__name__)
+        continue
+
+      gmaps_status = result.get("status")
+      rows = result.get("rows") or []
+      elements = rows[0].get("elements", []) if gmaps_status == "OK" and rows else []
+      resolved = result.get("destination_addresses") or []
+      # Elements come back in request order, so the first OK one is the most specific
+      for index, element in enumerate(elements[:len(batch)]):
+        if element.get("status") == "OK":
+          resolved_address = resolved[index] if index < len(resolved) and resolved[index] else batch[index]
+          return batch[index], element, resolved_address
+
+      element_statuses = [element.get("status") for element in elements]
+      statuses.extend(element_statuses if elements else [gmaps_status])
+      logfire.warning(
+          f"Google Maps API returned no usable element for variations {batch}: GMaps Status: {gmaps_status}, "
+          f"Element Statuses: {element_statuses}")
+    return None
+
   async def get_distance_from_google(
       self, origin: str, destination: str
   ) -> Optional[Dict[str, Any]]:
-    """Helper to get distance using Google Maps API with multiple address variations. Logs errors to MongoDB."""
+    """
+    Helper to get distance using Google Maps API with multiple address variations.
+    Variations are probed several per request, and the whole lookup is bounded by
+    GMAPS_LOOKUP_BUDGET_SECONDS. Logs errors to MongoDB.
+    """
+    return (await self.lookup_distance(origin, destination)).result
+
+  async def lookup_distance(self, origin: str, destination: str) -> DistanceLookup:
+    """
+    Same as get_distance_from_google, but also reports whether a failed lookup
+    was a definitive answer from Google rather than a transient error.
+    """
     if not self.gmaps:
       msg = "Google Maps client not initialized."
       logfire.error(msg)
@@ -68,110 +202,92 @@ class GoogleMapsOperations:
           message=msg,
           details={"origin": origin, "destination": destination},
       )
-      return None
+      return DistanceLookup(None)
 
     loop = asyncio.get_running_loop()
+    budget = settings.GMAPS_LOOKUP_BUDGET_SECONDS
+    deadline = loop.time() + budget
     final_result_data: Optional[Dict[str, Any]] = None
-    attempted_variations = []
+    attempted_variations: List[str] = []
+    failure_statuses: List[str] = []
+    timed_out = False
 
     # Get multiple variations of the destination address
     destination_variations = parse_and_normalize_address(destination)
+    stored = await self.geocode_store.get(destination)
+    if stored and stored.variation:
+      # The variation Google accepted last time goes out in the first request
+      destination_variations = [stored.variation] + [
+          variation for variation in destination_variations if variation != stored.variation]
     logfire.info(
         f"Generated {len(destination_variations)} address variations for '{destination}': {destination_variations}")
 
-    # Try each variation until we get a successful result
-    for i, dest_variation in enumerate(destination_variations):
-      try:
-        logfire.info(
-            f"Attempting Google Maps API call for origin: '{origin}', destination: '{dest_variation}' (variation {i+1}/{len(destination_variations)})")
-        await increment_request_counter_bg(
-            self.redis_service, GMAPS_API_CALLS_KEY
-        )
-
-        # Track latency for this specific API call
-        from app.services.background.util import get_background_tasks
-
-        # Get background tasks if available
-        bg_tasks = get_background_tasks(self)
-
-        if bg_tasks:
-          with LatencyTracker(
-              service_type="gmaps",
-              redis_service=self.redis_service,
-              background_tasks=bg_tasks,
-              operation_name="distance_matrix",
-              request_id=f"{origin}:{dest_variation}"
-          ):
-            func_call = functools.partial(
-                self.gmaps.distance_matrix,  # type: ignore
-                origins=[origin],
-                destinations=[dest_variation],
-                mode="driving",
-            )
-            result = await loop.run_in_executor(None, func_call)
-        else:
-          func_call = functools.partial(
-              self.gmaps.distance_matrix,  # type: ignore
-              origins=[origin],
-              destinations=[dest_variation],
-              mode="driving",
-          )
-          result = await loop.run_in_executor(None, func_call)
-
-        attempted_variations.append(dest_variation)
-
-        gmaps_status = result.get("status")
-        element_status = (
-            result["rows"][0]["elements"][0].get("status")
-            if gmaps_status == "OK" and result.get("rows") and result["rows"][0].get("elements")
-            else "N/A" if gmaps_status == "OK" else gmaps_status
-        )
-
-        if gmaps_status == "OK" and element_status == "OK":
-          element = result["rows"][0]["elements"][0]
-          distance_meters = element["distance"]["value"]
-          duration_seconds = element["duration"]["value"]
-          distance_miles = distance_meters * MILES_PER_METER
-          logfire.info(
-              f"Google Maps distance (variation {i+1}): {distance_miles:.2f} miles, Duration: {duration_seconds}s for {origin} -> {dest_variation}"
-          )
-          final_result_data = {
-              "distance_miles": round(distance_miles, 2),
-              "distance_meters": distance_meters,
-              "duration_seconds": duration_seconds,
-              "origin": origin,
-              "destination": destination,  # Return original destination for consistency
-              "successful_variation": dest_variation,
-              "geocoded_coordinates": await self._get_geocoded_coordinates(dest_variation),
-          }
-          break  # Success! Stop trying other variations
+    try:
+      match = await asyncio.wait_for(
+          self._probe_variations(
+              origin, destination_variations, attempted_variations, failure_statuses),
+          timeout=budget,
+      )
+    except asyncio.TimeoutError:
+      timed_out = True
+      match = None
+      logfire.warning(
+          f"Google Maps lookup {origin} -> '{destination}' exceeded its {budget}s budget")
 
-        elif element_status == "ZERO_RESULTS":
-          logfire.warning(
-              f"Google Maps API returned ZERO_RESULTS for variation {i+1}: '{dest_variation}'. Trying next variation.")
-          continue  # Try next variation
+    if match is not None:
+      dest_variation, element, resolved_address = match
+      distance_meters = element["distance"]["value"]
+      duration_seconds = element["duration"]["value"]
+      distance_miles = distance_meters * MILES_PER_METER
+      logfire.info(
+          f"Google Maps distance: {distance_miles:.2f} miles, Duration: {duration_seconds}s for {origin} -> {dest_variation}"
+      )
 
-        else:
-          # Other error status - log but continue trying
+      # Coordinates come from the shared store, else best effort within whatever budget is left
+      geocoded_coordinates = stored.coordinates if stored else None
+      remaining = deadline - loop.time()
+      if geocoded_coordinates is None and remaining > 0:
+        try:
+          geocoded_coordinates = await asyncio.wait_for(
+              self.geocode_coordinates(resolved_address), timeout=remaining)
+        except asyncio.TimeoutError:
           logfire.warning(
-              f"Google Maps API error for variation {i+1} '{dest_variation}': GMaps Status: {gmaps_status}, Element Status: {element_status}")
-          continue  # Try next variation
+              f"Skipped geocoding '{resolved_address}': lookup budget spent")
+      if stored is not None and stored.variation != dest_variation:
+        # Only the accepted variation changed; the coordinates keep their source
+        await self.geocode_store.put(destination, replace(
+            stored, variation=dest_variation, formatted_address=resolved_address))
+      elif stored is None and geocoded_coordinates:
+        await self.geocode_store.put(destination, GeocodeRecord(
+            latitude=geocoded_coordinates["latitude"],
+            longitude=geocoded_coordinates["longitude"],
+            components=extract_location_components(destination),
+            variation=dest_variation,
+            formatted_address=resolved_address,
+            source="google",
+        ))
 
-      except (ApiError, HTTPError, Timeout, TransportError) as e:
-        msg = f"Google Maps API client error for variation {i+1} '{dest_variation}': {type(e).__name__} - {str(e)}"
-        logfire.warning(msg)
-        attempted_variations.append(dest_variation)
-        continue  # Try next variation
-
-      except Exception as e:
-        msg = f"Unexpected error during Google Maps API call for variation {i+1} '{dest_variation}': {str(e)}"
-        logfire.warning(msg)
-        attempted_variations.append(dest_variation)
-        continue  # Try next variation
+      final_result_data = {
+          "distance_miles": round(distance_miles, 2),
+          "distance_meters": distance_meters,
+          "duration_seconds": duration_seconds,
+          "origin": origin,
+          "destination": destination,  # Return original destination for consistency
+          "successful_variation": dest_variation,
+          "geocoded_coordinates": geocoded_coordinates,
+      }
 
     # If we reach here and final_result_data is None, all variations failed
+    unresolvable = False
     if final_result_data is None:
+      unresolvable = (
+          not timed_out
+          and bool(failure_statuses)
+          and set(failure_statuses) <= UNRESOLVABLE_ELEMENT_STATUSES
+      )
       msg = f"Google Maps API failed for all {len(attempted_variations)} address variations of '{destination}'"
+      if timed_out:
+        msg += f" within the {budget}s budget"
       logfire.error(msg)
       await increment_request_counter_bg(self.redis_service, GMAPS_API_ERRORS_KEY)
       await self.mongo_service.log_error_to_db(
@@ -183,7 +299,10 @@ class GoogleMapsOperations:
               "original_destination": destination,
               "attempted_variations": attempted_variations,
               "total_variations_tried": len(attempted_variations),
+              "timed_out": timed_out,
+              "failure_statuses": sorted(set(failure_statuses)),
+              "unresolvable": unresolvable,
           },
       )
 
-    return final_result_data
+    return DistanceLookup(final_result_data, unresolvable)
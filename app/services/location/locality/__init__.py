@@ -0,0 +1,13 @@
+# filepath: app/services/location/locality/__init__.py
+from .index import LocalityIndex, LocalityMatch, compile_index, locality_index
+from .builder import build_locality_index, ensure_locality_index, load_locality_index
+
+__all__ = [
+    "LocalityIndex",
+    "LocalityMatch",
+    "compile_index",
+    "locality_index",
+    "build_locality_index",
+    "ensure_locality_index",
+    "load_locality_index",
+]
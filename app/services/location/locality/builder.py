@@ -0,0 +1,109 @@
+# app/services/location/locality/builder.py
+
+"""
+Builds the locality index after a branch sync and loads it at startup.
+Branch addresses are geocoded once (coordinates are reused while the address
+is unchanged); delivery points come from stored geocoded location lookups.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import logfire
+
+from app.core.config import settings
+from app.core.keys import BRANCH_LIST_CACHE_KEY, LOCALITY_INDEX_KEY
+from app.services.location.google import GoogleMapsOperations
+from app.services.location.parsing import extract_location_components
+from app.services.mongo import MongoService
+from app.services.redis.service import RedisService
+
+from .index import LocalityIndex, compile_index, locality_index
+
+
+async def _geocode_hubs(
+    branches: List[Dict[str, Any]],
+    known: Dict[str, List[float]],
+    geocoder: GoogleMapsOperations,
+) -> Tuple[List[Tuple[str, float, float]], Dict[str, List[float]]]:
+  hubs: List[Tuple[str, float, float]] = []
+  geocoded: Dict[str, List[float]] = {}
+  for branch in branches:
+    name, address = branch.get("name"), branch.get("address")
+    if not name or not address:
+      continue
+    coords = known.get(address)
+    if coords is None:
+      result = await geocoder.geocode_coordinates(address)
+      if not result:
+        logfire.warning("Branch could not be geocoded; left out of locality index",
+                        branch=name, address=address)
+        continue
+      coords = [result["latitude"], result["longitude"]]
+    geocoded[address] = coords
+    hubs.append((name, float(coords[0]), float(coords[1])))
+  return hubs, geocoded
+
+
+def _points_from_documents(docs: List[Dict[str, Any]]) -> List[Tuple[float, float, Optional[str], Optional[str], Optional[str]]]:
+  points = []
+  for doc in docs:
+    coords = doc.get("geocoded_coordinates") or {}
+    lat, lon = coords.get("latitude"), coords.get("longitude")
+    if lat is None or lon is None:
+      continue
+    components = extract_location_components(doc.get("delivery_location") or "")
+    points.append((float(lat), float(lon), components.get("zip_code"),
+                   components.get("city"), components.get("state")))
+  return points
+
+
+async def build_locality_index(
+    redis_service: RedisService,
+    mongo_service: MongoService,
+    branches: List[Dict[str, Any]],
+) -> Optional[LocalityIndex]:
+  """
+  Rebuilds the index from `branches` and stored lookups, saves it to Redis
+  and swaps it into the process-wide instance. Returns None when no branch
+  could be placed on the map (the previous index is kept).
+  """
+  previous = await redis_service.get_json(LOCALITY_INDEX_KEY) or {}
+  hubs, geocoded = await _geocode_hubs(
+      branches, previous.get("geocoded") or {},
+      GoogleMapsOperations(redis_service, mongo_service))
+  if not hubs:
+    logfire.warning("Locality index not rebuilt: no geocoded branches")
+    return None
+
+  docs = await mongo_service.get_geocoded_locations(
+      limit=settings.LOCALITY_INDEX_MAX_LOCATIONS)
+  # Address parsing and nearest-hub math over tens of thousands of rows stay off the loop
+  index = await asyncio.to_thread(
+      lambda: compile_index(hubs, _points_from_documents(docs),
+                            settings.LOCALITY_MAX_DRIVE_HOURS))
+
+  payload = index.to_payload()
+  payload["geocoded"] = geocoded
+  await redis_service.set_json(LOCALITY_INDEX_KEY, payload)
+  locality_index.replace(index)
+  logfire.info("Locality index rebuilt", **index.stats())
+  return index
+
+
+async def load_locality_index(redis_service: RedisService) -> bool:
+  """Loads the last built index from Redis; False when none is stored."""
+  index = LocalityIndex.from_payload(await redis_service.get_json(LOCALITY_INDEX_KEY) or {})
+  if index is None:
+    return False
+  locality_index.replace(index)
+  logfire.info("Locality index loaded", **index.stats())
+  return True
+
+
+async def ensure_locality_index(redis_service: RedisService, mongo_service: MongoService) -> bool:
+  """Startup hook: loads the stored index, or builds one from the cached branch list."""
+  if await load_locality_index(redis_service):
+    return True
+  branches = await redis_service.get_json(BRANCH_LIST_CACHE_KEY) or []
+  return await build_locality_index(redis_service, mongo_service, branches) is not None
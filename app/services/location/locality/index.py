@@ -0,0 +1,234 @@
+# app/services/location/locality/index.py
+
+"""
+In-memory locality index for the "within 3 hours of a hub" check.
+Hubs are the synced branches. For every ZIP, ZIP3 prefix and city/state seen
+in past geocoded deliveries the index stores the estimated drive time to the
+nearest hub, so classification decides locality with a dict lookup and only
+geocodes strings it has never seen.
+"""
+
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import logfire
+
+# Same straight-line speed the geocoding path has always used
+AVERAGE_SPEED_KM_PER_HOUR = 70
+EARTH_RADIUS_KM = 6371.0088
+INDEX_VERSION = 1
+
+_ZIP_RE = re.compile(r"\b(\d{5})(?:-\d{4})?\b")
+
+# (min minutes, max minutes, hub position) across the deliveries behind an entry
+Entry = Tuple[int, int, int]
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+  """Great-circle distance in kilometers."""
+  phi1, phi2 = math.radians(lat1), math.radians(lat2)
+  d_phi = phi2 - phi1
+  d_lambda = math.radians(lon2 - lon1)
+  a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+  return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def estimate_drive_time_hours(km_distance: float) -> float:
+  """Estimated drive time for a straight-line distance."""
+  return km_distance / AVERAGE_SPEED_KM_PER_HOUR
+
+
+def normalize_zip(postal_code: Optional[str]) -> Optional[str]:
+  if not postal_code:
+    return None
+  match = _ZIP_RE.search(str(postal_code))
+  return match.group(1) if match else None
+
+
+def city_key(city: Optional[str], state: Optional[str]) -> Optional[str]:
+  if not city or not state:
+    return None
+  return f"{' '.join(city.lower().split())}|{state.strip().upper()}"
+
+
+@dataclass(frozen=True)
+class LocalityMatch:
+  """Result of an index lookup."""
+
+  is_local: bool
+  drive_hours: float
+  hub: Optional[str]
+  # "zip", "zip3", "city" or "coordinates"
+  matched_on: str
+
+
+@dataclass
+class LocalityIndex:
+  """Compact lookup tables; see compile_index for how they are filled."""
+
+  hubs: List[Tuple[str, float, float]] = field(default_factory=list)
+  zips: Dict[str, Entry] = field(default_factory=dict)
+  zip3s: Dict[str, Entry] = field(default_factory=dict)
+  cities: Dict[str, Entry] = field(default_factory=dict)
+  threshold_hours: float = 3.0
+  built_at: Optional[float] = None
+
+  @property
+  def loaded(self) -> bool:
+    return bool(self.hubs)
+
+  def nearest_hub(self, lat: float, lon: float) -> Tuple[float, Optional[int]]:
+    """Estimated drive hours to the closest hub and that hub's position."""
+    best_hours, best_hub = float("inf"), None
+    for position, (_, hub_lat, hub_lon) in enumerate(self.hubs):
+      hours = estimate_drive_time_hours(haversine_km(lat, lon, hub_lat, hub_lon))
+      if hours < best_hours:
+        best_hours, best_hub = hours, position
+    return best_hours, best_hub
+
+  def _decide(self, entry: Optional[Entry], matched_on: str) -> Optional[LocalityMatch]:
+    if entry is None:
+      return None
+    low, high, hub = entry
+    threshold_minutes = self.threshold_hours * 60
+    # A group straddling the threshold is not decisive; a finer key or geocoding decides
+    if low <= threshold_minutes < high:
+      return None
+    return LocalityMatch(
+        is_local=high <= threshold_minutes,
+        drive_hours=round(low / 60, 2),
+        hub=self.hubs[hub][0] if 0 <= hub < len(self.hubs) else None,
+        matched_on=matched_on,
+    )
+
+  def lookup(
+      self,
+      postal_code: Optional[str] = None,
+      city: Optional[str] = None,
+      state: Optional[str] = None,
+  ) -> Optional[LocalityMatch]:
+    """Decides locality from ZIP, ZIP3 or city/state; None when unknown."""
+    zip_code = normalize_zip(postal_code)
+    if zip_code:
+      match = self._decide(self.zips.get(zip_code), "zip")
+      if match:
+        return match
+    key = city_key(city, state)
+    if key:
+      match = self._decide(self.cities.get(key), "city")
+      if match:
+        return match
+    if zip_code:
+      return self._decide(self.zip3s.get(zip_code[:3]), "zip3")
+    return None
+
+  def locality_for_coordinates(self, lat: float, lon: float) -> Optional[LocalityMatch]:
+    if not self.loaded:
+      return None
+    hours, hub = self.nearest_hub(lat, lon)
+    return LocalityMatch(
+        is_local=hours <= self.threshold_hours,
+        drive_hours=round(hours, 2),
+        hub=self.hubs[hub][0] if hub is not None else None,
+        matched_on="coordinates",
+    )
+
+  def replace(self, other: "LocalityIndex") -> None:
+    """Swaps in a freshly built or loaded index."""
+    self.hubs, self.zips, self.zip3s, self.cities = other.hubs, other.zips, other.zip3s, other.cities
+    self.threshold_hours, self.built_at = other.threshold_hours, other.built_at
+
+  def to_payload(self) -> Dict[str, Any]:
+    return {
+        "v": INDEX_VERSION,
+        "built_at": self.built_at,
+        "threshold_hours": self.threshold_hours,
+        "hubs": [list(hub) for hub in self.hubs],
+        "zip": {key: list(value) for key, value in self.zips.items()},
+        "zip3": {key: list(value) for key, value in self.zip3s.items()},
+        "city": {key: list(value) for key, value in self.cities.items()},
+    }
+
+  @classmethod
+  def from_payload(cls, payload: Dict[str, Any]) -> Optional["LocalityIndex"]:
+    if not payload or payload.get("v") != INDEX_VERSION:
+      return None
+
+    def entries(name: str) -> Dict[str, Entry]:
+      return {key: (int(value[0]), int(value[1]), int(value[2]))
+              for key, value in (payload.get(name) or {}).items()}
+
+    return cls(
+        hubs=[(str(name), float(lat), float(lon)) for name, lat, lon in payload.get("hubs", [])],
+        zips=entries("zip"),
+        zip3s=entries("zip3"),
+        cities=entries("city"),
+        threshold_hours=float(payload.get("threshold_hours", 3.0)),
+        built_at=payload.get("built_at"),
+    )
+
+  def stats(self) -> Dict[str, Any]:
+    return {
+        "loaded": self.loaded,
+        "hubs": [name for name, _, _ in self.hubs],
+        "zips": len(self.zips),
+        "zip3s": len(self.zip3s),
+        "cities": len(self.cities),
+        "threshold_hours": self.threshold_hours,
+        "age_seconds": round(time.time() - self.built_at) if self.built_at else None,
+    }
+
+
+class _Accumulator:
+  """Collects per-key drive-time ranges while building the index."""
+
+  def __init__(self):
+    self.entries: Dict[str, List[int]] = {}
+
+  def add(self, key: str, minutes: int, hub: int) -> None:
+    entry = self.entries.get(key)
+    if entry is None:
+      self.entries[key] = [minutes, minutes, hub]
+      return
+    if minutes < entry[0]:
+      entry[0], entry[2] = minutes, hub
+    entry[1] = max(entry[1], minutes)
+
+  def freeze(self) -> Dict[str, Entry]:
+    return {key: (low, high, hub) for key, (low, high, hub) in self.entries.items()}
+
+
+def compile_index(
+    hubs: List[Tuple[str, float, float]],
+    points: List[Tuple[float, float, Optional[str], Optional[str], Optional[str]]],
+    threshold_hours: float,
+) -> LocalityIndex:
+  """
+  Builds the lookup tables from hub coordinates and geocoded points
+  (lat, lon, zip, city, state). Each point is assigned to its nearest hub.
+  """
+  index = LocalityIndex(hubs=hubs, threshold_hours=threshold_hours, built_at=time.time())
+  zips, zip3s, cities = _Accumulator(), _Accumulator(), _Accumulator()
+  for lat, lon, zip_code, city, state in points:
+    hours, hub = index.nearest_hub(lat, lon)
+    if hub is None:
+      continue
+    minutes = int(round(hours * 60))
+    zip_code = normalize_zip(zip_code)
+    if zip_code:
+      zips.add(zip_code, minutes, hub)
+      zip3s.add(zip_code[:3], minutes, hub)
+    key = city_key(city, state)
+    if key:
+      cities.add(key, minutes, hub)
+  index.zips, index.zip3s, index.cities = zips.freeze(), zip3s.freeze(), cities.freeze()
+  logfire.info("Locality index compiled", hubs=len(hubs), points=len(points),
+               zips=len(index.zips), zip3s=len(index.zip3s), cities=len(index.cities))
+  return index
+
+
+# Process-wide index, loaded at startup and replaced after each branch sync
+locality_index = LocalityIndex()
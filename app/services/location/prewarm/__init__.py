@@ -0,0 +1,14 @@
+# filepath: app/services/location/prewarm/__init__.py
+from .warmer import (
+    DistancePrewarmer,
+    initialize_distance_prewarmer,
+    rank_addresses,
+    shutdown_distance_prewarmer,
+)
+
+__all__ = [
+    "DistancePrewarmer",
+    "initialize_distance_prewarmer",
+    "rank_addresses",
+    "shutdown_distance_prewarmer",
+]
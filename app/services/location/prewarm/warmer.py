@@ -0,0 +1,373 @@
+# filepath: app/services/location/prewarm/warmer.py
+"""
+Background pre-warmer for the branch -> delivery distance cache.
+Each round ranks delivery addresses by demand (distance requests counted in
+Redis, recent location lookups and quotes in MongoDB, open HubSpot leads),
+then refreshes the cached distances that are missing or close to expiry with
+multi-destination Distance Matrix requests, most requested addresses first.
+Every worker runs the loop; a Redis lock lets one of them work each round.
+"""
+
+import asyncio
+import os
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import logfire
+
+from app.core.config import settings
+from app.core.keys import DISTANCE_PREWARM_BRANCHES_PREFIX, DISTANCE_PREWARM_LOCK_KEY
+from app.models.hubspot import HubSpotSearchFilter, HubSpotSearchFilterGroup, HubSpotSearchRequest
+from app.models.location import BranchLocation, DistanceResult
+from app.services.location.areas import ServiceAreaChecker
+from app.services.location.cache import LocationCacheOperations, pack_distance_result
+from app.services.location.cache.operations import _normalize_location
+from app.services.location.distance.calculator import CACHE_TTL_SECONDS
+from app.services.location.google import GoogleMapsOperations
+from app.services.location.google.operations import MILES_PER_METER, UNRESOLVABLE_ELEMENT_STATUSES
+from app.services.mongo import MongoService
+from app.services.redis.service import RedisService
+
+# Lead statuses still being worked; their job sites are likely to be quoted
+OPEN_LEAD_STATUSES = ("NEW", "ATTEMPTING", "CONNECTED", "IN_PROGRESS")
+# Leads carry no address; the job site is on the associated contact. Full
+# address first, else the street address with its locality parts.
+CONTACT_ADDRESS_PROPERTIES = ("event_or_job_address", "address", "city", "state", "zip")
+# Weight of an open lead's address relative to one past request
+LEAD_WEIGHT = 1.0
+
+# A pair is (branch, delivery address)
+Pair = Tuple[BranchLocation, str]
+
+
+def rank_addresses(sources: List[List[Tuple[str, float]]], limit: int) -> List[str]:
+  """
+  Merges (address, weight) lists from every source into one ranking.
+  Spellings that share a cache key are combined under the first one seen.
+  """
+  scores: Dict[str, float] = {}
+  spelling: Dict[str, str] = {}
+  for source in sources:
+    for address, weight in source:
+      if not address or not address.strip():
+        continue
+      key = _normalize_location(address)
+      spelling.setdefault(key, address.strip())
+      scores[key] = scores.get(key, 0.0) + float(weight)
+  ranked = sorted(scores, key=lambda key: scores[key], reverse=True)[:limit]
+  return [spelling[key] for key in ranked]
+
+
+def contact_address(properties: Dict[str, Any]) -> Optional[str]:
+  """The job site of a HubSpot contact, or None when it has no street address."""
+  full = (properties.get("event_or_job_address") or "").strip()
+  if full:
+    return full
+  street = (properties.get("address") or "").strip()
+  if not street:
+    return None
+  city, state, zip_code = ((properties.get(name) or "").strip() for name in ("city", "state", "zip"))
+  parts = [street, city, " ".join(part for part in (state, zip_code) if part)]
+  return ", ".join(part for part in parts if part)
+
+
+class DistancePrewarmer:
+  """Periodically refreshes cached distances for the most requested addresses."""
+
+  def __init__(
+      self,
+      redis_service: RedisService,
+      mongo_service: MongoService,
+      hubspot_manager: Optional[Any] = None,
+      interval_seconds: Optional[int] = None,
+  ):
+    self.redis = redis_service
+    self.mongo = mongo_service
+    self.hubspot_manager = hubspot_manager
+    self.cache_ops = LocationCacheOperations(redis_service, mongo_service)
+    self.google_ops = GoogleMapsOperations(redis_service, mongo_service)
+    self.area_checker = ServiceAreaChecker(self.cache_ops)
+    self.interval_seconds = interval_seconds or settings.DISTANCE_PREWARM_INTERVAL_SECONDS
+    self.owner = f"{socket.gethostname()}:{os.getpid()}"
+    self.running = False
+    self.task: Optional[asyncio.Task] = None
+    self.last_run: Dict[str, Any] = {}
+
+  async def start(self):
+    """Start the periodic pre-warm task."""
+    if self.running:
+      logfire.warning("Distance pre-warmer is already running.")
+      return
+    self.running = True
+    self.task = asyncio.create_task(self._loop())
+    logfire.info(f"Started distance pre-warmer (every {self.interval_seconds}s).")
+
+  async def stop(self):
+    """Stop the periodic pre-warm task."""
+    self.running = False
+    if self.task:
+      self.task.cancel()
+      try:
+        await self.task
+      except asyncio.CancelledError:
+        pass
+      self.task = None
+    logfire.info("Stopped distance pre-warmer.")
+
+  async def run_once(self) -> Dict[str, Any]:
+    """One pre-warm round if this worker wins the lock; returns its stats."""
+    # Lock expires just before the next round so a crashed owner does not stall warming
+    acquired = await self.redis.set_if_not_exists(
+        DISTANCE_PREWARM_LOCK_KEY, self.owner, ttl=max(1, self.interval_seconds - 1))
+    if not acquired:
+      return {}
+
+    started = time.perf_counter()
+    addresses = await self.collect_addresses()
+    branches = await self.cache_ops.get_branches_from_cache()
+    pairs = await self.stale_pairs(branches, addresses) if branches else []
+    requests, refreshed = await self.refresh(pairs)
+    await self.cache_ops.trim_demand(settings.DISTANCE_DEMAND_SIZE)
+
+    self.last_run = {
+        "addresses": len(addresses),
+        "branches": len(branches),
+        "stale_pairs": len(pairs),
+        "requests": requests,
+        "refreshed": refreshed,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    logfire.info("Distance pre-warm round complete", **self.last_run)
+    return self.last_run
+
+  async def warm_branches(self, branches: List[BranchLocation], version: str) -> Tuple[int, int]:
+    """
+    Computes distances from new or moved branches to the hot delivery
+    addresses right after a branch sync, so live quotes do not pay for them.
+    Every instance syncing the same branch-set `version` sees the same added
+    branches; only the one that claims the version warms them.
+    Returns (requests sent, entries refreshed).
+    """
+    if not branches:
+      return 0, 0
+    try:
+      claimed = await self.redis.set_if_not_exists(
+          f"{DISTANCE_PREWARM_BRANCHES_PREFIX}{version}", self.owner, ttl=self.interval_seconds)
+      if not claimed:
+        return 0, 0
+      addresses = await self.collect_addresses()
+      pairs = await self.stale_pairs(branches, addresses)
+      requests, refreshed = await self.refresh(pairs)
+    except Exception as e:
+      logfire.error(f"Error warming distances of changed branches: {e}", exc_info=True)
+      return 0, 0
+    logfire.info("Warmed distances of changed branches",
+                 branches=[branch.name for branch in branches],
+                 addresses=len(addresses), requests=requests, refreshed=refreshed)
+    return requests, refreshed
+
+  async def collect_addresses(self) -> List[str]:
+    """Delivery addresses worth keeping warm, highest demand first."""
+    limit = settings.DISTANCE_PREWARM_MAX_ADDRESSES
+    since = datetime.now(timezone.utc) - timedelta(days=settings.DISTANCE_PREWARM_LOOKBACK_DAYS)
+    demand, lookups, quotes, leads = await asyncio.gather(
+        self.cache_ops.get_top_demand(limit),
+        self.mongo.get_frequent_lookup_locations(since, limit),
+        self.mongo.get_frequent_quote_locations(since, limit),
+        self.lead_addresses(),
+    )
+    return rank_addresses([
+        list(demand),
+        [(doc["delivery_location"], doc["count"]) for doc in lookups],
+        [(doc["delivery_location"], doc["count"]) for doc in quotes],
+        [(address, LEAD_WEIGHT) for address in leads],
+    ], limit)
+
+  async def lead_addresses(self) -> List[str]:
+    """Job site addresses of the contacts on open HubSpot leads, most recently modified lead first."""
+    if self.hubspot_manager is None:
+      return []
+    limit = settings.DISTANCE_PREWARM_LEAD_LIMIT
+    lead_ids: List[str] = []
+    after: Optional[str] = None
+    try:
+      while len(lead_ids) < limit:
+        response = await self.hubspot_manager.search_leads(HubSpotSearchRequest(
+            filterGroups=[HubSpotSearchFilterGroup(filters=[HubSpotSearchFilter(
+                propertyName="hs_lead_status", operator="IN", values=list(OPEN_LEAD_STATUSES))])],
+            sorts=[{"propertyName": "hs_lastmodifieddate", "direction": "DESCENDING"}],
+            properties=["hs_object_id"],
+            limit=100,
+            after=after,
+        ))
+        lead_ids.extend(lead.id for lead in response.results)
+        paging = response.paging.next_val if response.paging else None
+        if not paging or not response.results:
+          break
+        after = paging.after
+      lead_ids = lead_ids[:limit]
+      if not lead_ids:
+        return []
+
+      contacts_by_lead = await self.hubspot_manager.get_associated_ids("leads", lead_ids, "contacts")
+      contact_ids = list(dict.fromkeys(
+          contact_id for lead_id in lead_ids for contact_id in contacts_by_lead.get(lead_id, [])))
+      contacts = await self.hubspot_manager.batch_read_contacts(
+          contact_ids, list(CONTACT_ADDRESS_PROPERTIES))
+    except Exception as e:
+      logfire.warning(f"Could not load open HubSpot lead addresses for pre-warming: {e}")
+      return []
+
+    address_by_contact = {contact.id: contact_address(contact.properties) for contact in contacts}
+    addresses = [address_by_contact[contact_id] for contact_id in contact_ids
+                 if address_by_contact.get(contact_id)]
+    return addresses[:limit]
+
+  async def stale_pairs(self, branches: List[BranchLocation], addresses: List[str]) -> List[Pair]:
+    """
+    (branch, address) pairs whose cached distance is missing or expires within
+    DISTANCE_PREWARM_REFRESH_BEFORE_SECONDS, in address priority order.
+    Addresses in the negative cache are skipped.
+    """
+    if not addresses:
+      return []
+    client = await self.redis.get_client()
+    try:
+      async with client.pipeline(transaction=False) as pipe:
+        for address in addresses:
+          pipe.exists(self.cache_ops.get_unresolvable_key(address))
+          for branch in branches:
+            pipe.ttl(self.cache_ops.get_cache_key(branch.address, address))
+        results = await pipe.execute()
+    finally:
+      await client.close()
+
+    pairs: List[Pair] = []
+    step = len(branches) + 1
+    for index, address in enumerate(addresses):
+      unresolvable, *ttls = results[index * step:(index + 1) * step]
+      if unresolvable:
+        continue
+      for branch, ttl in zip(branches, ttls):
+        # ttl is -2 for missing keys and -1 for keys without expiry
+        if ttl == -2 or 0 <= ttl < settings.DISTANCE_PREWARM_REFRESH_BEFORE_SECONDS:
+          pairs.append((branch, address))
+    return pairs
+
+  async def refresh(self, pairs: List[Pair]) -> Tuple[int, int]:
+    """
+    Recomputes the pairs with one Distance Matrix request per branch and
+    GMAPS_DESTINATIONS_PER_REQUEST addresses, the highest-priority batches
+    of every branch first. An address that every branch asked this round
+    answers with NOT_FOUND or ZERO_RESULTS goes into the negative cache, as
+    a live lookup would put it, so later rounds stop spending requests on it.
+    Returns (requests sent, entries refreshed).
+    """
+    by_branch: Dict[str, Tuple[BranchLocation, List[str]]] = {}
+    for branch, address in pairs:
+      by_branch.setdefault(branch.address, (branch, []))[1].append(address)
+
+    size = max(1, settings.GMAPS_DESTINATIONS_PER_REQUEST)
+    batches: List[Tuple[int, BranchLocation, List[str]]] = []
+    for branch, addresses in by_branch.values():
+      for start in range(0, len(addresses), size):
+        batches.append((start, branch, addresses[start:start + size]))
+    batches.sort(key=lambda batch: batch[0])
+
+    requests = 0
+    refreshed = 0
+    # Address -> branches that answered it definitively with no route or no such place
+    rejected: Dict[str, int] = {}
+    resolved = set()
+    for _, branch, addresses in batches[:settings.DISTANCE_PREWARM_MAX_REQUESTS]:
+      if requests:
+        await asyncio.sleep(settings.DISTANCE_PREWARM_REQUEST_INTERVAL_SECONDS)
+      requests += 1
+      elements = await self.google_ops.distance_matrix_elements(branch.address, addresses)
+      items: Dict[str, Dict[str, Any]] = {}
+      for address, element in elements.items():
+        status = element.get("status")
+        if status in UNRESOLVABLE_ELEMENT_STATUSES:
+          rejected[address] = rejected.get(address, 0) + 1
+        if status != "OK":
+          continue
+        resolved.add(address)
+        result = await self._distance_result(branch, address, element)
+        items[self.cache_ops.get_cache_key(branch.address, address)] = pack_distance_result(result)
+      if items:
+        refreshed += await self.cache_ops.distance_cache.set_many_json(items, ttl=CACHE_TTL_SECONDS)
+
+    asked = {address: sum(1 for _, addresses in by_branch.values() if address in addresses)
+             for address in rejected}
+    now = time.time()
+    unresolvable = {
+        self.cache_ops.get_unresolvable_key(address): {
+            "delivery_location": address,
+            "branches_checked": count,
+            "cached_at": now,
+        }
+        for address, count in rejected.items()
+        if address not in resolved and count == asked[address]
+    }
+    if unresolvable:
+      await self.cache_ops.unresolvable_cache.set_many_json(
+          unresolvable, ttl=settings.UNRESOLVABLE_LOCATION_TTL_SECONDS)
+      logfire.info("Pre-warm marked unresolvable addresses", addresses=len(unresolvable))
+    return requests, refreshed
+
+  async def _distance_result(
+      self, branch: BranchLocation, address: str, element: Dict[str, Any]
+  ) -> DistanceResult:
+    distance_meters = element["distance"]["value"]
+    stored = await self.google_ops.geocode_store.get(address)
+    return DistanceResult(
+        nearest_branch=branch,
+        delivery_location=address,
+        distance_miles=round(distance_meters * MILES_PER_METER, 2),
+        distance_meters=distance_meters,
+        duration_seconds=element["duration"]["value"],
+        within_service_area=await self.area_checker.check_service_area(address),
+        geocoded_coordinates=stored.coordinates if stored else None,
+        is_distance_estimated=False,
+    )
+
+  async def _loop(self):
+    try:
+      while self.running:
+        try:
+          await self.run_once()
+        except Exception as e:
+          logfire.error(f"Error during distance pre-warm round: {e}", exc_info=True)
+        await asyncio.sleep(self.interval_seconds)
+    except asyncio.CancelledError:
+      logfire.info("Distance pre-warmer loop cancelled.")
+      raise
+
+
+distance_prewarmer: Optional[DistancePrewarmer] = None
+
+
+async def initialize_distance_prewarmer(
+    redis_service: RedisService,
+    mongo_service: MongoService,
+    hubspot_manager: Optional[Any] = None,
+):
+  """Initialize and start the distance pre-warmer."""
+  global distance_prewarmer
+
+  if distance_prewarmer is None:
+    distance_prewarmer = DistancePrewarmer(redis_service, mongo_service, hubspot_manager)
+    await distance_prewarmer.start()
+  else:
+    logfire.warning("Distance pre-warmer already initialized.")
+
+
+async def shutdown_distance_prewarmer():
+  """Stop the distance pre-warmer."""
+  global distance_prewarmer
+
+  if distance_prewarmer:
+    await distance_prewarmer.stop()
+    distance_prewarmer = None
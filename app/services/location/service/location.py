@@ -40,7 +40,7 @@ class LocationService:
     """
     return await self.distance_calc.get_distance_to_nearest_branch(delivery_location)
 
-  async def prefetch_distance(self, delivery_location: str):
+  async def prefetch_distance(self, delivery_location: str, raise_errors: bool = False):
     """
     Triggers the distance calculation and caching in the background.
 
@@ -48,4 +48,4 @@ class LocationService:
     from app.services.background.util import attach_background_tasks
     attach_background_tasks(location_service, background_tasks)
     """
-    await self.distance_calc.prefetch_distance(delivery_location)
+    await self.distance_calc.prefetch_distance(delivery_location, raise_errors=raise_errors)
@@ -284,6 +284,39 @@ class ClassifyOperations:
           f"Error retrieving classifications requiring review: {e}", exc_info=True)
       return []
 
+  async def get_classification_inputs(self, limit: int = 1000, offset: int = 0) -> List[Dict[str, Any]]:
+    """
+    Retrieves the stored inputs of past classifications for re-classification.
+
+    Args:
+        limit: Maximum number of documents to return
+        offset: Number of documents to skip (oldest first, for stable paging)
+
+    Returns:
+        List of documents with id, lead_type, classification_input and the flat input fields
+    """
+    try:
+      collection = self.db[CLASSIFY_COLLECTION]
+
+      projection = {
+          "lead_type": 1, "source": 1, "classification_input": 1, "intended_use": 1,
+          "product_interest": 1, "is_local": 1, "duration_days": 1, "stall_count": 1,
+      }
+      cursor = collection.find({}, projection).sort(
+          "created_at", 1).skip(offset).limit(limit)
+      docs = await cursor.to_list(length=limit)
+
+      for doc in docs:
+        doc["id"] = str(doc.pop("_id"))
+
+      logfire.debug(f"Retrieved {len(docs)} stored classification inputs",
+                    offset=offset)
+      return docs
+
+    except Exception as e:
+      logfire.error(f"Error retrieving classification inputs: {e}", exc_info=True)
+      return []
+
   async def get_classifications_paginated(
       self,
       page: int = 1,
@@ -1,4 +1,5 @@
 # filepath: app/services/mongo/connection/indexes.py
+import asyncio
 import logfire
 from pymongo import ASCENDING, DESCENDING
 from app.services.mongo.collections.names import *
@@ -19,21 +20,30 @@ class IndexManager:
       )
       return
 
-    try:
-      await self._create_users_indexes()
-      await self._create_reports_indexes()
-      await self._create_sheet_indexes()
-      await self._create_error_indexes()
-      await self._create_service_status_indexes()
-      await self._create_stats_indexes()
-      # New collections
-      await self._create_quotes_indexes()
-      await self._create_calls_indexes()
-      await self._create_classify_indexes()
-      await self._create_location_indexes()
-      await self._create_emails_indexes()
-    except Exception as e:
-      logfire.error(f"Error creating MongoDB indexes: {e}", exc_info=True)
+    # Each collection's indexes are independent, so ensure them concurrently
+    creators = [
+        self._create_users_indexes,
+        self._create_reports_indexes,
+        self._create_sheet_indexes,
+        self._create_error_indexes,
+        self._create_service_status_indexes,
+        self._create_stats_indexes,
+        # New collections
+        self._create_quotes_indexes,
+        self._create_calls_indexes,
+        self._create_classify_indexes,
+        self._create_location_indexes,
+        self._create_emails_indexes,
+    ]
+    results = await asyncio.gather(
+        *(creator() for creator in creators), return_exceptions=True
+    )
+    for creator, result in zip(creators, results):
+      if isinstance(result, Exception):
+        logfire.error(
+            f"Error creating MongoDB indexes in {creator.__name__}: {result}",
+            exc_info=result,
+        )
 
   async def _create_users_indexes(self):
     """Creates indexes for users collection."""
@@ -51,8 +61,17 @@ class IndexManager:
     await reports_collection.create_index(
         [("timestamp", DESCENDING)], name="timestamp_desc_idx"
     )
+    # Dashboard error views filter on outcome (and type) and sort by recency
+    await reports_collection.create_index(
+        [("success", ASCENDING), ("timestamp", DESCENDING)],
+        name="success_timestamp_idx"
+    )
+    await reports_collection.create_index(
+        [("report_type", ASCENDING), ("success", ASCENDING), ("timestamp", DESCENDING)],
+        name="type_success_timestamp_idx"
+    )
     logfire.info(
-        f"Index 'timestamp_desc_idx' ensured for collection '{REPORTS_COLLECTION}'."
+        f"Indexes ensured for collection '{REPORTS_COLLECTION}'."
     )
 
   async def _create_sheet_indexes(self):
@@ -119,6 +138,14 @@ class IndexManager:
     await error_logs_coll.create_index(
         [("error_type", ASCENDING)], name="error_log_error_type_idx"
     )
+    await error_logs_coll.create_index(
+        [("error_type", ASCENDING), ("timestamp", DESCENDING)],
+        name="error_log_type_timestamp_idx"
+    )
+    await error_logs_coll.create_index(
+        [("fingerprint", ASCENDING), ("timestamp", DESCENDING)],
+        name="error_log_fingerprint_idx"
+    )
     logfire.info(
         f"Indexes ensured for collection '{ERROR_LOGS_COLLECTION}'."
     )
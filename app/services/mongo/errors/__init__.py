@@ -1,2 +1,3 @@
 # filepath: app/services/mongo/errors/__init__.py
 from .operations import ErrorOperations
+from .rollup import ErrorRollup, error_fingerprint, normalize_message
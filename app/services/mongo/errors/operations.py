@@ -1,10 +1,17 @@
 # filepath: app/services/mongo/errors/operations.py
+import asyncio
 import logfire
-import uuid
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timezone
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+from app.core.config import settings
 from app.services.mongo.collections.names import ERROR_LOGS_COLLECTION
+from app.services.mongo.errors.rollup import (
+    ErrorRollup,
+    error_fingerprint,
+    rollup_id,
+    rollup_update,
+)
 
 
 class ErrorOperations:
@@ -12,6 +19,8 @@ class ErrorOperations:
 
   def __init__(self, db):
     self.db = db
+    self.rollup = ErrorRollup(max(1, settings.ERROR_ROLLUP_WINDOW_SECONDS))
+    self._flush_task: Optional[asyncio.Task] = None
 
   async def log_error_to_db(
       self,
@@ -25,6 +34,11 @@ class ErrorOperations:
     """
     Logs an error to the error_logs collection in MongoDB.
 
+    Recurring errors are rolled up: one document per fingerprint (service,
+    error type and normalized message) per ERROR_ROLLUP_WINDOW_SECONDS, with a
+    count and first/last-seen timestamps. Details, stack trace and request
+    context are those of the first occurrence in the window.
+
     Args:
         service_name: Name of the service where the error occurred
         error_type: Type of error (e.g., ValueError, HTTPException, CacheMiss)
@@ -34,41 +48,105 @@ class ErrorOperations:
         request_context: Optional contextual information about the request
 
     Returns:
-        String ID of the created error log document, or None if operation failed
+        String ID of the rollup document, or None if operation failed
     """
     if self.db is None:
       logfire.error("log_error_to_db: MongoDB database is not initialized.")
       return None
 
-    collection = self.db[ERROR_LOGS_COLLECTION]
     current_time = datetime.now(timezone.utc)
+    fingerprint = error_fingerprint(service_name, error_type, message)
+    window_start = self.rollup.window_start(current_time)
+    error_id = rollup_id(fingerprint, window_start)
 
     # Create error document based on ErrorLog model structure
     error_doc = {
-        "_id": uuid.uuid4(),  # Generate a unique ID
+        "_id": error_id,
         "timestamp": current_time,
         "service_name": service_name,
         "error_type": error_type,
         "error_message": message,
         "stack_trace": stack_trace,
         "request_context": request_context,
-        "additional_data": details  # Use details parameter for additional_data field
+        "additional_data": details,  # Use details parameter for additional_data field
+        "fingerprint": fingerprint,
+        "window_start": window_start,
+        "first_seen": current_time,
+        "last_seen": current_time,
     }
 
+    if not self.rollup.open(error_id, window_start):
+      # Already written this window; counted in memory until the flush
+      self.rollup.add(error_id, error_doc, current_time)
+      self._schedule_flush()
+      return str(error_id)
+
     try:
-      result = await collection.insert_one(error_doc)
-      error_id = str(result.inserted_id)
+      await self.db[ERROR_LOGS_COLLECTION].update_one(
+          {"_id": error_id},
+          rollup_update(error_doc, 1, current_time),
+          upsert=True,
+      )
       logfire.info(
           f"Logged error to MongoDB: type={error_type}, service={service_name}, id={error_id}"
       )
-      return error_id
+      return str(error_id)
     except Exception as e:
+      self.rollup.discard(error_id)
       logfire.error(
           f"Failed to log error to MongoDB: {e}. Original error: {message}",
           exc_info=True
       )
       return None
 
+  def _schedule_flush(self) -> None:
+    if self._flush_task is not None and not self._flush_task.done():
+      return
+    self._flush_task = asyncio.create_task(self._flush_at_window_end())
+
+  async def _flush_at_window_end(self) -> None:
+    await asyncio.sleep(self.rollup.seconds_until_window_end(datetime.now(timezone.utc)))
+    await self.flush_rollups()
+
+  async def flush_rollups(self) -> int:
+    """Writes the counts buffered since the last flush in one bulk write."""
+    pending = self.rollup.drain(datetime.now(timezone.utc))
+    if not pending or self.db is None:
+      return 0
+    operations = [
+        UpdateOne({"_id": doc_id}, rollup_update(
+            rollup.document, rollup.count, rollup.last_seen), upsert=True)
+        for doc_id, rollup in pending.items()
+    ]
+    try:
+      await self.db[ERROR_LOGS_COLLECTION].bulk_write(operations, ordered=False)
+      logfire.debug(f"Flushed {len(operations)} error rollups to MongoDB")
+      return len(operations)
+    except Exception as e:
+      logfire.error(f"Failed to flush error rollups to MongoDB: {e}", exc_info=True)
+      return 0
+
+  async def close(self) -> None:
+    """Flushes buffered counts; called before the connection is closed."""
+    if self._flush_task is not None and not self._flush_task.done():
+      self._flush_task.cancel()
+    await self.flush_rollups()
+
+  async def get_recent_error_rollups(
+      self, error_type: Optional[str] = None, limit: int = 50
+  ) -> List[Dict[str, Any]]:
+    """Most recently seen error rollups, optionally for one error type (indexed)."""
+    if self.db is None:
+      return []
+    query = {"error_type": error_type} if error_type else {}
+    try:
+      cursor = self.db[ERROR_LOGS_COLLECTION].find(query).sort(
+          "timestamp", DESCENDING).limit(limit)
+      return await cursor.to_list(length=limit)
+    except Exception as e:
+      logfire.error(f"Failed to retrieve error rollups: {e}", exc_info=True)
+      return []
+
   async def get_error_logs(
       self,
       page: int = 1,
@@ -0,0 +1,105 @@
+# filepath: app/services/mongo/errors/rollup.py
+"""
+Fingerprinting and rollup windows for error logs.
+Errors with the same service, type and normalized message share a
+fingerprint. Each fingerprint gets one document per window
+(count, first_seen, last_seen): the first occurrence is written at once,
+later ones are counted in memory and flushed together when the window ends.
+"""
+
+import hashlib
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+# Namespace for deterministic rollup document ids, so every worker upserts the same document
+ROLLUP_ID_NAMESPACE = uuid.UUID("5d0f4a52-58a3-4c1e-9a7e-2f1b0c6e8d41")
+
+_NORMALIZERS = (
+    (re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.I), "<uuid>"),
+    (re.compile(r"\b0x[0-9a-f]+\b|\b[0-9a-f]{12,}\b", re.I), "<hex>"),
+    (re.compile(r"'[^']*'|\"[^\"]*\""), "<str>"),
+    (re.compile(r"\d+(\.\d+)?"), "<n>"),
+    (re.compile(r"\s+"), " "),
+)
+
+
+def normalize_message(message: str) -> str:
+  """Strips ids, quoted values and numbers so recurring errors compare equal."""
+  normalized = message or ""
+  for pattern, replacement in _NORMALIZERS:
+    normalized = pattern.sub(replacement, normalized)
+  return normalized.strip().lower()[:500]
+
+
+def error_fingerprint(service_name: str, error_type: str, message: str) -> str:
+  key = f"{service_name}|{error_type}|{normalize_message(message)}"
+  return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def rollup_id(fingerprint: str, window_start: datetime) -> uuid.UUID:
+  return uuid.uuid5(ROLLUP_ID_NAMESPACE, f"{fingerprint}:{window_start.isoformat()}")
+
+
+@dataclass
+class PendingRollup:
+  """Occurrences counted in memory since the rollup document was last written."""
+
+  document: Dict[str, Any]
+  count: int = 0
+  last_seen: Optional[datetime] = None
+
+
+@dataclass
+class ErrorRollup:
+  """Per-process rollup state for one error_logs collection."""
+
+  window_seconds: int
+  opened: Dict[uuid.UUID, datetime] = field(default_factory=dict)
+  pending: Dict[uuid.UUID, PendingRollup] = field(default_factory=dict)
+
+  def window_start(self, now: datetime) -> datetime:
+    epoch = int(now.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % self.window_seconds, tz=timezone.utc)
+
+  def open(self, doc_id: uuid.UUID, window_start: datetime) -> bool:
+    """True for the first occurrence of a rollup in this process, which is written at once."""
+    if doc_id in self.opened:
+      return False
+    self.opened[doc_id] = window_start
+    return True
+
+  def discard(self, doc_id: uuid.UUID) -> None:
+    """Forgets a rollup whose first write failed, so the next occurrence retries it."""
+    self.opened.pop(doc_id, None)
+
+  def add(self, doc_id: uuid.UUID, document: Dict[str, Any], now: datetime) -> None:
+    pending = self.pending.get(doc_id)
+    if pending is None:
+      pending = self.pending[doc_id] = PendingRollup(document=document)
+    pending.count += 1
+    pending.last_seen = now
+
+  def drain(self, now: datetime) -> Dict[uuid.UUID, PendingRollup]:
+    """Takes the pending counts and forgets rollups whose window has ended."""
+    pending, self.pending = self.pending, {}
+    current = self.window_start(now)
+    self.opened = {doc_id: start for doc_id, start in self.opened.items() if start >= current}
+    return pending
+
+  def seconds_until_window_end(self, now: datetime) -> float:
+    return self.window_seconds - (now.timestamp() % self.window_seconds)
+
+
+def rollup_update(document: Dict[str, Any], count: int, last_seen: datetime) -> Dict[str, Any]:
+  """Upsert that creates the rollup document or adds `count` occurrences to it."""
+  insert_fields: Dict[str, Any] = {
+      key: value for key, value in document.items() if key not in ("_id", "timestamp", "last_seen")}
+  return {
+      "$setOnInsert": insert_fields,
+      "$inc": {"count": count},
+      "$max": {"timestamp": last_seen, "last_seen": last_seen},
+  }
+
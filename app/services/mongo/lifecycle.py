@@ -7,14 +7,18 @@ from app.services.mongo.service import MongoService
 mongo_service_instance: Optional[MongoService] = None
 
 
-async def startup_mongo_service():
-  """Starts up the MongoDB service during application startup."""
+async def startup_mongo_service(create_indexes: bool = True):
+  """
+  Starts up the MongoDB service during application startup.
+  Index creation can be deferred by passing create_indexes=False.
+  """
   global mongo_service_instance
   logfire.info("Attempting to start up MongoDB service...")
   if mongo_service_instance is None:
     mongo_service_instance = MongoService()
     try:
-      await mongo_service_instance.connect_and_initialize()
+      await mongo_service_instance.connect_and_initialize(
+          create_indexes=create_indexes)
       logfire.info("MongoDB service started and initialized successfully.")
     except Exception as e:
       logfire.error(f"MongoDB service startup failed: {e}", exc_info=True)
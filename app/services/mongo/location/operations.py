@@ -297,6 +297,55 @@ class LocationOperations:
 
     return await self.update_location(location_id, update_data)
 
+  async def get_geocoded_locations(self, limit: int = 50000) -> List[Dict[str, Any]]:
+    """
+    Retrieves the address and coordinates of the most recent geocoded lookups.
+
+    Args:
+        limit: Maximum number of locations to return
+
+    Returns:
+        List of {"delivery_location", "geocoded_coordinates"} documents
+    """
+    try:
+      collection = self.db[LOCATION_COLLECTION]
+
+      cursor = collection.find(
+          {"geocoded_coordinates.latitude": {"$ne": None},
+           "geocoded_coordinates.longitude": {"$ne": None}},
+          {"_id": 0, "delivery_location": 1, "geocoded_coordinates": 1}
+      ).sort("created_at", -1).limit(limit)
+
+      docs = await cursor.to_list(length=limit)
+      logfire.debug(f"Retrieved {len(docs)} geocoded locations")
+      return docs
+
+    except Exception as e:
+      logfire.error(f"Error retrieving geocoded locations: {e}", exc_info=True)
+      return []
+
+  async def get_frequent_delivery_locations(self, since: datetime, limit: int = 500) -> List[Dict[str, Any]]:
+    """
+    Delivery locations looked up since `since`, most frequent first.
+
+    Returns:
+        List of {"delivery_location", "count"} documents
+    """
+    try:
+      collection = self.db[LOCATION_COLLECTION]
+      pipeline = [
+          {"$match": {"created_at": {"$gte": since},
+                      "delivery_location": {"$nin": [None, ""]}}},
+          {"$group": {"_id": "$delivery_location", "count": {"$sum": 1}}},
+          {"$sort": {"count": -1}},
+          {"$limit": limit},
+          {"$project": {"_id": 0, "delivery_location": "$_id", "count": 1}},
+      ]
+      return await collection.aggregate(pipeline).to_list(length=limit)
+    except Exception as e:
+      logfire.error(f"Error aggregating frequent lookup delivery locations: {e}", exc_info=True)
+      return []
+
   async def get_location_stats(self) -> Dict[str, int]:
     """
     Retrieves statistics about locations.
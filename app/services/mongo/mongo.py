@@ -34,6 +34,3 @@ __all__ = [
     "STATS_COLLECTION",
     "SERVICE_STATUS_COLLECTION",
 ]
-
-# Update the global instance reference to point to the lifecycle module
-lifecycle.mongo_service_instance = mongo_service_instance
@@ -278,6 +278,28 @@ class QuotesOperations:
       logfire.error(f"Error retrieving quote by ID: {e}", exc_info=True)
       return None
 
+  async def get_frequent_delivery_locations(self, since: datetime, limit: int = 500) -> List[Dict[str, Any]]:
+    """
+    Delivery locations quoted since `since`, most frequent first.
+
+    Returns:
+        List of {"delivery_location", "count"} documents
+    """
+    try:
+      collection = self.db[QUOTES_COLLECTION]
+      pipeline = [
+          {"$match": {"created_at": {"$gte": since},
+                      "delivery_location": {"$nin": [None, ""]}}},
+          {"$group": {"_id": "$delivery_location", "count": {"$sum": 1}}},
+          {"$sort": {"count": -1}},
+          {"$limit": limit},
+          {"$project": {"_id": 0, "delivery_location": "$_id", "count": 1}},
+      ]
+      return await collection.aggregate(pipeline).to_list(length=limit)
+    except Exception as e:
+      logfire.error(f"Error aggregating frequent quote delivery locations: {e}", exc_info=True)
+      return []
+
   # Pagination query methods
   async def get_recent_quotes(self, limit: int = 10, offset: int = 0) -> List[QuoteDocument]:
     """Get recent quotes ordered by creation date (newest first)."""
@@ -40,11 +40,19 @@ class ReportsOperations:
       return None
 
   async def get_recent_reports(
-      self, report_type: Optional[Union[str, List[str]]] = None, limit: int = 100
+      self,
+      report_type: Optional[Union[str, List[str]]] = None,
+      limit: int = 100,
+      success: Optional[bool] = None,
   ) -> List[Dict[str, Any]]:
-    """Retrieves recent reports, optionally filtered by a single type or a list of types."""
+    """
+    Retrieves recent reports, optionally filtered by a single type or a list
+    of types and by outcome.
+    """
     collection = self.db[REPORTS_COLLECTION]
-    query = {}
+    query: Dict[str, Any] = {}
+    if success is not None:
+      query["success"] = success
     if report_type:
       if isinstance(report_type, str):
         query["report_type"] = report_type
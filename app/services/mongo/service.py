@@ -36,8 +36,11 @@ class MongoService:
     self.emails_ops: Optional[EmailsOperations] = None
     self.index_manager: Optional[IndexManager] = None
 
-  async def connect_and_initialize(self):
-    """Connects to MongoDB and initializes all operation classes."""
+  async def connect_and_initialize(self, create_indexes: bool = True):
+    """
+    Connects to MongoDB and initializes all operation classes.
+    Pass create_indexes=False to defer index creation (see ensure_indexes).
+    """
     await self.connection.connect_and_initialize()
 
     # Initialize all operation classes with the database instance
@@ -53,11 +56,18 @@ class MongoService:
     self.emails_ops = EmailsOperations(db)
     self.index_manager = IndexManager(db)
 
-    # Create indexes
-    await self.index_manager.create_indexes()
+    if create_indexes:
+      await self.ensure_indexes()
+
+  async def ensure_indexes(self):
+    """Creates MongoDB indexes if they don't already exist."""
+    if self.index_manager:
+      await self.index_manager.create_indexes()
 
   async def close_mongo_connection(self):
-    """Closes MongoDB connection."""
+    """Flushes buffered error rollups and closes MongoDB connection."""
+    if self.error_ops:
+      await self.error_ops.close()
     await self.connection.close_connection()
 
   async def get_db(self):
@@ -93,11 +103,14 @@ class MongoService:
       return await self.reports_ops.log_report(report_type, data, success, error_message)
 
   async def get_recent_reports(
-      self, report_type: Optional[Union[str, List[str]]] = None, limit: int = 100
+      self,
+      report_type: Optional[Union[str, List[str]]] = None,
+      limit: int = 100,
+      success: Optional[bool] = None,
   ) -> List[Dict[str, Any]]:
-    """Retrieves recent reports."""
+    """Retrieves recent reports, optionally only successful or failed ones."""
     if self.reports_ops:
-      return await self.reports_ops.get_recent_reports(report_type, limit)
+      return await self.reports_ops.get_recent_reports(report_type, limit, success)
     return []
 
   async def get_report_summary(self) -> Dict[str, Any]:
@@ -271,6 +284,14 @@ class MongoService:
       )
     return [], 0
 
+  async def get_recent_error_rollups(
+      self, error_type: Optional[str] = None, limit: int = 50
+  ) -> List[Dict[str, Any]]:
+    """Retrieves the most recently seen error rollups."""
+    if self.error_ops:
+      return await self.error_ops.get_recent_error_rollups(error_type, limit)
+    return []
+
   # === Sheets Operations ===
   async def replace_sheet_collection_data(
       self, collection_name: str, data: List[Dict[str, Any]], id_field: str
@@ -321,6 +342,12 @@ class MongoService:
       return await self.quotes_ops.get_quote_stats()
     return {"total_quotes": 0}
 
+  async def get_frequent_quote_locations(self, since: datetime, limit: int = 500) -> List[Dict[str, Any]]:
+    """Most frequently quoted delivery locations since `since`."""
+    if self.quotes_ops:
+      return await self.quotes_ops.get_frequent_delivery_locations(since, limit)
+    return []
+
   # === Quote Pagination Methods ===
   async def get_recent_quotes(self, limit: int = 10, offset: int = 0):
     """Get recent quotes ordered by creation date (newest first)."""
@@ -505,6 +532,12 @@ class MongoService:
       return await self.classify_ops.get_classifications_requiring_review(limit)
     return []
 
+  async def get_classification_inputs(self, limit: int = 1000, offset: int = 0) -> List[Dict[str, Any]]:
+    """Retrieves stored classification inputs, oldest first, for re-classification."""
+    if self.classify_ops:
+      return await self.classify_ops.get_classification_inputs(limit, offset)
+    return []
+
   async def get_classify_stats(self) -> Dict[str, int]:
     """Retrieves statistics about classifications."""
     if self.classify_ops:
@@ -626,6 +659,18 @@ class MongoService:
       return await self.location_ops.get_location_by_address(delivery_location)
     return None
 
+  async def get_geocoded_locations(self, limit: int = 50000) -> List[Dict[str, Any]]:
+    """Retrieves addresses and coordinates of recent geocoded lookups."""
+    if self.location_ops:
+      return await self.location_ops.get_geocoded_locations(limit)
+    return []
+
+  async def get_frequent_lookup_locations(self, since: datetime, limit: int = 500) -> List[Dict[str, Any]]:
+    """Most frequently looked up delivery locations since `since`."""
+    if self.location_ops:
+      return await self.location_ops.get_frequent_delivery_locations(since, limit)
+    return []
+
   async def get_location_stats(self) -> Dict[str, int]:
     """Retrieves statistics about locations."""
     if self.location_ops:
@@ -51,6 +51,26 @@ async def send_to_n8n_webhook(
     return False
 
 
+async def deliver_n8n_handoff(payload: Dict[str, Any]) -> bool:
+  """
+  Hands a payload to n8n through the "integrations" job queue, so failed
+  deliveries are retried by the worker. Without JOB_QUEUE_ENABLED (or if
+  enqueueing fails) the webhook is called directly.
+  """
+  if settings.JOB_QUEUE_ENABLED:
+    from app.services.jobs import JobQueue
+    from app.services.redis.factory import get_redis_service
+
+    try:
+      if await JobQueue(await get_redis_service()).enqueue("n8n_handoff", {"payload": payload}):
+        logfire.info("Queued n8n handoff for delivery by the job worker.")
+        return True
+    except Exception as e:
+      logfire.warn(f"Could not queue n8n handoff: {e}")
+    logfire.warn("Enqueue of n8n handoff failed; calling the webhook directly.")
+  return await send_to_n8n_webhook(payload=payload)
+
+
 # Updated function signature and logic for Leads
 async def trigger_n8n_handoff_automation(
     classification_result: ClassificationResult,
@@ -193,7 +213,7 @@ async def trigger_n8n_handoff_automation(
   }
 
   # Send the payload to n8n
-  await send_to_n8n_webhook(payload=payload)
+  return await deliver_n8n_handoff(payload)
 
 
 # Optional: Add a function to close the client gracefully if needed
@@ -107,7 +107,7 @@ async def increment_counter_bg(
   try:
     # Use the actual increment method from dash.background
     from app.services.dash.background import increment_request_counter_bg
-    await increment_request_counter_bg(redis_service, key)
+    await increment_request_counter_bg(redis_service, key, increment)
     logfire.debug(f"Counter incremented: {key}")
   except Exception as e:
     logfire.error(f"Failed to increment counter {key}: {e}")
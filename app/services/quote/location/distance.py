@@ -4,13 +4,12 @@
 Distance calculation utilities for quote service.
 """
 
-import asyncio
 import logging
 from typing import Dict, List, Optional, Tuple
 
 import logfire
 
-from app.utils.location import geocode_location, SERVICE_HUBS, get_distance_km
+from app.utils.location import geocode_location_shared, SERVICE_HUBS, get_distance_km
 from app.models.location import DistanceResult, BranchLocation
 
 logger = logging.getLogger(__name__)
@@ -77,11 +76,8 @@ class DistanceCalculator:
         DistanceResult or None if calculation failed
     """
     try:
-      # Geocode delivery address (not async)
-      loop = asyncio.get_running_loop()
-      delivery_coords = await loop.run_in_executor(
-          None, geocode_location, delivery_address
-      )
+      # Geocode delivery address through the shared geocode store
+      delivery_coords = await geocode_location_shared(delivery_address)
 
       if not delivery_coords or None in delivery_coords:
         logfire.warning(
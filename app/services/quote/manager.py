@@ -4,7 +4,6 @@
 Main QuoteService manager that delegates to specialized operation classes.
 """
 
-import asyncio
 import logging
 from typing import Any, Dict, List, Optional, Tuple, Literal
 from datetime import date
@@ -16,7 +15,7 @@ from app.services.redis.service import RedisService
 from app.services.redis.factory import get_redis_service
 from app.services.location import LocationService
 from app.services.mongo import MongoService, get_mongo_service
-from app.utils.location import geocode_location, SERVICE_HUBS, get_distance_km
+from app.utils.location import geocode_location_shared, SERVICE_HUBS, get_distance_km
 
 from .pricing.catalog.retriever import CatalogRetriever
 from .pricing.delivery.calculator import DeliveryCalculator
@@ -99,8 +98,7 @@ class QuoteService:
     # Step 1: Geocode the delivery location
     lat, lon = None, None  # Initialize
     try:
-      loop = asyncio.get_running_loop()
-      lat, lon = await loop.run_in_executor(None, geocode_location, delivery_location_str)
+      lat, lon = await geocode_location_shared(delivery_location_str)
     except Exception as e:
       logger.error(
           f"Exception during fallback geocoding for '{delivery_location_str}': {e}", exc_info=True)
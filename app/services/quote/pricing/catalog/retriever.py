@@ -4,8 +4,10 @@
 Catalog retrieval operations for managing pricing catalogs.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 from app.core.keys import (
     PRICING_CATALOG_CACHE_KEY,
@@ -13,9 +15,13 @@ from app.core.keys import (
     PRICING_CACHE_MISSES_KEY,
 )
 from app.services.dash.background import increment_request_counter_bg
+from app.services.redis.revalidate import RevalidatingCache
 
 logger = logging.getLogger(__name__)
 
+# Process-wide, so the last known good catalog outlives per-request services
+pricing_catalog_cache: RevalidatingCache = RevalidatingCache(PRICING_CATALOG_CACHE_KEY)
+
 
 class CatalogRetriever:
   """Handles catalog retrieval operations."""
@@ -26,63 +32,57 @@ class CatalogRetriever:
   async def get_pricing_catalog(self) -> Optional[Dict[str, Any]]:
     """
     Retrieves the pricing catalog from Redis cache.
-    If not found or on error, attempts to retrieve from MongoDB as a fallback.
+    If it is missing, the last known good catalog is served while a single
+    rebuild from MongoDB repopulates Redis; concurrent callers with nothing to
+    serve share that rebuild instead of each scanning MongoDB.
     """
-    try:
-      catalog = await self.manager.redis_service.get_json(PRICING_CATALOG_CACHE_KEY)
-
-      if catalog:
-        logger.debug(
-            f"Pricing catalog found in Redis cache ('{PRICING_CATALOG_CACHE_KEY}')."
-        )
-        await increment_request_counter_bg(
-            self.manager.redis_service, PRICING_CACHE_HITS_KEY
-        )
-        return catalog
-      else:
-        logger.warning(
-            f"Pricing catalog NOT FOUND in Redis cache ('{PRICING_CATALOG_CACHE_KEY}'). Attempting MongoDB fallback."
-        )
-        await increment_request_counter_bg(
-            self.manager.redis_service, PRICING_CACHE_MISSES_KEY
-        )
-        # Log to MongoDB
-        await self.manager.mongo_service.log_error_to_db(
-            service_name="CatalogRetriever.get_pricing_catalog",
-            error_type="CacheMiss",
-            message=f"Pricing catalog not found in Redis cache (key: '{PRICING_CATALOG_CACHE_KEY}'). Trying MongoDB fallback.",
-            details={"cache_key": PRICING_CATALOG_CACHE_KEY},
-        )
-
-        # Attempt MongoDB fallback
-        return await self.build_catalog_from_mongo()
-
-    except Exception as e:
-      logger.error(
-          f"Error retrieving pricing catalog: {e}. Attempting MongoDB fallback."
+    return await pricing_catalog_cache.get(
+        self._read_cached_catalog,
+        self.build_catalog_from_mongo,
+        write=lambda catalog: self.manager.redis_service.set_json(
+            PRICING_CATALOG_CACHE_KEY, catalog),
+        report=self._report_catalog_error,
+    )
+
+  async def _read_cached_catalog(self) -> Optional[Dict[str, Any]]:
+    catalog = await self.manager.redis_service.get_json(PRICING_CATALOG_CACHE_KEY)
+    if catalog:
+      logger.debug(
+          f"Pricing catalog found in Redis cache ('{PRICING_CATALOG_CACHE_KEY}')."
       )
-      await self.manager.mongo_service.log_error_to_db(
-          service_name="CatalogRetriever.get_pricing_catalog",
-          error_type="CatalogRetrievalError",
-          message=f"Exception during catalog retrieval: {str(e)}",
-          details={"error": str(e), "cache_key": PRICING_CATALOG_CACHE_KEY},
+      await increment_request_counter_bg(
+          self.manager.redis_service, PRICING_CACHE_HITS_KEY
       )
-      # Attempt MongoDB fallback
-      return await self.build_catalog_from_mongo()
+    else:
+      await increment_request_counter_bg(
+          self.manager.redis_service, PRICING_CACHE_MISSES_KEY
+      )
+    return catalog
+
+  async def _report_catalog_error(
+      self, error_type: str, message: str, details: Dict[str, Any]
+  ) -> None:
+    await self.manager.mongo_service.log_error_to_db(
+        service_name="CatalogRetriever.get_pricing_catalog",
+        error_type=error_type,
+        message=message,
+        details=details,
+    )
+
+  async def _find_all(self, collection_name: str) -> List[Dict[str, Any]]:
+    db = await self.manager.mongo_service.get_db()
+    return await db[collection_name].find({}, {"_id": 0}).to_list(length=None)
 
   async def get_config_from_mongo(self) -> Optional[Dict[str, Any]]:
     """Get configuration from MongoDB."""
     try:
       from app.services.quote.utils.helpers import SHEET_CONFIG_COLLECTION
 
-      config_docs = await self.manager.mongo_service.find_all(SHEET_CONFIG_COLLECTION)
+      config_docs = await self._find_all(SHEET_CONFIG_COLLECTION)
       if config_docs:
         # Convert list of documents to dictionary
         config = {}
         for doc in config_docs:
-          # Remove MongoDB's _id field
-          if "_id" in doc:
-            del doc["_id"]
           config.update(doc)
         return config
       return None
@@ -105,10 +105,12 @@ class CatalogRetriever:
           SHEET_CONFIG_COLLECTION,
       )
 
-      # Fetch all collections
-      products = await self.manager.mongo_service.find_all(SHEET_PRODUCTS_COLLECTION)
-      generators = await self.manager.mongo_service.find_all(SHEET_GENERATORS_COLLECTION)
-      config = await self.manager.mongo_service.find_all(SHEET_CONFIG_COLLECTION)
+      # Fetch all collections concurrently
+      products, generators, config = await asyncio.gather(
+          self._find_all(SHEET_PRODUCTS_COLLECTION),
+          self._find_all(SHEET_GENERATORS_COLLECTION),
+          self._find_all(SHEET_CONFIG_COLLECTION),
+      )
 
       if not products or not generators or not config:
         logger.warning(
@@ -125,26 +127,20 @@ class CatalogRetriever:
           "config": {},
       }
 
-      # Process products
+      # Process products (stored by the sheet sync with "id" as their key)
       for product in products:
-        if "_id" in product:
-          del product["_id"]
-        product_id = product.get("product_id")
+        product_id = product.get("id") or product.get("product_id")
         if product_id:
           catalog["products"][product_id] = product
 
       # Process generators
       for generator in generators:
-        if "_id" in generator:
-          del generator["_id"]
-        generator_id = generator.get("generator_id")
+        generator_id = generator.get("id") or generator.get("generator_id")
         if generator_id:
           catalog["generators"][generator_id] = generator
 
       # Process config
       for config_item in config:
-        if "_id" in config_item:
-          del config_item["_id"]
         catalog["config"].update(config_item)
 
       # Extract delivery costs and seasonal info from config
@@ -158,8 +154,15 @@ class CatalogRetriever:
         # Add duplicate key for compatibility
         catalog["delivery_costs"] = catalog["config"]["delivery"]
 
+      elif "delivery_config" in catalog["config"]:
+        # Master config document written by the sheet sync
+        catalog["delivery"] = catalog["config"]["delivery_config"]
+        catalog["delivery_costs"] = catalog["config"]["delivery_config"]
+
       if "seasonal_multipliers" in catalog["config"]:
         catalog["seasonal_multipliers"] = catalog["config"]["seasonal_multipliers"]
+      elif "seasonal_multipliers_config" in catalog["config"]:
+        catalog["seasonal_multipliers"] = catalog["config"]["seasonal_multipliers_config"]
 
       logger.info("Successfully built catalog from MongoDB collections")
       return catalog
@@ -201,20 +204,18 @@ class CatalogRetriever:
         return False
 
       # Store in Redis
-      from app.core.keys import PRICING_CATALOG_CACHE_KEY
-
       await self.manager.redis_service.set_json(
           PRICING_CATALOG_CACHE_KEY,
           catalog,
-          expiration=86400 * 7  # 7 days expiration
+          ttl=86400 * 7  # 7 days expiration
       )
 
       logger.info(
           f"Successfully synchronized catalog from MongoDB to Redis cache")
       # Record sync timestamp
-      await self.manager.redis_service.set_value(
+      await self.manager.redis_service.set(
           "catalog_last_sync",
-          f"{__import__('datetime').datetime.now().isoformat()}"
+          datetime.now().isoformat()
       )
 
       return True
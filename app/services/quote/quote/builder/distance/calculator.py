@@ -40,11 +40,10 @@ class DistanceCalculator:
     # Attach background tasks to location service before calling method
     from app.services.background.util import attach_background_tasks
 
-    # Make sure we have a BackgroundTasks instance
-    bg_tasks = background_tasks or BackgroundTasks()
-
-    # Attach background tasks to the location service
-    attach_background_tasks(self.manager.location_service, bg_tasks)
+    # Attach background tasks to the location service. Without any, the
+    # tasks already bound to this request (if any) are kept.
+    if background_tasks is not None:
+      attach_background_tasks(self.manager.location_service, background_tasks)
 
     # Now call the method with the proper signature
     distance_result = await self.manager.location_service.get_distance_to_nearest_branch(
@@ -104,10 +103,10 @@ class DistanceCalculator:
         Distance result or None if estimation fails
     """
     try:
-      from app.utils.location import geocode_location, SERVICE_HUBS, get_distance_km
+      from app.utils.location import geocode_location_shared, SERVICE_HUBS, get_distance_km
 
       # Geocode the delivery location
-      lat, lon = geocode_location(delivery_location)
+      lat, lon = await geocode_location_shared(delivery_location)
       if lat is None or lon is None:
         logger.warning(f"Could not geocode location: {delivery_location}")
         return None
@@ -8,6 +8,7 @@ import logging
 from typing import Any, Dict, List, Optional
 from datetime import date, datetime, timedelta
 
+from app.core.telemetry import is_detail_sampled, timing_span
 from app.models.quote import QuoteRequest, QuoteResponse, QuoteBody
 from app.services.quote.quote.builder.catalog.loader import CatalogLoader
 from app.services.quote.quote.builder.distance.calculator import DistanceCalculator
@@ -48,43 +49,49 @@ class QuoteBuildingOrchestrator:
     Returns:
         Complete quote response
     """
-    logger.info(f"Building quote for request_id: {request.request_id}")
+    if is_detail_sampled():
+      logger.info(f"Building quote for request_id: {request.request_id}")
 
     # Step 1: Load pricing catalog
-    catalog = await self.catalog_loader.load_catalog()
+    with timing_span("quote.load_catalog"):
+      catalog = await self.catalog_loader.load_catalog()
 
     # Step 2: Calculate delivery distance
-    distance_result = await self.distance_calculator.calculate_distance(
-        request.delivery_location, background_tasks
-    )
-
-    # Step 3: Calculate trailer cost
-    trailer_cost_result = await self.trailer_pricer.calculate_trailer_price(
-        request, catalog
-    )
-
-    # Step 4: Calculate delivery cost
-    delivery_result = await self.delivery_pricer.calculate_delivery_cost(
-        request, catalog, distance_result
-    )
-
-    # Step 5: Calculate extras cost
-    extras_result = await self.extras_pricer.calculate_extras_cost(
-        request, catalog
-    )
-
-    # Step 6: Format response
-    response = self.response_formatter.format_quote_response(
-        request,
-        catalog,
-        distance_result,
-        trailer_cost_result,
-        delivery_result,
-        extras_result
-    )
-
-    logger.info(
-        f"Quote built successfully for request_id: {request.request_id}, quote_id: {response.quote_id}"
-    )
+    with timing_span("quote.calculate_distance"):
+      distance_result = await self.distance_calculator.calculate_distance(
+          request.delivery_location, background_tasks
+      )
+
+    # Steps 3-6: Pricing and response formatting
+    with timing_span("quote.price_and_format", trailer_type=request.trailer_type):
+      # Step 3: Calculate trailer cost
+      trailer_cost_result = await self.trailer_pricer.calculate_trailer_price(
+          request, catalog
+      )
+
+      # Step 4: Calculate delivery cost
+      delivery_result = await self.delivery_pricer.calculate_delivery_cost(
+          request, catalog, distance_result
+      )
+
+      # Step 5: Calculate extras cost
+      extras_result = await self.extras_pricer.calculate_extras_cost(
+          request, catalog
+      )
+
+      # Step 6: Format response
+      response = self.response_formatter.format_quote_response(
+          request,
+          catalog,
+          distance_result,
+          trailer_cost_result,
+          delivery_result,
+          extras_result
+      )
+
+    if is_detail_sampled():
+      logger.info(
+          f"Quote built successfully for request_id: {request.request_id}, quote_id: {response.quote_id}"
+      )
 
     return response
@@ -9,6 +9,7 @@ from typing import Any, Dict, Optional
 from datetime import datetime, timezone
 
 import logfire
+from app.core.telemetry import detail
 from app.models.quote import QuoteResponse, QuoteBody, LineItem, QuoteMetadata
 from app.models.quote.response.details.location import LocationDetails
 
@@ -270,8 +271,8 @@ class ResponseFormatter:
           metadata=metadata
       )
 
-      logfire.info(
-          f"Successfully formatted quote response: {response.quote_id}")
+      detail("Successfully formatted quote response: {quote_id}",
+             quote_id=response.quote_id)
       return response
 
     except Exception as e:
@@ -28,6 +28,9 @@ from app.services.mongo import (
 )
 from app.models.location import BranchLocation
 from app.services.dash.background import log_error_bg
+from app.services.location.cache import LocationCacheOperations
+from app.services.location.locality import build_locality_index
+from app.services.location.prewarm import warmer as distance_warmer
 
 # Import modular components
 from .sheets.service import SheetsService
@@ -94,6 +97,7 @@ class SheetSyncService:
     # Background sync state
     self._sync_task: Optional[asyncio.Task] = None
     self._stop_sync = asyncio.Event()
+    self._branch_warm_task: Optional[asyncio.Task] = None
 
     # Service instances
     self.redis_service: Optional[RedisService] = None
@@ -378,6 +382,24 @@ class SheetSyncService:
       if self.mongo_storage:
         await self.mongo_storage.store_branches_default(branches)
 
+      # Branches are the locality hubs; recompute drive times when they change
+      if self.redis_service and self.mongo_service:
+        try:
+          await build_locality_index(self.redis_service, self.mongo_service, branches)
+        except Exception as index_err:
+          logfire.error(f"Failed to rebuild locality index: {index_err}", exc_info=True)
+
+        # Distance cache entries are namespaced per branch; only changed branches need work
+        try:
+          change = await LocationCacheOperations(
+              self.redis_service, self.mongo_service).record_branch_set(
+              [BranchLocation(**branch) for branch in branches])
+          result["branch_set_version"] = change.version
+          if change.added and settings.DISTANCE_PREWARM_ENABLED:
+            self._warm_branch_distances(change.added, change.version)
+        except Exception as version_err:
+          logfire.error(f"Failed to record branch set version: {version_err}", exc_info=True)
+
       result["success"] = True
       result["count"] = len(branches)
       result["source"] = "sheets"
@@ -399,6 +421,14 @@ class SheetSyncService:
 
       return result
 
+  def _warm_branch_distances(self, branches: List[BranchLocation], version: str) -> None:
+    """Computes distances of new or moved branches in the background."""
+    if self._branch_warm_task and not self._branch_warm_task.done():
+      self._branch_warm_task.cancel()
+    prewarmer = distance_warmer.distance_prewarmer or distance_warmer.DistancePrewarmer(
+        self.redis_service, self.mongo_service)
+    self._branch_warm_task = asyncio.create_task(prewarmer.warm_branches(branches, version))
+
   async def _sync_states_to_storage(
       self,
       background_tasks: Optional[BackgroundTasks] = None,
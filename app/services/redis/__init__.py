@@ -7,9 +7,19 @@ Provides unified Redis service with built-in latency tracking.
 
 from .service import RedisService
 from .factory import get_redis_service, RedisServiceFactory
+from .index import IndexedKeyspace
+from .revalidate import CircuitBreaker, RevalidatingCache
+from .counters import flush_counters
+from .serializer import Serializer, get_serializer
 
 __all__ = [
     "RedisService",
     "get_redis_service",
-    "RedisServiceFactory"
+    "RedisServiceFactory",
+    "IndexedKeyspace",
+    "CircuitBreaker",
+    "RevalidatingCache",
+    "flush_counters",
+    "Serializer",
+    "get_serializer",
 ]
@@ -0,0 +1,62 @@
+# app/services/redis/counters.py
+
+"""
+Dashboard counter writes.
+Deltas are applied to the lifetime counter keys and to a per-minute hash
+bucket in one pipeline, so the dashboard can show rates as well as totals.
+"""
+
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.keys import DASH_COUNTER_BUCKET_PREFIX
+
+if TYPE_CHECKING:
+  # RedisService records its latency through app.services.background, which imports this module
+  from app.services.redis.service import RedisService
+
+logger = logging.getLogger(__name__)
+
+
+def counter_bucket_key(timestamp: float) -> str:
+  return f"{DASH_COUNTER_BUCKET_PREFIX}{int(timestamp // 60)}"
+
+
+def recent_bucket_keys(minutes: int, now: float) -> List[Tuple[int, str]]:
+  """(epoch minute, key) of the last `minutes` buckets, oldest first."""
+  current = int(now // 60)
+  return [(minute, f"{DASH_COUNTER_BUCKET_PREFIX}{minute}")
+          for minute in range(current - minutes + 1, current + 1)]
+
+
+async def flush_counters(redis_service: "RedisService", deltas: Dict[str, int]) -> bool:
+  """INCRBY each lifetime counter and HINCRBY the current minute's bucket in one round trip."""
+  deltas = {key: amount for key, amount in deltas.items() if amount}
+  if not deltas:
+    return True
+  start_time = time.perf_counter()
+  success = False
+  client = None
+  try:
+    bucket = counter_bucket_key(time.time())
+    client = await redis_service.get_client()
+    async with client.pipeline(transaction=False) as pipe:
+      for key, amount in deltas.items():
+        pipe.incrby(key, amount)
+        pipe.hincrby(bucket, key, amount)
+      pipe.expire(bucket, settings.DASH_COUNTER_BUCKET_TTL_SECONDS)
+      await pipe.execute()
+    success = True
+    return True
+  except RedisError as e:
+    logger.error(f"Failed to flush counters {deltas}: {e}", exc_info=True)
+    return False
+  finally:
+    if client:
+      await client.close()
+    redis_service._record_latency(
+        "flush_counters", (time.perf_counter() - start_time) * 1000, success)
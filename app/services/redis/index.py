@@ -0,0 +1,218 @@
+# app/services/redis/index.py
+
+"""
+Indexed key namespaces.
+Keys written through an IndexedKeyspace are also recorded in a sorted set
+scored by their expiry time, so the namespace can be counted in O(log N) and
+cleared in batches without SCANning the whole keyspace.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from redis.exceptions import RedisError
+
+from app.services.redis.serializer import get_serializer
+from app.services.redis.service import RedisService
+
+logger = logging.getLogger(__name__)
+
+# Score for keys stored without a TTL
+NO_EXPIRY = float("inf")
+
+# A backfill that has not finished by then (worker killed mid-scan) can be retried
+BACKFILL_LOCK_SECONDS = 3600
+
+
+class IndexedKeyspace:
+  """A key prefix whose members are tracked in `index_key`."""
+
+  def __init__(self, redis_service: RedisService, index_key: str, prefix: str, batch_size: int = 500):
+    self.redis = redis_service
+    self.index_key = index_key
+    self.prefix = prefix
+    self.batch_size = batch_size
+    self.serializer = get_serializer()
+
+  async def set_json(self, key: str, data: Any, ttl: Optional[int] = None) -> bool:
+    """Stores `data` as JSON and indexes the key in the same round trip."""
+    start_time = time.perf_counter()
+    success = False
+    client = None
+    try:
+      payload = self.serializer.encode(data)
+      now = time.time()
+      client = await self.redis.get_client()
+      async with client.pipeline(transaction=False) as pipe:
+        pipe.set(key, payload, ex=ttl)
+        pipe.zadd(self.index_key, {key: now + ttl if ttl else NO_EXPIRY})
+        # Expired members are dropped as new ones arrive
+        pipe.zremrangebyscore(self.index_key, "-inf", now)
+        await pipe.execute()
+      success = True
+      return True
+    except (RedisError, TypeError) as e:
+      logger.error(f"Failed to store indexed key '{key}': {e}", exc_info=True)
+      return False
+    finally:
+      if client:
+        await client.close()
+      self.redis._record_latency(
+          "indexed_set_json", (time.perf_counter() - start_time) * 1000, success)
+
+  async def set_many_json(
+      self, items: Dict[str, Any], ttl: Optional[int] = None, only_new: bool = False,
+      strict: bool = False,
+  ) -> int:
+    """
+    Stores and indexes many keys, `batch_size` per round trip. With `only_new`
+    existing keys (and their index scores) are left untouched. Returns the
+    number of keys written; with `strict` a Redis error is raised after
+    logging instead of returning the partial count.
+    """
+    start_time = time.perf_counter()
+    success = False
+    client = None
+    written = 0
+    try:
+      now = time.time()
+      score = now + ttl if ttl else NO_EXPIRY
+      entries = [(key, self.serializer.encode(data)) for key, data in items.items()]
+      client = await self.redis.get_client()
+      for start in range(0, len(entries), self.batch_size):
+        batch = entries[start:start + self.batch_size]
+        async with client.pipeline(transaction=False) as pipe:
+          for key, payload in batch:
+            pipe.set(key, payload, ex=ttl, nx=only_new)
+          pipe.zadd(self.index_key, {key: score for key, _ in batch}, nx=only_new)
+          results = await pipe.execute()
+        written += sum(1 for result in results[:-1] if result)
+      success = True
+      return written
+    except (RedisError, TypeError) as e:
+      logger.error(f"Failed to store indexed keys under '{self.prefix}': {e}", exc_info=True)
+      if strict:
+        raise
+      return written
+    finally:
+      if client:
+        await client.close()
+      self.redis._record_latency(
+          "indexed_set_many_json", (time.perf_counter() - start_time) * 1000, success)
+
+  async def delete(self, *keys: str) -> int:
+    """Unlinks keys and removes them from the index."""
+    if not keys:
+      return 0
+    client = None
+    try:
+      client = await self.redis.get_client()
+      async with client.pipeline(transaction=False) as pipe:
+        pipe.unlink(*keys)
+        pipe.zrem(self.index_key, *keys)
+        removed, _ = await pipe.execute()
+      return removed
+    except RedisError as e:
+      logger.error(f"Failed to delete indexed keys {keys}: {e}", exc_info=True)
+      return 0
+    finally:
+      if client:
+        await client.close()
+
+  async def count(self) -> int:
+    """Number of live keys in the namespace."""
+    client = None
+    try:
+      client = await self.redis.get_client()
+      return await client.zcount(self.index_key, time.time(), "+inf")
+    except RedisError as e:
+      logger.error(f"Failed to count keys in index '{self.index_key}': {e}", exc_info=True)
+      return 0
+    finally:
+      if client:
+        await client.close()
+
+  async def clear(self, match: str = "*") -> int:
+    """
+    Unlinks every indexed key matching the glob `match`, `batch_size` keys
+    per round trip. Only the index is scanned, never the whole keyspace.
+    """
+    client = None
+    cleared = 0
+    try:
+      client = await self.redis.get_client()
+      batch: List[str] = []
+      async for member, _ in client.zscan_iter(self.index_key, match=match, count=self.batch_size):
+        batch.append(member)
+        if len(batch) >= self.batch_size:
+          cleared += await self._unlink_batch(client, batch)
+          batch = []
+      if batch:
+        cleared += await self._unlink_batch(client, batch)
+      logger.info(f"Cleared {cleared} keys from index '{self.index_key}' matching '{match}'")
+      return cleared
+    except RedisError as e:
+      logger.error(f"Failed to clear index '{self.index_key}': {e}", exc_info=True)
+      return cleared
+    finally:
+      if client:
+        await client.close()
+
+  async def _unlink_batch(self, client, keys: List[str]) -> int:
+    async with client.pipeline(transaction=False) as pipe:
+      pipe.unlink(*keys)
+      pipe.zrem(self.index_key, *keys)
+      removed, _ = await pipe.execute()
+    return removed
+
+  async def backfill(self) -> int:
+    """
+    One-time migration: indexes keys under the prefix that were written
+    before the index existed. A short-lived lock keeps other workers from
+    scanning at the same time; the done marker is only set once a scan
+    completes, so a failed backfill is retried on the next start.
+    """
+    done_key, lock_key = f"{self.index_key}:backfilled", f"{self.index_key}:backfilling"
+    if await self.redis.exists(done_key):
+      return 0
+    if not await self.redis.set_if_not_exists(lock_key, "1", ttl=BACKFILL_LOCK_SECONDS):
+      return 0
+    client = None
+    indexed = 0
+    try:
+      client = await self.redis.get_client()
+      now = time.time()
+      batch: List[str] = []
+      async for key in client.scan_iter(match=f"{self.prefix}*", count=self.batch_size):
+        batch.append(key)
+        if len(batch) >= self.batch_size:
+          indexed += await self._index_batch(client, batch, now)
+          batch = []
+      if batch:
+        indexed += await self._index_batch(client, batch, now)
+      await client.set(done_key, "1")
+      logger.info(f"Backfilled {indexed} keys into index '{self.index_key}'")
+      return indexed
+    except RedisError as e:
+      logger.error(f"Failed to backfill index '{self.index_key}': {e}", exc_info=True)
+      return indexed
+    finally:
+      if client:
+        try:
+          await client.delete(lock_key)
+        except RedisError:
+          pass  # The lock expires on its own
+        await client.close()
+
+  async def _index_batch(self, client, keys: List[str], now: float) -> int:
+    async with client.pipeline(transaction=False) as pipe:
+      for key in keys:
+        pipe.ttl(key)
+      ttls = await pipe.execute()
+    # ttl is -2 for keys that expired in the meantime and -1 for keys without expiry
+    mapping = {key: (now + ttl if ttl >= 0 else NO_EXPIRY)
+               for key, ttl in zip(keys, ttls) if ttl != -2}
+    if mapping:
+      await client.zadd(self.index_key, mapping)
+    return len(mapping)
@@ -0,0 +1,195 @@
+# app/services/redis/revalidate.py
+
+"""
+Stale-while-revalidate guard for Redis keys that are rebuilt from MongoDB.
+When the key goes missing, callers are served the last known good value
+while a single rebuild runs in the background. Without one, concurrent
+callers all await the same rebuild. A circuit breaker stops rebuild
+attempts, and rate-limits error reports, while the fallback keeps failing.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Reader = Callable[[], Awaitable[Optional[T]]]
+Rebuilder = Callable[[], Awaitable[Optional[T]]]
+Writer = Callable[[T], Awaitable[Any]]
+# (error_type, message, details) -> persisted error log
+Reporter = Callable[[str, str, Dict[str, Any]], Awaitable[Any]]
+
+
+class CircuitBreaker:
+  """Opens after consecutive failures; lets one trial through after the cooldown."""
+
+  def __init__(self, failure_threshold: int, cooldown_seconds: float):
+    self.failure_threshold = failure_threshold
+    self.cooldown_seconds = cooldown_seconds
+    self.failures = 0
+    self.opened_at: Optional[float] = None
+
+  @property
+  def state(self) -> str:
+    if self.opened_at is None:
+      return "closed"
+    if time.monotonic() - self.opened_at >= self.cooldown_seconds:
+      return "half_open"
+    return "open"
+
+  def allow(self) -> bool:
+    return self.state != "open"
+
+  def record_success(self) -> None:
+    self.failures = 0
+    self.opened_at = None
+
+  def record_failure(self) -> None:
+    self.failures += 1
+    if self.failures >= self.failure_threshold:
+      # A failed half-open trial restarts the cooldown
+      self.opened_at = time.monotonic()
+
+
+class RevalidatingCache(Generic[T]):
+  """Per-process guard around one Redis key with a MongoDB fallback."""
+
+  def __init__(
+      self,
+      name: str,
+      failure_threshold: Optional[int] = None,
+      cooldown_seconds: Optional[float] = None,
+      report_interval_seconds: Optional[float] = None,
+  ):
+    self.name = name
+    self.breaker = CircuitBreaker(
+        failure_threshold or settings.CACHE_REBUILD_FAILURE_THRESHOLD,
+        cooldown_seconds or settings.CACHE_REBUILD_COOLDOWN_SECONDS,
+    )
+    self.report_interval_seconds = (
+        report_interval_seconds or settings.CACHE_ERROR_REPORT_INTERVAL_SECONDS)
+    self.last_good: Optional[T] = None
+    self.last_good_at: Optional[float] = None
+    self._rebuild_task: Optional[asyncio.Task] = None
+    self._last_reported: Dict[str, float] = {}
+    self._suppressed: Dict[str, int] = {}
+
+  async def get(
+      self,
+      read: Reader,
+      rebuild: Rebuilder,
+      write: Optional[Writer] = None,
+      report: Optional[Reporter] = None,
+  ) -> Optional[T]:
+    """
+    Returns the cached value, else the last known good value (refreshing it
+    in the background), else the result of the shared rebuild.
+    """
+    try:
+      value = await read()
+    except Exception as e:
+      value = None
+      await self.report(report, "CacheReadError",
+                        f"Failed to read '{self.name}' from Redis: {e}", {"error": str(e)})
+
+    if value:
+      self.last_good = value
+      self.last_good_at = time.monotonic()
+      return value
+
+    if self.last_good is not None:
+      await self.report(report, "CacheMiss",
+                        f"'{self.name}' missing from Redis; serving last known good copy.",
+                        {"stale_seconds": round(time.monotonic() - self.last_good_at, 1)})
+      self._start_rebuild(rebuild, write, report)
+      return self.last_good
+
+    await self.report(report, "CacheMiss",
+                      f"'{self.name}' missing from Redis; rebuilding from MongoDB.", {})
+    task = self._start_rebuild(rebuild, write, report)
+    if task is None:
+      return None
+    # Shielded so one caller being cancelled does not abort everyone's rebuild
+    return await asyncio.shield(task)
+
+  def _start_rebuild(
+      self,
+      rebuild: Rebuilder,
+      write: Optional[Writer],
+      report: Optional[Reporter],
+  ) -> Optional[asyncio.Task]:
+    if self._rebuild_task is not None and not self._rebuild_task.done():
+      return self._rebuild_task
+    if not self.breaker.allow():
+      return None
+    self._rebuild_task = asyncio.create_task(self._rebuild(rebuild, write, report))
+    return self._rebuild_task
+
+  async def _rebuild(
+      self,
+      rebuild: Rebuilder,
+      write: Optional[Writer],
+      report: Optional[Reporter],
+  ) -> Optional[T]:
+    try:
+      value = await rebuild()
+      if not value:
+        raise ValueError("fallback returned no data")
+    except Exception as e:
+      self.breaker.record_failure()
+      await self.report(report, "CacheRebuildError",
+                        f"Failed to rebuild '{self.name}' from MongoDB: {e}",
+                        {"error": str(e), "breaker": self.breaker.state,
+                         "consecutive_failures": self.breaker.failures})
+      return None
+
+    self.breaker.record_success()
+    self.last_good = value
+    self.last_good_at = time.monotonic()
+    if write is not None:
+      try:
+        await write(value)
+      except Exception as e:
+        logger.warning(f"Rebuilt '{self.name}' but could not write it back to Redis: {e}")
+    logger.info(f"Rebuilt '{self.name}' from MongoDB.")
+    return value
+
+  async def report(
+      self,
+      report: Optional[Reporter],
+      error_type: str,
+      message: str,
+      details: Dict[str, Any],
+  ) -> None:
+    """Logs at most one error of each type per report interval; the rest are counted."""
+    now = time.monotonic()
+    last = self._last_reported.get(error_type)
+    if last is not None and now - last < self.report_interval_seconds:
+      self._suppressed[error_type] = self._suppressed.get(error_type, 0) + 1
+      return
+    self._last_reported[error_type] = now
+    suppressed = self._suppressed.pop(error_type, 0)
+    logger.error(f"{message} ({suppressed} similar errors suppressed)" if suppressed else message)
+    if report is None:
+      return
+    try:
+      await report(error_type, message, {
+          "cache_key": self.name, "suppressed": suppressed, **details})
+    except Exception as e:
+      logger.warning(f"Failed to persist cache error for '{self.name}': {e}")
+
+  def stats(self) -> Dict[str, Any]:
+    return {
+        "name": self.name,
+        "breaker": self.breaker.state,
+        "consecutive_failures": self.breaker.failures,
+        "has_last_good": self.last_good is not None,
+        "rebuilding": self._rebuild_task is not None and not self._rebuild_task.done(),
+        "suppressed_reports": dict(self._suppressed),
+    }
@@ -0,0 +1,106 @@
+# app/services/redis/serializer.py
+
+"""
+Encodings for JSON-shaped Redis values.
+Encoded values start with FORMAT_MARKER and a one-character format version,
+so readers can tell the formats apart. Values without the marker are plain
+JSON text written before the prefix existed and keep loading. Processes
+from before this module only read plain JSON, so REDIS_SERIALIZER stays
+"json" until every worker runs this reader; switching it is a later deploy.
+Encodings stay text because the connection pool decodes responses as UTF-8.
+"""
+
+import abc
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+try:
+  import orjson
+except ImportError:  # pragma: no cover - optional speedup
+  orjson = None
+
+logger = logging.getLogger(__name__)
+
+# ASCII record separator; JSON text never starts with it
+FORMAT_MARKER = "\x1e"
+
+
+class Serializer(abc.ABC):
+  """Turns JSON-compatible data into a Redis string value and back."""
+
+  name: str = ""
+  # Format version written after FORMAT_MARKER; empty for unprefixed JSON
+  version: str = ""
+
+  @abc.abstractmethod
+  def dumps(self, data: Any) -> str:
+    """Encodes `data` without the format prefix."""
+
+  @abc.abstractmethod
+  def loads(self, text: str) -> Any:
+    """Decodes a value with the format prefix already stripped."""
+
+  def encode(self, data: Any) -> str:
+    body = self.dumps(data)
+    return f"{FORMAT_MARKER}{self.version}{body}" if self.version else body
+
+
+class JsonSerializer(Serializer):
+  """Stdlib JSON without a prefix: the format every value had before versioning."""
+
+  name = "json"
+
+  def dumps(self, data: Any) -> str:
+    return json.dumps(data)
+
+  def loads(self, text: str) -> Any:
+    return json.loads(text)
+
+
+class OrjsonSerializer(Serializer):
+  """Compact orjson text, several times faster than stdlib json both ways."""
+
+  name = "orjson"
+  version = "1"
+
+  def dumps(self, data: Any) -> str:
+    # Non-string keys are stringified, as json.dumps does
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+  def loads(self, text: str) -> Any:
+    return orjson.loads(text)
+
+
+SERIALIZERS: Dict[str, Serializer] = {
+    serializer.name: serializer for serializer in (JsonSerializer(), OrjsonSerializer())
+}
+_BY_VERSION = {serializer.version: serializer for serializer in SERIALIZERS.values()}
+
+
+def get_serializer(name: Optional[str] = None) -> Serializer:
+  """The serializer called `name` (default REDIS_SERIALIZER), falling back to stdlib JSON."""
+  name = name or settings.REDIS_SERIALIZER
+  serializer = SERIALIZERS.get(name)
+  if serializer is None:
+    logger.warning(f"Unknown Redis serializer '{name}', using json")
+    return SERIALIZERS["json"]
+  if serializer.name == "orjson" and orjson is None:
+    logger.warning("orjson is not installed, using json for Redis values")
+    return SERIALIZERS["json"]
+  return serializer
+
+
+def decode(text: str) -> Any:
+  """
+  Loads a value written by any serializer. Raises ValueError for malformed
+  values and for format versions this process does not know.
+  """
+  if not text.startswith(FORMAT_MARKER):
+    return json.loads(text)
+  serializer = _BY_VERSION.get(text[1:2])
+  if serializer is None or (serializer.name == "orjson" and orjson is None):
+    raise ValueError(f"Unsupported Redis value format {text[1:2]!r}")
+  return serializer.loads(text[2:])
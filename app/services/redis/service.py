@@ -5,7 +5,6 @@ Unified Redis service with built-in latency tracking.
 This single service handles all Redis operations with automatic instrumentation.
 """
 
-import json
 import logging
 import time
 from typing import Any, Dict, List, Optional
@@ -16,7 +15,9 @@ from redis.exceptions import RedisError
 from fastapi import BackgroundTasks
 
 from app.core.config import settings
+from app.core.context import bind_request_context, current_background_tasks
 from app.services.background.latency import record_external_api_latency_bg
+from app.services.redis.serializer import Serializer, decode, get_serializer
 
 logger = logging.getLogger(__name__)
 
@@ -27,19 +28,38 @@ class RedisService:
   Manages connection pool and provides instrumented operations.
   """
   _pool: Optional[ConnectionPool] = None
+  # The pool is verified once per process, not once per service instance
+  _connection_tested: bool = False
+  _serializer: Optional[Serializer] = None
 
   def __init__(self):
     self.background_tasks: Optional[BackgroundTasks] = None
-    self._connection_tested = False
 
   def set_background_tasks(self, background_tasks: BackgroundTasks):
-    """Set background tasks for latency recording."""
-    self.background_tasks = background_tasks
+    """
+    Set background tasks for latency recording. They are bound to the
+    current request context, since instances are shared across requests.
+    """
+    bind_request_context(background_tasks=background_tasks)
+
+  @property
+  def serializer(self) -> Serializer:
+    """Encoding used for values written by set_json; reads accept every format."""
+    if RedisService._serializer is None:
+      RedisService._serializer = get_serializer()
+    return RedisService._serializer
+
+  def encode(self, data: Any) -> str:
+    return self.serializer.encode(data)
+
+  def decode(self, value: str) -> Any:
+    return decode(value)
 
   def _record_latency(self, operation: str, latency_ms: float, success: bool = True):
     """Record latency for a Redis operation."""
-    if self.background_tasks:
-      self.background_tasks.add_task(
+    background_tasks = self.background_tasks or current_background_tasks()
+    if background_tasks:
+      background_tasks.add_task(
           record_external_api_latency_bg,
           redis=self,
           service_type="redis",
@@ -50,16 +70,15 @@ class RedisService:
 
   async def _ensure_connection(self):
     """Ensure Redis connection is available and tested."""
-    if not self._connection_tested:
+    if not RedisService._connection_tested:
       try:
         client = await self.get_client()
         await client.ping()
         await client.close()
-        self._connection_tested = True
+        RedisService._connection_tested = True
         logger.debug("RedisService connection verified")
       except Exception as e:
         logger.warning(f"Redis connection test failed: {e}")
-        self._connection_tested = False
 
   @classmethod
   async def get_pool(cls) -> ConnectionPool:
@@ -91,6 +110,7 @@ class RedisService:
       logger.info("Closing Redis connection pool.")
       await cls._pool.disconnect()
       cls._pool = None
+      RedisService._connection_tested = False
 
   async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
     """Sets a value in Redis with latency tracking."""
@@ -112,6 +132,29 @@ class RedisService:
       latency_ms = (time.perf_counter() - start_time) * 1000
       self._record_latency("set", latency_ms, success)
 
+  async def set_if_not_exists(self, key: str, value: Any, ttl: Optional[int] = None) -> Optional[bool]:
+    """
+    Atomically sets a value only if the key does not exist (SET NX) with latency tracking.
+    Returns True if the key was set, False if it already existed, None on Redis errors.
+    """
+    await self._ensure_connection()
+    start_time = time.perf_counter()
+    try:
+      client = await self.get_client()
+      result = await client.set(key, value, ex=ttl, nx=True)
+      logger.debug(f"SET NX key '{key}' with ttl={ttl}: {bool(result)}")
+      success = True
+      return bool(result)
+    except RedisError as e:
+      logger.error(f"Redis error on SET NX for key '{key}': {e}", exc_info=True)
+      success = False
+      return None
+    finally:
+      if 'client' in locals() and client:
+        await client.close()
+      latency_ms = (time.perf_counter() - start_time) * 1000
+      self._record_latency("set_nx", latency_ms, success)
+
   async def get(self, key: str) -> Optional[str]:
     """Gets a value from Redis with latency tracking."""
     await self._ensure_connection()
@@ -157,11 +200,11 @@ class RedisService:
       self._record_latency(f"mget({len(keys)})", latency_ms, success)
 
   async def set_json(self, key: str, data: Any, ttl: Optional[int] = None) -> bool:
-    """Serializes data to JSON and sets it in Redis with latency tracking."""
+    """Serializes data with the configured serializer and sets it in Redis with latency tracking."""
     await self._ensure_connection()
     start_time = time.perf_counter()
     try:
-      json_data = json.dumps(data)
+      json_data = self.encode(data)
       success = await self.set(key, json_data, ttl=ttl)
       return success
     except TypeError as e:
@@ -174,18 +217,18 @@ class RedisService:
       self._record_latency("set_json", latency_ms, success)
 
   async def get_json(self, key: str) -> Optional[Any]:
-    """Gets a JSON string from Redis and deserializes it with latency tracking."""
+    """Gets a serialized value from Redis, in any format, and deserializes it with latency tracking."""
     await self._ensure_connection()
     start_time = time.perf_counter()
     try:
       json_data = await self.get(key)
       if json_data:
-        result = json.loads(json_data)
+        result = self.decode(json_data)
         success = True
         return result
       success = True
       return None
-    except json.JSONDecodeError as e:
+    except ValueError as e:
       logger.error(f"Error decoding JSON for key '{key}': {e}", exc_info=True)
       success = False
       return None
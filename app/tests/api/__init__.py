@@ -0,0 +1 @@
+# app/tests/api/__init__.py
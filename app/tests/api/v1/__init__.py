@@ -0,0 +1 @@
+# app/tests/api/v1/__init__.py
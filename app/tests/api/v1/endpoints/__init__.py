@@ -0,0 +1 @@
+# app/tests/api/v1/endpoints/__init__.py
@@ -0,0 +1 @@
+# app/tests/api/v1/endpoints/webhooks/util/__init__.py
@@ -0,0 +1,109 @@
+# app/tests/api/v1/endpoints/webhooks/util/idempotency.py
+"""Tests for webhook delivery ids and the idempotency guard."""
+
+import asyncio
+import importlib
+
+from fastapi import BackgroundTasks, Response
+
+from app.api.v1.endpoints.webhooks.util.idempotency import (
+    PAYLOAD_HASH_PREFIX,
+    WebhookIdempotency,
+    derive_event_id,
+)
+from app.core.config import settings
+from app.models.webhook import FormPayload, HubSpotContactDataPayload
+from app.tests.stubs import FakeRedisService
+
+# The packages re-export their APIRouter as `router`, shadowing the modules
+form_router = importlib.import_module("app.api.v1.endpoints.webhooks.form.router")
+hubspot_router = importlib.import_module("app.api.v1.endpoints.webhooks.hubspot.router")
+
+
+def idempotency_ttls(redis):
+  return {key: ttl for key, ttl in redis.client.ttls.items() if key.startswith("webhook:idempotency:")}
+
+
+class TestDeriveEventId:
+  """Test cases for choosing the delivery id."""
+
+  def test_delivery_id_wins_over_payload(self):
+    """Test that the Idempotency-Key header is used as is, whatever the body."""
+    assert derive_event_id({"email": "a@example.com"}, delivery_id=" sub-1 ") == "sub-1"
+    assert derive_event_id({"email": "b@example.com"}, delivery_id="sub-1") == "sub-1"
+
+  def test_identical_bodies_share_a_hash_without_an_id(self):
+    """Test that the fallback is a stable hash of the canonical body."""
+    first = derive_event_id({"email": "a@example.com", "phone": "1"}, delivery_id="")
+    second = derive_event_id({"phone": "1", "email": "a@example.com"})
+
+    assert first == second and first.startswith(PAYLOAD_HASH_PREFIX)
+    assert derive_event_id({"email": "b@example.com", "phone": "1"}) != first
+
+
+class TestFormWebhookIdempotency:
+  """Test cases for form deliveries with and without an Idempotency-Key."""
+
+  def run(self, monkeypatch, deliveries):
+    redis = FakeRedisService()
+    processed = []
+
+    async def process(payload, background_tasks):
+      processed.append(payload.email)
+      return form_router.FormWebhookResponseData(status="success", message=payload.email)
+
+    monkeypatch.setattr(form_router, "_process_form_webhook", process)
+
+    async def deliver_all():
+      return [await form_router.webhook_form(
+          response=Response(), payload=FormPayload(email=email), background_tasks=BackgroundTasks(),
+          redis_service=redis, idempotency_key=key) for email, key in deliveries]
+
+    return asyncio.run(deliver_all()), processed, redis
+
+  def test_retry_with_the_same_key_is_replayed(self, monkeypatch):
+    """Test that a delivery repeating an Idempotency-Key replays the stored outcome for a day."""
+    results, processed, redis = self.run(
+        monkeypatch, [("a@example.com", "sub-1"), ("a@example.com", "sub-1"), ("a@example.com", "sub-2")])
+
+    assert processed == ["a@example.com", "a@example.com"]
+    assert results[1].data.message == "a@example.com"
+    assert set(idempotency_ttls(redis).values()) == {settings.WEBHOOK_IDEMPOTENCY_TTL_SECONDS}
+
+  def test_identical_body_without_key_is_deduplicated_for_the_retry_window_only(self, monkeypatch):
+    """Test that the hash fallback replays a retry but keeps its record only briefly."""
+    _, processed, redis = self.run(monkeypatch, [("a@example.com", None), ("a@example.com", None)])
+
+    assert processed == ["a@example.com"]
+    [(key, ttl)] = idempotency_ttls(redis).items()
+    assert PAYLOAD_HASH_PREFIX in key
+    assert ttl == settings.WEBHOOK_IDEMPOTENCY_HASH_TTL_SECONDS < settings.WEBHOOK_IDEMPOTENCY_TTL_SECONDS
+
+
+class TestHubSpotWebhookIdempotency:
+  """Test cases for HubSpot deliveries with and without an Idempotency-Key."""
+
+  def test_key_and_hash_paths(self, monkeypatch):
+    """Test that a keyed delivery keeps the day-long record and a keyless one the short one."""
+    redis = FakeRedisService()
+    processed = []
+
+    async def process(payload, background_tasks):
+      processed.append(payload.email)
+      return hubspot_router.HubSpotWebhookResponseData(status="success", message="ok")
+
+    monkeypatch.setattr(hubspot_router, "_process_hubspot_webhook", process)
+
+    async def deliver(key):
+      return await hubspot_router.webhook_hubspot(
+          response=Response(), payload=HubSpotContactDataPayload(email="a@example.com"),
+          background_tasks=BackgroundTasks(), redis_service=redis, idempotency_key=key)
+
+    for key in ("evt-1", "evt-1", None, None):
+      asyncio.run(deliver(key))
+
+    assert processed == ["a@example.com", "a@example.com"]
+    ttls = idempotency_ttls(redis)
+    assert ttls[WebhookIdempotency.key_for("hubspot", "evt-1")] == settings.WEBHOOK_IDEMPOTENCY_TTL_SECONDS
+    assert sorted(ttls.values()) == [
+        settings.WEBHOOK_IDEMPOTENCY_HASH_TTL_SECONDS, settings.WEBHOOK_IDEMPOTENCY_TTL_SECONDS]
@@ -0,0 +1,2 @@
+# app/tests/benchmarks/__init__.py
+"""Performance benchmarks (run as scripts, not collected as unit tests)."""
@@ -0,0 +1,178 @@
+# app/tests/benchmarks/instrumentation.py
+"""
+Benchmark of quote-path telemetry cost under Logfire instrumentation policies.
+
+Replays the Pydantic work done for one quote (QuoteRequest parsing, one cached
+DistanceResult per branch, QuoteDocument for Mongo logging and a
+RequestLogEntry) with instrumentation fully on, in hot-path mode (metrics
+only) and off, and reports per-quote latency percentiles.
+
+It then replays the spans and detail logs of one quote request under head
+sampling (LOGFIRE_HEAD_SAMPLE_RATE) and hot-path detail sampling
+(LOGFIRE_HOT_PATH_SAMPLE_RATE) at each rate given with --sample-rates.
+
+Usage:
+    python -m app.tests.benchmarks.instrumentation --iterations 2000 \\
+        --sample-rates 1,0.1,0.01
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+import logfire
+
+from app.core.telemetry import begin_request, detail, get_telemetry_policy, timing_span
+from app.core.telemetry.policy import TelemetryPolicy
+from app.core.telemetry.setup import _sampling_options
+from app.models.dash.dashboard import RequestLogEntry
+from app.models.location import BranchLocation, DistanceResult
+from app.models.mongo.quotes import QuoteDocument
+from app.models.quote import QuoteRequest
+
+HOT_MODELS = (QuoteRequest, DistanceResult, BranchLocation,
+              QuoteDocument, RequestLogEntry)
+
+QUOTE_PAYLOAD = {
+    "delivery_location": "1600 Amphitheatre Parkway, Mountain View, CA 94043",
+    "trailer_type": "2 Stall Restroom Trailer",
+    "rental_start_date": "2025-07-15",
+    "rental_days": 3,
+    "usage_type": "event",
+    "extras": [{"extra_id": "3kW Generator", "qty": 1}, {"extra_id": "pump_out", "qty": 2}],
+}
+
+BRANCHES = [
+    {"name": "Omaha", "address": "123 Main St, Omaha, NE 68102"},
+    {"name": "Denver", "address": "456 Broadway, Denver, CO 80203"},
+    {"name": "Kansas City", "address": "789 Grand Blvd, Kansas City, KS 66101"},
+]
+
+
+def _with_record(model: type, record: str) -> type:
+  """Subclass of `model` with the given Logfire record mode."""
+  config = dict(model.model_config)
+  config["plugin_settings"] = {"logfire": {"record": record}}
+  return type(model.__name__, (model,), {"model_config": config, "__module__": model.__module__})
+
+
+def _build_models(record: str) -> Dict[str, type]:
+  return {model.__name__: _with_record(model, record) for model in HOT_MODELS}
+
+
+def _one_quote(models: Dict[str, type]) -> None:
+  request = models["QuoteRequest"](**QUOTE_PAYLOAD)
+  for branch in BRANCHES:
+    models["DistanceResult"](
+        nearest_branch=models["BranchLocation"](**branch),
+        delivery_location=request.delivery_location,
+        distance_miles=12.3,
+        distance_meters=19795,
+        duration_seconds=1500,
+        within_service_area=True,
+    )
+  models["QuoteDocument"](
+      id="QT-bench",
+      request_id=request.request_id,
+      delivery_location=request.delivery_location,
+      status="completed",
+  )
+  models["RequestLogEntry"](
+      timestamp=datetime.now(timezone.utc),
+      request_id=request.request_id,
+      endpoint="/api/v1/webhook/quote/generate",
+      request_payload=QUOTE_PAYLOAD,
+      status_code=200,
+      latency_ms=12.0,
+  )
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+  ordered = sorted(samples)
+  index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+  return ordered[index]
+
+
+def _one_request() -> None:
+  """Spans and detail logs of one quote request, as the middleware and services emit them."""
+  begin_request("/api/v1/webhook/quote/generate")
+  with timing_span("quote_request", path="/api/v1/webhook/quote/generate"):
+    for branch in BRANCHES:
+      with timing_span("distance_lookup", branch=branch["name"]):
+        detail("Cache hit for distance: '{branch_address}'", branch_address=branch["address"])
+    detail("Quote generated", trailer_type=QUOTE_PAYLOAD["trailer_type"])
+
+
+def _measure(func: Callable[[], None], iterations: int) -> Dict[str, Any]:
+  func()  # warm up
+  samples = []
+  for _ in range(iterations):
+    start = time.perf_counter()
+    func()
+    samples.append((time.perf_counter() - start) * 1000)
+  return {
+      "iterations": iterations,
+      "mean_ms": round(statistics.mean(samples), 4),
+      "p50_ms": round(_percentile(samples, 50), 4),
+      "p95_ms": round(_percentile(samples, 95), 4),
+      "p99_ms": round(_percentile(samples, 99), 4),
+  }
+
+
+def _set_hot_path(rate: float) -> None:
+  """Turns hot-path mode on with detail sampling at `rate`."""
+  os.environ["LOGFIRE_HOT_PATH_MODE"] = "true"
+  os.environ["LOGFIRE_HOT_PATH_SAMPLE_RATE"] = str(rate)
+  get_telemetry_policy.cache_clear()
+
+
+def run_sampling(iterations: int, rates: List[float]) -> Dict[str, Any]:
+  saved = {name: os.environ.get(name)
+           for name in ("LOGFIRE_HOT_PATH_MODE", "LOGFIRE_HOT_PATH_SAMPLE_RATE")}
+  results: Dict[str, Any] = {"head": {}, "hot_path_detail": {}}
+  try:
+    for rate in rates:
+      logfire.configure(send_to_logfire=False, console=False,
+                        **_sampling_options(TelemetryPolicy(head_sample_rate=rate)))
+      os.environ["LOGFIRE_HOT_PATH_MODE"] = "false"
+      get_telemetry_policy.cache_clear()
+      results["head"][str(rate)] = _measure(_one_request, iterations)
+
+    logfire.configure(send_to_logfire=False, console=False)
+    for rate in rates:
+      _set_hot_path(rate)
+      results["hot_path_detail"][str(rate)] = _measure(_one_request, iterations)
+  finally:
+    for name, value in saved.items():
+      if value is None:
+        os.environ.pop(name, None)
+      else:
+        os.environ[name] = value
+    get_telemetry_policy.cache_clear()
+  return results
+
+
+def run(iterations: int, sample_rates: List[float]) -> Dict[str, Any]:
+  logfire.configure(send_to_logfire=False, console=False)
+  logfire.instrument_pydantic(record="all")
+
+  results: Dict[str, Any] = {}
+  for label, record in (("instrumented", "all"), ("hot_path", "metrics"), ("off", "off")):
+    models = _build_models(record)
+    results[label] = _measure(lambda: _one_quote(models), iterations)
+  results["sampling"] = run_sampling(iterations, sample_rates)
+  return results
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--iterations", type=int, default=2000)
+  parser.add_argument("--sample-rates", default="1,0.1,0.01",
+                      help="Comma-separated head / hot-path sample rates to compare.")
+  args = parser.parse_args()
+  rates = [float(rate) for rate in args.sample_rates.split(",") if rate.strip()]
+  print(json.dumps(run(args.iterations, rates), indent=2))
@@ -0,0 +1,285 @@
+# app/tests/benchmarks/quote.py
+"""
+End-to-end latency benchmark for quote generation.
+
+Builds a real QuoteService (catalog retrieval, LocationService distance
+lookup and caching, trailer/delivery/extras pricing, response formatting)
+in-process against stand-ins from `app.tests.benchmarks.stubs`: an in-memory
+Redis (or a local one given with --redis-url), a canned Mongo and a Google Maps
+client with configurable latency. Pricing catalog, branches and states are
+seeded into Redis the way the sheet sync leaves them.
+
+Two scenarios are measured over the same location/trailer mix:
+
+- cold: the distance cache is cleared before each request, so every quote
+  pays for one Distance Matrix call per branch.
+- warm: the cache is primed once, so every quote is served from Redis.
+
+Per scenario it reports throughput and p50/p95/p99 latency, and writes all
+results as JSON so runs can be compared before and after a change.
+
+Usage:
+    python -m app.tests.benchmarks.quote --requests 200 --concurrency 10 \\
+        --gmaps-latency-ms 120 --output quote-bench.json
+
+Note: --redis-url overwrites the pricing catalog, branch and states keys of
+that instance; point it at a throwaway local Redis only.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from fastapi import BackgroundTasks
+
+from app.core.keys import BRANCH_LIST_CACHE_KEY, PRICING_CATALOG_CACHE_KEY, STATES_LIST_CACHE_KEY
+from app.models.quote import QuoteRequest
+from app.services.location import LocationService
+from app.services.location.cache import distance_cache_keyspace
+from app.services.quote import QuoteService
+from app.tests.benchmarks.stubs import BenchmarkMongoService, BenchmarkRedisService, StubGoogleMapsClient
+
+BRANCHES = [
+    {"name": "Omaha", "address": "10020 S 134th St, Omaha, NE 68138"},
+    {"name": "Denver", "address": "4600 Holly St, Denver, CO 80216"},
+    {"name": "Kansas City", "address": "1801 Swift Ave, North Kansas City, MO 64116"},
+]
+
+STATES = [
+    {"state": "Nebraska", "code": "NE"},
+    {"state": "Colorado", "code": "CO"},
+    {"state": "Kansas", "code": "KS"},
+    {"state": "Missouri", "code": "MO"},
+    {"state": "Iowa", "code": "IA"},
+    {"state": "Wyoming", "code": "WY"},
+]
+
+LOCATIONS = [
+    "1600 Pennsylvania St, Denver, CO 80203",
+    "1200 Market St, Lincoln, NE 68508",
+    "800 W 47th St, Kansas City, MO 64112",
+    "300 E Locust St, Des Moines, IA 50309",
+    "2100 Broadway, Boulder, CO 80302",
+    "500 S Main St, Council Bluffs, IA 51503",
+    "120 N Capitol Ave, Cheyenne, WY 82001",
+    "900 Massachusetts St, Lawrence, KS 66044",
+    "15 E 5th St, Grand Island, NE 68801",
+    "4000 S College Ave, Fort Collins, CO 80525",
+]
+
+_SHORT_PRODUCT_RATES = {"event_standard": 1450.0, "weekly_7_day": 1850.0,
+                        "rate_28_day": 4200.0, "rate_2_5_month": 3900.0,
+                        "rate_6_plus_month": 3600.0, "rate_18_plus_month": 3300.0}
+
+TRAILERS = {
+    "2 Stall Restroom Trailer": 1.0,
+    "3 Stall ADA Restroom Trailer": 1.4,
+    "8 Stall Restroom Trailer": 2.1,
+    "Shower Trailer": 1.7,
+}
+
+# (trailer, usage, rental_days, extras) – short events dominate, as in production.
+REQUEST_MIX = [
+    ("2 Stall Restroom Trailer", "event", 2, [{"extra_id": "3kW Generator", "qty": 1}]),
+    ("3 Stall ADA Restroom Trailer", "event", 3, [{"extra_id": "pump_out", "qty": 1}]),
+    ("8 Stall Restroom Trailer", "event", 1, [{"extra_id": "7kW Generator", "qty": 1},
+                                              {"extra_id": "cleaning", "qty": 2}]),
+    ("2 Stall Restroom Trailer", "commercial", 30, []),
+    ("Shower Trailer", "commercial", 90, [{"extra_id": "fresh_water_fill", "qty": 4}]),
+    ("3 Stall ADA Restroom Trailer", "commercial", 14, [{"extra_id": "pump_out", "qty": 2}]),
+]
+
+
+def build_catalog() -> Dict[str, Any]:
+  """Pricing catalog in the shape the sheet sync writes to Redis."""
+  products = {}
+  for trailer_id, factor in TRAILERS.items():
+    product = {key: round(rate * factor, 2)
+               for key, rate in _SHORT_PRODUCT_RATES.items()}
+    product.update({"id": trailer_id, "name": trailer_id, "extras": {
+        "pump_out": 300.0, "cleaning": 250.0, "fresh_water_fill": 150.0, "restocking": 100.0,
+    }})
+    products[trailer_id] = product
+  today = date.today()
+  return {
+      "products": products,
+      "generators": {
+          "3kW Generator": {"name": "3kW Generator", "rate_event": 250.0, "rate_7_day": 400.0, "rate_28_day": 900.0},
+          "7kW Generator": {"name": "7kW Generator", "rate_event": 350.0, "rate_7_day": 550.0, "rate_28_day": 1200.0},
+      },
+      "delivery": {
+          "base_fee": 0.0,
+          "free_miles_threshold": 25,
+          "per_mile_rates": {"denver": 3.99, "omaha_kansas_city": 2.99},
+      },
+      "seasonal_multipliers": {
+          "standard": 1.0,
+          "tiers": [{
+              "name": "Peak",
+              "start_date": (today + timedelta(days=60)).isoformat(),
+              "end_date": (today + timedelta(days=120)).isoformat(),
+              "rate": 1.15,
+          }],
+      },
+      "config": {},
+      "last_updated": datetime.now(timezone.utc).isoformat(),
+  }
+
+
+def build_requests(count: int, unique_locations: bool) -> List[QuoteRequest]:
+  """
+  Cycles the location and request mixes. With `unique_locations` each request
+  gets its own street number so no two requests share a distance cache entry.
+  """
+  start = date.today() + timedelta(days=14)
+  requests = []
+  for i in range(count):
+    location = LOCATIONS[i % len(LOCATIONS)]
+    if unique_locations:
+      number, rest = location.split(" ", 1)
+      location = f"{int(number) + i} {rest}"
+    trailer, usage, days, extras = REQUEST_MIX[i % len(REQUEST_MIX)]
+    requests.append(QuoteRequest(
+        delivery_location=location,
+        trailer_type=trailer,
+        rental_start_date=start + timedelta(days=i % 90),
+        rental_days=days,
+        usage_type=usage,
+        extras=extras,
+    ))
+  return requests
+
+
+def _percentile(values: List[float], pct: float) -> float:
+  ordered = sorted(values)
+  index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+  return round(ordered[index], 3)
+
+
+def summarize(name: str, latencies_ms: List[float], wall_seconds: float, failures: int, gmaps_calls: int) -> Dict[str, Any]:
+  return {
+      "scenario": name,
+      "requests": len(latencies_ms) + failures,
+      "failures": failures,
+      "throughput_rps": round(len(latencies_ms) / wall_seconds, 2) if wall_seconds else None,
+      "mean_ms": round(statistics.fmean(latencies_ms), 3) if latencies_ms else None,
+      "p50_ms": _percentile(latencies_ms, 50) if latencies_ms else None,
+      "p95_ms": _percentile(latencies_ms, 95) if latencies_ms else None,
+      "p99_ms": _percentile(latencies_ms, 99) if latencies_ms else None,
+      "max_ms": round(max(latencies_ms), 3) if latencies_ms else None,
+      "gmaps_distance_calls": gmaps_calls,
+  }
+
+
+class QuoteBenchmark:
+  """Owns the service graph and runs scenarios against it."""
+
+  def __init__(self, gmaps: StubGoogleMapsClient):
+    self.gmaps = gmaps
+    self.redis_service = BenchmarkRedisService()
+    self.mongo_service = BenchmarkMongoService()
+    self.location_service = LocationService(
+        self.redis_service, self.mongo_service)  # type: ignore[arg-type]
+    self.location_service.google_ops._gmaps = gmaps
+    self.quote_service = QuoteService(
+        self.redis_service, self.location_service, self.mongo_service)  # type: ignore[arg-type]
+
+  async def seed(self):
+    await self.redis_service.set_json(PRICING_CATALOG_CACHE_KEY, build_catalog())
+    await self.redis_service.set_json(BRANCH_LIST_CACHE_KEY, BRANCHES)
+    await self.redis_service.set_json(STATES_LIST_CACHE_KEY, STATES)
+
+  async def clear_distance_cache(self):
+    await distance_cache_keyspace(self.redis_service).clear()
+
+  async def _one(self, request: QuoteRequest, clear_first: bool) -> Optional[float]:
+    if clear_first:
+      await self.clear_distance_cache()
+    background_tasks = BackgroundTasks()
+    start = time.perf_counter()
+    try:
+      await self.quote_service.build_quote(request, background_tasks)
+    except Exception:
+      return None
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    # Background work runs after the response in the route; keep it out of the timing.
+    await background_tasks()
+    return elapsed_ms
+
+  async def run_scenario(self, name: str, requests: List[QuoteRequest], concurrency: int, clear_first: bool) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    calls_before = self.gmaps.distance_matrix_calls
+
+    async def bounded(request: QuoteRequest) -> Optional[float]:
+      async with semaphore:
+        return await self._one(request, clear_first)
+
+    wall_start = time.perf_counter()
+    results = await asyncio.gather(*(bounded(r) for r in requests))
+    wall_seconds = time.perf_counter() - wall_start
+
+    latencies = [r for r in results if r is not None]
+    return summarize(name, latencies, wall_seconds, len(results) - len(latencies),
+                     self.gmaps.distance_matrix_calls - calls_before)
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+  backend = BenchmarkRedisService.configure(args.redis_url)
+  gmaps = StubGoogleMapsClient(
+      latency_ms=args.gmaps_latency_ms, jitter_ms=args.gmaps_jitter_ms)
+  bench = QuoteBenchmark(gmaps)
+  await bench.seed()
+
+  # Cold: one request at a time so clearing the cache cannot race other requests.
+  await bench.clear_distance_cache()
+  cold = await bench.run_scenario(
+      "cold", build_requests(args.cold_requests, unique_locations=True),
+      concurrency=1, clear_first=True)
+
+  warm_requests = build_requests(args.requests, unique_locations=False)
+  await bench.run_scenario("prime", warm_requests[:len(LOCATIONS)], 1, False)
+  warm = await bench.run_scenario(
+      "warm", warm_requests, concurrency=args.concurrency, clear_first=False)
+
+  return {
+      "generated_at": datetime.now(timezone.utc).isoformat(),
+      "redis_backend": backend,
+      "gmaps_latency_ms": args.gmaps_latency_ms,
+      "gmaps_jitter_ms": args.gmaps_jitter_ms,
+      "branches": len(BRANCHES),
+      "concurrency": args.concurrency,
+      "mongo_errors_logged": bench.mongo_service.errors_logged,
+      "results": [cold, warm],
+  }
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__,
+                                   formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--requests", type=int, default=200,
+                      help="Warm-cache requests.")
+  parser.add_argument("--cold-requests", type=int, default=30,
+                      help="Cold-cache requests (run sequentially).")
+  parser.add_argument("--concurrency", type=int, default=10)
+  parser.add_argument("--gmaps-latency-ms", type=float, default=120.0)
+  parser.add_argument("--gmaps-jitter-ms", type=float, default=40.0)
+  parser.add_argument("--redis-url", default=None,
+                      help="Use a local Redis instead of the in-memory one.")
+  parser.add_argument("--output", default=None,
+                      help="Write the JSON results to this file.")
+  args = parser.parse_args()
+
+  report = asyncio.run(run(args))
+  text = json.dumps(report, indent=2)
+  print(text)
+  if args.output:
+    with open(args.output, "w") as fh:
+      fh.write(text)
+
+
+if __name__ == "__main__":
+  main()
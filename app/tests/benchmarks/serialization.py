@@ -0,0 +1,122 @@
+# app/tests/benchmarks/serialization.py
+"""
+Micro-benchmark of Redis value encodings for the hot payloads.
+
+Compares the plain JSON text every value used to be stored as with the
+orjson serializer, and for cached distances also the compact list layout,
+on the pricing catalog, branch list, states list and one DistanceResult
+(the catalog, branches and states are the quote benchmark's seed data).
+For each payload and format it reports encode and decode cost (decode of a
+distance includes rebuilding the DistanceResult, as a cache hit does), the
+encoded size in bytes and the size of the decoded Python string. With
+--redis-url each encoding is also written to that Redis and measured with
+MEMORY USAGE.
+
+Usage:
+    python -m app.tests.benchmarks.serialization --iterations 5000 \\
+        [--redis-url redis://localhost:6379/15]
+
+Note: --redis-url writes and deletes keys under `bench:serialization:`.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.models.location import BranchLocation, DistanceResult
+from app.services.location.cache import pack_distance_result, unpack_distance_result
+from app.services.redis.serializer import SERIALIZERS, decode
+from app.tests.benchmarks.quote import BRANCHES, STATES, build_catalog
+from app.tests.benchmarks.stubs import BenchmarkRedisService
+
+KEY_PREFIX = "bench:serialization:"
+
+DISTANCE = DistanceResult(
+    nearest_branch=BranchLocation(**BRANCHES[0]),
+    delivery_location="1600 Amphitheatre Parkway, Mountain View, CA 94043",
+    distance_miles=12.34,
+    distance_meters=19859,
+    duration_seconds=1500,
+    within_service_area=True,
+    geocoded_coordinates={"latitude": 41.2565, "longitude": -95.9345},
+)
+
+# (payload, format) -> (encode, decode); decode takes the stored string
+Codec = Tuple[Callable[[], str], Callable[[str], Any]]
+
+
+def _codecs() -> Dict[str, Dict[str, Codec]]:
+  plain, compact = SERIALIZERS["json"], SERIALIZERS["orjson"]
+  codecs: Dict[str, Dict[str, Codec]] = {}
+  for name, payload in (("catalog", build_catalog()), ("branches", BRANCHES), ("states", STATES)):
+    codecs[name] = {
+        "json": (lambda payload=payload: plain.encode(payload), decode),
+        "orjson": (lambda payload=payload: compact.encode(payload), decode),
+    }
+  codecs["distance"] = {
+      "json": (lambda: plain.encode(DISTANCE.model_dump()),
+               lambda text: DistanceResult(**decode(text))),
+      "orjson": (lambda: compact.encode(DISTANCE.model_dump()),
+                 lambda text: DistanceResult(**decode(text))),
+      "orjson+tuple": (lambda: compact.encode(pack_distance_result(DISTANCE, compact=True)),
+                       lambda text: unpack_distance_result(decode(text))),
+  }
+  return codecs
+
+
+def _time_us(func: Callable[[], Any], iterations: int) -> Dict[str, float]:
+  func()  # warm up
+  samples: List[float] = []
+  for _ in range(iterations):
+    start = time.perf_counter()
+    func()
+    samples.append((time.perf_counter() - start) * 1_000_000)
+  return {"mean_us": round(statistics.mean(samples), 2),
+          "p50_us": round(statistics.median(samples), 2)}
+
+
+async def _redis_bytes(values: Dict[str, str]) -> Dict[str, Optional[int]]:
+  redis = BenchmarkRedisService()
+  sizes: Dict[str, Optional[int]] = {}
+  for name, value in values.items():
+    key = f"{KEY_PREFIX}{name}"
+    await redis.set(key, value)
+    sizes[name] = await redis.get_key_memory_usage(key)
+    await redis.delete(key)
+  await BenchmarkRedisService.close_pool()
+  return sizes
+
+
+def run(iterations: int, redis_url: Optional[str] = None) -> Dict[str, Any]:
+  results: Dict[str, Any] = {}
+  stored: Dict[str, str] = {}
+  for payload, formats in _codecs().items():
+    results[payload] = {}
+    for fmt, (encode, load) in formats.items():
+      text = encode()
+      stored[f"{payload}:{fmt}"] = text
+      results[payload][fmt] = {
+          "encode": _time_us(encode, iterations),
+          "decode": _time_us(lambda: load(text), iterations),
+          "encoded_bytes": len(text.encode("utf-8")),
+          "python_str_bytes": sys.getsizeof(text),
+      }
+  if redis_url:
+    BenchmarkRedisService.configure(redis_url)
+    for name, size in asyncio.run(_redis_bytes(stored)).items():
+      payload, fmt = name.split(":", 1)
+      results[payload][fmt]["redis_bytes"] = size
+  return results
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--iterations", type=int, default=5000)
+  parser.add_argument("--redis-url", default=None,
+                      help="Local Redis to measure MEMORY USAGE per key (optional)")
+  args = parser.parse_args()
+  print(json.dumps(run(args.iterations, args.redis_url), indent=2))
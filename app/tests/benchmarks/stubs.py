@@ -0,0 +1,126 @@
+# app/tests/benchmarks/stubs.py
+"""
+In-process stand-ins for the external systems on the quote path.
+
+Only used by the benchmark scripts in this package; the application itself
+never imports these. Each stand-in implements just the surface the quote
+path touches:
+
+- StubGoogleMapsClient: `distance_matrix` and `geocode` with configurable
+  latency and deterministic distances.
+- BenchmarkRedisService: RedisService backed by the in-memory client shared
+  with the unit tests, or by an explicit local Redis URL.
+- BenchmarkMongoService: no-op error logging and stats, canned sheet data.
+"""
+
+import hashlib
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+import redis.asyncio as redis
+
+from app.services.redis.service import RedisService
+from app.tests.stubs import FakeRedisClient
+
+
+class StubGoogleMapsClient:
+  """
+  Drop-in for `googlemaps.Client` on the quote path.
+
+  Calls block the executor thread for `latency_ms` (plus up to `jitter_ms`),
+  like the real client does. Distances are derived from a hash of the
+  origin/destination pair so repeated runs price identically.
+  """
+
+  def __init__(self, latency_ms: float = 120.0, jitter_ms: float = 40.0, seed: int = 7):
+    self.latency_ms = latency_ms
+    self.jitter_ms = jitter_ms
+    self._random = random.Random(seed)
+    self.distance_matrix_calls = 0
+    self.geocode_calls = 0
+
+  def _sleep(self):
+    jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+    time.sleep((self.latency_ms + jitter) / 1000)
+
+  @staticmethod
+  def _pair_hash(origin: str, destination: str) -> int:
+    digest = hashlib.sha1(f"{origin}|{destination}".encode()).hexdigest()
+    return int(digest[:8], 16)
+
+  def distance_matrix(self, origins: List[str], destinations: List[str], mode: str = "driving", **_: Any) -> Dict[str, Any]:
+    self.distance_matrix_calls += 1
+    self._sleep()
+    rows = []
+    for origin in origins:
+      elements = []
+      for destination in destinations:
+        meters = 3_000 + self._pair_hash(origin, destination) % 400_000
+        elements.append({
+            "status": "OK",
+            "distance": {"value": meters, "text": f"{meters / 1609.34:.1f} mi"},
+            "duration": {"value": int(meters / 24), "text": ""},
+        })
+      rows.append({"elements": elements})
+    return {"status": "OK", "rows": rows}
+
+  def geocode(self, address: str, **_: Any) -> List[Dict[str, Any]]:
+    self.geocode_calls += 1
+    self._sleep()
+    value = self._pair_hash(address, "")
+    return [{
+        "geometry": {
+            "location": {
+                "lat": 37.0 + (value % 1000) / 100,
+                "lng": -104.0 + (value // 1000 % 1000) / 100,
+            }
+        }
+    }]
+
+
+class BenchmarkRedisService(RedisService):
+  """
+  RedisService whose client is the in-memory FakeRedisClient or comes from
+  an explicit Redis URL.
+
+  All instrumented operations of the real service are inherited unchanged;
+  only client creation is redirected.
+  """
+
+  _memory_client: Optional[FakeRedisClient] = None
+  _redis_url: Optional[str] = None
+
+  @classmethod
+  def configure(cls, redis_url: Optional[str] = None) -> str:
+    """Selects the backend and returns a short description of it."""
+    if redis_url:
+      cls._redis_url = redis_url
+      cls._pool = redis.ConnectionPool.from_url(
+          redis_url, decode_responses=True, max_connections=50)
+      return f"redis ({redis_url})"
+    cls._memory_client = FakeRedisClient()
+    return "in-memory"
+
+  @classmethod
+  async def get_client(cls) -> redis.Redis:
+    if cls._memory_client is not None:
+      return cls._memory_client
+    return await super().get_client()
+
+
+class BenchmarkMongoService:
+  """Mongo stand-in: swallows error logs and stats, serves canned sheet data."""
+
+  def __init__(self, collections: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+    self.collections = collections or {}
+    self.errors_logged = 0
+
+  async def log_error_to_db(self, *args: Any, **kwargs: Any) -> None:
+    self.errors_logged += 1
+
+  async def increment_request_stat(self, *args: Any, **kwargs: Any) -> None:
+    return None
+
+  async def find_all(self, collection: str, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+    return [dict(doc) for doc in self.collections.get(collection, [])]
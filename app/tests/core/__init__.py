@@ -0,0 +1 @@
+# app/tests/core/__init__.py
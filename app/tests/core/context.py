@@ -0,0 +1,52 @@
+# app/tests/core/context.py
+"""Tests for request-scoped context on shared services."""
+
+import asyncio
+
+from fastapi import BackgroundTasks
+
+from app.core.context import bind_request_context, current_background_tasks, get_request_context
+
+
+class TestRequestContext:
+  """Test cases for contextvar isolation between concurrent requests."""
+
+  def test_concurrent_requests_see_their_own_tasks(self):
+
+    """Test that concurrent requests never see each other's background tasks."""
+    async def handle(request_id):
+      tasks = BackgroundTasks()
+      bind_request_context(request_id=request_id, background_tasks=tasks)
+      await asyncio.sleep(0)
+      context = get_request_context()
+      return context.request_id == request_id and context.background_tasks is tasks
+
+    async def run():
+      return await asyncio.gather(*(asyncio.create_task(handle(f"req-{i}")) for i in range(10)))
+
+    assert all(asyncio.run(run()))
+
+  def test_child_tasks_inherit_binding(self):
+
+    """Test that tasks spawned inside a request inherit its binding."""
+    async def run():
+      tasks = BackgroundTasks()
+      bind_request_context(background_tasks=tasks)
+
+      async def child():
+        return current_background_tasks()
+
+      return tasks, await asyncio.create_task(child())
+
+    tasks, seen = asyncio.run(run())
+    assert seen is tasks
+
+  def test_binding_keeps_other_fields(self):
+
+    """Test that binding one field leaves the others as they were."""
+    async def run():
+      bind_request_context(request_id="abc")
+      bind_request_context(background_tasks=BackgroundTasks())
+      return get_request_context().request_id
+
+    assert asyncio.run(run()) == "abc"
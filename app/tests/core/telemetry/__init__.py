@@ -0,0 +1 @@
+# app/tests/core/telemetry/__init__.py
@@ -0,0 +1,88 @@
+# app/tests/core/telemetry/policy.py
+"""Tests for the Logfire instrumentation policy."""
+
+from logfire.integrations.pydantic import PydanticPlugin, plugin, set_pydantic_plugin_config
+from pydantic.plugin import SchemaTypePath
+
+from app.core.telemetry.policy import TelemetryPolicy, get_telemetry_policy
+
+
+def instrumented(policy, model_name, opted_in):
+  """Whether the Logfire plugin wraps a model's validator under `policy`."""
+  options = policy.plugin_options()
+  set_pydantic_plugin_config(PydanticPlugin(
+      record=options["record"], include=set(options.get("include", ()))))
+  try:
+    plugin_settings = {"logfire": {"record": policy.record_for_model(model_name)}} if opted_in else {}
+    wrappers = plugin.new_schema_validator(
+        {"type": "any"}, None, SchemaTypePath("app.models.location", model_name),
+        "BaseModel", None, plugin_settings)
+    return wrappers[0] is not None
+  finally:
+    set_pydantic_plugin_config(None)
+
+
+class TestTelemetryPolicy:
+  """Test cases for TelemetryPolicy."""
+
+  def test_default_records_everything(self):
+    """Test that the default policy keeps the global record mode."""
+    policy = TelemetryPolicy()
+
+    assert policy.record_for_model("QuoteRequest") == "all"
+    assert policy.record_for_model("ClassificationInput") == "all"
+
+  def test_allowlist_turns_off_other_models(self):
+    """Test that models outside the allowlist are not instrumented."""
+    policy = TelemetryPolicy(pydantic_allowlist=frozenset({"QuoteRequest"}))
+
+    assert policy.record_for_model("QuoteRequest") == "all"
+    assert policy.record_for_model("DistanceResult") == "off"
+
+  def test_hot_path_mode_keeps_metrics_only(self):
+    """Test that hot-path models only record metrics in hot-path mode."""
+    policy = TelemetryPolicy(hot_path_mode=True)
+
+    assert policy.record_for_model("DistanceResult") == "metrics"
+    assert policy.record_for_model("ClassificationInput") == "all"
+
+  def test_hot_route_matching(self):
+    """Test hot route prefix matching."""
+    policy = TelemetryPolicy()
+
+    assert policy.is_hot_route("/api/v1/webhook/quote/generate")
+    assert policy.is_hot_route("/api/v1/webhook/location/lookup/sync")
+    assert not policy.is_hot_route("/api/v1/dashboard/overview")
+
+  def test_allowlist_limits_what_the_plugin_instruments(self):
+    """Test that the allowlist filters models with and without plugin_settings."""
+    policy = TelemetryPolicy(pydantic_allowlist=frozenset({"QuoteRequest", "ClassificationInput"}))
+
+    assert instrumented(policy, "QuoteRequest", opted_in=True)
+    assert instrumented(policy, "ClassificationInput", opted_in=False)
+    assert not instrumented(policy, "DistanceResult", opted_in=True)
+    assert not instrumented(policy, "HubSpotContact", opted_in=False)
+
+  def test_allowlist_opts_models_in_when_default_is_off(self):
+    """Test that allowlisted models are instrumented even with the default record mode off."""
+    policy = TelemetryPolicy(pydantic_record="off", pydantic_allowlist=frozenset({"QuoteRequest"}))
+
+    assert instrumented(policy, "QuoteRequest", opted_in=True)
+    assert not instrumented(policy, "DistanceResult", opted_in=True)
+    assert not instrumented(TelemetryPolicy(pydantic_record="off"), "QuoteRequest", opted_in=True)
+
+  def test_policy_reads_dotenv(self, tmp_path, monkeypatch):
+    """Test that LOGFIRE_* values from .env are applied however early the policy is built."""
+    (tmp_path / ".env").write_text("LOGFIRE_PYDANTIC_MODELS=QuoteRequest\nLOGFIRE_HEAD_SAMPLE_RATE=0.25\n")
+    for name in ("LOGFIRE_PYDANTIC_MODELS", "LOGFIRE_HEAD_SAMPLE_RATE"):
+      monkeypatch.setenv(name, "")
+      monkeypatch.delenv(name)
+    monkeypatch.chdir(tmp_path)
+    get_telemetry_policy.cache_clear()
+    try:
+      policy = get_telemetry_policy()
+    finally:
+      get_telemetry_policy.cache_clear()
+
+    assert policy.pydantic_allowlist == frozenset({"QuoteRequest"})
+    assert policy.head_sample_rate == 0.25
@@ -0,0 +1,87 @@
+# app/tests/services/bland/prefill.py
+"""Tests for deterministic pre-extraction of Bland transcripts."""
+
+from datetime import date
+
+from app.services.bland.processing.ai.transcript.prefill import (
+    TranscriptPreExtractor,
+    find_dates,
+    split_turns,
+)
+
+TRANSCRIPT = """assistant: Hi, this is Stahla calling from 555-123-4567. Who am I speaking with?
+user: Jane Doe. My email is jane at example dot com
+assistant: Great weather today!
+user: yeah it's lovely
+assistant: Where is the event?
+user: 123 Main St, Austin TX 78701. It's a wedding on March 5th 2027 for 3 days, about 150 guests, we need 4 restroom stalls.
+"""
+
+
+class TestTranscriptPreExtractor:
+  """Test cases for variable mapping, patterns, trimming and the LLM skip decision."""
+
+  def test_patterns_use_caller_turns_only(self):
+    """Test that fields come from the caller, not the agent's own number."""
+    fields = TranscriptPreExtractor().from_transcript(TRANSCRIPT)
+
+    assert "phone" not in fields
+    assert fields["email"] == "jane@example.com"
+    assert (fields["city"], fields["state"], fields["zip"]) == ("Austin", "TX", "78701")
+    assert fields["start_date"] == "2027-03-05"
+    assert fields["duration_days"] == 3
+    assert fields["guest_count"] == 150
+    assert fields["required_stalls"] == 4
+
+  def test_variables_override_patterns_and_skip_llm(self):
+    """Test that form data in variables completes the required fields."""
+    extractor = TranscriptPreExtractor()
+    variables = {"metadata": {"form_submission_data": {
+        "firstname": "Jane",
+        "lastname": "Doe",
+        "what_service_do_you_need_": "Restroom Trailer",
+        "event_type": "Wedding",
+        "zip": "78702",
+        "ada": "no",
+        "do_you_have_power_access_onsite_": "yes",
+        "do_you_have_water_access_onsite_": "no",
+    }}}
+
+    result = extractor.run(TRANSCRIPT, variables)
+
+    assert result.llm_required is False
+    assert result.prompt == ""
+    assert result.fields["zip"] == "78702"
+    assert result.sources["zip"] == "variables"
+    assert extractor.get_stats()["llm_skip_rate"] == 1.0
+
+  def test_llm_runs_while_name_and_site_details_are_unknown(self):
+    """Test that regex-filled groups alone do not skip the name, ADA, power and water questions."""
+    extractor = TranscriptPreExtractor()
+    variables = {"what_service_do_you_need_": "Restroom Trailer", "event_type": "Wedding"}
+
+    result = extractor.run(TRANSCRIPT, variables)
+
+    assert result.llm_required is True
+    for name in ("firstname", "lastname", "ada_required", "power_available", "water_available"):
+      assert name in result.missing
+    assert "Jane Doe" in result.prompt
+
+  def test_trim_keeps_relevant_turns(self):
+    """Test that small talk is dropped from the LLM prompt."""
+    result = TranscriptPreExtractor().run(TRANSCRIPT)
+
+    assert result.llm_required is True
+    assert "weather" not in result.prompt
+    assert "Where is the event?" in result.prompt
+    assert len(result.prompt) < len(TRANSCRIPT) + 200
+
+  def test_find_dates_without_year_rolls_forward(self):
+    """Test that a month-day without a year resolves to its next occurrence."""
+    assert find_dates("starting jan 10", today=date(2026, 6, 1)) == ["2027-01-10"]
+    assert find_dates("from 2026-07-01 to 07/04/2026") == ["2026-07-01", "2026-07-04"]
+
+  def test_split_turns_joins_continuation_lines(self):
+    """Test that wrapped lines stay with their speaker."""
+    turns = split_turns("user: first line\nsecond line\nassistant: reply")
+    assert turns == [("user", "first line second line"), ("assistant", "reply")]
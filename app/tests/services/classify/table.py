@@ -0,0 +1,102 @@
+# app/tests/services/classify/table.py
+"""Tests for the compiled classification decision tables."""
+
+from app.models.classification import ClassificationInput
+from app.services.classify.rules import classify_lead, is_porta_potty, is_specialty_trailer
+from app.services.classify.table import (
+    PORTA_POTTY,
+    SPECIALTY_TRAILER,
+    TRAILER,
+    DecisionTable,
+    Rule,
+    call_flow_table,
+    categories_for,
+    compare_tables,
+    enhancement_table,
+)
+
+
+def make_input(**fields) -> ClassificationInput:
+  return ClassificationInput(source="webform", raw_data={}, **fields)
+
+
+class TestDecisionTable:
+  """Test cases for table compilation, evaluation and batch analysis."""
+
+  def test_product_categories(self):
+    """Test that product names map to frozenset categories case-insensitively."""
+    categories = categories_for(["restroom trailer (2 stall)", "Portable Toilet"])
+
+    assert {TRAILER, SPECIALTY_TRAILER, PORTA_POTTY} <= categories
+    assert categories_for(None) == frozenset()
+
+  def test_call_flow_construction_porta_potty(self):
+    """Test locality routing for construction porta potty leads."""
+    local = make_input(intended_use="Construction", product_interest=["Portable Toilet"],
+                       is_local=True, stall_count=4)
+    remote = make_input(intended_use="Construction", product_interest=["Portable Toilet"],
+                        is_local=False, stall_count=4)
+
+    assert classify_lead(local)[0] == "Services"
+    assert classify_lead(remote) == (
+        "Logistics", "Construction | Porta Potty: Subflow SB, Process PB", "Stahla Logistics Sales Team")
+
+  def test_call_flow_fallbacks(self):
+    """Test the out-of-area, disqualify and default rows."""
+    assert classify_lead(make_input(is_local=False))[0] == "Leads"
+    assert classify_lead(make_input(is_local=True))[0] == "Disqualify"
+    assert classify_lead(make_input(is_local=True, stall_count=3))[0] == "Leads"
+
+  def test_enhancement_table(self):
+    """Test thresholds of the rules layered on the AI classification."""
+    lead = make_input(intended_use="Large Event", product_interest=["Restroom Trailer"],
+                      required_stalls=8, duration_days=7, is_local=False)
+    decision = enhancement_table.evaluate(lead)
+
+    assert decision.lead_type == "Logistics"
+    assert decision.label == "Large Event / Trailer / Not Local"
+    assert not enhancement_table.evaluate(make_input(intended_use="Large Event")).matched
+
+  def test_batch_and_what_if(self):
+    """Test batch evaluation and comparing a changed rule set."""
+    leads = [make_input(intended_use="Construction", product_interest=["Portable Toilet"],
+                        is_local=False, stall_count=2) for _ in range(100)]
+    candidate = DecisionTable("candidate", (Rule("Everything local", "Services"),),
+                              stall_field="stall_count")
+
+    assert {d.lead_type for d in call_flow_table.classify_batch(leads)} == {"Logistics"}
+    report = compare_tables(leads, call_flow_table, candidate, sample_limit=3)
+    assert report["changed"] == 100
+    assert report["transitions"] == {"Logistics -> Services": 100}
+    assert len(report["samples"]) == 3
+
+  def test_rule_helpers_match_exact_product_names(self):
+    """Test that the rules.py helpers only accept the exact, correctly cased product names."""
+    table = [
+        (["Restroom Trailer"], True, False),
+        (["ADA Trailer", "Portable Toilet"], True, True),
+        (["restroom trailer"], False, False),
+        (["Restroom Trailer (2 stall)"], False, False),
+        (["portable toilet"], False, False),
+        (["Handwashing Station"], False, True),
+        (["Handwashing Station x2"], False, False),
+        ([], False, False),
+    ]
+    for products, specialty, porta_potty in table:
+      assert is_specialty_trailer(products) is specialty, products
+      assert is_porta_potty(products) is porta_potty, products
+
+  def test_counts_are_coerced_with_int(self):
+    """Test that stall and day counts keep int() coercion: fractions truncate, "3.5" counts as 0."""
+    table = [
+        ("4", 4),
+        (4.9, 4),
+        ("3.5", 0),
+        ("many", 0),
+        (None, 0),
+    ]
+    for stall_count, expected in table:
+      features = call_flow_table.features(make_input(stall_count=stall_count, is_local=True))
+      assert features.stalls == expected, stall_count
+    # A fractional string is not a stall, so the lead is disqualified as before
+    assert classify_lead(make_input(stall_count="3.5", is_local=True))[0] == "Disqualify"
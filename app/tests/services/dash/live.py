@@ -0,0 +1,63 @@
+# app/tests/services/dash/live.py
+"""Tests for the live dashboard publisher."""
+
+import asyncio
+
+from app.services.dash.live.hub import LiveEvent, LiveMetricsHub, latency_histogram
+
+
+class TestLiveMetricsHub:
+  """Test cases for fan-out, filters and bounded client buffers."""
+
+  def test_filters_by_topic_and_service(self):
+    """Test that clients only receive the topics and services they asked for."""
+    async def run():
+      hub = LiveMetricsHub(feeds=[])
+      latency_only = hub.subscribe(topics=["latency"], services=["quote"])
+      everything = hub.subscribe()
+      hub.publish(LiveEvent.create("latency", {"service": "quote"}, service="quote"))
+      hub.publish(LiveEvent.create("latency", {"service": "gmaps"}, service="gmaps"))
+      hub.publish(LiveEvent.create("errors", {"message": "boom"}))
+      return await latency_only.drain(0.1), await everything.drain(0.1)
+
+    latency_only, everything = asyncio.run(run())
+    assert [event.data["service"] for event in latency_only] == ["quote"]
+    assert len(everything) == 3
+
+  def test_slow_client_drops_oldest_events(self):
+    """Test that a full buffer keeps the newest events and counts the drops."""
+    async def run():
+      hub = LiveMetricsHub(feeds=[])
+      subscription = hub.subscribe(buffer_size=3)
+      for number in range(5):
+        hub.publish(LiveEvent.create("requests", {"n": number}))
+      return subscription, await subscription.drain(0.1)
+
+    subscription, events = asyncio.run(run())
+    assert [event.data["n"] for event in events] == [2, 3, 4]
+    assert subscription.dropped == 2
+
+  def test_counter_deltas_and_late_joiners(self):
+    """Test that only changed counters are published and new clients get totals."""
+    async def run():
+      hub = LiveMetricsHub(feeds=[])
+      first = hub.subscribe(topics=["counters"])
+      hub.update_counters({"quote_requests.total": 5, "gmaps_api.calls": 2})
+      hub.update_counters({"quote_requests.total": 7, "gmaps_api.calls": 2})
+      hub.update_counters({"quote_requests.total": 7, "gmaps_api.calls": 2})
+      late = hub.subscribe(topics=["counters"])
+      return await first.drain(0.1), await late.drain(0.1)
+
+    first, late = asyncio.run(run())
+    assert [event.data["deltas"] for event in first] == [{}, {"quote_requests.total": 2}]
+    assert late[0].data["totals"]["quote_requests.total"] == 7
+
+  def test_latency_histogram(self):
+    """Test bucket assignment and summary values."""
+    histogram = latency_histogram([20, 80, 80, 6000])
+
+    assert histogram["count"] == 4
+    assert histogram["buckets"]["le_50"] == 1
+    assert histogram["buckets"]["le_100"] == 2
+    assert histogram["buckets"]["gt_max"] == 1
+    assert histogram["max_ms"] == 6000
@@ -0,0 +1,66 @@
+# app/tests/services/dash/snapshot.py
+"""Tests for materialized dashboard snapshots."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from app.services.dash.snapshot.aggregator import SnapshotAggregator
+from app.services.dash.snapshot.store import SnapshotStore
+from app.tests.stubs import FakeRedisService
+
+
+def counting_builder(calls):
+  async def build():
+    calls.append(1)
+    await asyncio.sleep(0)
+    return {"value": len(calls)}
+  return build
+
+
+class TestSnapshots:
+  """Test cases for snapshot serving and the aggregator lock."""
+
+  def test_fresh_snapshot_is_served_without_rebuilding(self):
+    """Test that a fresh snapshot is returned as stored, with its as_of."""
+    store, calls = SnapshotStore(FakeRedisService()), []
+
+    async def run():
+      first = await store.serve("overview", counting_builder(calls), max_age_seconds=60)
+      second = await store.serve("overview", counting_builder(calls), max_age_seconds=60)
+      return first, second
+
+    first, second = asyncio.run(run())
+    assert len(calls) == 1
+    assert second.data == {"value": 1}
+    assert second.as_of == first.as_of
+
+  def test_stale_snapshot_is_rebuilt_once_for_concurrent_readers(self):
+    """Test that concurrent readers of a stale snapshot share one rebuild."""
+    redis, calls = FakeRedisService(), []
+    store = SnapshotStore(redis)
+    old = (datetime.now(timezone.utc) - timedelta(minutes=10)).isoformat()
+    asyncio.run(redis.set_json(store.key("overview"), {"as_of": old, "data": {"value": 0}}))
+
+    async def run():
+      return await asyncio.gather(*[
+          store.serve("overview", counting_builder(calls), max_age_seconds=60)
+          for _ in range(5)])
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(result.data == {"value": 1} for result in results)
+
+  def test_only_lock_holder_refreshes(self):
+    """Test that a second aggregator skips the round the first one owns."""
+    redis, calls = FakeRedisService(), []
+    builders = {"overview": counting_builder(calls)}
+    first = SnapshotAggregator(redis, builders, interval_seconds=30)
+    second = SnapshotAggregator(redis, builders, interval_seconds=30)
+
+    async def run():
+      return await first.refresh_all(), await second.refresh_all()
+
+    owned, skipped = asyncio.run(run())
+    assert "duration_ms" in owned["overview"]
+    assert skipped == {}
+    assert len(calls) == 1
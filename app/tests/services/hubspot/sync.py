@@ -0,0 +1,105 @@
+# app/tests/services/hubspot/sync.py
+"""Tests for the diff-based, batched property sync."""
+
+import asyncio
+
+from app.services.hubspot.properties import PropertySyncManager
+
+DEFINITIONS = [
+    {"name": "new_one", "label": "New One", "type": "string", "fieldType": "text"},
+    {"name": "new_two", "label": "New Two", "type": "number", "fieldType": "number"},
+    {"name": "renamed", "label": "Renamed Label", "type": "string", "fieldType": "text"},
+    {"name": "service", "label": "Service", "type": "enumeration", "fieldType": "select",
+     "options": [{"label": "Trailer", "value": "trailer"}, {"label": "Porta Potty", "value": "porta"}]},
+    {"name": "same", "label": "Same", "type": "string", "fieldType": "text"},
+]
+
+EXISTING = [
+    {"name": "renamed", "label": "Old Label", "type": "string", "fieldType": "text"},
+    {"name": "service", "label": "Service", "type": "enumeration", "fieldType": "select",
+     "options": [{"label": "Trailer", "value": "trailer"}]},
+    {"name": "same", "label": "Same", "type": "string", "fieldType": "text"},
+]
+
+
+class FakeResponse:
+  def __init__(self, data):
+    self.data = data
+
+  def raise_for_status(self):
+    pass
+
+  def json(self):
+    return self.data
+
+
+class FakeHttpClient:
+  def __init__(self):
+    self.requests = []
+
+  async def get(self, url):
+    self.requests.append(("GET", url))
+    return FakeResponse({"results": EXISTING})
+
+  async def post(self, url, json):
+    self.requests.append(("POST", url))
+    return FakeResponse({"results": json["inputs"]})
+
+  async def patch(self, url, json):
+    self.requests.append(("PATCH", url, sorted(json)))
+    return FakeResponse(json)
+
+
+class FakeManager:
+  def __init__(self):
+    self._http_client = FakeHttpClient()
+
+
+def make_sync(monkeypatch):
+  manager = FakeManager()
+  sync = PropertySyncManager(manager)
+
+  async def load(filename):
+    return DEFINITIONS
+
+  monkeypatch.setattr(sync, "_load_properties_from_file", load)
+  return sync, manager._http_client
+
+
+class TestPropertySync:
+  """Test cases for one listing, batched creates and field-level updates."""
+
+  def test_sync_lists_once_and_batches_creates(self, monkeypatch):
+
+    """Test that existing properties are listed once, creates go in batches and updates send only changed fields."""
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "HUBSPOT_PROPERTY_BATCH_SIZE", 1)
+    sync, client = make_sync(monkeypatch)
+
+    result = asyncio.run(sync.sync_contact_properties())
+
+    gets = [request for request in client.requests if request[0] == "GET"]
+    batches = [request for request in client.requests
+               if request[0] == "POST" and request[1].endswith("/batch/create")]
+    patches = sorted(request[1:] for request in client.requests if request[0] == "PATCH")
+    assert len(gets) == 1 and len(batches) == 2
+    assert patches == [
+        ("/crm/v3/properties/contacts/renamed", ["label"]),
+        ("/crm/v3/properties/contacts/service", ["options"]),
+    ]
+    assert [prop["name"] for prop in result["created"]] == ["new_one", "new_two"]
+    assert [prop["name"] for prop in result["existing"]] == ["same"]
+    assert not result["failed"]
+
+  def test_dry_run_reports_without_writing(self, monkeypatch):
+
+    """Test that a dry run reports creates and updates without writing anything."""
+    sync, client = make_sync(monkeypatch)
+
+    result = asyncio.run(sync.sync_contact_properties(dry_run=True))
+
+    assert [request[0] for request in client.requests] == ["GET"]
+    assert result["dry_run"] is True
+    assert {prop["name"] for prop in result["created"]} == {"new_one", "new_two"}
+    assert {(prop["name"], tuple(prop["changes"])) for prop in result["updated"]} == {
+        ("renamed", ("label",)), ("service", ("options",))}
@@ -0,0 +1,146 @@
+# app/tests/services/jobs/handlers.py
+"""Tests for the registered job handlers."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.core.keys import JOBS_DELAYED_KEY
+from app.services import n8n
+from app.services.jobs import get_job
+from app.services.jobs.queue import JobQueue, dead_letter_key, stream_key
+from app.services.jobs.registry import QUEUES
+from app.services.jobs.worker import JobWorker
+from app.services.location.distance import DistanceCalculator
+from app.tests.stubs import FakeRedisService
+
+
+class FakeMongo:
+  def __init__(self, stored=True):
+    self.stored = stored
+
+  async def create_location(self, location_data):
+    return location_data["id"] if self.stored else None
+
+  async def log_error_to_db(self, **kwargs):
+    pass
+
+  async def increment_request_stat(self, *args):
+    pass
+
+
+def use_services(monkeypatch, redis, mongo):
+  """Points the handlers' service factories at the fakes."""
+  async def fake_redis_service():
+    return redis
+
+  async def fake_mongo_service():
+    return mongo
+
+  monkeypatch.setattr("app.services.redis.factory.get_redis_service", fake_redis_service)
+  monkeypatch.setattr("app.services.mongo.get_mongo_service", fake_mongo_service)
+
+
+def run_job(redis, name, payload, attempt=0):
+  """Enqueues one job and runs it through `JobWorker._process`."""
+  queue_name = get_job(name).queue
+  worker = JobWorker(redis, queues=[queue_name], consumer_name="test-consumer")
+
+  async def run():
+    await JobQueue(redis).enqueue(name, payload, attempt=attempt)
+    [(_, [(message_id, fields)])] = await redis.client.xreadgroup(
+        "group", "test-consumer", {stream_key(queue_name): ">"})
+    await worker._semaphores[queue_name].acquire()
+    worker._active[queue_name] += 1
+    await worker._process(queue_name, message_id, fields)
+
+  asyncio.run(run())
+
+
+class TestN8nHandoffJob:
+  """Test cases for routing n8n handoffs through the integrations queue."""
+
+  def test_handoff_is_queued_when_job_queue_is_enabled(self, monkeypatch):
+    """Test that the handoff is enqueued on "integrations" instead of posted inline."""
+    redis = FakeRedisService()
+    posted = []
+
+    async def fake_redis_service():
+      return redis
+
+    async def fake_send(payload, **kwargs):
+      posted.append(payload)
+      return True
+
+    monkeypatch.setattr(settings, "JOB_QUEUE_ENABLED", True)
+    monkeypatch.setattr("app.services.redis.factory.get_redis_service", fake_redis_service)
+    monkeypatch.setattr(n8n, "send_to_n8n_webhook", fake_send)
+
+    assert asyncio.run(n8n.deliver_n8n_handoff({"lead_id": "1"})) is True
+
+    assert posted == []
+    [(_, fields)] = redis.client.streams[stream_key("integrations")]
+    assert fields["name"] == "n8n_handoff"
+    assert json.loads(fields["payload"]) == {"payload": {"lead_id": "1"}}
+
+  def test_rejected_handoff_raises_so_the_worker_retries(self, monkeypatch):
+    """Test that a webhook failure surfaces as an error instead of being swallowed."""
+    async def fake_send(payload, **kwargs):
+      return False
+
+    monkeypatch.setattr(settings, "N8N_WEBHOOK_URL", "https://n8n.example.com/hook")
+    monkeypatch.setattr(n8n, "send_to_n8n_webhook", fake_send)
+    definition = get_job("n8n_handoff")
+
+    assert definition.queue == "integrations"
+    with pytest.raises(RuntimeError):
+      asyncio.run(definition.handler({"payload": {"lead_id": "1"}}))
+
+
+class TestBackgroundJobFailures:
+  """Test cases for failures of the wrapped background functions reaching the worker."""
+
+  def test_unsaved_location_log_is_retried(self, monkeypatch):
+    """Test that a location record MongoDB did not store is parked for a retry."""
+    redis = FakeRedisService()
+    use_services(monkeypatch, redis, FakeMongo(stored=False))
+
+    run_job(redis, "log_location", {"location_data": {"id": "loc-1"}})
+
+    assert len(redis.client.zsets[JOBS_DELAYED_KEY]) == 1
+    assert dead_letter_key("logging") not in redis.client.streams
+
+  def test_failed_prefetch_is_dead_lettered_on_last_attempt(self, monkeypatch):
+    """Test that a prefetch that raised on its last attempt goes to the dead-letter stream."""
+    redis = FakeRedisService()
+    use_services(monkeypatch, redis, FakeMongo())
+
+    async def fail(self, delivery_location):
+      raise ConnectionError("maps down")
+
+    monkeypatch.setattr(DistanceCalculator, "get_distance_to_nearest_branch", fail)
+
+    run_job(redis, "location_prefetch", {"delivery_location": "1 Elm St, Omaha, NE"},
+            attempt=QUEUES["location"].max_retries)
+
+    [(_, entry)] = redis.client.streams[dead_letter_key("location")]
+    assert entry["error"] == "ConnectionError: maps down"
+
+  def test_prefetch_without_distance_raises_unless_unresolvable(self, monkeypatch):
+    """Test that an empty lookup fails the job, except for a negative-cached address."""
+    redis = FakeRedisService()
+    use_services(monkeypatch, redis, FakeMongo())
+
+    async def no_distance(self, delivery_location):
+      return None
+
+    monkeypatch.setattr(DistanceCalculator, "get_distance_to_nearest_branch", no_distance)
+    handler = get_job("location_prefetch").handler
+
+    with pytest.raises(RuntimeError):
+      asyncio.run(handler({"delivery_location": "1 Elm St, Omaha, NE"}))
+
+    redis.client.values["maps:unresolvable:nowhere"] = "{}"
+    asyncio.run(handler({"delivery_location": "nowhere"}))
@@ -0,0 +1,83 @@
+# app/tests/services/jobs/queue.py
+"""Tests for the Redis Streams job queue."""
+
+import asyncio
+import json
+import time
+
+from app.core.keys import JOBS_DELAYED_KEY
+from app.services.jobs.queue import JobQueue, dead_letter_key, metrics_key, stream_key
+from app.services.jobs.registry import job
+from app.tests.stubs import FakeRedisService
+
+
+@job("test_queue_job", queue="logging")
+async def queued_job(payload):
+  return payload
+
+
+class TestJobQueue:
+  """Test cases for enqueueing, retry scheduling and dead-lettering."""
+
+  def test_enqueue_adds_entry_to_its_queue_stream(self):
+    """Test that a job lands on its queue's stream with attempt 0 and is counted."""
+    redis = FakeRedisService()
+
+    job_id = asyncio.run(JobQueue(redis).enqueue("test_queue_job", {"n": 1}))
+
+    [(_, fields)] = redis.client.streams[stream_key("logging")]
+    assert fields["job_id"] == job_id
+    assert fields["name"] == "test_queue_job"
+    assert json.loads(fields["payload"]) == {"n": 1}
+    assert fields["attempt"] == "0"
+    assert redis.client.hashes[metrics_key("logging")]["enqueued"] == 1
+
+  def test_unknown_job_is_not_enqueued(self):
+    """Test that enqueueing an unregistered job returns None and writes nothing."""
+    redis = FakeRedisService()
+
+    assert asyncio.run(JobQueue(redis).enqueue("no_such_job", {})) is None
+    assert redis.client.streams == {}
+
+  def test_enqueue_returns_none_when_redis_fails(self):
+    """Test that a Redis error is reported as None so callers can fall back."""
+    redis = FakeRedisService()
+    redis.client.fail = {"xadd"}
+
+    assert asyncio.run(JobQueue(redis).enqueue("test_queue_job", {})) is None
+
+  def test_retry_waits_for_backoff_then_is_promoted(self):
+    """Test that a retry is parked until due, then returns to its stream as the next attempt."""
+    redis = FakeRedisService()
+    queue = JobQueue(redis)
+    fields = {"job_id": "j1", "name": "test_queue_job", "payload": "{}", "attempt": "0"}
+
+    async def run():
+      await queue.schedule_retry("logging", fields, 30)
+      early = await queue.promote_due()
+      [(entry, due_at)] = redis.client.zsets[JOBS_DELAYED_KEY].items()
+      redis.client.zsets[JOBS_DELAYED_KEY][entry] = time.time() - 1
+      return early, due_at, await queue.promote_due()
+
+    early, due_at, promoted = asyncio.run(run())
+
+    assert early == 0
+    assert abs(due_at - (time.time() + 30)) < 5
+    assert promoted == 1
+    assert redis.client.zsets[JOBS_DELAYED_KEY] == {}
+    [(_, retried)] = redis.client.streams[stream_key("logging")]
+    assert retried["attempt"] == "1"
+    assert "queue" not in retried
+    assert redis.client.hashes[metrics_key("logging")]["retried"] == 1
+
+  def test_dead_letter_keeps_fields_and_error(self):
+    """Test that an exhausted job is copied to the dead-letter stream with its error."""
+    redis = FakeRedisService()
+    fields = {"job_id": "j1", "name": "test_queue_job", "payload": "{}", "attempt": "5"}
+
+    asyncio.run(JobQueue(redis).dead_letter("logging", fields, "ValueError: boom"))
+
+    [(_, entry)] = redis.client.streams[dead_letter_key("logging")]
+    assert entry["job_id"] == "j1"
+    assert entry["error"] == "ValueError: boom"
+    assert redis.client.hashes[metrics_key("logging")]["dead_lettered"] == 1
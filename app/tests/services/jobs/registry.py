@@ -0,0 +1,40 @@
+# app/tests/services/jobs/registry.py
+"""Tests for the background job queue registry."""
+
+import pytest
+
+from app.services.jobs.registry import QUEUES, QueueConfig, get_job, get_queue_config, job
+
+
+class TestJobRegistry:
+  """Test cases for queue policies and job registration."""
+
+  def test_backoff_doubles_and_caps(self):
+    """Test that retry delays grow exponentially up to the cap."""
+    config = QueueConfig("test", backoff_base_seconds=5.0, backoff_max_seconds=30.0)
+
+    assert config.backoff_for(1) == 5.0
+    assert config.backoff_for(2) == 10.0
+    assert config.backoff_for(3) == 20.0
+    assert config.backoff_for(4) == 30.0
+
+  def test_register_job_on_known_queue(self):
+    """Test that a registered handler is found with its queue."""
+    @job("test_registry_job", queue="logging")
+    async def handler(payload):
+      return payload
+
+    definition = get_job("test_registry_job")
+    assert definition is not None
+    assert definition.queue == "logging"
+    assert definition.handler is handler
+
+  def test_unknown_queue_is_rejected(self):
+    """Test that jobs cannot target a queue without a policy."""
+    with pytest.raises(ValueError):
+      job("test_bad_queue_job", queue="does-not-exist")
+
+  def test_unknown_queue_config_falls_back_to_defaults(self):
+    """Test that looking up an unconfigured queue returns default limits."""
+    assert get_queue_config("classification") is QUEUES["classification"]
+    assert get_queue_config("other").concurrency == QueueConfig("other").concurrency
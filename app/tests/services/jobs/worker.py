@@ -0,0 +1,108 @@
+# app/tests/services/jobs/worker.py
+"""Tests for the job worker's settle, retry and reclaim handling."""
+
+import asyncio
+import time
+
+from app.core.keys import JOBS_DELAYED_KEY
+from app.services.jobs import worker as worker_module
+from app.services.jobs.queue import JobQueue, dead_letter_key, stream_key
+from app.services.jobs.registry import QUEUES, job
+from app.services.jobs.worker import JobWorker
+from app.tests.stubs import FakeRedisService
+
+CALLS = []
+
+
+@job("test_worker_ok", queue="logging")
+async def ok_job(payload):
+  CALLS.append(payload)
+
+
+@job("test_worker_fails", queue="logging")
+async def failing_job(payload):
+  raise ValueError("boom")
+
+
+def read_one(redis, name, attempt=0):
+  """Enqueues a job and reads it through the consumer group like `_consume`."""
+  async def run():
+    await JobQueue(redis).enqueue(name, {"n": 1}, attempt=attempt)
+    [(_, [(message_id, fields)])] = await redis.client.xreadgroup(
+        "group", "test-consumer", {stream_key("logging"): ">"})
+    return message_id, fields
+  return asyncio.run(run())
+
+
+def process(worker, message_id, fields):
+  async def run():
+    await worker._semaphores["logging"].acquire()
+    worker._active["logging"] += 1
+    await worker._process("logging", message_id, fields)
+  asyncio.run(run())
+
+
+class TestJobWorker:
+  """Test cases for `JobWorker._process` and `_reclaim`."""
+
+  def test_successful_job_is_acknowledged(self):
+    """Test that a job that ran is acked and removed from the stream."""
+    redis = FakeRedisService()
+    worker = JobWorker(redis, queues=["logging"], consumer_name="test-consumer")
+    message_id, fields = read_one(redis, "test_worker_ok")
+
+    process(worker, message_id, fields)
+
+    assert CALLS[-1] == {"n": 1}
+    assert redis.client.pending[stream_key("logging")] == {}
+    assert redis.client.streams[stream_key("logging")] == []
+
+  def test_failed_job_is_retried_with_backoff(self):
+    """Test that a failure parks the next attempt for the queue's backoff, then acks."""
+    redis = FakeRedisService()
+    worker = JobWorker(redis, queues=["logging"], consumer_name="test-consumer")
+    message_id, fields = read_one(redis, "test_worker_fails")
+
+    process(worker, message_id, fields)
+
+    [due_at] = redis.client.zsets[JOBS_DELAYED_KEY].values()
+    assert abs(due_at - (time.time() + QUEUES["logging"].backoff_for(1))) < 5
+    assert redis.client.pending[stream_key("logging")] == {}
+
+  def test_exhausted_job_is_dead_lettered(self):
+    """Test that the last allowed attempt goes to the dead-letter stream, not the retry set."""
+    redis = FakeRedisService()
+    worker = JobWorker(redis, queues=["logging"], consumer_name="test-consumer")
+    message_id, fields = read_one(redis, "test_worker_fails", attempt=QUEUES["logging"].max_retries)
+
+    process(worker, message_id, fields)
+
+    [(_, entry)] = redis.client.streams[dead_letter_key("logging")]
+    assert entry["error"] == "ValueError: boom"
+    assert JOBS_DELAYED_KEY not in redis.client.zsets
+    assert redis.client.pending[stream_key("logging")] == {}
+
+  def test_unsaved_retry_leaves_job_pending_for_reclaim(self, monkeypatch):
+    """Test that a job whose retry could not be written stays pending and is reclaimed."""
+    redis = FakeRedisService()
+    worker = JobWorker(redis, queues=["logging"], consumer_name="test-consumer")
+    message_id, fields = read_one(redis, "test_worker_fails")
+    redis.client.fail = {"zadd"}
+
+    process(worker, message_id, fields)
+
+    assert message_id in redis.client.pending[stream_key("logging")]
+    assert [entry_id for entry_id, _ in redis.client.streams[stream_key("logging")]] == [message_id]
+    assert worker._active["logging"] == 0
+
+    started = []
+
+    async def record_start(queue_name, reclaimed_id, reclaimed_fields):
+      started.append((queue_name, reclaimed_id, reclaimed_fields["name"]))
+      worker.stop()
+
+    monkeypatch.setattr(worker_module, "RECLAIM_INTERVAL_SECONDS", 0)
+    monkeypatch.setattr(worker, "_start", record_start)
+    asyncio.run(worker._reclaim())
+
+    assert started == [("logging", message_id, "test_worker_fails")]
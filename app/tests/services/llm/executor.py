@@ -0,0 +1,68 @@
+# app/tests/services/llm/executor.py
+"""Tests for the async-safe LLM execution layer."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.llm.executor import LLMExecutor, LLMOverloadedError, LLMTimeoutError, estimate_tokens
+
+
+class TestLLMExecutor:
+  """Test cases for off-loop execution, limits and metrics."""
+
+  def test_estimate_tokens(self):
+    """Test that token estimates scale with text length."""
+    assert estimate_tokens(None) == 0
+    assert estimate_tokens("a") == 1
+    assert estimate_tokens("x" * 400) == 100
+
+  def test_runs_off_event_loop_and_records_stats(self):
+    """Test that calls run on the LLM pool and are counted per call type."""
+    executor = LLMExecutor(max_concurrency=2, max_queued=5, call_timeout=5, queue_timeout=5)
+    loop_thread = threading.get_ident()
+
+    def blocking(text):
+      return threading.get_ident(), text.upper()
+
+    async def main():
+      return await executor.run("test.echo", blocking, "hello", provider="test")
+
+    thread_id, result = asyncio.run(main())
+
+    assert thread_id != loop_thread
+    assert result == "HELLO"
+    stats = executor.get_stats()["call_types"]["test.echo"]
+    assert stats["calls"] == 1
+    assert stats["errors"] == 0
+    assert stats["input_tokens_estimated"] >= 1
+
+  def test_call_timeout(self):
+    """Test that a slow call raises LLMTimeoutError and frees its slot."""
+    executor = LLMExecutor(max_concurrency=1, max_queued=1, call_timeout=0.05, queue_timeout=1)
+
+    async def main():
+      with pytest.raises(LLMTimeoutError):
+        await executor.run("test.slow", time.sleep, 0.3, provider="test")
+      return await executor.run("test.fast", lambda: "ok", provider="test")
+
+    assert asyncio.run(main()) == "ok"
+    assert executor.get_stats()["call_types"]["test.slow"]["timeouts"] == 1
+
+  def test_rejects_when_queue_full(self):
+    """Test that callers beyond the wait queue fail fast."""
+    executor = LLMExecutor(max_concurrency=1, max_queued=1, call_timeout=5, queue_timeout=5)
+
+    async def main():
+      running = asyncio.create_task(executor.run("test.busy", time.sleep, 0.2, provider="test"))
+      await asyncio.sleep(0.02)
+      waiting = asyncio.create_task(executor.run("test.busy", time.sleep, 0, provider="test"))
+      await asyncio.sleep(0.02)
+      with pytest.raises(LLMOverloadedError):
+        await executor.run("test.busy", time.sleep, 0, provider="test")
+      await asyncio.gather(running, waiting)
+
+    asyncio.run(main())
+    assert executor.get_stats()["call_types"]["test.busy"]["rejected"] == 1
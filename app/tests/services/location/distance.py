@@ -0,0 +1,170 @@
+# app/tests/services/location/distance.py
+"""Tests for the distance cache and the negative cache of unresolvable delivery locations."""
+
+import asyncio
+
+from app.core.keys import UNRESOLVABLE_LOCATION_PREFIX
+from app.models.location import BranchLocation, DistanceResult
+from app.services.location.cache.operations import LocationCacheOperations
+from app.services.location.distance import DistanceCalculator
+from app.services.location.google import DistanceLookup
+from app.tests.stubs import FakeRedisService
+
+BRANCHES = [
+    BranchLocation(name="Omaha", address="1 Main St, Omaha, NE 68102"),
+    BranchLocation(name="Denver", address="2 Main St, Denver, CO 80202"),
+]
+
+
+class FakeMongo:
+  async def log_error_to_db(self, **kwargs):
+    pass
+
+  async def increment_request_stat(self, *args):
+    pass
+
+
+class FakeCacheOps(LocationCacheOperations):
+  def __init__(self):
+    super().__init__(FakeRedisService(), FakeMongo())
+
+  async def get_branches_from_cache(self):
+    return BRANCHES
+
+
+class FakeGoogle:
+  def __init__(self, unresolvable):
+    self.unresolvable = unresolvable
+    self.calls = 0
+
+  async def lookup_distance(self, origin, destination):
+    self.calls += 1
+    return DistanceLookup(None, self.unresolvable)
+
+
+class FakeAreaChecker:
+  async def check_service_area(self, delivery_location):
+    return True
+
+
+def unresolvable_keys(cache_ops):
+  return [key for key in cache_ops.redis_service.client.values if key.startswith(UNRESOLVABLE_LOCATION_PREFIX)]
+
+
+def make_calculator(unresolvable):
+  cache_ops = FakeCacheOps()
+  google = FakeGoogle(unresolvable)
+  return DistanceCalculator(cache_ops, google, FakeAreaChecker()), cache_ops, google
+
+
+class TestUnresolvableLocations:
+  """Test cases for skipping the API fan-out for known-bad addresses."""
+
+  def test_unresolvable_location_skips_api_on_repeat(self):
+
+    """Test that a location no branch can resolve is not looked up again."""
+    calculator, cache_ops, google = make_calculator(unresolvable=True)
+
+    assert asyncio.run(calculator.get_distance_to_nearest_branch("uh the blue house")) is None
+    assert google.calls == len(BRANCHES)
+    assert asyncio.run(calculator.get_distance_to_nearest_branch("Uh, the blue house")) is None
+
+    assert google.calls == len(BRANCHES)
+    assert cache_ops.redis_service.client.values["dash:cache:maps:negative_hits"] == 1
+    key = cache_ops.get_unresolvable_key("uh the blue house")
+    assert key == "maps:unresolvable:uhthebluehouse"
+    assert cache_ops.redis_service.client.ttls[key] > 0
+
+  def test_transient_failures_are_not_cached(self):
+
+    """Test that transient lookup failures leave no negative-cache entry."""
+    calculator, cache_ops, google = make_calculator(unresolvable=False)
+
+    asyncio.run(calculator.get_distance_to_nearest_branch("47 W 13th St, New York, NY"))
+    asyncio.run(calculator.get_distance_to_nearest_branch("47 W 13th St, New York, NY"))
+
+    assert google.calls == 2 * len(BRANCHES)
+    assert unresolvable_keys(cache_ops) == []
+
+  def test_warm_hit_reads_distances_and_negative_cache_in_one_round_trip(self):
+    """Test that a fully cached lookup costs one MGET, even with a negative entry around."""
+    calculator, cache_ops, google = make_calculator(unresolvable=False)
+    delivery = "47 W 13th St, New York, NY"
+    for branch in BRANCHES:
+      key = cache_ops.get_cache_key(branch.address, delivery)
+      asyncio.run(cache_ops.distance_cache.set_json(key, cached_result(branch, delivery)))
+    asyncio.run(cache_ops.unresolvable_cache.set_json(cache_ops.get_unresolvable_key(delivery), {}))
+    client = cache_ops.redis_service.client
+    client.fail = {"get"}
+    reads = []
+    mget = client.mget
+
+    async def counting_mget(keys):
+      reads.append(keys)
+      return await mget(keys)
+
+    client.mget = counting_mget
+
+    result = asyncio.run(calculator.get_distance_to_nearest_branch(delivery))
+
+    assert result is not None and google.calls == 0
+    assert len(reads) == 1 and reads[0][-1] == cache_ops.get_unresolvable_key(delivery)
+
+
+def cached_result(branch, delivery_location):
+  return DistanceResult(
+      nearest_branch=branch,
+      delivery_location=delivery_location,
+      distance_miles=10.0,
+      distance_meters=16093,
+      duration_seconds=600,
+      within_service_area=True,
+  ).model_dump()
+
+
+class TestBranchVersions:
+  """Test cases for namespacing cached distances by branch."""
+
+  def test_renamed_branch_keeps_cached_distance(self):
+
+    """Test that renaming a branch keeps its cached distances."""
+    calculator, cache_ops, google = make_calculator(unresolvable=False)
+    delivery = "47 W 13th St, New York, NY"
+    for branch in BRANCHES:
+      old = BranchLocation(name=f"Old {branch.name}", address=branch.address)
+      key = cache_ops.get_cache_key(branch.address, delivery)
+      asyncio.run(cache_ops.distance_cache.set_json(key, cached_result(old, delivery)))
+
+    result = asyncio.run(calculator.get_distance_to_nearest_branch(delivery))
+
+    assert google.calls == 0
+    assert result.nearest_branch.name in {branch.name for branch in BRANCHES}
+
+  def test_branch_set_change_clears_only_removed_branch(self):
+
+    """Test that a branch set change drops the removed branch's distances and the negative cache."""
+    cache_ops = FakeCacheOps()
+    delivery = "47 W 13th St, New York, NY"
+    for branch in BRANCHES:
+      key = cache_ops.get_cache_key(branch.address, delivery)
+      asyncio.run(cache_ops.distance_cache.set_json(key, cached_result(branch, delivery)))
+    asyncio.run(cache_ops.unresolvable_cache.set_json(
+        cache_ops.get_unresolvable_key("nowhere"), {"reason": "NOT_FOUND"}))
+
+    first = asyncio.run(cache_ops.record_branch_set(BRANCHES))
+    assert first.previous_version is None and first.added == []
+
+    omaha, denver = BRANCHES
+    moved = BranchLocation(name="Denver", address="9 Oak St, Aurora, CO 80010")
+    renamed = BranchLocation(name="Omaha Central", address=omaha.address)
+    change = asyncio.run(cache_ops.record_branch_set([renamed, moved]))
+
+    assert change.previous_version == first.version != change.version
+    assert [branch.address for branch in change.added] == [moved.address]
+    assert [branch.address for branch in change.removed] == [denver.address]
+    assert [branch.name for branch in change.renamed] == ["Omaha Central"]
+    assert cache_ops.get_cache_key(omaha.address, delivery) in cache_ops.redis_service.client.values
+    assert cache_ops.get_cache_key(denver.address, delivery) not in cache_ops.redis_service.client.values
+    assert unresolvable_keys(cache_ops) == []
+
+    assert not asyncio.run(cache_ops.record_branch_set([renamed, moved])).changed
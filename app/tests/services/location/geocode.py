@@ -0,0 +1,87 @@
+# app/tests/services/location/geocode.py
+"""Tests for the Redis-backed geocode store shared across instances."""
+
+import asyncio
+from collections import OrderedDict
+
+from app.services.location.geocode import GeocodeRecord, GeocodeStore, canonical_address
+from app.tests.stubs import FakeRedisService
+
+
+class FakeMongo:
+  def __init__(self, docs):
+    self.docs = docs
+
+  async def get_geocoded_locations(self, limit):
+    return self.docs[:limit]
+
+
+def make_store(redis, version=1):
+  return GeocodeStore(redis, version=version, ttl=60, local_cache=OrderedDict())
+
+
+class TestGeocodeStore:
+  """Test cases for shared, versioned geocode records."""
+
+  def test_spellings_of_an_address_share_a_record(self):
+
+    """Test that punctuation and case variants of an address map to one record."""
+    assert canonical_address("123 Main St., Omaha,  NE") == canonical_address("123 main st, omaha, ne")
+    assert canonical_address("Omaha", "NE") != canonical_address("Omaha")
+
+    redis = FakeRedisService()
+    asyncio.run(make_store(redis).put(
+        "123 Main St., Omaha, NE", GeocodeRecord(latitude=41.25, longitude=-95.93, variation="123 Main St")))
+
+    record = asyncio.run(make_store(redis).get("123 main st, omaha, ne"))
+    assert record.coordinates == {"latitude": 41.25, "longitude": -95.93}
+    assert record.variation == "123 Main St"
+
+  def test_records_of_another_version_are_ignored(self):
+
+    """Test that bumping the store version hides records of the old one."""
+    redis = FakeRedisService()
+    asyncio.run(make_store(redis, version=1).put(
+        "Denver, CO", GeocodeRecord(latitude=39.74, longitude=-104.99)))
+
+    assert asyncio.run(make_store(redis, version=2).get("Denver, CO")) is None
+
+  def test_warm_up_loads_history_once_without_overwriting(self):
+
+    """Test that history is loaded once per interval and never replaces stored records."""
+    redis = FakeRedisService()
+    store = make_store(redis)
+    asyncio.run(store.put("Denver, CO", GeocodeRecord(latitude=1.0, longitude=2.0, variation="Denver")))
+    mongo = FakeMongo([
+        {"delivery_location": "Denver, CO", "geocoded_coordinates": {"latitude": 39.74, "longitude": -104.99}},
+        {"delivery_location": "Omaha, NE", "geocoded_coordinates": {"latitude": 41.26, "longitude": -95.93}},
+        {"delivery_location": "omaha ne", "geocoded_coordinates": {"latitude": 0.0, "longitude": 0.0}},
+        {"delivery_location": "Nowhere", "geocoded_coordinates": {"latitude": None, "longitude": None}},
+    ])
+
+    assert asyncio.run(store.warm_up(mongo)) == 1
+    assert asyncio.run(store.warm_up(mongo)) == 0
+
+    fresh = make_store(redis)
+    assert asyncio.run(fresh.get("Denver, CO")).variation == "Denver"
+    omaha = asyncio.run(fresh.get("Omaha, NE"))
+    assert omaha.source == "history" and omaha.latitude == 41.26
+
+  def test_warm_up_is_retried_after_a_failed_write(self):
+    """Test that the 24h marker is only set once the history was written."""
+    redis = FakeRedisService()
+    store = make_store(redis)
+    mongo = FakeMongo([
+        {"delivery_location": "Omaha, NE", "geocoded_coordinates": {"latitude": 41.26, "longitude": -95.93}},
+    ])
+    marker = f"{store.keyspace.index_key}:warmed:v1"
+    redis.client.fail = {"zadd"}
+
+    assert asyncio.run(store.warm_up(mongo)) == 0
+    assert marker not in redis.client.values
+
+    redis.client.fail = set()
+    asyncio.run(store.warm_up(mongo))
+    assert redis.client.ttls[marker] > 0
+    assert asyncio.run(make_store(redis).get("Omaha, NE")).source == "history"
+    assert not any(key.endswith(":warming:v1") for key in redis.client.values)
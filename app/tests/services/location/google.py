@@ -0,0 +1,150 @@
+# app/tests/services/location/google.py
+"""Tests for batched address-variation probing against the Distance Matrix API."""
+
+import asyncio
+import time
+from collections import OrderedDict
+
+from app.services.location.geocode import GeocodeRecord, GeocodeStore
+from app.services.location.google.operations import GoogleMapsOperations
+from app.tests.stubs import FakeRedisService
+
+DESTINATION = "47 W 13th St, New York, NY 10011, USA"
+
+
+class FakeGmaps:
+  """Distance Matrix stand-in: only the listed destinations resolve."""
+
+  def __init__(self, resolvable, delay=0.0):
+    self.resolvable = resolvable
+    self.delay = delay
+    self.requests = []
+    self.geocodes = 0
+
+  def distance_matrix(self, origins, destinations, mode):
+    self.requests.append(list(destinations))
+    time.sleep(self.delay)
+    elements = [
+        {"status": "OK", "distance": {"value": 1609}, "duration": {"value": 60}}
+        if destination in self.resolvable else {"status": "ZERO_RESULTS"}
+        for destination in destinations
+    ]
+    return {
+        "status": "OK",
+        "destination_addresses": [f"resolved {destination}" for destination in destinations],
+        "rows": [{"elements": elements}],
+    }
+
+  def geocode(self, address):
+    self.geocodes += 1
+    return [{"geometry": {"location": {"lat": 40.7, "lng": -74.0}}}]
+
+
+class FakeMongo:
+  def __init__(self):
+    self.errors = []
+
+  async def log_error_to_db(self, **kwargs):
+    self.errors.append(kwargs)
+
+
+def make_ops(gmaps, redis=None):
+  redis = redis or FakeRedisService()
+  ops = GoogleMapsOperations(redis, FakeMongo())
+  ops.geocode_store = GeocodeStore(redis, local_cache=OrderedDict())
+  ops._gmaps = gmaps
+  return ops
+
+
+class TestVariationProbing:
+  """Test cases for hedged multi-destination lookups."""
+
+  def test_primary_variation_is_sent_alone(self):
+    """Test that a resolvable address bills one element: the most specific variation."""
+    gmaps = FakeGmaps(resolvable={DESTINATION})
+    ops = make_ops(gmaps)
+
+    result = asyncio.run(ops.get_distance_from_google("Omaha, NE", DESTINATION))
+
+    assert gmaps.requests == [[DESTINATION]]
+    assert result["successful_variation"] == DESTINATION
+    assert result["distance_miles"] == 1.0
+    assert result["geocoded_coordinates"] == {"latitude": 40.7, "longitude": -74.0}
+
+  def test_fallbacks_share_one_request_and_most_specific_wins(self):
+    """Test that after the primary fails the fallbacks go out together, in rank order."""
+    gmaps = FakeGmaps(resolvable={"47 W 13th St, New York, NY 10011", "New York, NY 10011, USA"})
+    ops = make_ops(gmaps)
+
+    result = asyncio.run(ops.get_distance_from_google("Omaha, NE", DESTINATION))
+
+    assert [len(request) for request in gmaps.requests] == [1, 4]
+    assert result["successful_variation"] == "47 W 13th St, New York, NY 10011"
+
+  def test_budget_bounds_the_lookup(self, monkeypatch):
+
+    """Test that a slow API gives up within the lookup budget and records the timeout."""
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "GMAPS_LOOKUP_BUDGET_SECONDS", 0.05)
+    gmaps = FakeGmaps(resolvable=set(), delay=0.2)
+    ops = make_ops(gmaps)
+
+    started = time.monotonic()
+    result = asyncio.run(ops.get_distance_from_google("Omaha, NE", DESTINATION))
+
+    assert result is None
+    assert time.monotonic() - started < 0.5
+    assert ops.mongo_service.errors[0]["details"]["timed_out"] is True
+
+  def test_only_definitive_rejections_are_unresolvable(self):
+
+    """Test that ZERO_RESULTS for every variation marks the address unresolvable."""
+    ops = make_ops(FakeGmaps(resolvable=set()))
+
+    lookup = asyncio.run(ops.lookup_distance("Omaha, NE", DESTINATION))
+
+    assert lookup.result is None and lookup.unresolvable is True
+    assert ops.mongo_service.errors[0]["details"]["failure_statuses"] == ["ZERO_RESULTS"]
+
+  def test_transient_errors_are_not_unresolvable(self):
+
+    """Test that connection errors never mark an address unresolvable."""
+    class FailingGmaps(FakeGmaps):
+      def distance_matrix(self, origins, destinations, mode):
+        raise ConnectionError("reset by peer")
+
+    ops = make_ops(FailingGmaps(resolvable=set()))
+
+    lookup = asyncio.run(ops.lookup_distance("Omaha, NE", DESTINATION))
+
+    assert lookup.result is None and lookup.unresolvable is False
+
+  def test_shared_geocode_is_reused_across_instances(self):
+
+    """Test that a second instance reuses the stored geocode and probes the accepted variation first."""
+    redis = FakeRedisService()
+    gmaps = FakeGmaps(resolvable={"New York, NY 10011, USA"})
+    asyncio.run(make_ops(gmaps, redis).get_distance_from_google("Omaha, NE", DESTINATION))
+    assert gmaps.geocodes == 1
+
+    # A second instance sharing Redis skips geocoding and probes the accepted variation first
+    gmaps.requests.clear()
+    result = asyncio.run(make_ops(gmaps, redis).get_distance_from_google("Denver, CO", DESTINATION))
+
+    assert gmaps.geocodes == 1
+    assert gmaps.requests[0][0] == "New York, NY 10011, USA"
+    assert result["geocoded_coordinates"] == {"latitude": 40.7, "longitude": -74.0}
+
+  def test_new_variation_keeps_the_stored_source(self):
+    """Test that recording a newly accepted variation does not relabel history coordinates as Google's."""
+    redis = FakeRedisService()
+    ops = make_ops(FakeGmaps(resolvable={"New York, NY 10011, USA"}), redis)
+    asyncio.run(ops.geocode_store.put(DESTINATION, GeocodeRecord(
+        latitude=40.7, longitude=-74.0, variation="47 W 13th St", source="history")))
+
+    asyncio.run(ops.get_distance_from_google("Omaha, NE", DESTINATION))
+
+    record = asyncio.run(make_ops(FakeGmaps(set()), redis).geocode_store.get(DESTINATION))
+    assert record.variation == "New York, NY 10011, USA"
+    assert record.source == "history"
+    assert ops._gmaps.geocodes == 0
@@ -0,0 +1,58 @@
+# app/tests/services/location/locality.py
+"""Tests for the precomputed locality index."""
+
+from app.services.location.locality.index import LocalityIndex, compile_index
+
+HUBS = [("Omaha", 41.2565, -95.9345), ("Denver", 39.7392, -104.9903)]
+POINTS = [
+    # Lincoln, NE (~1h from Omaha)
+    (40.8136, -96.7026, "68508", "Lincoln", "NE"),
+    (40.8000, -96.6667, "68510", "Lincoln", "NE"),
+    # Boulder, CO (~0.6h from Denver)
+    (40.0150, -105.2705, "80302", "Boulder", "CO"),
+    # Chicago, IL (far from both hubs)
+    (41.8781, -87.6298, "60601", "Chicago", "IL"),
+    # Two points sharing a ZIP3 on either side of the cutoff
+    (41.0, -96.0, "68001", "Near", "NE"),
+    (42.9, -103.5, "68999", "Far", "NE"),
+]
+
+
+def build() -> LocalityIndex:
+  return compile_index(HUBS, POINTS, threshold_hours=3.0)
+
+
+class TestLocalityIndex:
+  """Test cases for index lookups and serialization."""
+
+  def test_zip_and_city_lookups(self):
+    """Test that known ZIPs and cities are decided without coordinates."""
+    index = build()
+
+    lincoln = index.lookup(postal_code="68508-1234")
+    assert lincoln.is_local and lincoln.hub == "Omaha" and lincoln.matched_on == "zip"
+    assert index.lookup(city="boulder", state="co").hub == "Denver"
+    assert index.lookup(postal_code="60601").is_local is False
+
+  def test_straddling_group_is_not_decisive(self):
+    """Test that a ZIP3 spanning the cutoff falls through to geocoding."""
+    index = build()
+
+    assert index.lookup(postal_code="68123") is None
+    assert index.lookup(postal_code="99999") is None
+    assert index.lookup(city="Nowhere", state="KS") is None
+
+  def test_coordinates_use_synced_hubs(self):
+    """Test that coordinate checks measure against the indexed hubs."""
+    index = build()
+
+    assert index.locality_for_coordinates(39.7, -105.0).hub == "Denver"
+    assert LocalityIndex().locality_for_coordinates(39.7, -105.0) is None
+
+  def test_payload_round_trip(self):
+    """Test that the compact payload restores the same lookups."""
+    index = build()
+    restored = LocalityIndex.from_payload(index.to_payload())
+
+    assert restored.zips == index.zips and restored.hubs == index.hubs
+    assert LocalityIndex.from_payload({"v": 0}) is None
@@ -0,0 +1,192 @@
+# app/tests/services/location/prewarm.py
+"""Tests for the distance cache pre-warmer."""
+
+import asyncio
+import json
+
+from app.models.hubspot import HubSpotObject, HubSpotSearchResponse
+from app.models.location import BranchLocation
+from app.services.location.cache import unpack_distance_result
+from app.services.location.prewarm import DistancePrewarmer, rank_addresses
+from app.tests.stubs import FakeRedisService
+
+OMAHA = BranchLocation(name="Omaha", address="1 Main St, Omaha, NE 68102")
+DENVER = BranchLocation(name="Denver", address="2 Main St, Denver, CO 80202")
+
+
+class FakeGoogle:
+  def __init__(self):
+    self.requests = []
+
+  async def distance_matrix_elements(self, origin, destinations):
+    self.requests.append((origin, list(destinations)))
+    return {destination: {"status": "ZERO_RESULTS"} if "nowhere" in destination
+            else {"status": "OK", "distance": {"value": 16093}, "duration": {"value": 600}}
+            for destination in destinations}
+
+
+class FakeGeocodeStore:
+  async def get(self, address):
+    return None
+
+
+class FakeAreaChecker:
+  async def check_service_area(self, address):
+    return True
+
+
+class FakeHubSpot:
+  """Leads, lead -> contact associations and contacts as HubSpot returns them."""
+
+  def __init__(self, leads, associations, contacts):
+    self.leads = leads
+    self.associations = associations
+    self.contacts = contacts
+    self.requested_properties = []
+
+  async def search_leads(self, search_request):
+    return HubSpotSearchResponse(
+        total=len(self.leads), results=[HubSpotObject(id=lead_id, properties={}) for lead_id in self.leads])
+
+  async def get_associated_ids(self, from_object_type, from_object_ids, to_object_type):
+    return {lead_id: self.associations[lead_id] for lead_id in from_object_ids if lead_id in self.associations}
+
+  async def batch_read_contacts(self, contact_ids, properties):
+    self.requested_properties = properties
+    return [HubSpotObject(id=contact_id, properties=self.contacts[contact_id])
+            for contact_id in contact_ids if contact_id in self.contacts]
+
+
+def contact_property_names():
+  with open("app/properties/contact.json") as f:
+    return {prop["name"] for prop in json.load(f)["inputs"]}
+
+
+def make_warmer(redis):
+  warmer = DistancePrewarmer(redis, mongo_service=None)
+  warmer.google_ops = FakeGoogle()
+  warmer.google_ops.geocode_store = FakeGeocodeStore()
+  warmer.area_checker = FakeAreaChecker()
+  return warmer
+
+
+class TestDistancePrewarmer:
+  """Test cases for ranking and refreshing cached distances."""
+
+  def test_sources_are_merged_by_cache_key(self):
+
+    """Test that spellings sharing a cache key add up under the first spelling seen."""
+    ranked = rank_addresses([
+        [("Lincoln, NE", 2.0), ("Boulder, CO", 3.0)],
+        [("lincoln ne", 4.0)],
+        [("Aurora, CO", 1.0)],
+    ], limit=2)
+
+    assert ranked == ["Lincoln, NE", "Boulder, CO"]
+
+  def test_only_missing_or_expiring_pairs_are_refreshed(self, monkeypatch):
+
+    """Test that fresh, non-expiring and unresolvable pairs are skipped."""
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "DISTANCE_PREWARM_REFRESH_BEFORE_SECONDS", 3600)
+    redis = FakeRedisService()
+    warmer = make_warmer(redis)
+    key = warmer.cache_ops.get_cache_key
+    client = redis.client
+    client.values[key(OMAHA.address, "Lincoln, NE")] = "{}"
+    client.ttls[key(OMAHA.address, "Lincoln, NE")] = 80000  # fresh
+    client.values[key(DENVER.address, "Lincoln, NE")] = "{}"
+    client.ttls[key(DENVER.address, "Lincoln, NE")] = 600  # about to expire
+    client.values[key(OMAHA.address, "Boulder, CO")] = "{}"  # never expires
+    client.values[warmer.cache_ops.get_unresolvable_key("Nowhere")] = "{}"
+
+    pairs = asyncio.run(warmer.stale_pairs([OMAHA, DENVER], ["Lincoln, NE", "Boulder, CO", "Nowhere"]))
+
+    assert [(branch.name, address) for branch, address in pairs] == [
+        ("Denver", "Lincoln, NE"),
+        ("Denver", "Boulder, CO"),
+    ]
+
+  def test_refresh_batches_destinations_under_request_budget(self, monkeypatch):
+
+    """Test that every branch's top batch goes first and the request budget cuts the rest."""
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "GMAPS_DESTINATIONS_PER_REQUEST", 2)
+    monkeypatch.setattr(settings, "DISTANCE_PREWARM_MAX_REQUESTS", 3)
+    monkeypatch.setattr(settings, "DISTANCE_PREWARM_REQUEST_INTERVAL_SECONDS", 0)
+    redis = FakeRedisService()
+    warmer = make_warmer(redis)
+    addresses = ["A, NE", "B, NE", "nowhere", "C, NE"]
+    pairs = [(branch, address) for address in addresses for branch in (OMAHA, DENVER)]
+
+    requests, refreshed = asyncio.run(warmer.refresh(pairs))
+
+    # The top batch of each branch goes first; the budget cuts the rest
+    assert warmer.google_ops.requests == [
+        (OMAHA.address, ["A, NE", "B, NE"]),
+        (DENVER.address, ["A, NE", "B, NE"]),
+        (OMAHA.address, ["nowhere", "C, NE"]),
+    ]
+    assert (requests, refreshed) == (3, 5)
+    cached = redis.decode(redis.client.values[warmer.cache_ops.get_cache_key(OMAHA.address, "C, NE")])
+    result = unpack_distance_result(cached)
+    assert result.distance_miles == 10.0 and result.nearest_branch.name == "Omaha"
+    # Denver was never asked about "nowhere", so it is not negative-cached yet
+    assert warmer.cache_ops.get_unresolvable_key("nowhere") not in redis.client.values
+
+  def test_refresh_negative_caches_addresses_no_branch_can_reach(self, monkeypatch):
+    """Test that an address every branch answers with ZERO_RESULTS is marked unresolvable."""
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "GMAPS_DESTINATIONS_PER_REQUEST", 2)
+    monkeypatch.setattr(settings, "DISTANCE_PREWARM_REQUEST_INTERVAL_SECONDS", 0)
+    redis = FakeRedisService()
+    warmer = make_warmer(redis)
+    pairs = [(branch, address) for address in ("A, NE", "nowhere") for branch in (OMAHA, DENVER)]
+
+    requests, refreshed = asyncio.run(warmer.refresh(pairs))
+
+    assert (requests, refreshed) == (2, 2)
+    key = warmer.cache_ops.get_unresolvable_key("nowhere")
+    assert redis.decode(redis.client.values[key])["branches_checked"] == 2
+    assert redis.client.ttls[key] == settings.UNRESOLVABLE_LOCATION_TTL_SECONDS
+    assert warmer.cache_ops.get_unresolvable_key("A, NE") not in redis.client.values
+    # The next round's stale pairs skip it
+    stale = asyncio.run(warmer.stale_pairs([OMAHA, DENVER], ["nowhere"]))
+    assert stale == []
+
+  def test_lead_addresses_come_from_associated_contacts(self):
+    """Test that open leads are resolved to their contacts' job site properties."""
+    hubspot = FakeHubSpot(
+        leads=["l1", "l2", "l3"],
+        associations={"l1": ["c1"], "l2": ["c2", "c1"], "l3": []},
+        contacts={
+            "c1": {"event_or_job_address": "123 Main St, Austin, TX 78701", "address": "PO Box 4"},
+            "c2": {"address": "9 Elm St", "city": "Omaha", "state": "NE", "zip": "68102"},
+        },
+    )
+    warmer = make_warmer(FakeRedisService())
+    warmer.hubspot_manager = hubspot
+
+    addresses = asyncio.run(warmer.lead_addresses())
+
+    assert addresses == ["123 Main St, Austin, TX 78701", "9 Elm St, Omaha, NE 68102"]
+    # The properties read are the contact properties this portal actually defines
+    assert {"event_or_job_address", "address", "city", "zip"} <= contact_property_names()
+    assert {"event_or_job_address", "address"} <= set(hubspot.requested_properties)
+
+  def test_added_branches_are_warmed_once_per_branch_set(self, monkeypatch):
+    """Test that of two instances syncing the same branch set only one warms it."""
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "DISTANCE_PREWARM_REQUEST_INTERVAL_SECONDS", 0)
+    redis = FakeRedisService()
+    first, second = make_warmer(redis), make_warmer(redis)
+
+    async def addresses():
+      return ["A, NE", "B, NE"]
+
+    for warmer in (first, second):
+      warmer.collect_addresses = addresses
+
+    assert asyncio.run(first.warm_branches([DENVER], "v2")) == (1, 2)
+    assert asyncio.run(second.warm_branches([DENVER], "v2")) == (0, 0)
+    assert second.google_ops.requests == []
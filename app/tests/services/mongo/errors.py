@@ -0,0 +1,61 @@
+# app/tests/services/mongo/errors.py
+"""Tests for error fingerprinting and rollup windows."""
+
+import asyncio
+
+from app.services.mongo.errors import ErrorOperations, error_fingerprint
+
+
+class FakeCollection:
+  def __init__(self):
+    self.upserts = []
+    self.bulk_writes = []
+
+  async def update_one(self, query, update, upsert=False):
+    self.upserts.append((query, update))
+
+  async def bulk_write(self, operations, ordered=True):
+    self.bulk_writes.append(operations)
+
+
+class FakeDb:
+  def __init__(self):
+    self.collection = FakeCollection()
+
+  def __getitem__(self, name):
+    return self.collection
+
+
+class TestErrorRollup:
+  """Test cases for one document per fingerprint per window."""
+
+  def test_fingerprint_ignores_ids_and_numbers(self):
+
+    """Test that messages differing only in ids, numbers and case share a fingerprint."""
+    first = error_fingerprint("Svc", "CacheMiss", "Key 'stahla:branches' missing after 3 tries (id 9f1c2e3d4b5a)")
+    second = error_fingerprint("Svc", "CacheMiss", "key 'other' missing after 12 tries (id 0a1b2c3d4e5f)")
+
+    assert first == second
+    assert first != error_fingerprint("Other", "CacheMiss", "key 'x' missing after 3 tries")
+
+  def test_repeats_are_counted_and_flushed_together(self):
+
+    """Test that repeats of one error share a document and flush as one increment."""
+    async def scenario():
+      ops = ErrorOperations(FakeDb())
+      ids = [await ops.log_error_to_db("Svc", "CacheMiss", f"Branch list key not found ({n})")
+             for n in range(5)]
+      await ops.log_error_to_db("Svc", "Other", "Something else")
+      await ops.close()
+      return ops, ids
+
+    ops, ids = asyncio.run(scenario())
+    collection = ops.db.collection
+
+    assert len(set(ids)) == 1
+    assert len(collection.upserts) == 2
+    assert collection.upserts[0][1]["$inc"] == {"count": 1}
+    [operations] = collection.bulk_writes
+    assert len(operations) == 1
+    assert operations[0]._doc["$inc"] == {"count": 4}
+    assert ops.rollup.pending == {}
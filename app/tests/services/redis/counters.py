@@ -0,0 +1,59 @@
+# app/tests/services/redis/counters.py
+"""Tests for per-request batching of dashboard counters."""
+
+import asyncio
+
+from app.core.context import CounterBatch, bind_request_context
+from app.services.background.request import flush_request_counters_bg, increment_request_counter_bg
+from app.services.redis.counters import counter_bucket_key, recent_bucket_keys
+from app.tests.stubs import FakeRedisService
+
+
+class TestCounterBatching:
+  """Test cases for counters collected during a request."""
+
+  def test_increments_inside_request_are_flushed_in_one_pipeline(self):
+
+    """Test that a request's increments are summed and written in one pipeline."""
+    redis = FakeRedisService()
+
+    async def run():
+      counters = CounterBatch()
+      bind_request_context(request_id="req-1", counters=counters)
+      await increment_request_counter_bg(redis, "quote:total")
+      await increment_request_counter_bg(redis, "quote:success")
+      await increment_request_counter_bg(redis, "quote:total")
+      assert redis.client.pipelines == []
+      await flush_request_counters_bg(redis, counters)
+
+    asyncio.run(run())
+    assert len(redis.client.pipelines) == 1
+    assert redis.client.values == {"quote:total": 2, "quote:success": 1}
+    [(bucket, totals)] = redis.client.hashes.items()
+    assert totals == {"quote:total": 2, "quote:success": 1}
+    assert bucket in redis.client.ttls
+    assert redis.client.pipelines[0][-1][0] == "expire"
+
+  def test_increment_after_flush_is_written_directly(self):
+
+    """Test that an increment after the flush is written straight away."""
+    redis = FakeRedisService()
+
+    async def run():
+      counters = CounterBatch()
+      bind_request_context(counters=counters)
+      await flush_request_counters_bg(redis, counters)
+      await increment_request_counter_bg(redis, "gmaps:calls")
+
+    asyncio.run(run())
+    # The empty batch costs no round trip; the late increment is not lost
+    assert len(redis.client.pipelines) == 1
+    assert redis.client.values == {"gmaps:calls": 1}
+
+  def test_recent_bucket_keys_end_at_current_minute(self):
+
+    """Test that the recent bucket keys run up to the current minute in order."""
+    now = 1_700_000_000.0
+    keys = recent_bucket_keys(3, now)
+    assert [minute for minute, _ in keys] == [int(now // 60) - 2, int(now // 60) - 1, int(now // 60)]
+    assert keys[-1][1] == counter_bucket_key(now)
@@ -0,0 +1,88 @@
+# app/tests/services/redis/index.py
+"""Tests for expiry-indexed key namespaces."""
+
+import asyncio
+import time
+
+from app.services.redis.index import IndexedKeyspace
+from app.tests.stubs import FakeRedisService
+
+INDEX_KEY = "maps:index:distance"
+
+
+def make_keyspace(batch_size=500):
+  redis = FakeRedisService()
+  return redis, IndexedKeyspace(redis, INDEX_KEY, "maps:distance:", batch_size=batch_size)
+
+
+class TestIndexedKeyspace:
+  """Test cases for counting and clearing without SCAN."""
+
+  def test_count_tracks_writes_and_deletes(self):
+
+    """Test that the index counts written keys and drops deleted ones."""
+    redis, keyspace = make_keyspace()
+
+    async def run():
+      await keyspace.set_json("maps:distance:a:x", {"km": 1}, ttl=60)
+      await keyspace.set_json("maps:distance:a:y", {"km": 2}, ttl=60)
+      await keyspace.delete("maps:distance:a:x")
+      return await keyspace.count()
+
+    assert asyncio.run(run()) == 1
+    assert "maps:distance:a:x" not in redis.client.values
+
+  def test_expired_members_are_not_counted(self):
+
+    """Test that members past their expiry are pruned on the next write."""
+    redis, keyspace = make_keyspace()
+    redis.client.zsets[INDEX_KEY] = {"maps:distance:old:x": time.time() - 1}
+
+    async def run():
+      await keyspace.set_json("maps:distance:a:x", {"km": 1}, ttl=60)
+      return await keyspace.count()
+
+    assert asyncio.run(run()) == 1
+    assert "maps:distance:old:x" not in redis.client.zsets[INDEX_KEY]
+
+  def test_clear_unlinks_matching_keys_in_batches(self):
+
+    """Test that clear removes only matching keys, across several batches."""
+    redis, keyspace = make_keyspace(batch_size=2)
+
+    async def run():
+      for delivery in ("x1", "x2", "x3", "y1"):
+        await keyspace.set_json(f"maps:distance:a:{delivery}", {}, ttl=60)
+      cleared = await keyspace.clear(match="maps:distance:*:x*")
+      return cleared, await keyspace.count()
+
+    assert asyncio.run(run()) == (3, 1)
+    assert list(redis.client.values) == ["maps:distance:a:y1"]
+
+  def test_backfill_indexes_existing_keys_once(self):
+
+    """Test that keys written before the index are indexed by the first backfill only."""
+    redis, keyspace = make_keyspace()
+    redis.client.values.update({"maps:distance:a:x": "{}", "maps:distance:b:y": "{}", "other": "1"})
+    redis.client.ttls["maps:distance:a:x"] = 60
+
+    async def run():
+      first = await keyspace.backfill()
+      second = await keyspace.backfill()
+      return first, second, await keyspace.count()
+
+    assert asyncio.run(run()) == (2, 0, 2)
+
+  def test_failed_backfill_is_retried(self):
+    """Test that a scan cut short by Redis leaves no done marker, so the next start rescans."""
+    redis, keyspace = make_keyspace()
+    redis.client.values["maps:distance:a:x"] = "{}"
+    redis.client.fail = {"zadd"}
+
+    first = asyncio.run(keyspace.backfill())
+    redis.client.fail = set()
+    second = asyncio.run(keyspace.backfill())
+
+    assert (first, second) == (0, 1)
+    assert redis.client.values[f"{keyspace.index_key}:backfilled"] == "1"
+    assert f"{keyspace.index_key}:backfilling" not in redis.client.values
@@ -0,0 +1,90 @@
+# app/tests/services/redis/revalidate.py
+"""Tests for stale-while-revalidate cache fallbacks."""
+
+import asyncio
+
+from app.services.redis.revalidate import RevalidatingCache
+
+
+def make_cache():
+  return RevalidatingCache(
+      "pricing:catalog", failure_threshold=2, cooldown_seconds=60, report_interval_seconds=60)
+
+
+class Source:
+  """Redis key plus MongoDB fallback with call counters."""
+
+  def __init__(self, cached=None, rebuilt=None):
+    self.cached = cached
+    self.rebuilt = rebuilt
+    self.rebuilds = 0
+    self.reports = []
+
+  async def read(self):
+    return self.cached
+
+  async def rebuild(self):
+    self.rebuilds += 1
+    await asyncio.sleep(0.01)
+    if isinstance(self.rebuilt, Exception):
+      raise self.rebuilt
+    return self.rebuilt
+
+  async def write(self, value):
+    self.cached = value
+
+  async def report(self, error_type, message, details):
+    self.reports.append(error_type)
+
+  def get(self, cache):
+    return cache.get(self.read, self.rebuild, self.write, self.report)
+
+
+class TestRevalidatingCache:
+  """Test cases for single-flight rebuilds, stale serving and the breaker."""
+
+  def test_concurrent_misses_share_one_rebuild(self):
+
+    """Test that concurrent misses wait on a single rebuild and report the miss once."""
+    cache = make_cache()
+    source = Source(rebuilt={"products": {"p1": {}}})
+
+    async def run():
+      return await asyncio.gather(*(source.get(cache) for _ in range(20)))
+
+    results = asyncio.run(run())
+    assert source.rebuilds == 1
+    assert all(result == {"products": {"p1": {}}} for result in results)
+    assert source.cached == {"products": {"p1": {}}}
+    # The cache miss was reported once, not once per caller
+    assert source.reports == ["CacheMiss"]
+
+  def test_serves_last_known_good_while_revalidating(self):
+
+    """Test that a miss serves the last known value while the rebuild runs."""
+    cache = make_cache()
+    source = Source(cached={"v": 1}, rebuilt={"v": 2})
+
+    async def run():
+      assert await source.get(cache) == {"v": 1}
+      source.cached = None
+      stale = await source.get(cache)
+      await asyncio.sleep(0.05)
+      return stale, await source.get(cache)
+
+    assert asyncio.run(run()) == ({"v": 1}, {"v": 2})
+    assert source.rebuilds == 1
+
+  def test_breaker_stops_rebuilds_after_repeated_failures(self):
+
+    """Test that repeated rebuild failures open the breaker and stop further rebuilds."""
+    cache = make_cache()
+    source = Source(rebuilt=RuntimeError("mongo down"))
+
+    async def run():
+      return [await source.get(cache) for _ in range(5)]
+
+    assert asyncio.run(run()) == [None] * 5
+    assert source.rebuilds == 2
+    assert cache.breaker.state == "open"
+    assert source.reports == ["CacheMiss", "CacheRebuildError"]
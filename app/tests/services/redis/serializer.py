@@ -0,0 +1,84 @@
+# app/tests/services/redis/serializer.py
+"""Tests for version-prefixed Redis value encodings."""
+
+import json
+
+import pytest
+
+from app.models.location import BranchLocation, DistanceResult
+from app.services.location.cache import pack_distance_result, unpack_distance_result
+from app.core.config import settings
+from app.services.redis.serializer import FORMAT_MARKER, SERIALIZERS, Serializer, decode
+
+CATALOG = {"products": {"2 Stall": {"rates": {"event": 1450.0}}}, "version": 3, "note": "día"}
+
+
+def make_result(coordinates=None):
+  return DistanceResult(
+      nearest_branch=BranchLocation(name="Omaha", address="1 Main St, Omaha, NE 68102"),
+      delivery_location="47 W 13th St, New York, NY",
+      distance_miles=12.34,
+      distance_meters=19859,
+      duration_seconds=1500,
+      within_service_area=True,
+      geocoded_coordinates=coordinates,
+  )
+
+
+class TestSerializers:
+  """Test cases for reading every format regardless of the one being written."""
+
+  def test_every_format_reads_back(self):
+    """Test that values written by each serializer decode to the original data."""
+    for serializer in SERIALIZERS.values():
+      assert decode(serializer.encode(CATALOG)) == CATALOG
+
+  def test_legacy_json_has_no_prefix_and_orjson_is_versioned(self):
+    """Test that json writes the legacy plain text and orjson a shorter prefixed value."""
+    legacy = SERIALIZERS["json"].encode(CATALOG)
+    compact = SERIALIZERS["orjson"].encode(CATALOG)
+
+    assert legacy == json.dumps(CATALOG)
+    assert compact.startswith(FORMAT_MARKER + "1")
+    assert len(compact) < len(legacy)
+
+  def test_unknown_format_version_is_rejected(self):
+    """Test that a format version this process does not know raises ValueError."""
+    with pytest.raises(ValueError):
+      decode(FORMAT_MARKER + "9{}")
+
+  def test_default_writes_plain_json(self):
+    """Test that values stay readable by older workers unless the format is switched."""
+    assert settings.REDIS_SERIALIZER == "json"
+
+  def test_serializer_must_implement_dumps_and_loads(self):
+    """Test that the base class cannot be used without an encoding."""
+    with pytest.raises(TypeError):
+      Serializer()
+
+
+class TestDistanceLayout:
+  """Test cases for the compact cached DistanceResult layout."""
+
+  def test_packed_result_round_trips(self):
+    """Test that the compact layout decodes to an equal result, with and without coordinates."""
+    for coordinates in (None, {"latitude": 41.25, "longitude": -95.93}):
+      result = make_result(coordinates)
+      packed = pack_distance_result(result, compact=True)
+
+      assert unpack_distance_result(decode(SERIALIZERS["orjson"].encode(packed))) == result
+
+  def test_plain_json_keeps_the_model_dump(self, monkeypatch):
+    """Test that the compact layout is not written while values are plain JSON."""
+    monkeypatch.setattr(settings, "REDIS_SERIALIZER", "json")
+    result = make_result()
+
+    assert pack_distance_result(result) == result.model_dump()
+
+  def test_dicts_written_before_the_layout_still_load(self):
+    """Test that model dumps load and unknown layout versions are rejected."""
+    result = make_result()
+
+    assert unpack_distance_result(json.loads(json.dumps(result.model_dump()))) == result
+    with pytest.raises(ValueError):
+      unpack_distance_result([99, "Omaha"])
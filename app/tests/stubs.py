@@ -0,0 +1,326 @@
+# app/tests/stubs.py
+"""
+In-memory stand-ins shared by the unit tests.
+
+- FakeRedisClient: the subset of redis.asyncio commands the services use
+  (strings, hashes, lists, sorted sets, streams with one consumer group) plus
+  pipelines. Time never passes: TTLs are stored as given.
+- FakeRedisService: RedisService surface on top of one FakeRedisClient,
+  encoding JSON values with the configured serializer.
+"""
+
+import fnmatch
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.redis.serializer import decode, get_serializer
+
+
+def _score(value: Any) -> float:
+  return float(value) if not isinstance(value, str) else float(value.replace("inf", "Infinity"))
+
+
+class FakePipeline:
+  """Queues commands and runs them in order on `execute()`."""
+
+  def __init__(self, client: "FakeRedisClient"):
+    self.client = client
+    self.calls: List[Tuple[str, tuple, dict]] = []
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, *exc):
+    return False
+
+  def __getattr__(self, name):
+    def queue(*args, **kwargs):
+      self.calls.append((name, args, kwargs))
+      return self
+    return queue
+
+  async def execute(self):
+    self.client.pipelines.append(list(self.calls))
+    results = [await getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+    self.calls = []
+    return results
+
+
+class FakeRedisClient:
+  """Dict-backed client; `fail` names commands that raise RedisError."""
+
+  def __init__(self):
+    self.values: Dict[str, Any] = {}
+    self.ttls: Dict[str, int] = {}
+    self.hashes: Dict[str, Dict[str, Any]] = {}
+    self.lists: Dict[str, List[str]] = {}
+    self.zsets: Dict[str, Dict[str, float]] = {}
+    self.streams: Dict[str, List[Tuple[str, Dict[str, str]]]] = {}
+    # stream -> message id -> consumer, for entries read but not acknowledged
+    self.pending: Dict[str, Dict[str, str]] = {}
+    self.delivered: Dict[str, int] = {}
+    self.pipelines: List[List[Tuple[str, tuple, dict]]] = []
+    self.fail: set = set()
+    self._ids = itertools.count(1)
+
+  def __getattribute__(self, name):
+    if not name.startswith("_") and name in object.__getattribute__(self, "fail"):
+      from redis.exceptions import RedisError
+      raise RedisError(f"{name} failed")
+    return object.__getattribute__(self, name)
+
+  def pipeline(self, transaction=True):
+    return FakePipeline(self)
+
+  async def close(self):
+    pass
+
+  async def ping(self):
+    return True
+
+  # Strings and keys
+
+  async def get(self, key):
+    return self.values.get(key)
+
+  async def mget(self, keys):
+    return [self.values.get(key) for key in keys]
+
+  async def set(self, key, value, ex=None, nx=False):
+    if nx and key in self.values:
+      return None
+    self.values[key] = value
+    self.ttls.pop(key, None)
+    if ex:
+      self.ttls[key] = int(ex)
+    return True
+
+  async def incrby(self, key, amount=1):
+    self.values[key] = int(self.values.get(key, 0)) + amount
+    return self.values[key]
+
+  async def incr(self, key, amount=1):
+    return await self.incrby(key, amount)
+
+  async def incrbyfloat(self, key, amount=1.0):
+    self.values[key] = float(self.values.get(key, 0)) + amount
+    return self.values[key]
+
+  async def expire(self, key, ttl):
+    self.ttls[key] = int(ttl)
+    return True
+
+  async def ttl(self, key):
+    if not await self.exists(key):
+      return -2
+    return self.ttls.get(key, -1)
+
+  async def exists(self, *keys):
+    stores = (self.values, self.hashes, self.lists, self.zsets, self.streams)
+    return sum(1 for key in keys if any(key in store for store in stores))
+
+  async def delete(self, *keys):
+    removed = 0
+    for key in keys:
+      for store in (self.values, self.hashes, self.lists, self.zsets, self.streams):
+        if store.pop(key, None) is not None:
+          removed += 1
+      self.ttls.pop(key, None)
+    return removed
+
+  unlink = delete
+
+  async def scan_iter(self, match="*", count=None):
+    for key in list(self.values):
+      if fnmatch.fnmatchcase(key, match):
+        yield key
+
+  # Hashes
+
+  async def hincrby(self, name, key, amount=1):
+    bucket = self.hashes.setdefault(name, {})
+    bucket[key] = int(bucket.get(key, 0)) + amount
+    return bucket[key]
+
+  async def hincrbyfloat(self, name, key, amount=1.0):
+    bucket = self.hashes.setdefault(name, {})
+    bucket[key] = float(bucket.get(key, 0)) + amount
+    return bucket[key]
+
+  async def hgetall(self, name):
+    return {key: str(value) for key, value in self.hashes.get(name, {}).items()}
+
+  # Lists
+
+  async def lpush(self, name, *values):
+    items = self.lists.setdefault(name, [])
+    items[:0] = reversed(values)
+    return len(items)
+
+  async def ltrim(self, name, start, end):
+    items = self.lists.get(name, [])
+    self.lists[name] = items[start:] if end == -1 else items[start:end + 1]
+    return True
+
+  async def lrange(self, name, start, end):
+    items = self.lists.get(name, [])
+    return items[start:] if end == -1 else items[start:end + 1]
+
+  # Sorted sets
+
+  async def zadd(self, name, mapping, nx=False):
+    zset = self.zsets.setdefault(name, {})
+    added = 0
+    for member, score in mapping.items():
+      if member in zset and nx:
+        continue
+      added += member not in zset
+      zset[member] = float(score)
+    return added
+
+  async def zincrby(self, name, amount, member):
+    zset = self.zsets.setdefault(name, {})
+    zset[member] = zset.get(member, 0.0) + amount
+    return zset[member]
+
+  async def zrem(self, name, *members):
+    zset = self.zsets.get(name, {})
+    return sum(1 for member in members if zset.pop(member, None) is not None)
+
+  def _sorted(self, name) -> List[Tuple[str, float]]:
+    return sorted(self.zsets.get(name, {}).items(), key=lambda item: (item[1], item[0]))
+
+  async def zcount(self, name, low, high):
+    return sum(1 for _, score in self._sorted(name) if _score(low) <= score <= _score(high))
+
+  async def zrange(self, name, start, end, withscores=False):
+    items = self._sorted(name)
+    items = items[start:] if end == -1 else items[start:end + 1]
+    return items if withscores else [member for member, _ in items]
+
+  async def zrevrange(self, name, start, end, withscores=False):
+    items = list(reversed(self._sorted(name)))
+    items = items[start:] if end == -1 else items[start:end + 1]
+    return items if withscores else [member for member, _ in items]
+
+  async def zrangebyscore(self, name, low, high, start=None, num=None):
+    members = [member for member, score in self._sorted(name) if _score(low) <= score <= _score(high)]
+    if start is not None and num is not None:
+      members = members[start:start + num]
+    return members
+
+  async def zremrangebyscore(self, name, low, high):
+    doomed = [member for member, score in self._sorted(name) if _score(low) <= score <= _score(high)]
+    return await self.zrem(name, *doomed) if doomed else 0
+
+  async def zremrangebyrank(self, name, start, end):
+    items = self._sorted(name)
+    end = len(items) + end if end < 0 else end
+    doomed = [member for member, _ in items[start:end + 1]]
+    return await self.zrem(name, *doomed) if doomed else 0
+
+  async def zscan_iter(self, name, match="*", count=None):
+    for member, score in list(self.zsets.get(name, {}).items()):
+      if fnmatch.fnmatchcase(member, match):
+        yield member, score
+
+  # Streams (one consumer group per stream)
+
+  async def xadd(self, name, fields, maxlen=None, approximate=True):
+    message_id = f"{next(self._ids)}-0"
+    self.streams.setdefault(name, []).append((message_id, dict(fields)))
+    return message_id
+
+  async def xtrim(self, name, maxlen=None, minid=None, approximate=True):
+    """Keeps everything: time never passes here."""
+    return 0
+
+  async def xlen(self, name):
+    return len(self.streams.get(name, []))
+
+  async def xrange(self, name):
+    return list(self.streams.get(name, []))
+
+  async def xgroup_create(self, name, group, id="0", mkstream=False):
+    self.streams.setdefault(name, [])
+    return True
+
+  async def xreadgroup(self, group, consumer, streams, count=None, block=None):
+    response = []
+    for name in streams:
+      pending = self.pending.setdefault(name, {})
+      fresh = [(message_id, fields) for message_id, fields in self.streams.get(name, [])
+               if message_id not in pending and self.delivered.get(message_id) is None]
+      fresh = fresh[:count] if count else fresh
+      for message_id, _ in fresh:
+        pending[message_id] = consumer
+        self.delivered[message_id] = 1
+      if fresh:
+        response.append((name, fresh))
+    return response
+
+  async def xack(self, name, group, *message_ids):
+    pending = self.pending.setdefault(name, {})
+    return sum(1 for message_id in message_ids if pending.pop(message_id, None) is not None)
+
+  async def xdel(self, name, *message_ids):
+    entries = self.streams.get(name, [])
+    kept = [entry for entry in entries if entry[0] not in message_ids]
+    self.streams[name] = kept
+    return len(entries) - len(kept)
+
+  async def xautoclaim(self, name, group, consumer, min_idle_time=0, start_id="0-0", count=None):
+    """Every pending entry counts as idle long enough."""
+    entries = dict(self.streams.get(name, []))
+    claimed = []
+    for message_id in list(self.pending.get(name, {}))[:count]:
+      self.pending[name][message_id] = consumer
+      claimed.append((message_id, entries.get(message_id)))
+    return ["0-0", claimed, []]
+
+
+class FakeRedisService:
+  """RedisService surface over one shared FakeRedisClient."""
+
+  background_tasks = None
+
+  def __init__(self, client: Optional[FakeRedisClient] = None):
+    self.client = client or FakeRedisClient()
+    self.serializer = get_serializer()
+
+  async def get_client(self):
+    return self.client
+
+  def _record_latency(self, *args, **kwargs):
+    pass
+
+  def encode(self, data: Any) -> str:
+    return self.serializer.encode(data)
+
+  def decode(self, value: str) -> Any:
+    return decode(value)
+
+  async def get(self, key):
+    return await self.client.get(key)
+
+  async def mget(self, keys):
+    return await self.client.mget(keys)
+
+  async def set(self, key, value, ttl=None):
+    return bool(await self.client.set(key, value, ex=ttl))
+
+  async def set_if_not_exists(self, key, value, ttl=None):
+    return bool(await self.client.set(key, value, ex=ttl, nx=True))
+
+  async def get_json(self, key):
+    value = await self.client.get(key)
+    return decode(value) if value else None
+
+  async def set_json(self, key, data, ttl=None):
+    return await self.set(key, self.encode(data), ttl=ttl)
+
+  async def exists(self, key):
+    return await self.client.exists(key) > 0
+
+  async def delete(self, *keys):
+    return await self.client.delete(*keys)
@@ -0,0 +1,83 @@
+# app/tests/utils/image.py
+"""Tests for the single-decode profile picture pipeline."""
+
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from app.utils.image import (
+    PICTURE_SIZES,
+    ImageProcessor,
+    _render_and_store,
+    picture_digest,
+    store_user_picture,
+)
+
+
+def encode(size, mode="RGB", fmt="JPEG"):
+  output = io.BytesIO()
+  Image.new(mode, size, (200, 40, 40) if mode == "RGB" else None).save(output, format=fmt)
+  return output.getvalue()
+
+
+class TestImagePipeline:
+  """Test cases for rendering and content-addressed storage."""
+
+  def test_renders_every_variant_as_square_jpeg(self):
+
+    """Test that one decode yields every configured size as a square JPEG."""
+    variants = ImageProcessor.render_picture(encode((3000, 2000)))
+
+    assert set(variants) == set(PICTURE_SIZES)
+    for name, data in variants.items():
+      with Image.open(io.BytesIO(data)) as img:
+        assert img.format == "JPEG"
+        assert img.size == (PICTURE_SIZES[name], PICTURE_SIZES[name])
+
+  def test_transparent_png_is_flattened(self):
+
+    """Test that transparency is flattened onto white before JPEG encoding."""
+    variants = ImageProcessor.render_picture(encode((300, 300), mode="RGBA", fmt="PNG"), {"md": 150})
+
+    with Image.open(io.BytesIO(variants["md"])) as img:
+      assert img.mode == "RGB"
+      assert img.getpixel((75, 75)) == (255, 255, 255)
+
+  def test_invalid_data_raises_value_error(self):
+
+    """Test that undecodable bytes raise ValueError."""
+    with pytest.raises(ValueError):
+      ImageProcessor.render_picture(b"not an image")
+
+  def test_store_is_content_addressed_and_idempotent(self, tmp_path):
+
+    """Test that storing the same upload twice returns the same URLs without rewriting files."""
+    content = encode((800, 600))
+
+    first = asyncio.run(store_user_picture(content, tmp_path, "/static/users"))
+    mtimes = {path.name: path.stat().st_mtime_ns for path in tmp_path.iterdir()}
+    second = asyncio.run(store_user_picture(content, tmp_path, "/static/users"))
+
+    digest = picture_digest(content)
+    assert first == second
+    assert first["md"] == f"/static/users/{digest}_md.jpg"
+    assert {path.name: path.stat().st_mtime_ns for path in tmp_path.iterdir()} == mtimes
+
+  def test_concurrent_writers_do_not_share_temp_files(self, tmp_path):
+    """Test that threads storing the same upload each write their own temp file."""
+    content = encode((800, 600))
+    digest = picture_digest(content)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+      results = list(pool.map(
+          lambda _: _render_and_store(content, digest, tmp_path, "/static/users"), range(8)))
+
+    assert all(result == results[0] for result in results)
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        f"{digest}_{name}.jpg" for name in PICTURE_SIZES)
+    for name in PICTURE_SIZES:
+      with Image.open(tmp_path / f"{digest}_{name}.jpg") as img:
+        assert img.size == (PICTURE_SIZES[name], PICTURE_SIZES[name])
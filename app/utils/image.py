@@ -2,14 +2,38 @@
 """
 Image processing utilities for handling user profile pictures.
 Provides functionality to resize images to thumbnails and validate image formats.
+
+Uploads are decoded once (JPEGs in draft mode at a reduced scale), every
+variant size is rendered from that single decode, and the results are stored
+under content-addressed filenames on a bounded worker pool, so a large upload
+never blocks the event loop and re-uploading the same image is a no-op.
 """
 
+import asyncio
+import hashlib
 import io
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
-from PIL import Image, ImageOps
+from typing import Dict, Optional, Tuple
 import logfire
 
+from app.core.config import settings
+
+# Pillow is imported inside the methods that need it, so it is only loaded
+# when a profile picture is actually processed.
+
+# Square variants rendered for every profile picture: name -> edge length (px)
+PICTURE_SIZES: Dict[str, int] = {"sm": 64, "md": 150, "lg": 400}
+# Variant stored in the user's `picture` field
+DEFAULT_PICTURE_VARIANT = "md"
+# Part of the content address; bump when rendering changes so files are regenerated
+PICTURE_PIPELINE_VERSION = "1"
+
+USER_PICTURES_DIR = Path("app/static/users")
+USER_PICTURES_URL = "/static/users"
+
 
 class ImageProcessor:
   """Helper class for processing uploaded images"""
@@ -29,6 +53,8 @@ class ImageProcessor:
     Returns:
         bool: True if valid image, False otherwise
     """
+    from PIL import Image
+
     try:
       with Image.open(io.BytesIO(file_content)) as img:
         # Get format before verification (verify destroys the image)
@@ -55,6 +81,8 @@ class ImageProcessor:
     Returns:
         str: Image format (e.g., 'JPEG', 'PNG') or None if invalid
     """
+    from PIL import Image
+
     try:
       with Image.open(io.BytesIO(file_content)) as img:
         return img.format
@@ -81,6 +109,8 @@ class ImageProcessor:
     Raises:
         ValueError: If the image cannot be processed
     """
+    from PIL import Image, ImageOps
+
     if size is None:
       size = ImageProcessor.THUMBNAIL_SIZE
     if quality is None:
@@ -130,6 +160,80 @@ class ImageProcessor:
       logfire.error(f"Error creating thumbnail: {e}", exc_info=True)
       raise ValueError(f"Failed to process image: {str(e)}")
 
+  @staticmethod
+  def _square_rgb(img):
+    """Orients, flattens transparency onto white and center-crops to a square."""
+    from PIL import Image, ImageOps
+
+    img = ImageOps.exif_transpose(img)
+    if img.mode in ('RGBA', 'LA', 'P'):
+      img = img.convert('RGBA')
+      background = Image.new('RGB', img.size, (255, 255, 255))
+      background.paste(img, mask=img.split()[-1])
+      img = background
+    elif img.mode != 'RGB':
+      img = img.convert('RGB')
+
+    width, height = img.size
+    side = min(width, height)
+    left = (width - side) // 2
+    top = (height - side) // 2
+    return img.crop((left, top, left + side, top + side))
+
+  @staticmethod
+  def render_picture(
+      file_content: bytes,
+      sizes: Optional[Dict[str, int]] = None,
+      quality: Optional[int] = None
+  ) -> Dict[str, bytes]:
+    """
+    Render square JPEG variants of an image from a single decode.
+
+    Args:
+        file_content: Raw bytes of the uploaded image
+        sizes: Variant name -> edge length in pixels. Defaults to PICTURE_SIZES
+        quality: JPEG quality (1-100). Defaults to 85
+
+    Returns:
+        Dict[str, bytes]: Encoded JPEG bytes per variant name
+
+    Raises:
+        ValueError: If the image is unsupported or cannot be decoded
+    """
+    from PIL import Image
+
+    sizes = sizes or PICTURE_SIZES
+    quality = quality or ImageProcessor.DEFAULT_QUALITY
+    largest = max(sizes.values())
+
+    try:
+      with Image.open(io.BytesIO(file_content)) as img:
+        if img.format not in ImageProcessor.SUPPORTED_FORMATS:
+          raise ValueError(f"Unsupported image format: {img.format}")
+        if img.format == 'JPEG':
+          # Let libjpeg decode at 1/2, 1/4 or 1/8 scale while both sides stay at
+          # least twice the largest variant, leaving detail for the final resample
+          img.draft('RGB', (largest * 2, largest * 2))
+        img.load()
+        current = ImageProcessor._square_rgb(img)
+
+      variants: Dict[str, bytes] = {}
+      # Largest first, so each smaller variant is resampled from the previous one
+      for name, edge in sorted(sizes.items(), key=lambda item: item[1], reverse=True):
+        if current.size != (edge, edge):
+          current = current.resize(
+              (edge, edge), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        output = io.BytesIO()
+        current.save(output, format='JPEG', quality=quality, optimize=True)
+        variants[name] = output.getvalue()
+      return variants
+
+    except ValueError:
+      raise
+    except Exception as e:
+      logfire.warning(f"Image rendering failed: {e}")
+      raise ValueError(f"Failed to process image: {str(e)}")
+
   @staticmethod
   def get_file_extension_for_format(image_format: str) -> str:
     """
@@ -172,12 +276,10 @@ class ImageProcessor:
         ValueError: If the image cannot be processed
     """
     try:
-      # Validate the image
-      if not ImageProcessor.validate_image(file_content):
-        raise ValueError("Invalid image format or corrupted image data")
-
-      # Create thumbnail
-      thumbnail_bytes = ImageProcessor.create_thumbnail(file_content)
+      # Decoding validates the image; no separate verify pass
+      thumbnail_bytes = ImageProcessor.render_picture(
+          file_content, {DEFAULT_PICTURE_VARIANT: ImageProcessor.THUMBNAIL_SIZE[0]}
+      )[DEFAULT_PICTURE_VARIANT]
 
       # Generate filename - always use .jpg for thumbnails since we convert to JPEG
       original_name = Path(original_filename).stem
@@ -214,3 +316,88 @@ def process_user_picture(
 ) -> Tuple[bytes, str]:
   """Process a user's profile picture upload."""
   return ImageProcessor.process_user_picture(file_content, original_filename, user_id, timestamp)
+
+
+# --- Off-loop pipeline ---
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+  # Pillow releases the GIL while decoding, resampling and encoding, so a
+  # small thread pool keeps CPU work off the loop without pickling uploads
+  global _executor
+  if _executor is None:
+    _executor = ThreadPoolExecutor(
+        max_workers=settings.IMAGE_PROCESSING_WORKERS, thread_name_prefix="image")
+  return _executor
+
+
+def picture_digest(file_content: bytes) -> str:
+  """Content address of an upload under the current pipeline version."""
+  hasher = hashlib.sha256(PICTURE_PIPELINE_VERSION.encode())
+  hasher.update(file_content)
+  return hasher.hexdigest()[:32]
+
+
+def picture_filename(digest: str, variant: str) -> str:
+  return f"{digest}_{variant}.jpg"
+
+
+def _render_and_store(
+    file_content: bytes,
+    digest: str,
+    directory: Path,
+    url_prefix: str,
+) -> Dict[str, str]:
+  paths = {name: directory / picture_filename(digest, name) for name in PICTURE_SIZES}
+  missing = [name for name, path in paths.items() if not path.exists()]
+  if missing:
+    variants = ImageProcessor.render_picture(file_content)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in missing:
+      # Write-then-rename so a concurrent reader never sees a partial file; the
+      # temp name is unique per writer, as pool threads share one process id
+      with tempfile.NamedTemporaryFile(
+          dir=directory, prefix=f".{paths[name].stem}.", suffix=".tmp", delete=False) as tmp:
+        tmp.write(variants[name])
+      try:
+        os.replace(tmp.name, paths[name])
+      except OSError:
+        os.unlink(tmp.name)
+        raise
+    logfire.info(f"Stored picture {digest} ({len(missing)} variants rendered)")
+  else:
+    logfire.info(f"Picture {digest} already stored; skipped rendering")
+  return {name: f"{url_prefix}/{path.name}" for name, path in paths.items()}
+
+
+async def store_user_picture(
+    file_content: bytes,
+    directory: Path = USER_PICTURES_DIR,
+    url_prefix: str = USER_PICTURES_URL,
+) -> Dict[str, str]:
+  """
+  Render and store every picture variant on the image worker pool.
+
+  Files are named by the digest of the upload, so URLs are immutable and the
+  static file server's ETag/If-None-Match handling makes re-serving cheap.
+
+  Returns:
+      Dict[str, str]: Variant name -> static URL
+
+  Raises:
+      ValueError: If the image cannot be processed
+  """
+  digest = picture_digest(file_content)
+  loop = asyncio.get_running_loop()
+  return await loop.run_in_executor(
+      _get_executor(), _render_and_store, file_content, digest, directory, url_prefix)
+
+
+def shutdown_image_executor() -> None:
+  """Stop the image worker pool (called on application shutdown)."""
+  global _executor
+  if _executor is not None:
+    _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
@@ -3,6 +3,7 @@ Location utilities for determining locality based on drive time from key service
 Enhanced with better address parsing for improved geocoding reliability.
 """
 
+import asyncio
 import math
 import json
 import hashlib
@@ -11,32 +12,38 @@ import re
 from typing import Tuple, List, Optional, Dict, Any
 import logfire
 
-# Import geopy
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut, GeocoderServiceError
-from geopy.distance import geodesic  # For more accurate distance
-
 # Import our enhanced address parsing functions
 from app.services.location.parsing.address import parse_and_normalize_address
 from app.services.location.parsing.address import extract_location_components
+from app.services.location.locality.index import locality_index
 
 # Define the key service hubs (latitude, longitude)
+# Fallback only: once the locality index is built, hubs are the synced branches
 SERVICE_HUBS = {
     "omaha_ne": (41.2565, -95.9345),
     "denver_co": (39.7392, -104.9903),
     "kansas_city_ks": (39.1141, -94.6275),
 }
 
-# Initialize geocoder with basic configuration
-try:
-  geolocator = Nominatim(user_agent="stahla_ai_sdr_app/1.0")
-  logfire.info("Initialized geocoder with standard configuration")
-except Exception as e:
-  logfire.error(f"Error initializing geocoder: {e}")
-  # Create a placeholder that will gracefully fail
-  from unittest.mock import MagicMock
-  geolocator = MagicMock()
-  geolocator.geocode.return_value = None
+# Geocoder is created on first use so geopy is not imported at application startup
+_geolocator = None
+
+
+def _get_geolocator():
+  """Returns the shared Nominatim geocoder, creating it on first use."""
+  global _geolocator
+  if _geolocator is None:
+    try:
+      from geopy.geocoders import Nominatim
+      _geolocator = Nominatim(user_agent="stahla_ai_sdr_app/1.0")
+      logfire.info("Initialized geocoder with standard configuration")
+    except Exception as e:
+      logfire.error(f"Error initializing geocoder: {e}")
+      # Create a placeholder that will gracefully fail
+      from unittest.mock import MagicMock
+      _geolocator = MagicMock()
+      _geolocator.geocode.return_value = None
+  return _geolocator
 
 # In-memory cache for geocoding results
 _GEOCODE_CACHE: Dict[str, Dict[str, Any]] = {}
@@ -91,6 +98,7 @@ def _cache_geocode(query: str, lat: float, lon: float) -> None:
 
 def get_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
   """Calculate geodesic distance between two points in kilometers."""
+  from geopy.distance import geodesic  # For more accurate distance
   return geodesic((lat1, lon1), (lat2, lon2)).km
 
 
@@ -116,6 +124,17 @@ def is_location_local(lat: Optional[float], lon: Optional[float]) -> bool:
         "Cannot determine locality: Latitude or longitude is missing.")
     return True  # Default to local if no coordinates
 
+  match = locality_index.locality_for_coordinates(lat, lon)
+  if match is not None:
+    logfire.info(
+        f"Locality determined: {match.is_local}",
+        min_drive_time_hours=match.drive_hours,
+        closest_hub=match.hub,
+        location_lat=lat,
+        location_lon=lon,
+    )
+    return match.is_local
+
   min_drive_time = float("inf")
   closest_hub = None
 
@@ -160,6 +179,8 @@ def geocode_location(
   Returns:
       Tuple containing (latitude, longitude) or (None, None) if geocoding fails
   """
+  from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+
   logfire.info(
       f"Attempting to geocode location description: '{location_description}'",
       state_code=state_code,
@@ -180,7 +201,7 @@ def geocode_location(
 
     try:
       logfire.info(f"Geocoding state only: '{state_query}'")
-      location = geolocator.geocode(state_query, exactly_one=True)
+      location = _get_geolocator().geocode(state_query, exactly_one=True)
 
       # Safely extract coordinates
       lat, lon = _extract_coordinates_safely(location)
@@ -217,7 +238,7 @@ def geocode_location(
     try:
       logfire.info(
           f"Trying geocoding variation {i+1}/{len(address_variations)}: '{enhanced_variation}'")
-      location = geolocator.geocode(enhanced_variation, exactly_one=True)
+      location = _get_geolocator().geocode(enhanced_variation, exactly_one=True)
 
       # Safely extract coordinates
       lat, lon = _extract_coordinates_safely(location)
@@ -249,7 +270,7 @@ def geocode_location(
 
     try:
       logfire.info(f"Trying city/state fallback: '{fallback_query}'")
-      location = geolocator.geocode(fallback_query, exactly_one=True)
+      location = _get_geolocator().geocode(fallback_query, exactly_one=True)
 
       lat, lon = _extract_coordinates_safely(location)
       if lat is not None and lon is not None:
@@ -270,7 +291,7 @@ def geocode_location(
 
     try:
       logfire.info(f"Trying state fallback: '{state_query}'")
-      location = geolocator.geocode(state_query, exactly_one=True)
+      location = _get_geolocator().geocode(state_query, exactly_one=True)
 
       lat, lon = _extract_coordinates_safely(location)
       if lat is not None and lon is not None:
@@ -287,6 +308,34 @@ def geocode_location(
   return None, None
 
 
+async def geocode_location_shared(
+    location_description: str, state_code: Optional[str] = None
+) -> Tuple[Optional[float], Optional[float]]:
+  """
+  geocode_location through the shared geocode store: a geocode made by any
+  instance or consumer is reused, and a fresh Nominatim result is stored for
+  the others. Nominatim runs in the default executor.
+  """
+  from app.services.location.geocode import GeocodeRecord, get_geocode_store
+
+  store = get_geocode_store()
+  record = await store.get(location_description, state_code)
+  if record is not None:
+    logfire.info(f"Using shared geocode for '{location_description}'", source=record.source)
+    return record.latitude, record.longitude
+
+  loop = asyncio.get_running_loop()
+  lat, lon = await loop.run_in_executor(None, geocode_location, location_description, state_code)
+  if lat is not None and lon is not None and location_description:
+    await store.put(location_description, GeocodeRecord(
+        latitude=lat,
+        longitude=lon,
+        components=extract_location_components(location_description),
+        source="nominatim",
+    ), state_code)
+  return lat, lon
+
+
 def _extract_coordinates_safely(location_obj) -> Tuple[Optional[float], Optional[float]]:
   """
   Safely extract latitude and longitude from a location object.
@@ -329,22 +378,76 @@ def _extract_coordinates_safely(location_obj) -> Tuple[Optional[float], Optional
     return None, None
 
 
+def _lookup_locality_index(
+    location_description: Optional[str],
+    state_code: Optional[str],
+    city: Optional[str],
+    postal_code: Optional[str],
+) -> Optional[bool]:
+  """Answers from the locality index, or None when it has no decisive entry."""
+  if not locality_index.loaded:
+    return None
+  if location_description and not (postal_code and city):
+    components = extract_location_components(location_description)
+    postal_code = postal_code or components["zip_code"]
+    city = city or components["city"]
+    state_code = state_code or components["state"]
+  match = locality_index.lookup(postal_code, city, state_code)
+  if match is None:
+    return None
+  logfire.info(
+      f"Locality determined from index: {match.is_local}",
+      matched_on=match.matched_on,
+      min_drive_time_hours=match.drive_hours,
+      closest_hub=match.hub,
+  )
+  return match.is_local
+
+
+async def determine_locality(
+    location_description: Optional[str], state_code: Optional[str] = None,
+    city: Optional[str] = None,
+    postal_code: Optional[str] = None,
+) -> bool:
+  """
+  determine_locality_from_description for async callers: the geocode comes
+  from the shared geocode store instead of a blocking Nominatim call.
+  """
+  coordinates = None
+  if location_description and _lookup_locality_index(
+          location_description, state_code, city, postal_code) is None:
+    coordinates = await geocode_location_shared(location_description, state_code)
+  return determine_locality_from_description(
+      location_description, state_code, city, postal_code, coordinates=coordinates)
+
+
 def determine_locality_from_description(
     location_description: str, state_code: Optional[str] = None,
     city: Optional[str] = None,
     postal_code: Optional[str] = None,
+    coordinates: Optional[Tuple[Optional[float], Optional[float]]] = None,
 ) -> bool:
   """
   Determine if a location description refers to a local area using geocoding.
   Falls back to keyword matching if geocoding fails or description is missing.
 
+  Known ZIPs, ZIP3 prefixes and cities are answered from the locality index
+  without geocoding.
+
   Args:
       location_description: Text description of the location
       state_code: Two-letter state code (e.g., 'NY', 'CO') if available
+      city: City name if available
+      postal_code: Postal/ZIP code if available
+      coordinates: Geocode already looked up by the caller, used instead of geocoding
 
   Returns:
       bool: True if local, False if not, defaults to True if description is None
   """
+  indexed = _lookup_locality_index(location_description, state_code, city, postal_code)
+  if indexed is not None:
+    return indexed
+
   # If we only have state code but no description
   if not location_description and state_code:
     state_lower = state_code.lower()
@@ -366,6 +469,8 @@ def determine_locality_from_description(
     logfire.warn("Geocoding skipped: location_description is None.")
     # Fallback to keyword matching based on state_code if available
     lat, lon = None, None
+  elif coordinates is not None:
+    lat, lon = coordinates
   else:
     # Step 1: Try to geocode the location with state information
     lat, lon = geocode_location(location_description, state_code)
@@ -0,0 +1,60 @@
+# app/worker.py
+
+"""
+Background job worker entry point.
+
+Consumes the Redis Streams job queues filled by the web workers when
+JOB_QUEUE_ENABLED is set. Run one or more of these next to the API:
+
+    python -m app.worker                      # all queues
+    python -m app.worker --queues classification,location
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from app.core.telemetry import configure_logfire
+
+# Before the service imports below define their models (see app/main.py)
+configure_logfire()
+
+from app.services.jobs import QUEUES  # noqa: E402
+from app.services.jobs.worker import JobWorker
+from app.services.location.locality import ensure_locality_index
+from app.services.mongo import get_mongo_service, startup_mongo_service, shutdown_mongo_service
+from app.services.redis.service import RedisService
+
+logger = logging.getLogger(__name__)
+
+
+async def main(queues):
+  await startup_mongo_service(create_indexes=False)
+  redis_service = RedisService()
+  if "classification" in queues:
+    # Voice classification reads the locality index; the web process loads its own copy
+    try:
+      await ensure_locality_index(redis_service, await get_mongo_service())
+    except Exception as e:
+      logger.warning(f"Locality index not loaded; classifying without it: {e}")
+  worker = JobWorker(redis_service, queues=queues)
+
+  loop = asyncio.get_running_loop()
+  for sig in (signal.SIGINT, signal.SIGTERM):
+    loop.add_signal_handler(sig, worker.stop)
+
+  try:
+    await worker.run()
+  finally:
+    await RedisService.close_pool()
+    await shutdown_mongo_service()
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Stahla background job worker")
+  parser.add_argument("--queues", default=",".join(QUEUES.keys()),
+                      help="Comma-separated queues to consume.")
+  args = parser.parse_args()
+  logging.basicConfig(level=logging.INFO)
+  asyncio.run(main([q.strip() for q in args.queues.split(",") if q.strip()]))